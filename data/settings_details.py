@@ -23,6 +23,7 @@ class DifficultyData:
     max_word_length: int
     min_subword_length: int
     heart_point_mode: bool = True  # Default to True
+    board_engine: str = "greedy"  # Board generator engine, see setup.grid_generator.main_generator.BOARD_ENGINES
 
 
 HEART_POINTS_SETTINGS: dict[str, DifficultyData] = {
@@ -7,5 +7,6 @@ Modules:
     display_basic: Basic text-based display functions.
     display_rich: Rich-formatted display functions using the Rich library.
     display_utils: Utility functions for display operations.
+    frame_renderer: Incremental rendering that redraws only the changed lines of a frame.
     display: Dispatcher functions to select display mode based on settings.
 """
@@ -1,3 +1,5 @@
+from types import ModuleType
+
 from data.settings_details import DifficultyData
 from data.wizards_details import WizardData
 from display.display_basic import (
@@ -10,22 +12,36 @@ from display.display_basic import (
     basic_print_statistics,
     basic_print_streak_leaderboard,
 )
-from display.display_rich import (
-    rich_display_menu_options,
-    rich_display_wizard_art,
-    rich_display_wizard_selection,
-    rich_get_input,
-    rich_print_grid,
-    rich_print_message,
-    rich_print_statistics,
-    rich_print_streak_leaderboard,
-)
+from display.display_utils import is_headless
 from gameplay.game_state_handler import GameStateData, GameStatisticsData
 from leaderboard.streak_handler import StreakEntry
 
 DEFAULT_BORDER_STYLE = "bright_cyan"
 
 
+def _get_rich_display(settings: DifficultyData | None) -> ModuleType | None:
+    """Return the Rich display module when the settings ask for it, importing it on first use.
+
+    Rich is only imported once something is drawn with it, so startup, the basic display
+    and headless runs never load it. Settings without heart point mode, headless mode
+    (WORDERLY_DISPLAY=headless) and a missing Rich install all use the basic display.
+
+    Args:
+        settings (DifficultyData | None): The current difficulty settings, or None.
+
+    Returns:
+        ModuleType | None: The display_rich module, or None to use the basic display.
+
+    """
+    if (settings and not settings.heart_point_mode) or is_headless():
+        return None
+    try:
+        from display import display_rich  # noqa: PLC0415
+    except ImportError:
+        return None
+    return display_rich
+
+
 def get_input(settings: DifficultyData | None, prompt_message: str = "Enter Guess") -> str:
     """Get user input using either rich or basic input based on settings.
 
@@ -37,23 +53,26 @@ def get_input(settings: DifficultyData | None, prompt_message: str = "Enter Gues
         str: The user's input.
 
     """
-    if not settings or settings.heart_point_mode:
-        return rich_get_input(prompt_message)
+    rich_display = _get_rich_display(settings)
+    if rich_display is not None:
+        return rich_display.rich_get_input(prompt_message)
     return basic_get_input(prompt_message)
 
 
 def print_streak_leaderboard(settings: DifficultyData | None, streaks: list[StreakEntry]) -> None:
     """Display the winning streak leaderboard using rich or basic formatting.
 
-    If settings are not provided or if heart_point_mode is True, it defaults to the rich display.
+    If settings are not provided or if heart_point_mode is True, it defaults to the rich display,
+    unless the game runs headless.
 
     Args:
         settings (DifficultyData | None): The current difficulty settings, or None.
         streaks (list[StreakEntry]): List of streak entries to display.
 
     """
-    if not settings or settings.heart_point_mode:
-        rich_print_streak_leaderboard(streaks)
+    rich_display = _get_rich_display(settings)
+    if rich_display is not None:
+        rich_display.rich_print_streak_leaderboard(streaks)
     else:
         basic_print_streak_leaderboard(streaks)
 
@@ -71,8 +90,9 @@ def display_wizard_selection(
         wizard_index (int): The index of the wizard.
 
     """
-    if not settings or settings.heart_point_mode:
-        rich_display_wizard_selection(settings, wizard, wizard_index)
+    rich_display = _get_rich_display(settings)
+    if rich_display is not None:
+        rich_display.rich_display_wizard_selection(settings, wizard, wizard_index)
     else:
         basic_display_wizard_selection(settings, wizard, wizard_index)
 
@@ -101,9 +121,10 @@ def print_grid(  # noqa: PLR0913, PLR0917
 
     """
     active_highlighted_coords = highlighted_coords if highlighted_coords is not None else []
-    if not settings or settings.heart_point_mode:
+    rich_display = _get_rich_display(settings)
+    if rich_display is not None:
         effective_highlight_color = highlight_color if highlight_color is not None else "yellow"
-        rich_print_grid(
+        rich_display.rich_print_grid(
             grid,
             active_highlighted_coords,
             effective_highlight_color,
@@ -135,8 +156,9 @@ def print_statistics(  # noqa: PLR0913, PLR0917
         game_st (GameStateData): The current game state.
 
     """
-    if not settings or settings.heart_point_mode:
-        rich_print_statistics(
+    rich_display = _get_rich_display(settings)
+    if rich_display is not None:
+        rich_display.rich_print_statistics(
             statistics_obj,
             border_style,
             grid,
@@ -173,8 +195,9 @@ def print_message(  # noqa: PLR0913, PLR0917
         justify (str): Justification for the message text.
 
     """
-    if not settings or settings.heart_point_mode:
-        rich_print_message(
+    rich_display = _get_rich_display(settings)
+    if rich_display is not None:
+        rich_display.rich_print_message(
             message=message,
             style=style,
             border_style=border_style,
@@ -196,8 +219,9 @@ def display_wizard_art(settings: DifficultyData | None, wizard: WizardData) -> N
         wizard (WizardData): The wizard data to display.
 
     """
-    if not settings or settings.heart_point_mode:
-        rich_display_wizard_art(settings, wizard)
+    rich_display = _get_rich_display(settings)
+    if rich_display is not None:
+        rich_display.rich_display_wizard_art(settings, wizard)
     else:
         basic_display_wizard_art(settings, wizard)
 
@@ -217,8 +241,9 @@ def display_menu_options(
         title (str): Title for the menu.
 
     """
-    if not settings or settings.heart_point_mode:
-        rich_display_menu_options(settings, options, current_index, title)
+    rich_display = _get_rich_display(settings)
+    if rich_display is not None:
+        rich_display.rich_display_menu_options(settings, options, current_index, title)
     else:
         basic_display_menu_options(
             options,
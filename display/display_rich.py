@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
 from rich.columns import Columns
@@ -16,6 +18,7 @@ from .display_utils import clear_screen
 
 DEFAULT_BORDER_STYLE = "bright_cyan"
 DETAILS_PANEL_WIDTH = 40
+ROW_CACHE_SIZE = 256  # Styled grid rows kept between frames, enough for several boards of the largest size
 
 console = Console()
 
@@ -285,42 +288,42 @@ def rich_print_statistics(
     console.print(full_panel)
 
 
-def _get_styled_row_items(  # noqa: PLR0913, PLR0917
-    row_idx: int,
-    row_data: list[str | None],
+@lru_cache(maxsize=ROW_CACHE_SIZE)
+def _get_styled_row(  # noqa: PLR0913, PLR0917
+    row_cells: tuple[str | None, ...],
+    highlighted_cols: frozenset[int],
     num_cols: int,
-    highlighted_coords: set[tuple[int, int]] | list[tuple[int, int]],
     highlight_color: str,
     letters_color: str,
     hidden_color: str,
-) -> list[Text]:
-    """Get a list of styled Text objects for a row in the grid.
+) -> Text:
+    """Build the styled Text for a row of the grid, reusing the one built for identical rows.
+
+    Rows are cached by their contents, highlighted columns and colors, so a frame only
+    builds Text for the rows that changed since the previous frame. The returned Text is
+    shared between frames and must not be modified.
 
     Args:
-        row_idx (int): The index of the row.
-        row_data (list[str | None]): The data for the row.
+        row_cells (tuple[str | None, ...]): The cells of the row.
+        highlighted_cols (frozenset[int]): Columns of the row to highlight.
         num_cols (int): The number of columns in the grid.
-        highlighted_coords (set[tuple[int, int]] | list[tuple[int, int]]): Coordinates to highlight.
         highlight_color (str): The color for highlighted cells.
         letters_color (str): The color for letter cells.
         hidden_color (str): The color for hidden cells.
 
     Returns:
-        list[Text]: The styled row items.
+        Text: The styled row, one character and a separating space per cell.
 
     """
-    styled_row_items: list[Text] = []
+    row_text = Text(no_wrap=True)
     for col_idx in range(num_cols):
         content = "."
         current_style = "dim"
-        cell_value = None
-        if row_data and col_idx < len(row_data):
-            cell_value = row_data[col_idx]
+        cell_value = row_cells[col_idx] if col_idx < len(row_cells) else None
 
         if cell_value is not None:
             content = cell_value
-            coord = (row_idx, col_idx)
-            if coord in highlighted_coords:
+            if col_idx in highlighted_cols:
                 current_style = f"bold {highlight_color}"
             elif cell_value == "#":
                 current_style = f"dim {hidden_color}"
@@ -328,8 +331,26 @@ def _get_styled_row_items(  # noqa: PLR0913, PLR0917
                 current_style = f"bold {letters_color}"
 
         separator = " " if col_idx < num_cols - 1 else ""
-        styled_row_items.append(Text(content + separator, style=current_style))
-    return styled_row_items
+        row_text.append(content + separator, style=current_style)
+    return row_text
+
+
+def _group_highlights_by_row(
+    highlighted_coords: Iterable[tuple[int, int]],
+) -> dict[int, frozenset[int]]:
+    """Group highlighted coordinates into the highlighted columns of each row.
+
+    Args:
+        highlighted_coords (Iterable[tuple[int, int]]): Coordinates to highlight.
+
+    Returns:
+        dict[int, frozenset[int]]: The highlighted columns, keyed by row index.
+
+    """
+    cols_by_row: dict[int, set[int]] = {}
+    for row_idx, col_idx in set(highlighted_coords):
+        cols_by_row.setdefault(row_idx, set()).add(col_idx)
+    return {row_idx: frozenset(cols) for row_idx, cols in cols_by_row.items()}
 
 
 def rich_print_grid(  # noqa: PLR0913, PLR0917
@@ -364,20 +385,20 @@ def rich_print_grid(  # noqa: PLR0913, PLR0917
         _print_no_columns_message(grid, title)
         return
 
-    for _ in range(num_cols):
-        table.add_column(justify="left", no_wrap=True)
+    table.add_column(justify="left", no_wrap=True)
 
+    highlighted_cols_by_row = _group_highlights_by_row(highlighted_coords)
+    no_highlights: frozenset[int] = frozenset()
     for row_idx, row_data in enumerate(grid):
-        styled_row_items = _get_styled_row_items(
-            row_idx,
-            row_data,
+        styled_row = _get_styled_row(
+            tuple(row_data or ()),
+            highlighted_cols_by_row.get(row_idx, no_highlights),
             num_cols,
-            highlighted_coords,
             highlight_color,
             letters_color,
             hidden_color,
         )
-        table.add_row(*styled_row_items)
+        table.add_row(styled_row)
 
     grid_panel = Panel(table, title=title, border_style=border_style, expand=False)
     console.print(grid_panel)
@@ -3,9 +3,82 @@
 # ****************
 import os
 import sys
+from dataclasses import dataclass
+
+# ANSI control sequences
+CURSOR_HOME = "\x1b[H"
+ERASE_SCREEN = "\x1b[2J"
+ERASE_LINE_END = "\x1b[K"
+ERASE_SCREEN_END = "\x1b[J"
+
+DISPLAY_MODE_ENV_VAR = "WORDERLY_DISPLAY"  # "rich" (default) or "headless"
+HEADLESS_DISPLAY_MODE = "headless"
+
+
+@dataclass
+class ScreenState:
+    """Tracks whole-screen clears, so that incremental renderers know when their last frame is gone.
+
+    Attributes:
+        clear_count (int): Number of times the screen has been cleared.
+
+    """
+
+    clear_count: int = 0
+
+
+SCREEN_STATE = ScreenState()
+
+
+def is_headless() -> bool:
+    """Check whether the game was asked to run without Rich.
+
+    Returns:
+        bool: True if WORDERLY_DISPLAY is set to "headless".
+
+    """
+    return os.environ.get(DISPLAY_MODE_ENV_VAR, "").strip().lower() == HEADLESS_DISPLAY_MODE
+
+
+def supports_ansi() -> bool:
+    """Check whether stdout is a terminal that understands ANSI cursor and erase sequences.
+
+    Returns:
+        bool: True for a non-dumb POSIX terminal, or a Windows terminal known to process ANSI sequences.
+
+    """
+    if not sys.stdout.isatty() or os.environ.get("TERM") == "dumb":
+        return False
+    if os.name != "nt":
+        return True
+    return any(name in os.environ for name in ("WT_SESSION", "ANSICON", "TERM_PROGRAM")) or "TERM" in os.environ
+
+
+def move_cursor(row: int, col: int = 1) -> str:
+    """Return the ANSI sequence that moves the cursor to a screen position.
+
+    Args:
+        row (int): The 1-based row.
+        col (int): The 1-based column.
+
+    Returns:
+        str: The escape sequence.
+
+    """
+    return f"\x1b[{row};{col}H"
 
 
 def clear_screen() -> None:
-    """Clear the terminal screen, if any."""
-    if sys.stdout.isatty():
+    """Clear the terminal screen, if any, and move the cursor to the top left.
+
+    On ANSI terminals the erase and home sequences are written to stdout without a flush,
+    so they reach the terminal together with the frame printed next instead of on their
+    own. Other terminals fall back to the system clear command.
+    """
+    SCREEN_STATE.clear_count += 1
+    if not sys.stdout.isatty():
+        return
+    if supports_ansi():
+        sys.stdout.write(ERASE_SCREEN + CURSOR_HOME)
+    else:
         os.system("cls" if os.name == "nt" else "clear")  # noqa: S605
@@ -0,0 +1,170 @@
+import io
+import os
+import shutil
+import sys
+from collections.abc import Generator
+from contextlib import contextmanager, redirect_stdout
+from typing import TYPE_CHECKING
+
+from .display_utils import (
+    CURSOR_HOME,
+    ERASE_LINE_END,
+    ERASE_SCREEN,
+    ERASE_SCREEN_END,
+    SCREEN_STATE,
+    clear_screen,
+    is_headless,
+    move_cursor,
+    supports_ansi,
+)
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+RENDER_MODE_ENV_VAR = "WORDERLY_RENDER_MODE"  # "diff" (default) or "full"
+DIFF_RENDER_MODE = "diff"
+FULL_RENDER_MODE = "full"
+PROMPT_LINES = 2  # Rows below the frame used by the input prompt and the Enter that ends it
+
+
+def get_render_mode() -> str:
+    """Read the configured rendering mode.
+
+    Returns:
+        str: FULL_RENDER_MODE if WORDERLY_RENDER_MODE asks for it, DIFF_RENDER_MODE otherwise.
+
+    """
+    configured = os.environ.get(RENDER_MODE_ENV_VAR, "").strip().lower()
+    return FULL_RENDER_MODE if configured == FULL_RENDER_MODE else DIFF_RENDER_MODE
+
+
+class FrameRenderer:
+    """Draws game frames, rewriting only the screen lines that changed since the previous frame.
+
+    The first frame, and any frame after the screen was cleared elsewhere, resized or grew
+    taller than the terminal, is drawn in full from the top of the screen. Later frames
+    move the cursor to each changed line and rewrite just that line, so a turn that
+    reveals one word only redraws the grid rows, stats lines and message that changed.
+
+    Attributes:
+        previous_lines (list[str] | None): The lines of the frame on screen, or None to draw the next one in full.
+        terminal_size (tuple[int, int] | None): The (columns, rows) of the terminal when it was drawn.
+        clear_count (int): SCREEN_STATE.clear_count when it was drawn.
+
+    """
+
+    def __init__(self) -> None:
+        self.previous_lines: list[str] | None = None
+        self.terminal_size: tuple[int, int] | None = None
+        self.clear_count = SCREEN_STATE.clear_count
+
+    def reset(self) -> None:
+        """Forget the frame on screen, so the next frame is drawn in full."""
+        self.previous_lines = None
+
+    def _can_diff(self, lines: list[str], terminal_size: tuple[int, int]) -> bool:
+        """Check whether the frame on screen can be updated in place.
+
+        Args:
+            lines (list[str]): The lines of the new frame.
+            terminal_size (tuple[int, int]): The current (columns, rows) of the terminal.
+
+        Returns:
+            bool: True if the previous frame is still on screen, unscrolled, at the same terminal size.
+
+        """
+        return (
+            self.previous_lines is not None
+            and self.clear_count == SCREEN_STATE.clear_count
+            and self.terminal_size == terminal_size
+            and len(lines) + PROMPT_LINES <= terminal_size[1]
+        )
+
+    def build_output(self, frame: str) -> str:
+        """Return the text to write to the terminal to show a frame, and remember the frame.
+
+        Args:
+            frame (str): The rendered frame, with ANSI styles.
+
+        Returns:
+            str: The escape sequences and lines that turn the screen into the frame.
+
+        """
+        lines = frame.rstrip("\n").split("\n")
+        terminal_size = tuple(shutil.get_terminal_size())
+        if self._can_diff(lines, terminal_size):
+            previous_lines = self.previous_lines or []
+            parts = [
+                f"{move_cursor(row)}{line}{ERASE_LINE_END}"
+                for row, line in enumerate(lines, start=1)
+                if row > len(previous_lines) or previous_lines[row - 1] != line
+            ]
+            # Wipe the old prompt (and any longer previous frame) below the new frame
+            parts.append(f"{move_cursor(len(lines) + 1)}{ERASE_SCREEN_END}")
+        else:
+            parts = [ERASE_SCREEN, CURSOR_HOME, "\n".join(lines), "\n"]
+
+        self.previous_lines = lines
+        self.terminal_size = terminal_size
+        self.clear_count = SCREEN_STATE.clear_count
+        return "".join(parts)
+
+    def render(self, frame: str) -> None:
+        """Show a frame on the terminal with a single write.
+
+        Args:
+            frame (str): The rendered frame, with ANSI styles.
+
+        """
+        sys.stdout.write(self.build_output(frame))
+        sys.stdout.flush()
+
+
+FRAME_RENDERER = FrameRenderer()
+
+
+def _get_rich_console() -> "Console | None":
+    """Return the Rich console that frames are captured from, importing Rich on first use.
+
+    Returns:
+        Console | None: The shared console, or None when running headless or without Rich.
+
+    """
+    if is_headless():
+        return None
+    try:
+        from .display_rich import console  # noqa: PLC0415
+    except ImportError:
+        return None
+    return console
+
+
+@contextmanager
+def render_frame() -> Generator[None]:
+    """Collect everything printed in the block as one frame, and draw only what changed on screen.
+
+    Without an ANSI terminal, or with WORDERLY_RENDER_MODE=full, the screen is cleared
+    and the block prints directly, as before. Headless runs only capture plain prints,
+    so Rich is never imported.
+
+    Yields:
+        None: Print the frame's contents inside the block.
+
+    """
+    if get_render_mode() == FULL_RENDER_MODE or not supports_ansi():
+        FRAME_RENDERER.reset()
+        clear_screen()
+        yield
+        return
+
+    plain_output = io.StringIO()
+    rich_console = _get_rich_console()
+    if rich_console is None:
+        with redirect_stdout(plain_output):
+            yield
+        FRAME_RENDERER.render(plain_output.getvalue())
+        return
+
+    with rich_console.capture() as rich_output, redirect_stdout(plain_output):
+        yield
+    FRAME_RENDERER.render(rich_output.get() + plain_output.getvalue())
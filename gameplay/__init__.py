@@ -4,8 +4,10 @@ This package contains modules responsible for the core game logic, state managem
 powerup handling, and gameplay constants.
 
 Modules:
+    bots: Headless games played by solver bots.
     game_constants: Constants used throughout the gameplay.
     game_state_handler: Functions and classes for managing game state and statistics.
     gameplay: Main gameplay loop and related utilities.
     powerup_handler: Logic for handling powerups and their effects.
+    word_placement: Compact record of where a word lies on the board.
 """
@@ -0,0 +1,96 @@
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+from data.wizards_details import WIZARDS_DATA
+from gameplay.bots import BotGameResult, BotTurn, play_bot_game
+from gameplay.gameplay import GameConfig
+
+BOT_PLAYER_NAME = "Bot"
+
+
+@dataclass
+class WizardTally:
+    """Totals of the simulated games of one wizard.
+
+    Attributes:
+        games (int): Games played.
+        wins (int): Games won.
+        turns (int): Guesses and powerups played, over all games.
+        points (int): Points scored, over all games.
+        powerups_used (int): Powerups activated, over all games.
+
+    """
+
+    games: int = 0
+    wins: int = 0
+    turns: int = 0
+    points: int = 0
+    powerups_used: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        """Share of the games that were won.
+
+        Returns:
+            float: Between 0 and 1, or 0.0 before any game.
+
+        """
+        return self.wins / self.games if self.games else 0.0
+
+    def add_game(self, result: BotGameResult) -> None:
+        """Count one finished game.
+
+        Args:
+            result (BotGameResult): The outcome of the game.
+
+        """
+        self.games += 1
+        self.wins += result.status == "win"
+        self.turns += result.turns
+        self.points += result.points
+        self.powerups_used += result.powerups_used
+
+    def merge(self, other: "WizardTally") -> None:
+        """Add the totals of another tally to this one.
+
+        Args:
+            other (WizardTally): The tally to add.
+
+        """
+        self.games += other.games
+        self.wins += other.wins
+        self.turns += other.turns
+        self.points += other.points
+        self.powerups_used += other.powerups_used
+
+
+def play_every_wizard(
+    game_config: GameConfig,
+    bot: Callable[[BotTurn, random.Random], str],
+    candidate_words: list[str],
+    games_per_wizard: int,
+    rng: random.Random | None = None,
+) -> dict[str, WizardTally]:
+    """Let a bot play a puzzle several times with each wizard of WIZARDS_DATA.
+
+    Args:
+        game_config (GameConfig): The puzzle to play. Its wizard is replaced by each wizard in turn.
+        bot (Callable[[BotTurn, random.Random], str]): The strategy choosing each move, such as one of BOT_STRATEGIES.
+        candidate_words (list[str]): Lexicon words that can be spelled from the letters.
+        games_per_wizard (int): Games each wizard plays.
+        rng (random.Random | None): Random number generator shared by every game. Defaults to a fresh one.
+
+    Returns:
+        dict[str, WizardTally]: The tally of each wizard by name, in WIZARDS_DATA order.
+
+    """
+    rng = rng or random.Random()
+    tallies = {}
+    for wizard in WIZARDS_DATA:
+        wizard_config = replace(game_config, selected_wizard=wizard)
+        tally = WizardTally()
+        for _ in range(games_per_wizard):
+            tally.add_game(play_bot_game(wizard_config, bot, candidate_words, rng=rng))
+        tallies[wizard.name] = tally
+    return tallies
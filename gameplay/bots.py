@@ -0,0 +1,242 @@
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from gameplay import game_constants
+from gameplay.game_state_handler import (
+    GameStateData,
+    check_game_over,
+    initialize_game_state,
+    process_guess,
+)
+from gameplay.gameplay import GameConfig
+from gameplay.powerup_handler import update_power_points, use_powerup
+
+NO_POWERUP_COLOR = "bright_white"  # The wizard without a powerup
+LOW_LIVES = 2  # Lives left at which the healing wizard spends a power point
+
+
+@dataclass
+class BotTurn:
+    """What a bot sees when choosing its next move.
+
+    Attributes:
+        game_config (GameConfig): The puzzle and wizard being played.
+        game_st (GameStateData): The current game state.
+        board_words (list[str]): The words on the board.
+        candidate_words (list[str]): Lexicon words that can be spelled from the letters.
+        pending_words (list[str]): The rest of the bot's current shuffled pass over its words.
+
+    """
+
+    game_config: GameConfig
+    game_st: GameStateData
+    board_words: list[str]
+    candidate_words: list[str]
+    pending_words: list[str] = field(default_factory=list)
+
+
+@dataclass
+class BotGameResult:
+    """The outcome of one headless game.
+
+    Attributes:
+        status (str): "win" or "loss".
+        turns (int): Guesses and powerups played.
+        points (int): Final score.
+        powerups_used (int): Powerups activated.
+        lives_left (int): Lives left at the end.
+
+    """
+
+    status: str
+    turns: int
+    points: int
+    powerups_used: int
+    lives_left: int
+
+
+def can_use_powerup(game_config: GameConfig, game_st: GameStateData) -> bool:
+    """Check whether the powerup command would be accepted, as get_guess checks it.
+
+    Args:
+        game_config (GameConfig): The puzzle and wizard being played.
+        game_st (GameStateData): The current game state.
+
+    Returns:
+        bool: True in heart point mode, for a wizard with a powerup and at least one power point.
+
+    """
+    return (
+        game_config.difficulty_conf.heart_point_mode
+        and game_config.selected_wizard.color != NO_POWERUP_COLOR
+        and game_st.statistics.power_points > 0
+    )
+
+
+def draw_word(turn: BotTurn, words: list[str], rng: random.Random) -> str:
+    """Take the next word of a shuffled pass over words, skipping the words found already.
+
+    A new pass starts when the current one runs out, so every word is drawn once before
+    any is drawn again, at a constant cost per turn.
+
+    Args:
+        turn (BotTurn): The state of the game.
+        words (list[str]): The words to draw from.
+        rng (random.Random): Random number generator to use.
+
+    Returns:
+        str: The drawn word, or any of the words if all of them are found.
+
+    """
+    found_words = turn.game_st.correctly_guessed_words
+    started_pass = False
+    while True:
+        if not turn.pending_words:
+            if started_pass:
+                return rng.choice(words)
+            turn.pending_words = rng.sample(words, len(words))
+            started_pass = True
+        word = turn.pending_words.pop()
+        if word not in found_words:
+            return word
+
+
+def perfect_bot(turn: BotTurn, rng: random.Random) -> str:
+    """Guess a random word of the board that is not found yet, without ever using a powerup.
+
+    Args:
+        turn (BotTurn): The state of the game.
+        rng (random.Random): Random number generator to use.
+
+    Returns:
+        str: The guess.
+
+    """
+    return draw_word(turn, turn.board_words, rng)
+
+
+def random_lexicon_bot(turn: BotTurn, rng: random.Random) -> str:
+    """Guess a random lexicon word spelled from the letters, like a player who knows the words but not the board.
+
+    Every candidate is guessed once, in random order, before any is guessed again.
+
+    Args:
+        turn (BotTurn): The state of the game.
+        rng (random.Random): Random number generator to use.
+
+    Returns:
+        str: The guess.
+
+    """
+    return draw_word(turn, turn.candidate_words, rng)
+
+
+def should_use_powerup(turn: BotTurn) -> bool:
+    """Decide whether the wizard's powerup is worth a power point right now.
+
+    Reveals are spent at once, the shield when no shield is up, and the healing
+    powerup only when lives run low.
+
+    Args:
+        turn (BotTurn): The state of the game.
+
+    Returns:
+        bool: True to activate the powerup this turn.
+
+    """
+    if not can_use_powerup(turn.game_config, turn.game_st):
+        return False
+    stats = turn.game_st.statistics
+    wizard_color = turn.game_config.selected_wizard.color
+    if wizard_color == "magenta":
+        return stats.shield_turns == 0
+    if wizard_color == "blue":
+        return stats.lives_left <= LOW_LIVES
+    return True
+
+
+def powerup_bot(turn: BotTurn, rng: random.Random) -> str:
+    """Play like random_lexicon_bot, and activate the wizard's powerup whenever should_use_powerup allows it.
+
+    Args:
+        turn (BotTurn): The state of the game.
+        rng (random.Random): Random number generator to use.
+
+    Returns:
+        str: The guess, or the powerup command.
+
+    """
+    if should_use_powerup(turn):
+        return game_constants.POWERUP_COMMAND
+    return random_lexicon_bot(turn, rng)
+
+
+BOT_STRATEGIES: dict[str, Callable[[BotTurn, random.Random], str]] = {
+    "perfect": perfect_bot,
+    "random": random_lexicon_bot,
+    "powerup": powerup_bot,
+}
+
+
+def play_bot_game(
+    game_config: GameConfig,
+    bot: Callable[[BotTurn, random.Random], str],
+    candidate_words: list[str],
+    rng: random.Random | None = None,
+) -> BotGameResult:
+    """Play a full game without a terminal, letting a bot choose every move.
+
+    The turn loop is the one of run_game: guesses go through process_guess and
+    update_power_points, the powerup command through use_powerup, and the game ends
+    when check_game_over says so. A powerup command that get_guess would refuse is
+    treated as a wrong guess, so a bot cannot stall a game.
+
+    Args:
+        game_config (GameConfig): The puzzle and wizard to play.
+        bot (Callable[[BotTurn, random.Random], str]): The strategy choosing each move, such as one of BOT_STRATEGIES.
+        candidate_words (list[str]): Lexicon words that can be spelled from the letters.
+        rng (random.Random | None): Random number generator for the game and the bot. Defaults to a fresh one.
+
+    Returns:
+        BotGameResult: How the game ended.
+
+    """
+    rng = rng or random.Random()
+    wizard = game_config.selected_wizard
+    words_to_find = game_config.words_to_find
+    game_st = initialize_game_state(
+        game_config.final_grid,
+        game_config.middle_word,
+        wizard,
+        game_config.player_name,
+        rng=rng,
+    )
+    turn = BotTurn(
+        game_config=game_config,
+        game_st=game_st,
+        board_words=list(words_to_find),
+        candidate_words=candidate_words,
+    )
+
+    turns = 0
+    powerups_used = 0
+    game_over_status = "continue"
+    while game_over_status == "continue":
+        guess = bot(turn, rng)
+        turns += 1
+        if guess == game_constants.POWERUP_COMMAND and can_use_powerup(game_config, game_st):
+            use_powerup(game_st, wizard, words_to_find, game_config.final_grid, rng=rng)
+            powerups_used += 1
+        else:
+            process_guess(guess, game_st, words_to_find, game_config.final_grid, wizard.color)
+            update_power_points(game_st, wizard)
+        game_over_status = check_game_over(game_st, words_to_find)
+
+    return BotGameResult(
+        status=game_over_status,
+        turns=turns,
+        points=game_st.statistics.points,
+        powerups_used=powerups_used,
+        lives_left=game_st.statistics.lives_left,
+    )
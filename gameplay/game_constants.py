@@ -22,6 +22,10 @@ ALREADY_FOUND_MSG = "You already found '{}'!"
 NOT_A_WORD_MSG = "'{}' is not one of the words!"
 CORRECT_GUESS_MSG = "Correct! You found '{}'!"
 THANKS_MSG = "Thanks for playing, {}!\nFinal score: {}"
+PLAYER_RANK_MSG = (
+    "{}'s streak: {} wins, {} points\nRank #{} of {} streaks, better than or equal to {:.1f}% of the others"
+)
+PERSONAL_BEST_MSG = "Best recorded streak: {} wins, {} points"
 
 # DISPLAY DEFAULTS
 DEFAULT_HIGHLIGHT_COLOR = "green"
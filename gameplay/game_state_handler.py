@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 
 from data.wizards_details import WizardData
 from gameplay import game_constants
+from gameplay.word_placement import WordPlacement
 
 
 @dataclass
@@ -28,20 +29,25 @@ class GameStateData:
     correctly_guessed_words: set[str] = field(default_factory=set)
     hidden_letter_coords: set[tuple[int, int]] = field(default_factory=set)
     found_letter_coords: set[tuple[int, int]] = field(default_factory=set)
+    # Word-membership index, built on the first completion check (see build_word_index)
+    words_by_cell: dict[tuple[int, int], list[str]] = field(default_factory=dict)
+    hidden_cell_counts: dict[str, int] = field(default_factory=dict)
+    uncovered_words: dict[str, None] = field(default_factory=dict)  # Words with no hidden cell left, in order
 
 
-def shuffle_letters_statistic(middle_word: str) -> str:
+def shuffle_letters_statistic(middle_word: str, rng: random.Random | None = None) -> str:
     """Shuffle the letters of the given word and return them as a space-separated string.
 
     Args:
         middle_word (str): The word whose letters will be shuffled.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
 
     Returns:
         str: The shuffled letters as a space-separated string.
 
     """
     letters_list = list(str(middle_word).upper())
-    random.shuffle(letters_list)
+    (rng or random).shuffle(letters_list)
     return " ".join(letters_list)
 
 
@@ -112,6 +118,8 @@ def apply_coordinate_reveal(
     coords_set = set(coords_to_reveal)
 
     reveal_coords_in_hidden_grid(final_grid, game_state.hidden_grid, coords_set)
+    if game_state.hidden_cell_counts:
+        count_revealed_cells(game_state, coords_set & game_state.hidden_letter_coords)
 
     newly_revealed_coords = coords_set - game_state.found_letter_coords
     game_state.statistics.points += len(newly_revealed_coords)
@@ -127,6 +135,7 @@ def initialize_game_state(
     middle_word: str,
     selected_wizard: WizardData,
     player_name: str | None,
+    rng: random.Random | None = None,
 ) -> GameStateData:
     """Initialize and return a new GameStateData object for a new game round.
 
@@ -135,13 +144,14 @@ def initialize_game_state(
         middle_word (str): The central word for the round.
         selected_wizard (WizardData): The selected wizard's data.
         player_name (str | None): The player's name.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
 
     Returns:
         GameStateData: The initialized game state.
 
     """
     stats = GameStatisticsData(
-        letters=shuffle_letters_statistic(middle_word),
+        letters=shuffle_letters_statistic(middle_word, rng=rng),
         lives_left=selected_wizard.starting_lives,
         points=0,
         last_guess=None,
@@ -169,7 +179,7 @@ def initialize_game_state(
 def process_guess(
     guess: str,
     game_state: GameStateData,
-    words_to_find: dict[str, list[tuple[int, int]]],
+    words_to_find: dict[str, WordPlacement],
     final_grid: list[list[str | None]],
     wizard_color: str,
 ) -> None:
@@ -178,7 +188,7 @@ def process_guess(
     Args:
         guess (str): The player's guessed word.
         game_state (GameStateData): The current game state.
-        words_to_find (dict[str, list[tuple[int, int]]]): Words and their coordinates.
+        words_to_find (dict[str, WordPlacement]): Words and their placements.
         final_grid (list[list[str | None]]): The solution grid.
         wizard_color (str): The color associated with the wizard.
 
@@ -205,8 +215,7 @@ def process_guess(
         stats.combo += 1
         game_state.correctly_guessed_words.add(guess)
 
-        word_coords = words_to_find[guess]
-        apply_coordinate_reveal(game_state, final_grid, word_coords)
+        apply_coordinate_reveal(game_state, final_grid, words_to_find[guess])
 
         completed_words = check_for_completed_words(game_state, words_to_find)
         if completed_words:
@@ -220,39 +229,82 @@ def process_guess(
         stats.shield_turns -= 1
 
 
+def build_word_index(game_state: GameStateData, words_to_find: dict[str, WordPlacement]) -> None:
+    """Index which words cross each cell, and count the hidden cells of every word.
+
+    Words whose cells are all revealed already are marked as uncovered.
+
+    Args:
+        game_state (GameStateData): The current game state.
+        words_to_find (dict[str, WordPlacement]): Words and their placements.
+
+    """
+    words_by_cell: dict[tuple[int, int], list[str]] = {}
+    hidden_cell_counts: dict[str, int] = {}
+    hidden_letter_coords = game_state.hidden_letter_coords
+    for word, placement in words_to_find.items():
+        hidden_count = 0
+        for coord in placement:
+            words_by_cell.setdefault(coord, []).append(word)
+            if coord in hidden_letter_coords:
+                hidden_count += 1
+        hidden_cell_counts[word] = hidden_count
+        if hidden_count == 0:
+            game_state.uncovered_words[word] = None
+    game_state.words_by_cell = words_by_cell
+    game_state.hidden_cell_counts = hidden_cell_counts
+
+
+def count_revealed_cells(game_state: GameStateData, revealed_coords: Iterable[tuple[int, int]]) -> None:
+    """Update the hidden cell counts of the words crossing cells that were just revealed.
+
+    Args:
+        game_state (GameStateData): The current game state.
+        revealed_coords (Iterable[tuple[int, int]]): Cells that were hidden until this reveal.
+
+    """
+    hidden_cell_counts = game_state.hidden_cell_counts
+    for coord in revealed_coords:
+        for word in game_state.words_by_cell.get(coord, ()):
+            hidden_cell_counts[word] -= 1
+            if hidden_cell_counts[word] == 0:
+                game_state.uncovered_words[word] = None
+
+
 def check_for_completed_words(
     game_state: GameStateData,
-    words_to_find: dict[str, list[tuple[int, int]]],
+    words_to_find: dict[str, WordPlacement],
 ) -> list[str]:
     """Check for words that have been completed by the last reveal but not explicitly guessed.
 
+    Only the words whose last hidden cell was revealed since the previous check are
+    looked at, so the cost follows the number of revealed cells rather than the board size.
+
     Args:
         game_state (GameStateData): The current game state.
-        words_to_find (dict[str, list[tuple[int, int]]]): Words and their coordinates.
+        words_to_find (dict[str, WordPlacement]): Words and their placements.
 
     Returns:
         list[str]: List of newly completed words.
 
     """
-    newly_found_words: list[str] = []
+    if not game_state.hidden_cell_counts:
+        build_word_index(game_state, words_to_find)
 
-    for word, coords in words_to_find.items():
-        if word not in game_state.correctly_guessed_words:
-            all_letters_revealed = all(coord not in game_state.hidden_letter_coords for coord in coords)
-            if all_letters_revealed:
-                newly_found_words.append(word)
+    newly_found_words = [word for word in game_state.uncovered_words if word not in game_state.correctly_guessed_words]
+    game_state.uncovered_words.clear()
     return newly_found_words
 
 
 def check_game_over(
     game_state: GameStateData,
-    words_to_find: dict[str, list[tuple[int, int]]],
+    words_to_find: dict[str, WordPlacement],
 ) -> str:
     """Determine if the game is over due to win or loss conditions.
 
     Args:
         game_state (GameStateData): The current game state.
-        words_to_find (dict[str, list[tuple[int, int]]]): Words and their coordinates.
+        words_to_find (dict[str, WordPlacement]): Words and their placements.
 
     Returns:
         str: "win" if all words found, "loss" if out of lives, "continue" otherwise.
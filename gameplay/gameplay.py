@@ -10,6 +10,7 @@ from display.display import (
     print_streak_leaderboard,
 )
 from display.display_utils import clear_screen
+from display.frame_renderer import render_frame
 from gameplay import game_constants
 from gameplay.game_state_handler import (
     GameStateData,
@@ -18,7 +19,8 @@ from gameplay.game_state_handler import (
     process_guess,
 )
 from gameplay.powerup_handler import update_power_points, use_powerup
-from leaderboard.streak_handler import load_streaks
+from gameplay.word_placement import WordPlacement
+from leaderboard.streak_handler import StreakStanding, get_streak_standing, load_streaks
 
 
 @dataclass
@@ -27,10 +29,12 @@ class GameConfig:
 
     difficulty_conf: DifficultyData
     final_grid: list[list[str | None]]
-    words_to_find: dict[str, list[tuple[int, int]]]
+    words_to_find: dict[str, WordPlacement]
     middle_word: str
     player_name: str | None
     selected_wizard: WizardData
+    streak_count: int = 0  # Wins in the player's session streak before this game
+    streak_points: int = 0  # Points of those wins
 
 
 def update_display(
@@ -39,35 +43,36 @@ def update_display(
 ) -> None:
     """Update the entire game display for the current turn.
 
+    On an ANSI terminal only the lines that changed since the previous turn are redrawn.
+
     Args:
         game_config (GameConfig): The current game configuration.
         game_st (GameStateData): The current game state.
 
     """
-    clear_screen()
-
-    print_grid(
-        game_config.difficulty_conf,
-        game_st.hidden_grid,
-        highlighted_coords=game_st.last_guess_coords,
-        highlight_color=game_constants.DEFAULT_HIGHLIGHT_COLOR,
-        letters_color=game_constants.DEFAULT_LETTERS_COLOR,
-        border_style=game_st.next_message_color,
-        hidden_color=game_st.next_message_color,
-    )
-    print_statistics(
-        game_config.difficulty_conf,
-        game_st.statistics,
-        game_st.next_message_color,
-        game_st.hidden_grid,
-        game_config.selected_wizard,
-        game_st,
-    )
-    print_message(
-        game_config.difficulty_conf,
-        game_st.next_message,
-        border_style=game_st.next_message_color,
-    )
+    with render_frame():
+        print_grid(
+            game_config.difficulty_conf,
+            game_st.hidden_grid,
+            highlighted_coords=game_st.last_guess_coords,
+            highlight_color=game_constants.DEFAULT_HIGHLIGHT_COLOR,
+            letters_color=game_constants.DEFAULT_LETTERS_COLOR,
+            border_style=game_st.next_message_color,
+            hidden_color=game_st.next_message_color,
+        )
+        print_statistics(
+            game_config.difficulty_conf,
+            game_st.statistics,
+            game_st.next_message_color,
+            game_st.hidden_grid,
+            game_config.selected_wizard,
+            game_st,
+        )
+        print_message(
+            game_config.difficulty_conf,
+            game_st.next_message,
+            border_style=game_st.next_message_color,
+        )
 
 
 def get_guess(
@@ -159,15 +164,78 @@ def update_game_over_display(
     print_message(game_config.difficulty_conf, final_message, border_style=wizard_color)
 
 
+def get_session_streak(game_config: GameConfig, game_over_status: str, final_score: int) -> tuple[int, int]:
+    """Return the player's session streak once this game is counted.
+
+    A win extends the streak. A loss ends it, and it is recorded as it stood before this game.
+
+    Args:
+        game_config (GameConfig): The current game configuration.
+        game_over_status (str): "win" or "loss".
+        final_score (int): The final score achieved in the game.
+
+    Returns:
+        tuple[int, int]: The streak's number of wins and its points.
+
+    """
+    if game_over_status == "win":
+        return game_config.streak_count + 1, game_config.streak_points + final_score
+    return game_config.streak_count, game_config.streak_points
+
+
+def describe_player_rank(
+    player_name: str | None,
+    streak_count: int,
+    streak_points: int,
+    standing: StreakStanding,
+) -> str | None:
+    """Describe where the player's session streak stands among all recorded streaks, and their best one.
+
+    Args:
+        player_name (str | None): The player's name.
+        streak_count (int): The session streak's number of wins.
+        streak_points (int): The session streak's points.
+        standing (StreakStanding): The session streak's standing, from get_streak_standing.
+
+    Returns:
+        str | None: The message, or None if the player has neither a streak nor a recorded one.
+
+    """
+    if not player_name:
+        return None
+    lines: list[str] = []
+    if streak_count > 0:
+        lines.append(
+            game_constants.PLAYER_RANK_MSG.format(
+                player_name,
+                streak_count,
+                streak_points,
+                standing.rank,
+                standing.streak_total,
+                standing.percentile,
+            ),
+        )
+    best = standing.personal_best
+    if best is not None:
+        lines.append(game_constants.PERSONAL_BEST_MSG.format(best.streak_count, best.total_points_in_streak))
+    return "\n".join(lines) or None
+
+
 def end_game(
     game_config: GameConfig,
     final_score: int,
+    game_over_status: str,
 ) -> None:
     """Handle display and interaction after a game ends, show leaderboards.
 
+    Below the top streaks, the player's session streak, this game included, is shown with
+    its rank among every streak ever recorded, along with their best recorded streak. Players
+    outside the top streaks, or with no recorded streak yet, still see where they stand.
+
     Args:
         game_config (GameConfig): The current game configuration.
         final_score (int): The final score achieved in the game.
+        game_over_status (str): "win" or "loss".
 
     """
     get_input(game_config.difficulty_conf, "  > Game Over. Press Enter to see summary and leaderboards... ")
@@ -186,6 +254,13 @@ def end_game(
     )
     streaks = load_streaks()
     print_streak_leaderboard(game_config.difficulty_conf, streaks)
+    rank_message = None
+    if game_config.player_name:
+        streak_count, streak_points = get_session_streak(game_config, game_over_status, final_score)
+        standing = get_streak_standing(game_config.player_name, streak_count, streak_points)
+        rank_message = describe_player_rank(game_config.player_name, streak_count, streak_points, standing)
+    if rank_message:
+        print_message(game_config.difficulty_conf, rank_message, border_style="cyan")
 
     # Conditional prompt based on game mode
     if game_config.difficulty_conf.heart_point_mode:
@@ -236,6 +311,6 @@ def run_game(
     )
     final_score_this_game: int = game_st.statistics.points
 
-    end_game(game_config, final_score_this_game)
+    end_game(game_config, final_score_this_game, game_over_status)
 
     return game_over_status, final_score_this_game
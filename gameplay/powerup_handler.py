@@ -8,6 +8,7 @@ from gameplay.game_state_handler import (
     apply_coordinate_reveal,
     check_for_completed_words,
 )
+from gameplay.word_placement import WordPlacement
 
 
 def check_power_point_increment(
@@ -53,6 +54,7 @@ def get_coords_for_random_reveal(
     hidden_letter_coords_set: set[tuple[int, int]],
     min_reveal: int,
     max_reveal: int,
+    rng: random.Random | None = None,
 ) -> list[tuple[int, int]]:
     """Select a random subset of hidden letter coordinates to reveal.
 
@@ -60,6 +62,7 @@ def get_coords_for_random_reveal(
         hidden_letter_coords_set (set[tuple[int, int]]): Set of coordinates for hidden letters.
         min_reveal (int): Minimum number of coordinates to reveal.
         max_reveal (int): Maximum number of coordinates to reveal.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
 
     Returns:
         list[tuple[int, int]]: A list of randomly selected coordinates to reveal.
@@ -70,21 +73,23 @@ def get_coords_for_random_reveal(
 
     num_to_reveal = 0
     if available_to_reveal_count > 0:
-        chosen_number = random.randint(min_reveal, max_reveal)
+        chosen_number = (rng or random).randint(min_reveal, max_reveal)
         num_to_reveal = min(chosen_number, available_to_reveal_count)
 
-    return random.sample(hidden_letter_coords_list, num_to_reveal)
+    return (rng or random).sample(hidden_letter_coords_list, num_to_reveal)
 
 
 def get_coords_for_word_reveal(
-    words_to_find: dict[str, list[tuple[int, int]]],
+    words_to_find: dict[str, WordPlacement],
     correct_guesses_set: set[str],
+    rng: random.Random | None = None,
 ) -> list[tuple[int, int]]:
     """Select the coordinates of a random word that has not yet been guessed.
 
     Args:
-        words_to_find (dict[str, list[tuple[int, int]]]): Dictionary mapping words to their letter coordinates.
+        words_to_find (dict[str, WordPlacement]): Dictionary mapping words to their placements.
         correct_guesses_set (set[str]): Set of words that have already been guessed.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
 
     Returns:
         list[tuple[int, int]]: A list of coordinates for a randomly chosen unrevealed word,
@@ -94,23 +99,25 @@ def get_coords_for_word_reveal(
     unrevealed_words = [word for word in words_to_find if word not in correct_guesses_set]
     if not unrevealed_words:
         return []
-    chosen_word = random.choice(unrevealed_words)
-    return words_to_find[chosen_word]
+    chosen_word = (rng or random).choice(unrevealed_words)
+    return list(words_to_find[chosen_word])
 
 
 def use_powerup(
     game_st: GameStateData,
     current_selected_wizard: WizardData,
-    words_to_find: dict[str, list[tuple[int, int]]],
+    words_to_find: dict[str, WordPlacement],
     final_grid: list[list[str | None]],
+    rng: random.Random | None = None,
 ) -> None:
     """Activate the selected wizard's power-up and update the game state accordingly.
 
     Args:
         game_st (GameStateData): The current game state.
         current_selected_wizard (WizardData): The wizard whose power-up is being used.
-        words_to_find (dict[str, list[tuple[int, int]]]): Dictionary of words to find and their coordinates.
+        words_to_find (dict[str, WordPlacement]): Dictionary of words to find and their placements.
         final_grid (list[list[str | None]]): The final grid of letters for the game.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
 
     """
     stats = game_st.statistics
@@ -121,12 +128,13 @@ def use_powerup(
     stats.power_points -= 1
 
     if wizard_color == "red":
-        coords_to_reveal = get_coords_for_word_reveal(words_to_find, game_st.correctly_guessed_words)
+        coords_to_reveal = get_coords_for_word_reveal(words_to_find, game_st.correctly_guessed_words, rng=rng)
     elif wizard_color == "green":
         coords_to_reveal = get_coords_for_random_reveal(
             game_st.hidden_letter_coords,
             game_constants.MIN_RANDOM_REVEAL,
             game_constants.MAX_RANDOM_REVEAL,
+            rng=rng,
         )
     elif wizard_color == "magenta":
         stats.shield_turns += game_constants.SHIELD_INCREMENT
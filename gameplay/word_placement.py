@@ -0,0 +1,149 @@
+from collections.abc import Iterator, Sequence
+
+# Orientation -> (dr, dc) between consecutive letters. "D" is the diagonal middle word, which skips a cell.
+ORIENTATION_STEPS: dict[str, tuple[int, int]] = {"H": (0, 1), "V": (1, 0), "D": (2, 2)}
+STEP_ORIENTATIONS: dict[tuple[int, int], str] = {step: orientation for orientation, step in ORIENTATION_STEPS.items()}
+
+
+class WordPlacement:
+    """Where a word lies on the board, stored as its first cell, orientation and length.
+
+    The coordinates of the letters are computed when needed instead of being stored,
+    so a board keeps four small values per word rather than one tuple per letter.
+    Iterating over a placement yields the (row, col) of each letter, which lets it
+    stand in for the coordinate lists used before.
+
+    Attributes:
+        start_row (int): Row of the first letter.
+        start_col (int): Column of the first letter.
+        orientation (str): "H" for horizontal, "V" for vertical or "D" for the diagonal middle word.
+        length (int): Number of letters in the word.
+
+    """
+
+    __slots__ = ("length", "orientation", "start_col", "start_row")
+
+    def __init__(self, start_row: int, start_col: int, orientation: str, length: int) -> None:
+        self.start_row = start_row
+        self.start_col = start_col
+        self.orientation = orientation
+        self.length = length
+
+    @classmethod
+    def from_coords(cls, coords: Sequence[tuple[int, int]]) -> "WordPlacement":
+        """Create a placement from the coordinates of a word's letters.
+
+        Args:
+            coords (Sequence[tuple[int, int]]): The (row, col) of each letter, in order.
+
+        Returns:
+            WordPlacement: The matching placement. A one-letter word counts as horizontal.
+
+        """
+        start_row, start_col = coords[0]
+        orientation = "H"
+        if len(coords) > 1:
+            orientation = STEP_ORIENTATIONS[coords[1][0] - start_row, coords[1][1] - start_col]
+        return cls(start_row, start_col, orientation, len(coords))
+
+    @property
+    def coords(self) -> list[tuple[int, int]]:
+        """The (row, col) of each letter, in order.
+
+        Returns:
+            list[tuple[int, int]]: The coordinates.
+
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the coordinates of the letters.
+
+        Returns:
+            Iterator[tuple[int, int]]: The (row, col) of each letter, in order.
+
+        """
+        dr, dc = ORIENTATION_STEPS[self.orientation]
+        return ((self.start_row + i * dr, self.start_col + i * dc) for i in range(self.length))
+
+    def __len__(self) -> int:
+        """Return the number of letters.
+
+        Returns:
+            int: The word length.
+
+        """
+        return self.length
+
+    def __getitem__(self, index: int) -> tuple[int, int]:
+        """Return the coordinates of one letter.
+
+        Returns:
+            tuple[int, int]: The (row, col) of the letter at index.
+
+        Raises:
+            IndexError: If the index is outside the word.
+
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            msg = "word placement index out of range"
+            raise IndexError(msg)
+        dr, dc = ORIENTATION_STEPS[self.orientation]
+        return self.start_row + index * dr, self.start_col + index * dc
+
+    def __contains__(self, coord: object) -> bool:
+        """Check whether a cell holds one of the word's letters, without listing the coordinates.
+
+        Returns:
+            bool: True if coord is the (row, col) of one of the letters.
+
+        """
+        if not isinstance(coord, tuple) or len(coord) != 2:
+            return False
+        dr, dc = ORIENTATION_STEPS[self.orientation]
+        row_offset, col_offset = coord[0] - self.start_row, coord[1] - self.start_col
+        index = row_offset // dr if dr else col_offset // dc
+        return 0 <= index < self.length and (row_offset, col_offset) == (index * dr, index * dc)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another placement, or with a list of coordinates.
+
+        Returns:
+            bool: True if both cover the same cells in the same order.
+
+        """
+        if isinstance(other, WordPlacement):
+            return (self.start_row, self.start_col, self.orientation, self.length) == (
+                other.start_row,
+                other.start_col,
+                other.orientation,
+                other.length,
+            )
+        if isinstance(other, list | tuple):
+            return self.coords == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[type["WordPlacement"], tuple[int, int, str, int]]:
+        """Pickle a placement as its four values.
+
+        Returns:
+            tuple[type[WordPlacement], tuple[int, int, str, int]]: The class and its constructor arguments.
+
+        """
+        return WordPlacement, (self.start_row, self.start_col, self.orientation, self.length)
+
+    def __repr__(self) -> str:
+        """Return a short description of the placement.
+
+        Returns:
+            str: The placement's values.
+
+        """
+        return (
+            f"WordPlacement(start_row={self.start_row}, start_col={self.start_col}, "
+            f"orientation={self.orientation!r}, length={self.length})"
+        )
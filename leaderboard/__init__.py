@@ -1,8 +1,10 @@
 """Leaderboard package for Worderly.
 
 This package manages player streaks and leaderboard data, including saving and loading
-winning streaks to a JSON file.
+winning streaks to a JSON file, or to an SQLite database.
 
 Modules:
+    streak_database: The optional SQLite backend, keeping every streak with indexed queries.
     streak_handler: Functions and classes for handling player streaks and leaderboard operations.
+    streak_journal: The JSON snapshot, its journals and history, and their recovery after a crash.
 """
@@ -0,0 +1,324 @@
+import os
+import sqlite3
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import astuple
+from pathlib import Path
+
+from utils.file_lock import LOCK_TIMEOUT_SECONDS
+
+from .streak_handler import (
+    MAX_STREAK_ENTRIES,
+    STREAK_LEADERBOARD_FILEPATH,
+    StreakStanding,
+    get_database_path,
+)
+from .streak_journal import StreakEntry, read_recorded_streaks
+
+MIGRATED_VERSION = 1  # PRAGMA user_version once the JSON leaderboard was copied in
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS streaks (
+    id INTEGER PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    streak_count INTEGER NOT NULL,
+    total_points_in_streak INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS streaks_by_rank ON streaks (streak_count DESC, total_points_in_streak DESC);
+CREATE INDEX IF NOT EXISTS streaks_by_player
+    ON streaks (player_name, streak_count DESC, total_points_in_streak DESC);
+"""
+ENTRY_COLUMNS = "player_name, streak_count, total_points_in_streak"
+BEST_FIRST = "streak_count DESC, total_points_in_streak DESC, id"  # Equal streaks keep their order, as in sort_streaks
+
+# Keyed by process, thread and database file, since a connection must not cross either
+DATABASE_CONNECTIONS: dict[tuple[int, int, Path], sqlite3.Connection] = {}
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Generator[None]:
+    """Run statements in a write transaction, committed at the end or rolled back on an error.
+
+    The transaction takes the database's write lock as it begins, so a check made inside
+    it still holds when its writes are committed.
+
+    Args:
+        conn (sqlite3.Connection): A connection opened by open_database.
+
+    Yields:
+        None: While the transaction is open.
+
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def migrate_from_json(conn: sqlite3.Connection, filepath: Path) -> bool:
+    """Copy every streak the JSON leaderboard recorded into the database, the first time it is opened.
+
+    The streaks are read from the history, so those dropped from the top streaks snapshot are
+    copied too. The JSON files are left in place. PRAGMA user_version records the migration, so it
+    runs once even when several processes open a new database at the same time.
+
+    Args:
+        conn (sqlite3.Connection): A connection opened by open_database.
+        filepath (Path): The JSON snapshot file, read with its history and journals.
+
+    Returns:
+        bool: True if this call migrated the streaks, False if they were migrated already.
+
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= MIGRATED_VERSION:
+        return False
+    with _transaction(conn):
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= MIGRATED_VERSION:
+            return False
+        conn.executemany(
+            f"INSERT INTO streaks ({ENTRY_COLUMNS}) VALUES (?, ?, ?)",  # noqa: S608
+            [astuple(entry) for entry in read_recorded_streaks(filepath)],
+        )
+        conn.execute(f"PRAGMA user_version = {MIGRATED_VERSION}")
+    return True
+
+
+def _connect(db_path: Path, filepath: Path) -> sqlite3.Connection:
+    """Open a connection to the database, creating its schema and migrating the JSON leaderboard if needed.
+
+    Args:
+        db_path (Path): The database file.
+        filepath (Path): The JSON snapshot file, migrated into a new database.
+
+    Returns:
+        sqlite3.Connection: The connection, in autocommit mode.
+
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=LOCK_TIMEOUT_SECONDS, isolation_level=None)
+    try:
+        conn.executescript(SCHEMA)
+        migrate_from_json(conn, filepath)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+@contextmanager
+def open_database(filepath: Path = STREAK_LEADERBOARD_FILEPATH) -> Generator[sqlite3.Connection]:
+    """Use the leaderboard's database, creating it and migrating the JSON leaderboard if needed.
+
+    The connection is opened, and the schema and migration checked, once per process and
+    thread. Later calls reuse it from DATABASE_CONNECTIONS, so each query costs only itself.
+
+    Args:
+        filepath (Path): The JSON snapshot file. The database sits next to it, see get_database_path.
+
+    Yields:
+        sqlite3.Connection: The connection, kept open for the next call.
+
+    Raises:
+        sqlite3.Error: Raised in the block, after the connection is closed and forgotten.
+
+    """
+    db_path = get_database_path(filepath)
+    key = (os.getpid(), threading.get_ident(), db_path)
+    conn = DATABASE_CONNECTIONS.get(key)
+    if conn is None:
+        conn = DATABASE_CONNECTIONS[key] = _connect(db_path, filepath)
+    try:
+        yield conn
+    except sqlite3.Error:
+        del DATABASE_CONNECTIONS[key]  # Reopened by the next call, in case the file was replaced
+        conn.close()
+        raise
+
+
+def close_databases() -> None:
+    """Close every connection kept by open_database."""
+    for conn in DATABASE_CONNECTIONS.values():
+        conn.close()
+    DATABASE_CONNECTIONS.clear()
+
+
+def _to_entry(row: tuple[str, int, int]) -> StreakEntry:
+    """Build a streak entry from a row of ENTRY_COLUMNS.
+
+    Args:
+        row (tuple[str, int, int]): The row.
+
+    Returns:
+        StreakEntry: The entry.
+
+    """
+    return StreakEntry(*row)
+
+
+def insert_streak(conn: sqlite3.Connection, new_entry: StreakEntry) -> None:
+    """Record a streak.
+
+    Args:
+        conn (sqlite3.Connection): A connection opened by open_database.
+        new_entry (StreakEntry): The streak to record.
+
+    """
+    with _transaction(conn):
+        conn.execute(f"INSERT INTO streaks ({ENTRY_COLUMNS}) VALUES (?, ?, ?)", astuple(new_entry))  # noqa: S608
+
+
+def top_streaks(conn: sqlite3.Connection, limit: int) -> list[StreakEntry]:
+    """Return the best streaks, read in order from the streaks_by_rank index.
+
+    Args:
+        conn (sqlite3.Connection): A connection opened by open_database.
+        limit (int): The number of streaks to return.
+
+    Returns:
+        list[StreakEntry]: The best streaks, sorted from best to worst.
+
+    """
+    rows = conn.execute(f"SELECT {ENTRY_COLUMNS} FROM streaks ORDER BY {BEST_FIRST} LIMIT ?", (limit,))  # noqa: S608
+    return [_to_entry(row) for row in rows]
+
+
+def player_best(conn: sqlite3.Connection, player_name: str) -> StreakEntry | None:
+    """Return a player's best streak, found through the streaks_by_player index.
+
+    Args:
+        conn (sqlite3.Connection): A connection opened by open_database.
+        player_name (str): The player's name.
+
+    Returns:
+        StreakEntry | None: The best streak, or None if the player has none.
+
+    """
+    row = conn.execute(
+        f"SELECT {ENTRY_COLUMNS} FROM streaks WHERE player_name = ? ORDER BY {BEST_FIRST} LIMIT 1",  # noqa: S608
+        (player_name,),
+    ).fetchone()
+    return _to_entry(row) if row is not None else None
+
+
+def streak_rank(conn: sqlite3.Connection, streak_count: int, total_points_in_streak: int) -> int:
+    """Return the rank a streak has among all recorded streaks, counting the better ones in the streaks_by_rank index.
+
+    Args:
+        conn (sqlite3.Connection): A connection opened by open_database.
+        streak_count (int): The streak's number of wins.
+        total_points_in_streak (int): The streak's points.
+
+    Returns:
+        int: 1 for the best streak. Equal streaks share a rank.
+
+    """
+    better = conn.execute(
+        "SELECT COUNT(*) FROM streaks WHERE (streak_count, total_points_in_streak) > (?, ?)",
+        (streak_count, total_points_in_streak),
+    ).fetchone()[0]
+    return better + 1
+
+
+def count_streaks(conn: sqlite3.Connection) -> int:
+    """Return the number of recorded streaks.
+
+    Args:
+        conn (sqlite3.Connection): A connection opened by open_database.
+
+    Returns:
+        int: The number of streaks.
+
+    """
+    return conn.execute("SELECT COUNT(*) FROM streaks").fetchone()[0]
+
+
+def load_top_streaks(
+    filepath: Path = STREAK_LEADERBOARD_FILEPATH,
+    max_entries: int = MAX_STREAK_ENTRIES,
+) -> list[StreakEntry]:
+    """Load the best streaks from the database, as load_streaks does from the JSON files.
+
+    Args:
+        filepath (Path): The JSON snapshot file next to the database.
+        max_entries (int): The number of streaks to return.
+
+    Returns:
+        list[StreakEntry]: The best streaks, or an empty list if the database cannot be read.
+
+    """
+    try:
+        with open_database(filepath) as conn:
+            return top_streaks(conn, max_entries)
+    except (sqlite3.Error, OSError):
+        return []
+
+
+def load_streak_standing(
+    player_name: str,
+    streak_count: int,
+    total_points_in_streak: int,
+    filepath: Path = STREAK_LEADERBOARD_FILEPATH,
+) -> StreakStanding:
+    """Find a streak's standing with count_streaks, streak_rank and player_best, as get_streak_standing does.
+
+    Args:
+        player_name (str): The player's name.
+        streak_count (int): The streak's number of wins.
+        total_points_in_streak (int): The streak's points.
+        filepath (Path): The JSON snapshot file next to the database.
+
+    Returns:
+        StreakStanding: The streak's standing, as if no streak was recorded if the database cannot be read.
+
+    """
+    try:
+        with open_database(filepath) as conn:
+            return StreakStanding.from_counts(
+                count_streaks(conn),
+                streak_rank(conn, streak_count, total_points_in_streak) - 1,
+                player_best(conn, player_name),
+            )
+    except (sqlite3.Error, OSError):
+        return StreakStanding.from_counts(0, 0, None)
+
+
+def save_streak(new_entry: StreakEntry, filepath: Path = STREAK_LEADERBOARD_FILEPATH) -> bool:
+    """Record a streak in the database, as add_streak_entry does in the JSON files.
+
+    Args:
+        new_entry (StreakEntry): The streak to record.
+        filepath (Path): The JSON snapshot file next to the database.
+
+    Returns:
+        bool: True if the streak was saved.
+
+    """
+    try:
+        with open_database(filepath) as conn:
+            insert_streak(conn, new_entry)
+    except (sqlite3.Error, OSError):
+        print(f"Error: Could not save streak to {get_database_path(filepath)}.")
+        return False
+    return True
+
+
+def prepare_database(filepath: Path = STREAK_LEADERBOARD_FILEPATH) -> bool:
+    """Create the database and migrate the JSON leaderboard into it, if not done yet.
+
+    Args:
+        filepath (Path): The JSON snapshot file next to the database.
+
+    Returns:
+        bool: True if the database is ready.
+
+    """
+    try:
+        with open_database(filepath):
+            pass
+    except (sqlite3.Error, OSError):
+        print(f"Error: Could not open the leaderboard database {get_database_path(filepath)}.")
+        return False
+    return True
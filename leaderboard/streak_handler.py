@@ -1,59 +1,580 @@
 import contextlib
-import json
-from dataclasses import asdict, dataclass
+import os
+from bisect import bisect_right, insort
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 
+from utils.file_lock import file_lock
 
-@dataclass
-class StreakEntry:
-    player_name: str
-    streak_count: int
-    total_points_in_streak: int
-
+from .streak_journal import (
+    StreakEntry,
+    append_to_journal,
+    compact_journal,
+    get_compacting_path,
+    get_history_path,
+    get_journal_path,
+    next_sequence_number,
+    read_all_streaks,
+    read_journal,
+    sort_streaks,
+    start_history,
+)
 
 LEADERBOARD_DIR = Path("leaderboard")
 STREAK_LEADERBOARD_FILENAME = "winning_streaks.json"
 STREAK_LEADERBOARD_FILEPATH = LEADERBOARD_DIR / STREAK_LEADERBOARD_FILENAME
 MAX_STREAK_ENTRIES = 10
+LEADERBOARD_BACKEND_ENV_VAR = "WORDERLY_LEADERBOARD"  # "json" (default) or "sqlite"
+JSON_BACKEND = "json"
+SQLITE_BACKEND = "sqlite"
+DATABASE_SUFFIX = ".db"  # The SQLite database replaces the snapshot's .json suffix
+JOURNAL_COMPACTION_BYTES = 4096  # Journal size at which add_streak_entry merges it, about 60 entries
+SAVE_ATTEMPTS = 3  # Times add_streak_entry waits for the lock before giving up on a streak
+
+FileSignature = tuple[int, int, int] | None  # A file's (st_mtime_ns, st_size, st_ino), or None if it is missing
+
+
+@dataclass
+class CachedStreaks:
+    """The streaks read from a leaderboard, with the signature of its files at the time.
+
+    Attributes:
+        signature (tuple[FileSignature, ...]): get_leaderboard_signature when the streaks were read or written.
+        streaks (list[StreakEntry]): Every streak on the leaderboard, sorted from best to worst.
+
+    """
+
+    signature: tuple[FileSignature, ...]
+    streaks: list[StreakEntry]
+
+
+STREAK_CACHE: dict[Path, CachedStreaks] = {}  # Keyed by snapshot file
+
+
+@dataclass
+class StreakRanking:
+    """Every streak ever recorded, kept sorted to rank a new streak among them.
+
+    Attributes:
+        keys (list[tuple[int, int]]): The (streak_count, total_points_in_streak) of each streak, worst first.
+        personal_bests (dict[str, StreakEntry]): The best streak of each player.
+
+    """
+
+    keys: list[tuple[int, int]] = field(default_factory=list)
+    personal_bests: dict[str, StreakEntry] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Return the number of recorded streaks.
+
+        Returns:
+            int: The number of streaks.
+
+        """
+        return len(self.keys)
+
+    def add(self, entry: StreakEntry) -> None:
+        """Record a new streak.
+
+        Args:
+            entry (StreakEntry): The streak.
+
+        """
+        insort(self.keys, (entry.streak_count, entry.total_points_in_streak))
+        best = self.personal_bests.get(entry.player_name)
+        if best is None or _best_first_key(entry) < _best_first_key(best):
+            self.personal_bests[entry.player_name] = entry
+
+    def rank(self, streak_count: int, total_points_in_streak: int) -> int:
+        """Return the rank a streak would take among the recorded ones.
+
+        Args:
+            streak_count (int): The number of games won in a row.
+            total_points_in_streak (int): The points scored across those games.
+
+        Returns:
+            int: 1 for the best streak. Equal streaks share a rank.
+
+        """
+        return len(self.keys) - bisect_right(self.keys, (streak_count, total_points_in_streak)) + 1
+
+    def percentile(self, streak_count: int, total_points_in_streak: int) -> float:
+        """Return the share of recorded streaks that a streak equals or beats.
+
+        Args:
+            streak_count (int): The number of games won in a row.
+            total_points_in_streak (int): The points scored across those games.
+
+        Returns:
+            float: The share, from 0 to 100.
+
+        """
+        if not self.keys:
+            return 100.0
+        return 100 * bisect_right(self.keys, (streak_count, total_points_in_streak)) / len(self.keys)
+
+    def personal_best(self, player_name: str) -> StreakEntry | None:
+        """Return a player's best recorded streak.
+
+        Args:
+            player_name (str): The player.
+
+        Returns:
+            StreakEntry | None: The streak, or None if the player has none recorded.
+
+        """
+        return self.personal_bests.get(player_name)
+
+
+@dataclass
+class StreakStanding:
+    """Where a finished streak stands among every streak ever recorded.
+
+    Attributes:
+        rank (int): The streak's rank, 1 for the best.
+        streak_total (int): The number of recorded streaks, plus this one.
+        percentile (float): The share of recorded streaks that it equals or beats, from 0 to 100.
+        personal_best (StreakEntry | None): The player's best recorded streak, if any.
+
+    """
+
+    rank: int
+    streak_total: int
+    percentile: float
+    personal_best: StreakEntry | None
+
+    @classmethod
+    def from_counts(cls, recorded: int, better: int, personal_best: StreakEntry | None) -> "StreakStanding":
+        """Build a standing from the number of recorded streaks and of those better than this one.
+
+        Args:
+            recorded (int): The number of recorded streaks.
+            better (int): The number of them better than this streak.
+            personal_best (StreakEntry | None): The player's best recorded streak, if any.
+
+        Returns:
+            StreakStanding: The standing.
+
+        """
+        percentile = 100 * (recorded - better) / recorded if recorded else 100.0
+        return cls(rank=better + 1, streak_total=recorded + 1, percentile=percentile, personal_best=personal_best)
+
+
+@dataclass
+class CachedRanking:
+    """The ranking built from a leaderboard's history, with the history's signature at the time.
+
+    Attributes:
+        signature (FileSignature): _get_ranking_signature when the ranking was read or updated.
+        ranking (StreakRanking): The ranking.
+
+    """
+
+    signature: FileSignature
+    ranking: StreakRanking
+
+
+RANKING_CACHE: dict[Path, CachedRanking] = {}  # Keyed by snapshot file
+
+
+def get_database_path(filepath: Path) -> Path:
+    """Return the SQLite database used in place of a JSON snapshot.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        Path: The database, with the snapshot's suffix replaced.
+
+    """
+    return filepath.with_suffix(DATABASE_SUFFIX)
+
+
+def get_leaderboard_backend() -> str:
+    """Return the leaderboard backend chosen with the WORDERLY_LEADERBOARD environment variable.
+
+    Returns:
+        str: SQLITE_BACKEND if it is set to "sqlite", JSON_BACKEND otherwise.
+
+    """
+    configured = os.environ.get(LEADERBOARD_BACKEND_ENV_VAR, "").strip().lower()
+    return SQLITE_BACKEND if configured == SQLITE_BACKEND else JSON_BACKEND
+
+
+def _get_streak_database() -> ModuleType | None:
+    """Return the SQLite leaderboard module, if it is the chosen backend and can be imported.
+
+    Returns:
+        ModuleType | None: The module, or None to use the JSON files.
+
+    """
+    if get_leaderboard_backend() != SQLITE_BACKEND:
+        return None
+    try:
+        from leaderboard import streak_database  # noqa: PLC0415
+    except ImportError:  # No sqlite3 module, the JSON files are used instead
+        return None
+    return streak_database
+
+
+def _get_file_signature(path: Path) -> FileSignature:
+    """Return what changes about a file when it is written or replaced.
+
+    Args:
+        path (Path): The file.
+
+    Returns:
+        FileSignature: Its modification time, size and inode, or None if it is missing.
+
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def get_leaderboard_signature(filepath: Path) -> tuple[FileSignature, ...]:
+    """Return the signatures of the files the leaderboard's streaks are read from.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        tuple[FileSignature, ...]: The signatures of the snapshot, the journal being compacted and the journal.
+
+    """
+    return tuple(
+        _get_file_signature(path) for path in (filepath, get_compacting_path(filepath), get_journal_path(filepath))
+    )
+
+
+def _get_cached_streaks(filepath: Path) -> list[StreakEntry] | None:
+    """Return the cached streaks of a leaderboard, unless its files changed since they were cached.
 
+    Args:
+        filepath (Path): The snapshot file.
 
-def load_streaks(filepath: Path = STREAK_LEADERBOARD_FILEPATH) -> list[StreakEntry]:
-    if not filepath.exists():
-        return []
+    Returns:
+        list[StreakEntry] | None: The streaks, sorted from best to worst, or None if they must be read again.
+
+    """
+    cached = STREAK_CACHE.get(filepath)
+    if cached is None or cached.signature != get_leaderboard_signature(filepath):
+        return None
+    return cached.streaks
+
+
+def _cache_streaks(filepath: Path, streaks: list[StreakEntry]) -> None:
+    """Cache the streaks of a leaderboard. The caller must hold the lock.
+
+    Args:
+        filepath (Path): The snapshot file.
+        streaks (list[StreakEntry]): Every streak on the leaderboard, sorted from best to worst.
+
+    """
+    STREAK_CACHE[filepath] = CachedStreaks(signature=get_leaderboard_signature(filepath), streaks=streaks)
+
+
+def clear_streak_cache() -> None:
+    """Forget the cached streaks and rankings of every leaderboard."""
+    STREAK_CACHE.clear()
+    RANKING_CACHE.clear()
+
+
+def _best_first_key(entry: StreakEntry) -> tuple[int, int]:
+    """Return a sort key that puts the best streaks first.
+
+    Args:
+        entry (StreakEntry): The streak.
+
+    Returns:
+        tuple[int, int]: The negated streak count and points.
+
+    """
+    return (-entry.streak_count, -entry.total_points_in_streak)
+
+
+def leaderboard_lock(
+    filepath: Path = STREAK_LEADERBOARD_FILEPATH,
+    *,
+    shared: bool = False,
+) -> AbstractContextManager[None]:
+    """Hold the leaderboard's file lock, which readers passing shared=True can hold together.
+
+    Args:
+        filepath (Path): The snapshot file.
+        shared (bool): Whether to share the lock with other readers.
+
+    Returns:
+        AbstractContextManager[None]: The lock, held inside the with block. Entering it gives up
+            with file_lock's TimeoutError if the lock is still held elsewhere after LOCK_TIMEOUT_SECONDS.
+
+    """
+    return file_lock(filepath, shared=shared)
+
+
+def load_streaks(
+    filepath: Path = STREAK_LEADERBOARD_FILEPATH,
+    max_entries: int = MAX_STREAK_ENTRIES,
+) -> list[StreakEntry]:
+    """Load the best streaks on the leaderboard, cached until its files change.
+
+    Readers share the lock, so only a compaction makes them wait.
+
+    Args:
+        filepath (Path): The snapshot file.
+        max_entries (int): The number of streaks to return.
+
+    Returns:
+        list[StreakEntry]: The best streaks, sorted from best to worst.
+
+    """
+    database = _get_streak_database()
+    if database is not None:
+        return database.load_top_streaks(filepath, max_entries)
+    cached = _get_cached_streaks(filepath)
+    if cached is not None:
+        return cached[:max_entries]
     try:
-        with filepath.open(encoding="utf-8") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
-    else:
-        if not isinstance(data, list):
-            return []
-        loaded_streaks: list[StreakEntry] = []
-        for entry_dict in data:
-            if not isinstance(entry_dict, dict):
-                continue
-            with contextlib.suppress(TypeError):
-                loaded_streaks.append(StreakEntry(**entry_dict))
-        return loaded_streaks
-
-
-def save_streaks_to_file(filepath: Path, streaks: list[StreakEntry]) -> None:
+        with leaderboard_lock(filepath, shared=True):
+            streaks = sort_streaks(read_all_streaks(filepath))
+            _cache_streaks(filepath, streaks)
+            return streaks[:max_entries]
+    except OSError:
+        return _read_streaks(filepath, max_entries)
+
+
+def build_streak_ranking(streaks: Iterable[StreakEntry]) -> StreakRanking:
+    """Build the ranking of a list of streaks.
+
+    Args:
+        streaks (Iterable[StreakEntry]): The streaks.
+
+    Returns:
+        StreakRanking: Their ranking.
+
+    """
+    ranking = StreakRanking()
+    best_keys: dict[str, tuple[int, int]] = {}
+    for entry in streaks:
+        key = (entry.streak_count, entry.total_points_in_streak)
+        ranking.keys.append(key)
+        if key > best_keys.get(entry.player_name, (-1, -1)):
+            best_keys[entry.player_name] = key
+            ranking.personal_bests[entry.player_name] = entry
+    ranking.keys.sort()
+    return ranking
+
+
+def _get_ranking_signature(filepath: Path) -> FileSignature:
+    """Return the signature of the history a leaderboard's ranking is built from.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        FileSignature: The history's signature.
+
+    """
+    return _get_file_signature(get_history_path(filepath))
+
+
+def _get_cached_ranking(filepath: Path) -> StreakRanking | None:
+    """Return the cached ranking of a leaderboard, unless its history changed since it was cached.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        StreakRanking | None: The ranking, or None if it must be built again.
+
+    """
+    cached = RANKING_CACHE.get(filepath)
+    if cached is None or cached.signature != _get_ranking_signature(filepath):
+        return None
+    return cached.ranking
+
+
+def load_streak_ranking(filepath: Path = STREAK_LEADERBOARD_FILEPATH) -> StreakRanking:
+    """Load the ranking of every streak in the history, cached until the history changes.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        StreakRanking: The ranking, built from the snapshot and journal if there is no history yet.
+
+    """
+    cached = _get_cached_ranking(filepath)
+    if cached is not None:
+        return cached
+    signature = _get_ranking_signature(filepath)  # Taken first, so a write made while reading makes the cache stale
+    streaks = read_journal(get_history_path(filepath)) if signature is not None else read_all_streaks(filepath)
+    ranking = build_streak_ranking(streaks)
+    RANKING_CACHE[filepath] = CachedRanking(signature=signature, ranking=ranking)
+    return ranking
+
+
+def get_streak_standing(
+    player_name: str,
+    streak_count: int,
+    total_points_in_streak: int,
+    filepath: Path = STREAK_LEADERBOARD_FILEPATH,
+) -> StreakStanding:
+    """Return where a finished streak stands among every streak ever recorded.
+
+    Args:
+        player_name (str): The player who won the games.
+        streak_count (int): The number of games won in a row.
+        total_points_in_streak (int): The points scored across those games.
+        filepath (Path): The snapshot file.
+
+    Returns:
+        StreakStanding: The streak's rank, percentile and the player's best recorded streak.
+
+    """
+    database = _get_streak_database()
+    if database is not None:
+        return database.load_streak_standing(player_name, streak_count, total_points_in_streak, filepath)
+    ranking = load_streak_ranking(filepath)
+    return StreakStanding.from_counts(
+        len(ranking),
+        ranking.rank(streak_count, total_points_in_streak) - 1,
+        ranking.personal_best(player_name),
+    )
+
+
+def _read_streaks(filepath: Path, max_entries: int) -> list[StreakEntry]:
+    """Read the best streaks without the lock or the cache, for when the lock cannot be taken.
+
+    Args:
+        filepath (Path): The snapshot file.
+        max_entries (int): The number of streaks to return.
+
+    Returns:
+        list[StreakEntry]: The best streaks, sorted from best to worst.
+
+    """
+    return sort_streaks(read_all_streaks(filepath))[:max_entries]
+
+
+def compact_streaks(filepath: Path = STREAK_LEADERBOARD_FILEPATH, max_entries: int = MAX_STREAK_ENTRIES) -> None:
+    """Merge the journal into the snapshot, keeping the best max_entries streaks.
+
+    With the SQLite backend, this creates the database and migrates the JSON leaderboard into it instead.
+
+    Args:
+        filepath (Path): The snapshot file.
+        max_entries (int): The number of streaks to keep in the snapshot.
+
+    """
+    database = _get_streak_database()
+    if database is not None:
+        database.prepare_database(filepath)
+        return
     try:
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        data_to_save = [asdict(entry) for entry in streaks]
-        with filepath.open("w", encoding="utf-8") as f:
-            json.dump(data_to_save, f, indent=4)
+        with leaderboard_lock(filepath):
+            _compact_locked(filepath, max_entries)
     except OSError:
-        print(f"Error: Could not save streaks to {filepath}.")
+        print(f"Error: Could not compact the streaks in {filepath}.")
+
+
+def _compact_locked(filepath: Path, max_entries: int) -> None:
+    """Merge the journal into the snapshot and cache the result. The caller must hold the lock.
+
+    Args:
+        filepath (Path): The snapshot file.
+        max_entries (int): The number of streaks to keep in the snapshot.
+
+    """
+    streaks = compact_journal(filepath, max_entries)
+    if streaks is not None:
+        _cache_streaks(filepath, streaks)
 
 
 def add_streak_entry(
     new_entry: StreakEntry,
     filepath: Path = STREAK_LEADERBOARD_FILEPATH,
     max_entries: int = MAX_STREAK_ENTRIES,
-) -> None:
-    current_streaks = load_streaks(filepath)
-    current_streaks.append(new_entry)
-    current_streaks.sort(key=lambda x: (x.streak_count, x.total_points_in_streak), reverse=True)
-    updated_streaks = current_streaks[:max_entries]
-    save_streaks_to_file(filepath, updated_streaks)
+) -> bool:
+    """Journal a streak under the lock, and compact the journal to max_entries streaks once it grows large.
+
+    A game holding the lock for longer than LOCK_TIMEOUT_SECONDS is waited for again, up to SAVE_ATTEMPTS times.
+
+    Args:
+        new_entry (StreakEntry): The streak to save.
+        filepath (Path): The snapshot file.
+        max_entries (int): The number of streaks to keep in the snapshot.
+
+    Returns:
+        bool: True if the streak was saved, False if it could not be written or the lock stayed busy.
+
+    """
+    database = _get_streak_database()
+    if database is not None:
+        return database.save_streak(new_entry, filepath)
+    for _ in range(SAVE_ATTEMPTS):
+        try:
+            with leaderboard_lock(filepath):
+                return _add_locked(new_entry, filepath, max_entries)
+        except TimeoutError:
+            continue  # Only the lock raises it, _add_locked never does, so a streak is not journaled twice
+        except OSError:
+            break
+    print(f"Error: Could not save streak to {get_journal_path(filepath)}.")
+    return False
+
+
+def _add_locked(new_entry: StreakEntry, filepath: Path, max_entries: int) -> bool:
+    """Journal a streak, update the caches and history, and compact a large journal. The caller must hold the lock.
+
+    Args:
+        new_entry (StreakEntry): The streak to save.
+        filepath (Path): The snapshot file.
+        max_entries (int): The number of streaks to keep in the snapshot.
+
+    Returns:
+        bool: True if the streak was journaled.
+
+    """
+    journal_path = get_journal_path(filepath)
+    cached = _get_cached_streaks(filepath)
+    seq = next_sequence_number(filepath)
+    if not append_to_journal(journal_path, new_entry, seq=seq):
+        return False
+    if cached is not None:
+        insort(cached, new_entry, key=_best_first_key)
+        _cache_streaks(filepath, cached)
+    _add_to_history(new_entry, seq, filepath)
+    with contextlib.suppress(OSError):  # The journal is merged by the next compaction instead
+        if journal_path.stat().st_size >= JOURNAL_COMPACTION_BYTES:
+            _compact_locked(filepath, max_entries)
+    return True
+
+
+def _add_to_history(new_entry: StreakEntry, seq: int, filepath: Path) -> None:
+    """Append a journaled streak to the history and the cached ranking.
+
+    The line is not synced. The journal is the durable copy, and catch_up_history restores it after a crash.
+
+    Args:
+        new_entry (StreakEntry): The streak.
+        seq (int): The sequence number it was journaled under.
+        filepath (Path): The snapshot file.
+
+    """
+    history_path = get_history_path(filepath)
+    if not history_path.exists():
+        try:
+            start_history(filepath)  # Picks up the new streak from the journal
+        except OSError:
+            print(f"Error: Could not save streak to {history_path}.")
+        return
+    ranking = _get_cached_ranking(filepath)
+    if append_to_journal(history_path, new_entry, seq=seq, sync=False) and ranking is not None:
+        ranking.add(new_entry)
+        RANKING_CACHE[filepath] = CachedRanking(signature=_get_ranking_signature(filepath), ranking=ranking)
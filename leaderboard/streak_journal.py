@@ -0,0 +1,611 @@
+import contextlib
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from utils.file_lock import retry_with_backoff
+
+JOURNAL_SUFFIX = ".journal"  # New entries, one JSON object per line, appended next to the snapshot
+COMPACTING_SUFFIX = ".compacting"  # A journal being merged into the snapshot
+COMPACTED_SUFFIX = ".compacted"  # A merged journal, kept until the merged snapshot replaces the old one
+HISTORY_SUFFIX = ".history"  # Every streak ever recorded, one JSON object per line, never compacted
+TEMP_SUFFIX = ".tmp"
+REPLACE_TIMEOUT_SECONDS = 2.0  # Windows refuses to replace a file another program has open
+SEQUENCE_KEY = "seq"  # Numbers journal and history lines in the order the streaks were added
+SEQUENCE_TAIL_BYTES = 4096  # Read from the end of a journal to find its last sequence number
+
+
+@dataclass
+class StreakEntry:
+    """A winning streak recorded on the leaderboard.
+
+    Attributes:
+        player_name (str): The player who won the games.
+        streak_count (int): The number of games won in a row.
+        total_points_in_streak (int): The points scored across those games.
+
+    """
+
+    player_name: str
+    streak_count: int
+    total_points_in_streak: int
+
+
+@dataclass
+class JournaledStreak:
+    """A streak read from a journal or history line, with the sequence number it was journaled under.
+
+    Attributes:
+        entry (StreakEntry): The streak.
+        seq (int | None): The sequence number, or None for a line written before sequence numbers
+            were recorded, or a streak copied from the snapshot.
+
+    """
+
+    entry: StreakEntry
+    seq: int | None
+
+
+def get_journal_path(filepath: Path) -> Path:
+    """Return the journal that new streaks are appended to.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        Path: The journal, next to the snapshot.
+
+    """
+    return filepath.with_name(filepath.name + JOURNAL_SUFFIX)
+
+
+def get_history_path(filepath: Path) -> Path:
+    """Return the history that keeps every streak ever recorded.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        Path: The history, next to the snapshot.
+
+    """
+    return filepath.with_name(filepath.name + HISTORY_SUFFIX)
+
+
+def get_compacting_path(filepath: Path) -> Path:
+    """Return the path a journal is renamed to while it is merged into the snapshot.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        Path: The journal being compacted.
+
+    """
+    journal_path = get_journal_path(filepath)
+    return journal_path.with_name(journal_path.name + COMPACTING_SUFFIX)
+
+
+def get_compacted_path(filepath: Path) -> Path:
+    """Return the path a merged journal is kept at until the merged snapshot replaces the old one.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        Path: The compacted journal.
+
+    """
+    journal_path = get_journal_path(filepath)
+    return journal_path.with_name(journal_path.name + COMPACTED_SUFFIX)
+
+
+def get_temp_path(path: Path) -> Path:
+    """Return the temporary file written before it is renamed over a file.
+
+    Args:
+        path (Path): The file to replace.
+
+    Returns:
+        Path: The temporary file, next to it.
+
+    """
+    return path.with_name(path.name + TEMP_SUFFIX)
+
+
+def sort_streaks(streaks: Iterable[StreakEntry]) -> list[StreakEntry]:
+    """Sort streaks from best to worst, by streak count and then by points.
+
+    Args:
+        streaks (Iterable[StreakEntry]): The streaks to sort.
+
+    Returns:
+        list[StreakEntry]: The sorted streaks. Equal streaks keep their order.
+
+    """
+    return sorted(streaks, key=lambda x: (x.streak_count, x.total_points_in_streak), reverse=True)
+
+
+def _replace_with_retries(source: Path, target: Path) -> None:
+    """Rename a file over another, retrying while Windows refuses because the target is open elsewhere.
+
+    After REPLACE_TIMEOUT_SECONDS, one last attempt is made and its error is left to the caller.
+
+    Args:
+        source (Path): The file to rename.
+        target (Path): The file to replace.
+
+    """
+
+    def attempt() -> bool:
+        try:
+            source.replace(target)
+        except PermissionError:
+            return False
+        return True
+
+    if not retry_with_backoff(attempt, REPLACE_TIMEOUT_SECONDS):
+        source.replace(target)
+
+
+def _parse_streak_entry(entry_dict: object) -> StreakEntry | None:
+    """Build a streak entry from a decoded JSON object.
+
+    Args:
+        entry_dict (object): The decoded object.
+
+    Returns:
+        StreakEntry | None: The entry, or None if the object is not a valid streak.
+
+    """
+    if not isinstance(entry_dict, dict):
+        return None
+    try:
+        return StreakEntry(**entry_dict)
+    except TypeError:
+        return None
+
+
+def _parse_journaled_streak(entry_dict: object) -> JournaledStreak | None:
+    """Build a journaled streak from a decoded journal or history line.
+
+    Args:
+        entry_dict (object): The decoded line.
+
+    Returns:
+        JournaledStreak | None: The streak and its sequence number, or None if the line is not a valid streak.
+
+    """
+    if not isinstance(entry_dict, dict):
+        return None
+    fields = dict(entry_dict)
+    seq = fields.pop(SEQUENCE_KEY, None)
+    entry = _parse_streak_entry(fields)
+    if entry is None:
+        return None
+    return JournaledStreak(entry=entry, seq=seq if isinstance(seq, int) else None)
+
+
+def _encode_journal_line(entry: StreakEntry, seq: int | None = None) -> bytes:
+    """Encode a streak as one journal or history line.
+
+    Args:
+        entry (StreakEntry): The streak.
+        seq (int | None): Its sequence number, left out of the line if None.
+
+    Returns:
+        bytes: The line, ending with a newline.
+
+    """
+    fields = asdict(entry)
+    if seq is not None:
+        fields[SEQUENCE_KEY] = seq
+    return (json.dumps(fields) + "\n").encode("utf-8")
+
+
+def read_snapshot(filepath: Path) -> list[StreakEntry]:
+    """Read the streaks of the snapshot alone, without its journals.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        list[StreakEntry]: The snapshot's streaks, or none if it is missing or invalid.
+
+    """
+    if not filepath.exists():
+        return []
+    try:
+        with filepath.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return []
+    else:
+        if not isinstance(data, list):
+            return []
+        loaded_streaks: list[StreakEntry] = []
+        for entry_dict in data:
+            entry = _parse_streak_entry(entry_dict)
+            if entry is not None:
+                loaded_streaks.append(entry)
+        return loaded_streaks
+
+
+def read_journal(journal_path: Path) -> list[StreakEntry]:
+    """Read the streaks of a journal or history, in the order they were appended.
+
+    Args:
+        journal_path (Path): The journal or history file.
+
+    Returns:
+        list[StreakEntry]: The streaks, or none if the file is missing.
+
+    """
+    return [journaled.entry for journaled in read_journaled_streaks(journal_path)]
+
+
+def read_journaled_streaks(journal_path: Path) -> list[JournaledStreak]:
+    """Read the streaks of a journal or history with their sequence numbers.
+
+    Lines that cannot be decoded, such as a line torn by a crash, are skipped.
+
+    Args:
+        journal_path (Path): The journal or history file.
+
+    Returns:
+        list[JournaledStreak]: The streaks, in the order they were appended, or none if the file is missing.
+
+    """
+    try:
+        with journal_path.open(encoding="utf-8") as f:
+            lines = f.readlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+    try:
+        decoded = json.loads("[" + ",".join(lines) + "]")
+    except json.JSONDecodeError:
+        decoded = []
+        for line in lines:
+            with contextlib.suppress(json.JSONDecodeError):
+                decoded.append(json.loads(line))
+    entries: list[JournaledStreak] = []
+    for entry_dict in decoded:
+        journaled = _parse_journaled_streak(entry_dict)
+        if journaled is not None:
+            entries.append(journaled)
+    return entries
+
+
+def is_compaction_pending(filepath: Path) -> bool:
+    """Check whether a compaction stopped after renaming its journal to compacted, before its snapshot was in place.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        bool: True if the merged snapshot still waits in its temporary file.
+
+    """
+    return get_compacted_path(filepath).exists() and get_temp_path(filepath).exists()
+
+
+def read_all_streaks(filepath: Path) -> list[StreakEntry]:
+    """Read every streak on the leaderboard: the snapshot's, then the journaled ones.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        list[StreakEntry]: The streaks, unsorted.
+
+    """
+    return [journaled.entry for journaled in read_all_journaled_streaks(filepath)]
+
+
+def read_all_journaled_streaks(filepath: Path) -> list[JournaledStreak]:
+    """Read every streak on the leaderboard with the sequence numbers of the journaled ones.
+
+    A journal left by an interrupted compaction is read as well, unless its streaks are
+    already in the snapshot.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        list[JournaledStreak]: The snapshot's streaks, then the journaled ones in the order they were added.
+
+    """
+    compaction_pending = is_compaction_pending(filepath)
+    streaks = [JournaledStreak(entry=entry, seq=None) for entry in read_snapshot(filepath)]
+    if compaction_pending:
+        streaks.extend(read_journaled_streaks(get_compacted_path(filepath)))
+    streaks.extend(read_journaled_streaks(get_compacting_path(filepath)))
+    streaks.extend(read_journaled_streaks(get_journal_path(filepath)))
+    return streaks
+
+
+def read_recorded_streaks(filepath: Path) -> list[StreakEntry]:
+    """Read every streak ever recorded on the leaderboard, including those dropped from the snapshot.
+
+    The streaks come from the history. Journaled streaks that a crash dropped from it are added
+    from the journals, without writing to any file. A leaderboard saved before histories were
+    kept only has the streaks of its snapshot and journals.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        list[StreakEntry]: The streaks, in the order they were recorded.
+
+    """
+    history_path = get_history_path(filepath)
+    if not history_path.exists():
+        return read_all_streaks(filepath)
+    history = read_journaled_streaks(history_path)
+    recorded = {journaled.seq for journaled in history}
+    lost = [
+        journaled.entry
+        for journaled in read_all_journaled_streaks(filepath)
+        if journaled.seq is not None and journaled.seq not in recorded
+    ]
+    return [journaled.entry for journaled in history] + lost
+
+
+def _read_sequence_numbers(lines: Iterable[bytes]) -> list[int]:
+    """Read the sequence numbers of journal or history lines.
+
+    Args:
+        lines (Iterable[bytes]): The lines. Those that cannot be decoded, such as one cut off
+            at the start of a tail, are skipped.
+
+    Returns:
+        list[int]: The sequence numbers, in the order of the lines.
+
+    """
+    seqs: list[int] = []
+    for line in lines:
+        try:
+            journaled = _parse_journaled_streak(json.loads(line))
+        except ValueError:
+            continue
+        if journaled is not None and journaled.seq is not None:
+            seqs.append(journaled.seq)
+    return seqs
+
+
+def _read_last_sequence_number(journal_path: Path) -> int | None:
+    """Read the last sequence number of a journal or history from its tail.
+
+    Args:
+        journal_path (Path): The journal or history file.
+
+    Returns:
+        int | None: The number, or None if the file is missing or its tail has none.
+
+    """
+    try:
+        with journal_path.open("rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - SEQUENCE_TAIL_BYTES))
+            tail = f.read()
+    except OSError:
+        return None
+    seqs = _read_sequence_numbers(tail.splitlines())
+    return seqs[-1] if seqs else None
+
+
+def next_sequence_number(filepath: Path) -> int:
+    """Return the sequence number of the next streak to journal. The caller must hold the leaderboard lock.
+
+    The journals are synced, so they still hold the last numbers when a crash dropped them from the history.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    Returns:
+        int: One more than the last number in the journal, the journal being compacted or the history.
+
+    """
+    paths = (get_journal_path(filepath), get_compacting_path(filepath), get_history_path(filepath))
+    last_seqs = [seq for seq in map(_read_last_sequence_number, paths) if seq is not None]
+    return max(last_seqs, default=-1) + 1
+
+
+def _write_file(path: Path, data: bytes, mode: str, *, sync: bool = True) -> None:
+    """Write bytes to a file, flushed and, unless told otherwise, synced to disk.
+
+    Args:
+        path (Path): The file.
+        data (bytes): The bytes to write.
+        mode (str): The open mode, "wb" or "ab".
+        sync (bool): Whether to wait for the data to reach the disk.
+
+    """
+    with path.open(mode) as f:
+        f.write(data)
+        f.flush()
+        if sync:
+            os.fsync(f.fileno())
+
+
+def _ends_with_newline(journal_path: Path) -> bool:
+    """Check whether a journal's last line is complete.
+
+    Args:
+        journal_path (Path): The journal or history file.
+
+    Returns:
+        bool: True if the file is missing, empty or ends with a newline.
+
+    """
+    try:
+        with journal_path.open("rb") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except FileNotFoundError:
+        return True
+
+
+def save_streaks_to_file(filepath: Path, streaks: list[StreakEntry], merged_journal: Path | None = None) -> bool:
+    """Replace the snapshot with a list of streaks.
+
+    The streaks are written to a synced temporary file that is renamed over the snapshot.
+    A merged journal is renamed to the compacted path in between, so it is never merged twice.
+
+    Args:
+        filepath (Path): The snapshot file.
+        streaks (list[StreakEntry]): The streaks to save.
+        merged_journal (Path | None): The journal merged into these streaks, if any.
+
+    Returns:
+        bool: True if the snapshot was replaced.
+
+    """
+    temp_path = get_temp_path(filepath)
+    data_to_save = [asdict(entry) for entry in streaks]
+    try:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        _write_file(temp_path, json.dumps(data_to_save, indent=4).encode("utf-8"), mode="wb")
+        if merged_journal is not None:
+            _replace_with_retries(merged_journal, get_compacted_path(filepath))
+        _replace_with_retries(temp_path, filepath)
+    except OSError:
+        print(f"Error: Could not save streaks to {filepath}.")
+        return False
+    return True
+
+
+def append_to_journal(
+    journal_path: Path,
+    new_entry: StreakEntry,
+    *,
+    seq: int | None = None,
+    sync: bool = True,
+) -> bool:
+    """Append a streak to a journal or history as one line, started on a new line if a crash tore the last one.
+
+    Args:
+        journal_path (Path): The journal or history file.
+        new_entry (StreakEntry): The streak.
+        seq (int | None): Its sequence number, from next_sequence_number.
+        sync (bool): Whether to wait for the line to reach the disk.
+
+    Returns:
+        bool: True if the line was written.
+
+    """
+    line = _encode_journal_line(new_entry, seq)
+    try:
+        journal_path.parent.mkdir(parents=True, exist_ok=True)
+        if not _ends_with_newline(journal_path):
+            line = b"\n" + line
+        _write_file(journal_path, line, mode="ab", sync=sync)
+    except OSError:
+        print(f"Error: Could not save streak to {journal_path}.")
+        return False
+    return True
+
+
+def start_history(filepath: Path) -> None:
+    """Create the history from every streak on the leaderboard, for leaderboards saved before histories were kept.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    """
+    history_path = get_history_path(filepath)
+    temp_path = get_temp_path(history_path)
+    streaks = read_all_journaled_streaks(filepath)
+    lines = b"".join(_encode_journal_line(journaled.entry, journaled.seq) for journaled in streaks)
+    _write_file(temp_path, lines, mode="wb")
+    _replace_with_retries(temp_path, history_path)
+
+
+def catch_up_history(filepath: Path, pending: list[JournaledStreak]) -> None:
+    """Append the journaled streaks that a crash dropped from the history, and sync it.
+
+    The history is only synced here, so an OS crash can lose the last lines appended to it.
+    Pending streaks whose sequence number is not in the history's tail are appended again.
+
+    Args:
+        filepath (Path): The snapshot file.
+        pending (list[JournaledStreak]): The streaks in the journals, in the order they were added.
+
+    """
+    history_path = get_history_path(filepath)
+    sequenced = [journaled for journaled in pending if journaled.seq is not None]
+    if not sequenced or not history_path.exists():
+        return
+    lines = [_encode_journal_line(journaled.entry, journaled.seq) for journaled in sequenced]
+    with history_path.open("r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - 2 * sum(map(len, lines))))  # Room for the pending lines and as many torn ones
+        tail = f.read()
+        present = set(_read_sequence_numbers(tail.splitlines()))
+        missing = b"".join(
+            line for journaled, line in zip(sequenced, lines, strict=True) if journaled.seq not in present
+        )
+        if missing and size and not tail.endswith(b"\n"):
+            missing = b"\n" + missing
+        f.seek(0, os.SEEK_END)
+        f.write(missing)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def finish_compaction(filepath: Path) -> None:
+    """Put in place the merged snapshot of a compaction that stopped before it replaced the old one.
+
+    Args:
+        filepath (Path): The snapshot file.
+
+    """
+    compacted_path = get_compacted_path(filepath)
+    if not compacted_path.exists():
+        return
+    if is_compaction_pending(filepath):
+        _replace_with_retries(get_temp_path(filepath), filepath)
+    compacted_path.unlink()
+
+
+def compact_journal(filepath: Path, max_entries: int) -> list[StreakEntry] | None:
+    """Merge the journal into the snapshot, keeping the best max_entries streaks. The caller must hold the lock.
+
+    The journal is renamed to the compacting path first, so a compaction cut short by a crash
+    is merged again by the next one. The history is caught up before the snapshot is replaced.
+
+    Args:
+        filepath (Path): The snapshot file.
+        max_entries (int): The number of streaks to keep in the snapshot.
+
+    Returns:
+        list[StreakEntry] | None: The streaks of the new snapshot, or None if there was nothing
+            to merge or it could not be saved.
+
+    """
+    journal_path = get_journal_path(filepath)
+    compacting_path = get_compacting_path(filepath)
+    try:
+        finish_compaction(filepath)
+        if not compacting_path.exists():
+            if not journal_path.exists():
+                return None
+            _replace_with_retries(journal_path, compacting_path)
+    except OSError:
+        return None
+    merged = read_journaled_streaks(compacting_path)
+    try:
+        catch_up_history(filepath, merged + read_journaled_streaks(journal_path))
+    except OSError:
+        return None
+
+    streaks = sort_streaks(read_snapshot(filepath) + [journaled.entry for journaled in merged])[:max_entries]
+    if not save_streaks_to_file(filepath, streaks, merged_journal=compacting_path):
+        return None
+    with contextlib.suppress(OSError):
+        get_compacted_path(filepath).unlink()
+    return streaks
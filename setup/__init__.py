@@ -4,8 +4,14 @@ This package contains modules for initializing game settings, menus, word select
 and grid generation.
 
 Modules:
+    benchmark: Benchmark harness for word list and board generation.
+    lexicon: Functions for reading, indexing and caching the lexicon.
     menu_constants: Constants used in game menus.
     menus: Functions for displaying and handling game menus.
+    puzzle_bank: Append-only store of pre-generated puzzles, filled by the bank command.
+    puzzle_factory: Background pre-generation of puzzles between rounds.
+    simulation: Batch bot games reporting the win rate of every wizard, run by the simulate command.
+    startup_benchmark: Import time benchmark of the game's startup.
     word_selector: Functions for selecting and filtering words for the game.
     grid_generator: Subpackage for generating and validating the word grid.
 """
@@ -0,0 +1,325 @@
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field, replace
+
+from data.settings_details import HEART_POINTS_SETTINGS, DifficultyData
+
+from .grid_generator.main_generator import BOARD_ENGINES
+from .lexicon import Lexicon, load_lexicon
+from .seeded_puzzles import MAX_ATTEMPTS_PER_PUZZLE, add_seed_argument, iter_puzzle_attempts
+from .word_selector import describe_unsupported_settings
+
+DEFAULT_LEXICON_PATH = "corncob-lowercase.txt"
+DEFAULT_OUTPUT_PATH = "benchmark_results.json"
+DEFAULT_RUNS = 50  # Puzzles generated per difficulty
+DEFAULT_BASE_SEED = 0  # Puzzle i of every difficulty is generated with seed base_seed + i
+DEFAULT_MEMORY_RUNS = 3  # Puzzles re-generated under tracemalloc to measure peak memory
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class PuzzleRun:
+    """The outcome of generating one puzzle, retrying until it succeeds or runs out of attempts.
+
+    Attributes:
+        seed (int): The seed of the random number generator used for every attempt.
+        latency_seconds (float): Time spent on all attempts.
+        attempts (int): Number of word list and board attempts made.
+        succeeded (bool): Whether a valid board was generated.
+        failure_reasons (list[str]): Why each failed attempt failed.
+
+    """
+
+    seed: int
+    latency_seconds: float
+    attempts: int
+    succeeded: bool
+    failure_reasons: list[str] = field(default_factory=list)
+
+
+@dataclass
+class PresetReport:
+    """Benchmark results for one difficulty preset.
+
+    Attributes:
+        difficulty (str): Name of the difficulty preset.
+        board_engine (str): The board generator engine that was measured.
+        runs (int): Number of puzzles generated.
+        successes (int): Number of puzzles that ended with a valid board.
+        failure_rate (float): Share of puzzles that ran out of attempts.
+        attempts_per_success (float | None): Attempts made per valid board, or None if none succeeded.
+        latency_ms (dict[str, float]): Latency percentiles and mean per puzzle, in milliseconds.
+        peak_memory_kib (float): Peak memory allocated while generating a puzzle, in KiB.
+        failure_reasons (dict[str, int]): How often each kind of failed attempt happened.
+
+    """
+
+    difficulty: str
+    board_engine: str
+    runs: int
+    successes: int
+    failure_rate: float
+    attempts_per_success: float | None
+    latency_ms: dict[str, float]
+    peak_memory_kib: float
+    failure_reasons: dict[str, int] = field(default_factory=dict)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of a list of values.
+
+    Args:
+        values (list[float]): The measured values.
+        pct (float): The percentile to compute, between 0 and 100.
+
+    Returns:
+        float: The smallest value that at least pct percent of the values are less than or equal to,
+            or 0.0 if there are no values.
+
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def normalize_failure_reason(reason: str) -> str:
+    """Replace the numbers and quoted words in a failure reason, so that similar failures are counted together.
+
+    Args:
+        reason (str): The failure reason reported by the word selector or board generator.
+
+    Returns:
+        str: The reason with numbers replaced by N and quoted words by '...'.
+
+    """
+    return re.sub(r"\d+", "N", re.sub(r"'[^']*'", "'...'", reason))
+
+
+def run_puzzle(difficulty_conf: DifficultyData, lexicon: Lexicon, seed: int) -> PuzzleRun:
+    """Generate one puzzle from a fixed seed, retrying like the game does until it succeeds.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings for the puzzle.
+        lexicon (Lexicon): The compiled lexicon.
+        seed (int): The seed for the puzzle's random number generator.
+
+    Returns:
+        PuzzleRun: The timing and outcome of the puzzle.
+
+    """
+    failure_reasons: list[str] = []
+    start_time = time.perf_counter()
+    attempts = iter_puzzle_attempts(difficulty_conf, lexicon, random.Random(seed))
+    for attempt, (puzzle, reason) in enumerate(attempts, start=1):
+        if puzzle is not None:
+            return PuzzleRun(
+                seed,
+                time.perf_counter() - start_time,
+                attempt,
+                succeeded=True,
+                failure_reasons=failure_reasons,
+            )
+        failure_reasons.append(reason)
+    return PuzzleRun(
+        seed,
+        time.perf_counter() - start_time,
+        MAX_ATTEMPTS_PER_PUZZLE,
+        succeeded=False,
+        failure_reasons=failure_reasons,
+    )
+
+
+def measure_peak_memory(difficulty_conf: DifficultyData, lexicon: Lexicon, seeds: list[int]) -> int:
+    """Measure the largest amount of memory allocated while generating any one of the puzzles.
+
+    Runs separately from the timed runs, since tracing allocations slows generation down.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings for the puzzles.
+        lexicon (Lexicon): The compiled lexicon.
+        seeds (list[int]): Seeds of the puzzles to generate.
+
+    Returns:
+        int: The peak traced memory, in bytes.
+
+    """
+    peak_bytes = 0
+    tracemalloc.start()
+    try:
+        for seed in seeds:
+            tracemalloc.reset_peak()
+            run_puzzle(difficulty_conf, lexicon, seed)
+            peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+    return peak_bytes
+
+
+def benchmark_preset(
+    difficulty_name: str,
+    difficulty_conf: DifficultyData,
+    lexicon: Lexicon,
+    runs: int,
+    base_seed: int,
+) -> PresetReport:
+    """Generate a fixed series of puzzles for one difficulty and summarize how it went.
+
+    Args:
+        difficulty_name (str): Name of the difficulty preset.
+        difficulty_conf (DifficultyData): The difficulty settings.
+        lexicon (Lexicon): The compiled lexicon.
+        runs (int): Number of puzzles to generate.
+        base_seed (int): Seed of the first puzzle, the others follow on from it.
+
+    Returns:
+        PresetReport: The summarized results.
+
+    """
+    seeds = [base_seed + run for run in range(runs)]
+    puzzle_runs = [run_puzzle(difficulty_conf, lexicon, seed) for seed in seeds]
+    peak_memory = measure_peak_memory(difficulty_conf, lexicon, seeds[:DEFAULT_MEMORY_RUNS])
+
+    latencies_ms = [puzzle_run.latency_seconds * 1000 for puzzle_run in puzzle_runs]
+    latency_ms = {f"p{pct}": round(percentile(latencies_ms, pct), 3) for pct in LATENCY_PERCENTILES}
+    latency_ms["mean"] = round(sum(latencies_ms) / len(latencies_ms), 3) if latencies_ms else 0.0
+
+    successes = sum(puzzle_run.succeeded for puzzle_run in puzzle_runs)
+    total_attempts = sum(puzzle_run.attempts for puzzle_run in puzzle_runs)
+    failure_reasons: dict[str, int] = {}
+    for puzzle_run in puzzle_runs:
+        for reason in puzzle_run.failure_reasons:
+            normalized_reason = normalize_failure_reason(reason)
+            failure_reasons[normalized_reason] = failure_reasons.get(normalized_reason, 0) + 1
+
+    return PresetReport(
+        difficulty=difficulty_name,
+        board_engine=difficulty_conf.board_engine,
+        runs=runs,
+        successes=successes,
+        failure_rate=round(1 - successes / runs, 4) if runs else 0.0,
+        attempts_per_success=round(total_attempts / successes, 3) if successes else None,
+        latency_ms=latency_ms,
+        peak_memory_kib=round(peak_memory / 1024, 1),
+        failure_reasons=dict(sorted(failure_reasons.items(), key=lambda item: -item[1])),
+    )
+
+
+def run_benchmark(
+    lexicon: Lexicon,
+    runs: int = DEFAULT_RUNS,
+    base_seed: int = DEFAULT_BASE_SEED,
+    board_engine: str | None = None,
+) -> list[PresetReport]:
+    """Benchmark word list and board generation for every difficulty in HEART_POINTS_SETTINGS.
+
+    Args:
+        lexicon (Lexicon): The compiled lexicon.
+        runs (int): Number of puzzles to generate per difficulty.
+        base_seed (int): Seed of the first puzzle of each difficulty.
+        board_engine (str | None): Board engine to use for every difficulty, or None to keep each preset's own.
+
+    Returns:
+        list[PresetReport]: One report per difficulty that the lexicon supports.
+
+    """
+    reports: list[PresetReport] = []
+    for difficulty_name, difficulty_conf in HEART_POINTS_SETTINGS.items():
+        conf = difficulty_conf if board_engine is None else replace(difficulty_conf, board_engine=board_engine)
+        unsupported_reason = describe_unsupported_settings(conf, lexicon)
+        if unsupported_reason:
+            print(f"Skipping {difficulty_name}: {unsupported_reason}", file=sys.stderr)
+            continue
+        reports.append(benchmark_preset(difficulty_name, conf, lexicon, runs, base_seed))
+    return reports
+
+
+def format_report_table(reports: list[PresetReport]) -> str:
+    """Format the benchmark reports as a plain text table.
+
+    Args:
+        reports (list[PresetReport]): The reports to show.
+
+    Returns:
+        str: One header line and one line per difficulty.
+
+    """
+    header = (
+        f"{'Difficulty':<24}{'Engine':<14}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'Att/ok':>8}{'Fail':>8}{'Peak KiB':>11}"
+    )
+    lines = [header]
+    for report in reports:
+        attempts = f"{report.attempts_per_success:.2f}" if report.attempts_per_success is not None else "-"
+        lines.append(
+            f"{report.difficulty:<24}{report.board_engine:<14}"
+            f"{report.latency_ms['p50']:>10.1f}{report.latency_ms['p95']:>10.1f}{report.latency_ms['p99']:>10.1f}"
+            f"{attempts:>8}{report.failure_rate:>8.1%}{report.peak_memory_kib:>11.1f}",
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the benchmark's command-line arguments.
+
+    Args:
+        argv (list[str] | None): The arguments, or None to read them from sys.argv.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m setup.benchmark",
+        description="Benchmark word list and board generation for every heart points difficulty.",
+    )
+    parser.add_argument("lexicon", nargs="?", default=DEFAULT_LEXICON_PATH, help="Lexicon file to generate from.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Puzzles to generate per difficulty.")
+    add_seed_argument(parser, default=DEFAULT_BASE_SEED)
+    parser.add_argument(
+        "--engine",
+        choices=sorted(BOARD_ENGINES),
+        default=None,
+        help="Board engine to use for every difficulty, instead of each preset's own.",
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help="JSON file to write the results to.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark, print a summary table and write the full results as JSON.
+
+    Args:
+        argv (list[str] | None): The command-line arguments, or None to read them from sys.argv.
+
+    """
+    args = parse_args(argv)
+    lexicon = load_lexicon(args.lexicon)
+    if lexicon is None:
+        print(f"Lexicon file {args.lexicon} is missing or empty.", file=sys.stderr)
+        sys.exit(1)
+
+    reports = run_benchmark(lexicon, runs=args.runs, base_seed=args.seed, board_engine=args.engine)
+    print(format_report_table(reports))
+
+    results = {
+        "lexicon": args.lexicon,
+        "runs": args.runs,
+        "base_seed": args.seed,
+        "max_attempts_per_puzzle": MAX_ATTEMPTS_PER_PUZZLE,
+        "presets": [asdict(report) for report in reports],
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,11 @@ This package contains modules for generating and validating the word grid,
 including board state management, word placement logic, and placement rules.
 
 Modules:
+    backtracking_generator: Backtracking board generator engine.
     board_state: Dataclasses and functions for managing the board state and grid data.
+    flat_grid: Compact bytearray grid used during board generation.
     main_generator: Main functions for generating the game board.
+    parallel_generator: Parallel board generation across a process pool.
     placement_logic: Logic for finding and applying valid word placements.
     placement_rules: Rules and validation checks for word placement.
 """
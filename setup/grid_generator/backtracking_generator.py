@@ -0,0 +1,346 @@
+import random
+from dataclasses import dataclass, field
+
+from data.settings_details import DifficultyData
+
+from .board_state import BoardGenerationState, PlacementDetail, PlacementUndo, is_stopped
+from .placement_logic import (
+    apply_placement_with_undo,
+    categorize_placement,
+    find_possible_placements,
+    is_valid_crossing,
+    undo_placement,
+)
+
+MAX_BACKTRACKS = 200  # Number of placements the engine may undo before giving up on a board
+
+
+@dataclass
+class SearchBudget:
+    """Tracks how many more placements the search may undo.
+
+    Attributes:
+        backtracks_left (int): Remaining number of placements that may be undone.
+        best_word_count (int): Most words that were on the board at any point of the search.
+
+    """
+
+    backtracks_left: int = MAX_BACKTRACKS
+    best_word_count: int = 0
+
+    def spend(self) -> bool:
+        """Use up one backtrack.
+
+        Returns:
+            bool: True if the search may continue, False once the budget is exhausted.
+
+        """
+        self.backtracks_left -= 1
+        return self.backtracks_left > 0
+
+
+@dataclass
+class SearchFrame:
+    """One decision of the search: where to place a word, or whether to leave it out.
+
+    Attributes:
+        word (str): The word being decided.
+        candidates (list[PlacementDetail]): Placements still to be tried, the next one last.
+        undo (PlacementUndo | None): Record of the placement currently applied, or None if the word is left out.
+
+    """
+
+    word: str
+    candidates: list[PlacementDetail] = field(default_factory=list)
+    undo: PlacementUndo | None = None
+
+
+def find_middle_word_crossings(
+    state: BoardGenerationState,
+    middle_coord: tuple[int, int],
+    words: list[str],
+    all_words: set[str],
+) -> list[PlacementDetail]:
+    """Find every valid placement of an unplaced word that crosses a given middle word cell.
+
+    Args:
+        state (BoardGenerationState): The current board generation state.
+        middle_coord (tuple[int, int]): The middle word cell to cross.
+        words (list[str]): Candidate words, already placed ones are ignored.
+        all_words (set[str]): Every word that could be on the board.
+
+    Returns:
+        list[PlacementDetail]: The valid crossing placements.
+
+    """
+    row, col = middle_coord
+    letter = state.grid[row][col]
+    crossings: list[PlacementDetail] = []
+    for word in words:
+        if word in state.placed_words_coords:
+            continue
+        for idx, letter_in_word in enumerate(word):
+            if letter_in_word != letter:
+                continue
+            intersection_info = {"row": row, "col": col, "idx": idx}
+            crossings.extend(
+                PlacementDetail(word=word, coord=middle_coord, idx=idx, orientation=orientation)
+                for orientation in ("V", "H")
+                if is_valid_crossing(
+                    state.grid,
+                    word,
+                    all_words,
+                    intersection_info,
+                    orientation,
+                    open_anchors=state.open_anchors,
+                )
+            )
+    return crossings
+
+
+def cover_middle_word(
+    state: BoardGenerationState,
+    words: list[str],
+    all_words: set[str],
+    budget: SearchBudget,
+    rng: random.Random | None = None,
+) -> bool:
+    """Cross every middle word letter with a placed word, backtracking on dead ends.
+
+    The uncrossed middle word cell with the fewest crossing placements is always filled first.
+
+    Args:
+        state (BoardGenerationState): The current board generation state.
+        words (list[str]): Words that may be used to cross the middle word.
+        all_words (set[str]): Every word that could be on the board.
+        budget (SearchBudget): The shared backtracking budget.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+
+    Returns:
+        bool: True if every middle word cell is crossed, False if the search failed, ran out of budget or was stopped.
+
+    """
+    if is_stopped(state):
+        return False
+    uncrossed_coords = sorted(state.middle_word_coords - state.used_middle_word_coords)
+    if not uncrossed_coords:
+        return True
+
+    crossings_by_coord = {
+        coord: find_middle_word_crossings(state, coord, words, all_words) for coord in uncrossed_coords
+    }
+    most_constrained_coord = min(uncrossed_coords, key=lambda coord: len(crossings_by_coord[coord]))
+    crossings = crossings_by_coord[most_constrained_coord]
+    (rng or random).shuffle(crossings)
+
+    for crossing in crossings:
+        undo = apply_placement_with_undo(state, crossing)
+        budget.best_word_count = max(budget.best_word_count, len(state.placed_words_coords))
+        if cover_middle_word(state, words, all_words, budget, rng):
+            return True
+        undo_placement(state, undo)
+        if not budget.spend():
+            return False
+    return False
+
+
+def order_most_constrained(
+    state: BoardGenerationState,
+    words: list[str],
+    all_words: set[str],
+    rng: random.Random | None = None,
+) -> list[str]:
+    """Order the unplaced words so that those with the fewest placements come first.
+
+    Words that cannot be placed yet go last, since later placements may open room for them.
+
+    Args:
+        state (BoardGenerationState): The current board generation state.
+        words (list[str]): The words to order.
+        all_words (set[str]): Every word that could be on the board.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+
+    Returns:
+        list[str]: The unplaced words, most constrained first.
+
+    """
+    unplaced_words = [word for word in words if word not in state.placed_words_coords]
+    (rng or random).shuffle(unplaced_words)
+    placement_counts = {
+        word: len(
+            find_possible_placements(
+                state.grid,
+                word,
+                all_words,
+                state.placed_letter_coords,
+                open_anchors=state.open_anchors,
+            ),
+        )
+        for word in unplaced_words
+    }
+    return sorted(unplaced_words, key=lambda word: (placement_counts[word] == 0, placement_counts[word]))
+
+
+def _get_candidates(
+    state: BoardGenerationState,
+    word: str,
+    all_words: set[str],
+    rng: random.Random | None = None,
+) -> list[PlacementDetail]:
+    """Find the placements of a word, in the order they should be tried (the next one last).
+
+    Args:
+        state (BoardGenerationState): The current board generation state.
+        word (str): The word to place.
+        all_words (set[str]): Every word that could be on the board.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+
+    Returns:
+        list[PlacementDetail]: Shuffled placements, with those crossing unused middle word cells tried first.
+
+    """
+    possible_placements = find_possible_placements(
+        state.grid,
+        word,
+        all_words,
+        state.placed_letter_coords,
+        open_anchors=state.open_anchors,
+    )
+    priority_placements, other_placements = categorize_placement(
+        possible_placements,
+        state.middle_word_coords,
+        state.used_middle_word_coords,
+    )
+    (rng or random).shuffle(priority_placements)
+    (rng or random).shuffle(other_placements)
+    return other_placements + priority_placements
+
+
+def _try_next_candidate(state: BoardGenerationState, frame: SearchFrame) -> None:
+    """Apply the frame's next candidate placement, or leave the word out if none are left.
+
+    Args:
+        state (BoardGenerationState): The current board generation state.
+        frame (SearchFrame): The decision to advance.
+
+    """
+    frame.undo = apply_placement_with_undo(state, frame.candidates.pop()) if frame.candidates else None
+
+
+def _backtrack(state: BoardGenerationState, stack: list[SearchFrame], budget: SearchBudget) -> bool:
+    """Undo decisions until one with an untried alternative is found, and switch to that alternative.
+
+    Args:
+        state (BoardGenerationState): The current board generation state.
+        stack (list[SearchFrame]): The decisions made so far, the latest last.
+        budget (SearchBudget): The shared backtracking budget.
+
+    Returns:
+        bool: True if an alternative was applied, False if none is left or the budget ran out.
+
+    """
+    while stack:
+        frame = stack[-1]
+        if frame.undo is not None:
+            undo_placement(state, frame.undo)
+            frame.undo = None
+            if not budget.spend():
+                return False
+            _try_next_candidate(state, frame)
+            return True
+        stack.pop()
+    return False
+
+
+def fill_remaining_words(  # noqa: PLR0913, PLR0917
+    state: BoardGenerationState,
+    ordered_words: list[str],
+    all_words: set[str],
+    word_bounds: tuple[int, int],
+    budget: SearchBudget,
+    rng: random.Random | None = None,
+) -> bool:
+    """Place words in order, backtracking whenever the minimum word count can no longer be reached.
+
+    Every word is either placed at one of its candidate placements or left out. A branch is
+    abandoned as soon as the words still to be decided cannot make up the minimum.
+
+    Args:
+        state (BoardGenerationState): The current board generation state.
+        ordered_words (list[str]): The unplaced words, in the order they are decided.
+        all_words (set[str]): Every word that could be on the board.
+        word_bounds (tuple[int, int]): The minimum and maximum number of words on the board.
+        budget (SearchBudget): The shared backtracking budget.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+
+    Returns:
+        bool: True if at least the minimum number of words is on the board, False otherwise.
+
+    """
+    min_total_words, max_total_words = word_bounds
+    stack: list[SearchFrame] = []
+    while not is_stopped(state):
+        placed_count = len(state.placed_words_coords)
+        budget.best_word_count = max(budget.best_word_count, placed_count)
+        position = len(stack)
+        words_left = len(ordered_words) - position
+
+        if placed_count >= max_total_words or words_left == 0:
+            if placed_count >= min_total_words:
+                return True
+        elif placed_count + words_left >= min_total_words:
+            word = ordered_words[position]
+            frame = SearchFrame(word=word, candidates=_get_candidates(state, word, all_words, rng))
+            stack.append(frame)
+            _try_next_candidate(state, frame)
+            continue
+
+        if not _backtrack(state, stack, budget):
+            return False
+    return False
+
+
+def place_words_backtracking(
+    state: BoardGenerationState,
+    words_to_place: list[str],
+    difficulty_conf: DifficultyData,
+    rng: random.Random | None = None,
+) -> str | None:
+    """Place the sub-words with bounded backtracking, so one call reaches a valid board more often.
+
+    The middle word letters are crossed first, the most constrained letter first. The remaining
+    words are then placed most constrained first, undoing placements whenever the minimum word
+    count becomes unreachable. The search gives up after MAX_BACKTRACKS undone placements.
+
+    No preset selects this engine, it is opt-in through DifficultyData.board_engine. On the heart
+    points presets the greedy engine already needs about 1.1 attempts per valid board, so the
+    search saves little and costs a slower median puzzle and several times the peak memory.
+
+    Args:
+        state (BoardGenerationState): The board state, with the middle word already placed.
+        words_to_place (list[str]): List of sub-words to be placed on the grid.
+        difficulty_conf (DifficultyData): Difficulty configuration containing word requirements.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+
+    Returns:
+        str | None: Why no valid board was found, or None on success.
+
+    """
+    min_total_words = difficulty_conf.words_on_board_needed.minimum
+    max_total_words = difficulty_conf.words_on_board_needed.maximum
+    all_words = set(words_to_place) | set(state.placed_words_coords)
+    budget = SearchBudget()
+
+    if not cover_middle_word(state, words_to_place, all_words, budget, rng):
+        if budget.backtracks_left <= 0:
+            return f"Ran out of backtracks ({MAX_BACKTRACKS}) while crossing every letter of the middle word."
+        return "No arrangement of the sub-words crosses every letter of the middle word."
+
+    ordered_words = order_most_constrained(state, words_to_place, all_words, rng)
+    word_bounds = (min_total_words, max_total_words)
+    if not fill_remaining_words(state, ordered_words, all_words, word_bounds, budget, rng):
+        return (
+            f"Placed at most {budget.best_word_count} of the {min_total_words} words needed "
+            f"after {MAX_BACKTRACKS - max(budget.backtracks_left, 0)} backtracks."
+        )
+    return None
@@ -1,5 +1,8 @@
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
+from .flat_grid import FlatGrid
+
 
 @dataclass
 class PlacementDetail:
@@ -19,24 +22,81 @@ class PlacementDetail:
     orientation: str
 
 
+@dataclass
+class PlacementUndo:
+    """Records what a single placement changed, so that it can be undone.
+
+    Attributes:
+        word (str): The word that was placed.
+        new_cells (list[tuple[int, int]]): Cells that were empty before the placement.
+        new_letters (list[str]): Letters written into new_cells, in the same order.
+        used_middle_word_coord (tuple[int, int] | None): Middle word cell first crossed by this placement, if any.
+
+    """
+
+    word: str
+    new_cells: list[tuple[int, int]]
+    new_letters: list[str]
+    used_middle_word_coord: tuple[int, int] | None = None
+
+
+@dataclass(frozen=True)
+class AnchorRun:
+    """Room around a placed letter for a word crossing it in one orientation.
+
+    Attributes:
+        before (int): Letters a crossing word may put before the anchor without touching other letters.
+        after (int): Letters a crossing word may put after the anchor without touching other letters.
+        before_blocker (str | None): Letter of the occupied cell that ends the free run before the anchor,
+            or None if the run ends at the grid edge or at an empty cell that cannot take a letter.
+        after_blocker (str | None): Same as before_blocker, for the run after the anchor.
+
+    """
+
+    before: int
+    after: int
+    before_blocker: str | None = None
+    after_blocker: str | None = None
+
+
 @dataclass
 class BoardGenerationState:
     """Holds the mutable state during the board generation process.
 
     Attributes:
-        grid (list[list[str | None]]): The 2D grid representing the board.
+        grid (list[list[str | None]] | FlatGrid): The 2D grid representing the board.
         placed_words_coords (dict[str, list[tuple[int, int]]]): Mapping of words to their placed coordinates.
         placed_letter_coords (dict[str, list[tuple[int, int]]]): Mapping of letters to their placed coordinates.
         used_middle_word_coords (set[tuple[int, int]]): Set of coordinates used for the middle word.
         middle_word_coords (set[tuple[int, int]]): Set of coordinates for the middle word.
+        open_anchors (dict[tuple[str, str], dict[tuple[int, int], AnchorRun]] | None): For each
+            (letter, orientation), the placed cells a new word may still cross and the room around them.
+            Kept up to date incrementally by update_open_anchors, or None if the state is not indexed.
+        should_stop (Callable[[], bool] | None): Checked between placements, the engines give up once it
+            returns True. None to never stop early.
 
     """
 
-    grid: list[list[str | None]]
+    grid: list[list[str | None]] | FlatGrid
     placed_words_coords: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
     placed_letter_coords: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
     used_middle_word_coords: set[tuple[int, int]] = field(default_factory=set)
     middle_word_coords: set[tuple[int, int]] = field(default_factory=set)
+    open_anchors: dict[tuple[str, str], dict[tuple[int, int], AnchorRun]] | None = None
+    should_stop: Callable[[], bool] | None = None
+
+
+def is_stopped(state: BoardGenerationState) -> bool:
+    """Check whether the board generation was asked to give up.
+
+    Args:
+        state (BoardGenerationState): The current board generation state.
+
+    Returns:
+        bool: True if the state's should_stop callback returns True.
+
+    """
+    return state.should_stop is not None and state.should_stop()
 
 
 def create_empty_grid(height: int, width: int) -> list[list[str | None]]:
@@ -53,37 +113,231 @@ def create_empty_grid(height: int, width: int) -> list[list[str | None]]:
     return [[None] * width for _ in range(height)]
 
 
+def get_cell(grid: list[list[str | None]] | FlatGrid, row: int, col: int) -> str | None:
+    """Read one cell of either grid form.
+
+    Args:
+        grid (list[list[str | None]] | FlatGrid): The 2D grid.
+        row (int): Row index of the cell.
+        col (int): Column index of the cell.
+
+    Returns:
+        str | None: The letter in the cell, or None if it is empty.
+
+    """
+    if isinstance(grid, FlatGrid):
+        return grid.get(row, col)
+    return grid[row][col]
+
+
+def to_nested_grid(grid: list[list[str | None]] | FlatGrid) -> list[list[str | None]]:
+    """Return the nested-list form of a grid, converting it if it is a FlatGrid.
+
+    Args:
+        grid (list[list[str | None]] | FlatGrid): The 2D grid.
+
+    Returns:
+        list[list[str | None]]: The grid as a list of rows.
+
+    """
+    if isinstance(grid, FlatGrid):
+        return grid.to_nested()
+    return grid
+
+
 def place_letters_on_grid(
-    grid: list[list[str | None]],
+    grid: list[list[str | None]] | FlatGrid,
     word: str,
     coords_to_place: list[tuple[int, int]],
 ) -> None:
     """Place the letters of a word onto the grid at specified coordinates.
 
     Args:
-        grid (list[list[str | None]]): The 2D grid to place letters on.
+        grid (list[list[str | None]] | FlatGrid): The 2D grid to place letters on.
         word (str): The word whose letters are to be placed.
         coords_to_place (list[tuple[int, int]]): List of (row, col) coordinates for each letter in the word.
 
     """
+    if isinstance(grid, FlatGrid):
+        grid.place_word(word, coords_to_place)
+        return
     for idx, coord_pair in enumerate(coords_to_place):
         row, col = coord_pair
         if 0 <= row < len(grid) and 0 <= col < len(grid[0]):
             grid[row][col] = word[idx]
 
 
-def initialize_board_state(height: int, width: int) -> BoardGenerationState:
+def initialize_board_state(height: int, width: int, *, use_flat_grid: bool = False) -> BoardGenerationState:
     """Initialize the state object required for board generation.
 
     Args:
         height (int): The number of rows in the grid.
         width (int): The number of columns in the grid.
+        use_flat_grid (bool): Store the grid as a FlatGrid instead of nested lists.
 
     Returns:
         BoardGenerationState: An instance of BoardGenerationState with an empty grid.
 
     """
-    return BoardGenerationState(grid=create_empty_grid(height, width))
+    grid = create_empty_grid(height, width)
+    if use_flat_grid:
+        return BoardGenerationState(grid=FlatGrid.from_nested(grid), open_anchors={})
+    return BoardGenerationState(grid=grid, open_anchors={})
+
+
+def _scan_free_run(
+    grid: list[list[str | None]],
+    start: tuple[int, int],
+    direction: tuple[int, int],
+    size: tuple[int, int],
+) -> tuple[int, str | None]:
+    """Measure how many letters a word may put in a direction from an anchor.
+
+    A cell can take a letter if it is empty and both of its neighbours across the direction are empty.
+    When the run ends at an occupied cell, the last free cell must stay empty to keep the words apart.
+
+    Args:
+        grid (list[list[str | None]]): The 2D grid.
+        start (tuple[int, int]): The (row, col) of the anchor.
+        direction (tuple[int, int]): The (dr, dc) step away from the anchor.
+        size (tuple[int, int]): The grid height and width.
+
+    Returns:
+        tuple[int, str | None]: The usable length, and the letter of the occupied cell ending the run, if any.
+
+    """
+    height, width = size
+    dr, dc = direction
+    row, col = start[0] + dr, start[1] + dc
+    run_length = 0
+    while 0 <= row < height and 0 <= col < width:
+        cell = grid[row][col]
+        if cell is not None:
+            return run_length - 1, cell
+        if dr:
+            if (col > 0 and grid[row][col - 1] is not None) or (col + 1 < width and grid[row][col + 1] is not None):
+                break
+        elif (row > 0 and grid[row - 1][col] is not None) or (row + 1 < height and grid[row + 1][col] is not None):
+            break
+        run_length += 1
+        row += dr
+        col += dc
+    return run_length, None
+
+
+def compute_anchor_run(
+    grid: list[list[str | None]] | FlatGrid,
+    coord: tuple[int, int],
+    orientation: str,
+) -> AnchorRun | None:
+    """Compute the room around a placed letter for a word crossing it in one orientation.
+
+    Args:
+        grid (list[list[str | None]] | FlatGrid): The 2D grid.
+        coord (tuple[int, int]): The (row, col) of the placed letter.
+        orientation (str): "V" for vertical, "H" for horizontal.
+
+    Returns:
+        AnchorRun | None: The room around the anchor, or None if no word can cross it in this orientation.
+
+    """
+    dr, dc = (1, 0) if orientation == "V" else (0, 1)
+    if isinstance(grid, FlatGrid):
+        before, before_blocker = grid.free_run(coord, (-dr, -dc))
+        after, after_blocker = grid.free_run(coord, (dr, dc))
+    else:
+        size = (len(grid), len(grid[0]) if grid else 0)
+        before, before_blocker = _scan_free_run(grid, coord, (-dr, -dc), size)
+        after, after_blocker = _scan_free_run(grid, coord, (dr, dc), size)
+    if before + after < 1 and before_blocker is None and after_blocker is None:
+        return None
+    return AnchorRun(before=before, after=after, before_blocker=before_blocker, after_blocker=after_blocker)
+
+
+def _nearest_occupied_cells(
+    grid: list[list[str | None]] | FlatGrid,
+    coord: tuple[int, int],
+    direction: tuple[int, int],
+) -> list[tuple[int, int]]:
+    """Find the cell itself if occupied, or else the nearest occupied cells on both sides along a line.
+
+    Args:
+        grid (list[list[str | None]] | FlatGrid): The 2D grid.
+        coord (tuple[int, int]): The (row, col) to search from.
+        direction (tuple[int, int]): The (dr, dc) of the line.
+
+    Returns:
+        list[tuple[int, int]]: The occupied cells whose free runs along the line may reach coord.
+
+    """
+    if isinstance(grid, FlatGrid):
+        return grid.nearest_occupied(coord, direction)
+    height, width = len(grid), len(grid[0]) if grid else 0
+    row, col = coord
+    anchors = [coord] if grid[row][col] is not None else []
+    dr, dc = direction
+    for step_r, step_c in ((dr, dc), (-dr, -dc)):
+        r, c = row + step_r, col + step_c
+        while 0 <= r < height and 0 <= c < width:
+            if grid[r][c] is not None:
+                anchors.append((r, c))
+                break
+            r += step_r
+            c += step_c
+    return anchors
+
+
+def remove_open_anchor(state: BoardGenerationState, coord: tuple[int, int], letter: str) -> None:
+    """Drop a cell from the open anchor index, before its letter is removed from the grid.
+
+    Args:
+        state (BoardGenerationState): The board generation state to update.
+        coord (tuple[int, int]): The (row, col) of the letter being removed.
+        letter (str): The letter being removed.
+
+    """
+    if state.open_anchors is None:
+        return
+    for orientation in ("V", "H"):
+        letter_anchors = state.open_anchors.get((letter, orientation))
+        if letter_anchors is not None:
+            letter_anchors.pop(coord, None)
+
+
+def update_open_anchors(state: BoardGenerationState, changed_cells: list[tuple[int, int]]) -> None:
+    """Refresh the open anchor index after cells were filled or emptied.
+
+    Only anchors whose free runs can reach a changed cell, or a neighbour of one, are recomputed.
+    Emptied cells must first be dropped from the index with remove_open_anchor.
+
+    Args:
+        state (BoardGenerationState): The board generation state to update.
+        changed_cells (list[tuple[int, int]]): Cells whose contents changed.
+
+    """
+    if state.open_anchors is None or not changed_cells:
+        return
+    grid = state.grid
+    height, width = len(grid), len(grid[0]) if grid else 0
+
+    dirty_cells: set[tuple[int, int]] = set()
+    for row, col in changed_cells:
+        for r, c in ((row, col), (row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < height and 0 <= c < width:
+                dirty_cells.add((r, c))
+
+    for orientation, direction in (("V", (1, 0)), ("H", (0, 1))):
+        anchors_to_refresh = {
+            anchor for cell in dirty_cells for anchor in _nearest_occupied_cells(grid, cell, direction)
+        }
+        for coord in anchors_to_refresh:
+            letter = get_cell(grid, coord[0], coord[1])
+            letter_anchors = state.open_anchors.setdefault((letter, orientation), {})
+            anchor_run = compute_anchor_run(grid, coord, orientation)
+            if anchor_run is None:
+                letter_anchors.pop(coord, None)
+            else:
+                letter_anchors[coord] = anchor_run
 
 
 def _calculate_middle_word_start(
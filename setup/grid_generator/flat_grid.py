@@ -0,0 +1,332 @@
+from collections.abc import Iterator
+
+EMPTY_CELL = 0  # Byte value of an empty cell
+MAX_CELL_CODE = 255  # Letters must fit in a single byte (Latin-1)
+
+
+def fits_in_flat_grid(words: list[str]) -> bool:
+    """Check whether every letter of the words can be stored in a one-byte grid cell.
+
+    Args:
+        words (list[str]): The words that will be placed on the grid.
+
+    Returns:
+        bool: True if every letter is a Latin-1 character, False otherwise.
+
+    """
+    return all(ord(letter) <= MAX_CELL_CODE for word in words for letter in word)
+
+
+class FlatGridRow:
+    """A view of one row of a FlatGrid, so that grid[row][col] keeps working.
+
+    Attributes:
+        grid (FlatGrid): The grid the row belongs to.
+        row (int): The row index.
+
+    """
+
+    __slots__ = ("grid", "row")
+
+    def __init__(self, grid: "FlatGrid", row: int) -> None:
+        self.grid = grid
+        self.row = row
+
+    def __len__(self) -> int:
+        """Return the number of columns.
+
+        Returns:
+            int: The grid width.
+
+        """
+        return self.grid.width
+
+    def __getitem__(self, col: int) -> str | None:
+        """Read a cell of the row.
+
+        Returns:
+            str | None: The letter in the column, or None if the cell is empty.
+
+        """
+        return self.grid.get(self.row, col)
+
+    def __setitem__(self, col: int, letter: str | None) -> None:
+        """Write a letter (or None to empty the cell) in a column of the row."""
+        self.grid.set(self.row, col, letter)
+
+    def __iter__(self) -> Iterator[str | None]:
+        """Iterate over the cells of the row.
+
+        Returns:
+            Iterator[str | None]: The letters of the row, None for empty cells.
+
+        """
+        return (self.grid.get(self.row, col) for col in range(self.grid.width))
+
+
+class FlatGrid:
+    """A compact grid backend for board generation: one byte per cell, 0 for an empty cell.
+
+    Cells are stored row by row in a single bytearray. The placement checks work on slices of
+    that buffer, and to_nested converts the grid back to the list[list[str | None]] form used by
+    gameplay and display. Rows can still be read and written as grid[row][col].
+
+    Attributes:
+        height (int): The number of rows.
+        width (int): The number of columns.
+        cells (bytearray): The cells, row by row.
+
+    """
+
+    __slots__ = ("cells", "height", "width")
+
+    def __init__(self, height: int, width: int) -> None:
+        self.height = height
+        self.width = width
+        self.cells = bytearray(height * width)
+
+    @classmethod
+    def from_nested(cls, grid: list[list[str | None]]) -> "FlatGrid":
+        """Create a flat grid from the nested-list form.
+
+        Args:
+            grid (list[list[str | None]]): The grid as a list of rows.
+
+        Returns:
+            FlatGrid: A flat copy of the grid.
+
+        """
+        height = len(grid)
+        width = len(grid[0]) if height > 0 else 0
+        flat_grid = cls(height, width)
+        for row, cells in enumerate(grid):
+            for col, letter in enumerate(cells):
+                if letter is not None:
+                    flat_grid.cells[row * width + col] = ord(letter)
+        return flat_grid
+
+    def to_nested(self) -> list[list[str | None]]:
+        """Convert the grid to the nested-list form.
+
+        Returns:
+            list[list[str | None]]: The grid as a list of rows, with None for empty cells.
+
+        """
+        width = self.width
+        return [
+            [chr(code) if code else None for code in self.cells[row * width : (row + 1) * width]]
+            for row in range(self.height)
+        ]
+
+    def get(self, row: int, col: int) -> str | None:
+        """Return the letter at (row, col), or None if the cell is empty.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+
+        Returns:
+            str | None: The letter in the cell, or None if it is empty.
+
+        """
+        code = self.cells[row * self.width + col]
+        return chr(code) if code else None
+
+    def set(self, row: int, col: int, letter: str | None) -> None:
+        """Write a letter at (row, col), or empty the cell if letter is None.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+            letter (str | None): The letter to write, or None to empty the cell.
+
+        """
+        self.cells[row * self.width + col] = ord(letter) if letter is not None else EMPTY_CELL
+
+    def place_word(self, word: str, coords_to_place: list[tuple[int, int]]) -> None:
+        """Write the letters of a word at the given coordinates, skipping any outside the grid.
+
+        Args:
+            word (str): The word whose letters are to be placed.
+            coords_to_place (list[tuple[int, int]]): List of (row, col) coordinates for each letter in the word.
+
+        """
+        for letter, (row, col) in zip(word, coords_to_place, strict=False):
+            if 0 <= row < self.height and 0 <= col < self.width:
+                self.cells[row * self.width + col] = ord(letter)
+
+    def __len__(self) -> int:
+        """Return the number of rows.
+
+        Returns:
+            int: The grid height.
+
+        """
+        return self.height
+
+    def __getitem__(self, row: int) -> FlatGridRow:
+        """Return a view of a row, so that grid[row][col] works as with nested lists.
+
+        Returns:
+            FlatGridRow: A view of the row.
+
+        Raises:
+            IndexError: If the row is outside the grid.
+
+        """
+        if not 0 <= row < self.height:
+            msg = "grid row index out of range"
+            raise IndexError(msg)
+        return FlatGridRow(self, row)
+
+    def __iter__(self) -> Iterator[FlatGridRow]:
+        """Iterate over views of the rows.
+
+        Returns:
+            Iterator[FlatGridRow]: A view of each row, top to bottom.
+
+        """
+        return (FlatGridRow(self, row) for row in range(self.height))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another flat grid, or with the nested-list form of a grid.
+
+        Returns:
+            bool: True if both grids hold the same letters in the same cells.
+
+        """
+        if isinstance(other, FlatGrid):
+            return (self.height, self.width, self.cells) == (other.height, other.width, other.cells)
+        if isinstance(other, list):
+            return self.to_nested() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a short description of the grid.
+
+        Returns:
+            str: The grid size.
+
+        """
+        return f"FlatGrid(height={self.height}, width={self.width})"
+
+    def is_valid_placement(  # noqa: PLR0914
+        self,
+        word: str,
+        intersection_info: dict,
+        orientation: str,
+    ) -> bool:
+        """Check a placement with the same rules as placement_rules.is_valid_placement.
+
+        The word's path and the two lines of cells alongside it are taken as strided slices
+        of the buffer, so no per-cell bounds checks are needed.
+
+        Args:
+            word (str): The word to place.
+            intersection_info (dict): Dict with keys 'row', 'col', 'idx' for intersection details.
+            orientation (str): "V" for vertical or "H" for horizontal.
+
+        Returns:
+            bool: True if the placement is valid, False otherwise.
+
+        """
+        height, width, cells = self.height, self.width, self.cells
+        word_len = len(word)
+        is_vertical = orientation == "V"
+        start_row = intersection_info["row"] - (intersection_info["idx"] if is_vertical else 0)
+        start_col = intersection_info["col"] - (0 if is_vertical else intersection_info["idx"])
+        if is_vertical:
+            step, side_step = width, 1
+            end_row, end_col = start_row + word_len - 1, start_col
+            has_before, has_after = start_row > 0, end_row + 1 < height
+            has_side_before, has_side_after = start_col > 0, start_col + 1 < width
+        else:
+            step, side_step = 1, width
+            end_row, end_col = start_row, start_col + word_len - 1
+            has_before, has_after = start_col > 0, end_col + 1 < width
+            has_side_before, has_side_after = start_row > 0, start_row + 1 < height
+        if start_row < 0 or start_col < 0 or end_row >= height or end_col >= width:
+            return False
+
+        start = start_row * width + start_col
+        stop = start + (word_len - 1) * step + 1
+        # End caps: the cells just before and after the word must be empty
+        if (has_before and cells[start - step]) or (has_after and cells[stop - 1 + step]):
+            return False
+
+        path = cells[start:stop:step]
+        side_before = cells[start - side_step : stop - side_step : step] if has_side_before else None
+        side_after = cells[start + side_step : stop + side_step : step] if has_side_after else None
+
+        placed_new_letter = False
+        for i, code in enumerate(path):
+            if code:
+                if chr(code).lower() != word[i].lower():
+                    return False
+            elif (side_before and side_before[i]) or (side_after and side_after[i]):
+                return False
+            else:
+                placed_new_letter = True
+        return placed_new_letter
+
+    def free_run(self, coord: tuple[int, int], direction: tuple[int, int]) -> tuple[int, str | None]:
+        """Measure how many letters a word may put in a direction from an anchor.
+
+        Same rules as board_state._scan_free_run, working on the flat buffer.
+
+        Args:
+            coord (tuple[int, int]): The (row, col) of the anchor.
+            direction (tuple[int, int]): The (dr, dc) step away from the anchor.
+
+        Returns:
+            tuple[int, str | None]: The usable length, and the letter of the occupied cell ending the run, if any.
+
+        """
+        height, width, cells = self.height, self.width, self.cells
+        dr, dc = direction
+        row, col = coord[0] + dr, coord[1] + dc
+        position = row * width + col
+        step = dr * width + dc
+        side_step = 1 if dr else width
+        run_length = 0
+        while 0 <= row < height and 0 <= col < width:
+            code = cells[position]
+            if code:
+                return run_length - 1, chr(code)
+            if dr:
+                if (col > 0 and cells[position - 1]) or (col + 1 < width and cells[position + 1]):
+                    break
+            elif (row > 0 and cells[position - side_step]) or (row + 1 < height and cells[position + side_step]):
+                break
+            run_length += 1
+            row += dr
+            col += dc
+            position += step
+        return run_length, None
+
+    def nearest_occupied(self, coord: tuple[int, int], direction: tuple[int, int]) -> list[tuple[int, int]]:
+        """Find the cell itself if occupied, and the nearest occupied cells on both sides along a line.
+
+        Args:
+            coord (tuple[int, int]): The (row, col) to search from.
+            direction (tuple[int, int]): The (dr, dc) of the line.
+
+        Returns:
+            list[tuple[int, int]]: The occupied cells found.
+
+        """
+        height, width, cells = self.height, self.width, self.cells
+        row, col = coord
+        anchors = [coord] if cells[row * width + col] else []
+        dr, dc = direction
+        for step_r, step_c in ((dr, dc), (-dr, -dc)):
+            r, c = row + step_r, col + step_c
+            while 0 <= r < height and 0 <= c < width:
+                if cells[r * width + c]:
+                    anchors.append((r, c))
+                    break
+                r += step_r
+                c += step_c
+        return anchors
@@ -1,13 +1,20 @@
 import random
+from collections.abc import Callable
 
 from data.settings_details import DifficultyData
+from gameplay.word_placement import WordPlacement
 
+from .backtracking_generator import place_words_backtracking
 from .board_state import (
     BoardGenerationState,
     calculate_middle_word_placement_coords,
     initialize_board_state,
+    is_stopped,
     place_letters_on_grid,
+    to_nested_grid,
+    update_open_anchors,
 )
+from .flat_grid import fits_in_flat_grid
 from .placement_logic import (
     apply_placement,
     categorize_placement,
@@ -39,6 +46,7 @@ def place_middle_word(state: BoardGenerationState, middle_word: str) -> bool:
     update_placed_letter_coords(state, middle_word, middle_word_coords)
     state.placed_words_coords[middle_word] = middle_word_coords
     state.middle_word_coords = set(middle_word_coords)
+    update_open_anchors(state, middle_word_coords)
     return True
 
 
@@ -46,6 +54,7 @@ def place_other_words(
     state: BoardGenerationState,
     words_to_place: list[str],
     max_total_words: int,
+    rng: random.Random | None = None,
 ) -> None:
     """Attempt to place the remaining words onto the grid.
 
@@ -53,6 +62,7 @@ def place_other_words(
         state (BoardGenerationState): The current board generation state.
         words_to_place (list[str]): List of sub-words to be placed on the grid.
         max_total_words (int): Maximum number of words allowed on the board.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
 
 
     """
@@ -62,12 +72,12 @@ def place_other_words(
         all_potential_words_on_board.add(middle_word_key)
 
     shuffled_subwords = list(words_to_place)
-    random.shuffle(shuffled_subwords)
+    (rng or random).shuffle(shuffled_subwords)
 
     for word in shuffled_subwords:
         if word in state.placed_words_coords:
             continue
-        if len(state.placed_words_coords) >= max_total_words:
+        if len(state.placed_words_coords) >= max_total_words or is_stopped(state):
             break
 
         possible_placements = find_possible_placements(
@@ -75,18 +85,73 @@ def place_other_words(
             word,
             all_potential_words_on_board,
             state.placed_letter_coords,
+            open_anchors=state.open_anchors,
         )
         priority_placements, other_placements = categorize_placement(
             possible_placements,
             state.middle_word_coords,
             state.used_middle_word_coords,
         )
-        chosen_placement = select_random_placement(priority_placements, other_placements)
+        chosen_placement = select_random_placement(priority_placements, other_placements, rng=rng)
 
         if chosen_placement:
             apply_placement(state, chosen_placement)
 
 
+def place_words_greedy(
+    state: BoardGenerationState,
+    words_to_place: list[str],
+    difficulty_conf: DifficultyData,
+    rng: random.Random | None = None,
+) -> str | None:
+    """Place the sub-words in a single random greedy pass.
+
+    Args:
+        state (BoardGenerationState): The board state, with the middle word already placed.
+        words_to_place (list[str]): List of sub-words to be placed on the grid.
+        difficulty_conf (DifficultyData): Difficulty configuration containing word requirements.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+
+    Returns:
+        str | None: Always None, the resulting board is checked by describe_invalid_grid.
+
+    """
+    place_other_words(state, words_to_place, difficulty_conf.words_on_board_needed.maximum, rng=rng)
+    return None
+
+
+# Board generator engines, selected per difficulty by DifficultyData.board_engine.
+# Each engine places the sub-words around the middle word, drawing from the given random number
+# generator, and returns why it failed, if it knows.
+BOARD_ENGINES: dict[
+    str,
+    Callable[[BoardGenerationState, list[str], DifficultyData, random.Random | None], str | None],
+] = {
+    "greedy": place_words_greedy,
+    "backtracking": place_words_backtracking,
+}
+
+
+def describe_invalid_grid(state: BoardGenerationState, min_total_words: int) -> str | None:
+    """Explain why the generated grid does not meet the placement requirements, if it does not.
+
+    Args:
+        state (BoardGenerationState): The current board generation state.
+        min_total_words (int): Minimum number of words required on the board.
+
+    Returns:
+        str | None: A description of the problem, or None if the grid meets all requirements.
+
+    """
+    total_placed_count = len(state.placed_words_coords)
+    if total_placed_count < min_total_words:
+        return f"Placed {total_placed_count} of the {min_total_words} words needed."
+    if state.middle_word_coords and state.middle_word_coords != state.used_middle_word_coords:
+        uncrossed_count = len(state.middle_word_coords - state.used_middle_word_coords)
+        return f"{uncrossed_count} letter(s) of the middle word are not crossed by another word."
+    return None
+
+
 def validate_final_grid(state: BoardGenerationState, min_total_words: int) -> bool:
     """Validate the generated grid against placement requirements.
 
@@ -98,10 +163,7 @@ def validate_final_grid(state: BoardGenerationState, min_total_words: int) -> bo
         bool: True if the grid meets all requirements, False otherwise.
 
     """
-    total_placed_count = len(state.placed_words_coords)
-    if total_placed_count < min_total_words:
-        return False
-    return not (state.middle_word_coords and state.middle_word_coords != state.used_middle_word_coords)
+    return describe_invalid_grid(state, min_total_words) is None
 
 
 def capitalize_middle_word_appearance(state: BoardGenerationState, middle_word: str) -> None:
@@ -118,40 +180,98 @@ def capitalize_middle_word_appearance(state: BoardGenerationState, middle_word:
         place_letters_on_grid(state.grid, middle_word_upper, middle_word_coords_list)
 
 
-def generate_board(
+def generate_board_with_reason(
     difficulty_conf: DifficultyData,
     middle_word: str,
     words_to_place: list[str],
-) -> tuple[list[list[str | None]] | None, dict[str, list[tuple[int, int]]] | None]:
-    """Generate the final game board and word coordinate data.
+    rng: random.Random | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None, str | None]:
+    """Generate the final game board with the engine selected by the difficulty, reporting failures.
+
+    The same seeded rng and words always give the same board.
 
     Args:
         difficulty_conf (DifficultyData): Difficulty configuration containing grid and word requirements.
         middle_word (str): The word to be placed in the middle of the grid.
         words_to_place (list[str]): List of sub-words to be placed on the grid.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+        should_stop (Callable[[], bool] | None): Checked between placements, generation fails once it returns True.
 
     Returns:
-        tuple[list[list[str | None]] | None, dict[str, list[tuple[int, int]]] | None]:
-            A tuple containing the generated grid and a dictionary of placed word coordinates,
-            or (None, None) if generation fails.
+        tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None, str | None]:
+            The generated grid, the placement of each word and None on success,
+            or (None, None, reason) if generation fails.
+
+    Raises:
+        ValueError: If the difficulty selects an unknown board engine.
 
     """
     min_total_words = difficulty_conf.words_on_board_needed.minimum
-    max_total_words = difficulty_conf.words_on_board_needed.maximum
     height = difficulty_conf.grid.height
     width = difficulty_conf.grid.width
 
-    current_board_state = initialize_board_state(height, width)
+    board_engine = BOARD_ENGINES.get(difficulty_conf.board_engine)
+    if board_engine is None:
+        msg = f"Unknown board engine: {difficulty_conf.board_engine!r}"
+        raise ValueError(msg)
+
+    # Generate on a compact FlatGrid when every letter fits in a byte; gameplay gets nested lists back
+    current_board_state = initialize_board_state(
+        height,
+        width,
+        use_flat_grid=fits_in_flat_grid([middle_word, *words_to_place]),
+    )
+    current_board_state.should_stop = should_stop
 
     if not place_middle_word(current_board_state, middle_word):
-        return None, None  # Failed to place middle word
+        return None, None, f"The middle word '{middle_word}' does not fit on a {height}x{width} grid."
 
     # words_to_place here are the sub-words to be added around the middle_word
-    place_other_words(current_board_state, words_to_place, max_total_words)
-
-    if not validate_final_grid(current_board_state, min_total_words):
-        return None, None  # Grid validation failed
+    failure_reason = board_engine(current_board_state, words_to_place, difficulty_conf, rng)
+    if is_stopped(current_board_state):
+        return None, None, "Stopped before the board was finished."
+    if failure_reason is None:
+        failure_reason = describe_invalid_grid(current_board_state, min_total_words)
+    if failure_reason is not None:
+        return None, None, failure_reason  # Grid validation failed
 
     capitalize_middle_word_appearance(current_board_state, middle_word)
 
-    return current_board_state.grid, current_board_state.placed_words_coords
+    # Hand gameplay compact placements instead of one coordinate tuple per letter
+    placements = {
+        word: WordPlacement.from_coords(coords) for word, coords in current_board_state.placed_words_coords.items()
+    }
+    return to_nested_grid(current_board_state.grid), placements, None
+
+
+def generate_board(
+    difficulty_conf: DifficultyData,
+    middle_word: str,
+    words_to_place: list[str],
+    rng: random.Random | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+    """Generate the final game board and word coordinate data.
+
+    Args:
+        difficulty_conf (DifficultyData): Difficulty configuration containing grid and word requirements.
+        middle_word (str): The word to be placed in the middle of the grid.
+        words_to_place (list[str]): List of sub-words to be placed on the grid.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+        should_stop (Callable[[], bool] | None): Checked between placements, generation fails once it returns True.
+
+    Returns:
+        tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+            A tuple containing the generated grid and a dictionary of word placements,
+            or (None, None) if generation fails.
+
+    """
+    final_grid, placed_words_coords, _ = generate_board_with_reason(
+        difficulty_conf,
+        middle_word,
+        words_to_place,
+        rng=rng,
+        should_stop=should_stop,
+    )
+    return final_grid, placed_words_coords
@@ -0,0 +1,264 @@
+import multiprocessing
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import partial
+from multiprocessing.sharedctypes import Synchronized
+
+from data.settings_details import DifficultyData
+from gameplay.word_placement import WordPlacement
+
+from .main_generator import generate_board
+
+BOARD_WORKERS_ENV_VAR = "WORDERLY_BOARD_WORKERS"  # Number of processes used to generate boards
+DEFAULT_BOARD_WORKERS = 1  # Sequential generation unless configured otherwise
+SEED_BITS = 64
+NO_ACTIVE_ROUND = 0  # Round id set while no round runs, so every attempt still running stops
+# Workers must not be forked from a process whose other threads (such as PuzzleFactory's) may hold a lock
+WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+_worker_active_round: Synchronized | None = None  # Shared round id, set in each worker process by its initializer
+
+
+def get_board_worker_count() -> int:
+    """Read the configured number of board generation workers.
+
+    The count comes from the WORDERLY_BOARD_WORKERS environment variable. "auto"
+    uses one worker per CPU core, and anything invalid falls back to sequential generation.
+
+    Returns:
+        int: The number of worker processes to use, at least 1.
+
+    """
+    configured = os.environ.get(BOARD_WORKERS_ENV_VAR, "").strip().lower()
+    if configured == "auto":
+        return os.cpu_count() or DEFAULT_BOARD_WORKERS
+    try:
+        return max(DEFAULT_BOARD_WORKERS, int(configured))
+    except ValueError:
+        return DEFAULT_BOARD_WORKERS
+
+
+def generate_board_with_seed(
+    difficulty_conf: DifficultyData,
+    middle_word: str,
+    words_to_place: list[str],
+    seed: int,
+) -> tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+    """Run a single generate_board attempt with its own seeded random number generator.
+
+    Args:
+        difficulty_conf (DifficultyData): Difficulty configuration containing grid and word requirements.
+        middle_word (str): The word to be placed in the middle of the grid.
+        words_to_place (list[str]): List of sub-words to be placed on the grid.
+        seed (int): Seed for this attempt, so that every worker explores a different board.
+
+    Returns:
+        tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+            The result of generate_board.
+
+    """
+    return generate_board(difficulty_conf, middle_word, words_to_place, rng=random.Random(seed))
+
+
+def _init_board_worker(active_round: Synchronized) -> None:
+    """Keep the pool's shared round id in the worker process.
+
+    Args:
+        active_round (Synchronized): The id of the round the pool is running.
+
+    """
+    global _worker_active_round  # noqa: PLW0603
+    _worker_active_round = active_round
+
+
+def _is_round_over(round_id: int) -> bool:
+    """Check whether the pool has moved on from a round, so its attempts can give up.
+
+    Args:
+        round_id (int): The round the attempt belongs to.
+
+    Returns:
+        bool: True once the round has a board or was abandoned.
+
+    """
+    return _worker_active_round is not None and _worker_active_round.value != round_id
+
+
+def generate_pooled_attempt(
+    difficulty_conf: DifficultyData,
+    middle_word: str,
+    words_to_place: list[str],
+    seed: int,
+    round_id: int,
+) -> tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+    """Run a generate_board attempt in a pool worker, stopping between placements once its round is over.
+
+    Args:
+        difficulty_conf (DifficultyData): Difficulty configuration containing grid and word requirements.
+        middle_word (str): The word to be placed in the middle of the grid.
+        words_to_place (list[str]): List of sub-words to be placed on the grid.
+        seed (int): Seed for this attempt, so that every worker explores a different board.
+        round_id (int): The round the attempt belongs to.
+
+    Returns:
+        tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+            The result of generate_board, or (None, None) if the round ended first.
+
+    """
+    return generate_board(
+        difficulty_conf,
+        middle_word,
+        words_to_place,
+        rng=random.Random(seed),
+        should_stop=partial(_is_round_over, round_id),
+    )
+
+
+class BoardWorkerPool:
+    """A process pool kept for the whole session, that runs the attempts for one word list at a time.
+
+    The pool shares a round id with its workers. It changes as soon as a round has its board,
+    so the attempts still running see it between placements and return early.
+
+    Attributes:
+        max_workers (int): Number of worker processes.
+        active_round (Synchronized): The id of the running round, NO_ACTIVE_ROUND between rounds.
+        round_count (int): Number of rounds run so far, used to give each round its id.
+        executor (ProcessPoolExecutor): The worker processes.
+
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """Start the pool's worker processes.
+
+        Args:
+            max_workers (int): Number of worker processes.
+
+        """
+        self.max_workers = max_workers
+        context = multiprocessing.get_context(WORKER_START_METHOD)
+        self.active_round = context.Value("q", NO_ACTIVE_ROUND, lock=False)
+        self.round_count = 0
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_init_board_worker,
+            initargs=(self.active_round,),
+        )
+
+    def run_round(
+        self,
+        difficulty_conf: DifficultyData,
+        middle_word: str,
+        words_to_place: list[str],
+        seeds: list[int],
+    ) -> tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+        """Run one attempt per seed and return the first valid board, stopping the other attempts.
+
+        Args:
+            difficulty_conf (DifficultyData): Difficulty configuration containing grid and word requirements.
+            middle_word (str): The word to be placed in the middle of the grid.
+            words_to_place (list[str]): List of sub-words to be placed on the grid.
+            seeds (list[int]): One seed per attempt.
+
+        Returns:
+            tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+                The first valid grid and its word placements, or (None, None) if every attempt failed.
+
+        """
+        self.round_count += 1
+        round_id = self.round_count
+        self.active_round.value = round_id
+        pending: set[Future] = {
+            self.executor.submit(generate_pooled_attempt, difficulty_conf, middle_word, words_to_place, seed, round_id)
+            for seed in seeds
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    final_grid, placed_words_coords = future.result()
+                    if final_grid is not None:
+                        return final_grid, placed_words_coords
+            return None, None
+        finally:
+            self.active_round.value = NO_ACTIVE_ROUND
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, letting any attempt still running see its round is over."""
+        self.active_round.value = NO_ACTIVE_ROUND
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+BOARD_WORKER_POOLS: dict[int, BoardWorkerPool] = {}  # Session pools, by number of workers
+
+
+def get_board_worker_pool(max_workers: int) -> BoardWorkerPool:
+    """Return the session's pool with the given number of workers, starting it the first time.
+
+    Args:
+        max_workers (int): Number of worker processes.
+
+    Returns:
+        BoardWorkerPool: The pool, reused by every later call with the same worker count.
+
+    """
+    if max_workers not in BOARD_WORKER_POOLS:
+        BOARD_WORKER_POOLS[max_workers] = BoardWorkerPool(max_workers)
+    return BOARD_WORKER_POOLS[max_workers]
+
+
+def shutdown_board_worker_pools() -> None:
+    """Stop every pool started by get_board_worker_pool, at the end of the session."""
+    while BOARD_WORKER_POOLS:
+        _, pool = BOARD_WORKER_POOLS.popitem()
+        pool.shutdown()
+
+
+def generate_board_parallel(  # noqa: PLR0913, PLR0917
+    difficulty_conf: DifficultyData,
+    middle_word: str,
+    words_to_place: list[str],
+    attempts: int,
+    max_workers: int | None = None,
+    rng: random.Random | None = None,
+) -> tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+    """Run independent generate_board attempts across a process pool and keep the first valid board.
+
+    Each attempt gets its own seed drawn from rng, so a seeded rng gives the same attempts. The attempts run
+    in the session's pool from get_board_worker_pool. As soon as one attempt returns a valid board,
+    the attempts that have not started yet are cancelled and the ones still running stop at their next placement.
+
+    Args:
+        difficulty_conf (DifficultyData): Difficulty configuration containing grid and word requirements.
+        middle_word (str): The word to be placed in the middle of the grid.
+        words_to_place (list[str]): List of sub-words to be placed on the grid.
+        attempts (int): Total number of attempts to make.
+        max_workers (int | None): Number of worker processes. Defaults to get_board_worker_count().
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+
+    Returns:
+        tuple[list[list[str | None]] | None, dict[str, WordPlacement] | None]:
+            The first valid grid and its word placements, or (None, None) if every attempt failed.
+
+    """
+    if max_workers is None:
+        max_workers = get_board_worker_count()
+    seeds = [(rng or random).getrandbits(SEED_BITS) for _ in range(attempts)]
+
+    if max_workers <= 1 or attempts <= 1:
+        for seed in seeds:
+            final_grid, placed_words_coords = generate_board_with_seed(
+                difficulty_conf,
+                middle_word,
+                words_to_place,
+                seed,
+            )
+            if final_grid is not None:
+                return final_grid, placed_words_coords
+        return None, None
+
+    return get_board_worker_pool(max_workers).run_round(difficulty_conf, middle_word, words_to_place, seeds)
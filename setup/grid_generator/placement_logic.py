@@ -1,12 +1,108 @@
 import random
 
 from .board_state import (
+    AnchorRun,
     BoardGenerationState,
     PlacementDetail,
+    PlacementUndo,
     calculate_straight_word_placement_coords,
+    get_cell,
     place_letters_on_grid,
+    remove_open_anchor,
+    update_open_anchors,
 )
-from .placement_rules import is_valid_placement
+from .placement_rules import check_anchor_run, is_valid_placement
+
+
+def is_valid_crossing(  # noqa: PLR0913
+    grid: list[list[str | None]],
+    word: str,
+    words_to_place_set: set[str],
+    intersection_info: dict,
+    orientation: str,
+    *,
+    open_anchors: dict[tuple[str, str], dict[tuple[int, int], AnchorRun]] | None = None,
+) -> bool:
+    """Check a crossing placement, reading the open anchor index first when one is given.
+
+    Args:
+        grid: The current grid as a 2D list of strings or None.
+        word: The word to place.
+        words_to_place_set: Set of words that could be on the board.
+        intersection_info: Dict with keys 'row', 'col', 'idx' for intersection details.
+        orientation: "V" for vertical or "H" for horizontal.
+        open_anchors: The state's open anchor index, or None to always run the full check.
+
+    Returns:
+        True if the placement is valid, False otherwise.
+
+    """
+    if open_anchors is not None:
+        coord = (intersection_info["row"], intersection_info["col"])
+        anchor_run = open_anchors.get((word[intersection_info["idx"]], orientation), {}).get(coord)
+        if anchor_run is None:
+            return False
+        is_valid = check_anchor_run(anchor_run, word, intersection_info["idx"])
+        if is_valid is not None:
+            return is_valid
+    return is_valid_placement(grid, word, words_to_place_set, intersection_info, orientation)
+
+
+def find_indexed_placements(
+    grid: list[list[str | None]],
+    word: str,
+    words_to_place_set: set[str],
+    open_anchors: dict[tuple[str, str], dict[tuple[int, int], AnchorRun]],
+) -> list[PlacementDetail]:
+    """Find all valid placements for a word by reading the open anchor index.
+
+    Only anchors that a word can still cross are visited. The grid is only walked for the rare
+    placements that would run into another placed letter.
+
+    Args:
+        grid: The current grid as a 2D list of strings or None.
+        word: The word to place.
+        words_to_place_set: Set of words that could be on the board.
+        open_anchors: The state's open anchor index.
+
+    Returns:
+        A list of PlacementDetail objects representing valid placements for the word.
+
+    """
+    possible_placements: list[PlacementDetail] = []
+    if len(word) < 2:
+        return possible_placements
+    last_idx = len(word) - 1
+    for idx, letter_in_word in enumerate(word):
+        letters_after = last_idx - idx
+        for orientation in ("V", "H"):
+            for intersect_coord, anchor_run in open_anchors.get((letter_in_word, orientation), {}).items():
+                before, after = anchor_run.before, anchor_run.after
+                # Fast path: the word fits in the free runs on both sides of the anchor
+                if idx <= before and letters_after <= after:
+                    possible_placements.append(
+                        PlacementDetail(word=word, coord=intersect_coord, idx=idx, orientation=orientation),
+                    )
+                    continue
+                # Otherwise the word must run into a placed letter that it matches
+                if idx > before and (
+                    anchor_run.before_blocker is None
+                    or idx < before + 2
+                    or word[idx - before - 2] != anchor_run.before_blocker
+                ):
+                    continue
+                if letters_after > after and (
+                    anchor_run.after_blocker is None
+                    or letters_after < after + 2
+                    or word[idx + after + 2] != anchor_run.after_blocker
+                ):
+                    continue
+                intersection_info = {"row": intersect_coord[0], "col": intersect_coord[1], "idx": idx}
+                if is_valid_placement(grid, word, words_to_place_set, intersection_info, orientation):
+                    possible_placements.append(
+                        PlacementDetail(word=word, coord=intersect_coord, idx=idx, orientation=orientation),
+                    )
+    return possible_placements
 
 
 def find_possible_placements(
@@ -14,6 +110,7 @@ def find_possible_placements(
     word: str,
     words_to_place_set: set[str],
     placed_letter_coords: dict[str, list[tuple[int, int]]],
+    open_anchors: dict[tuple[str, str], dict[tuple[int, int], AnchorRun]] | None = None,
 ) -> list[PlacementDetail]:
     """Find all valid horizontal and vertical placements for a given word.
 
@@ -22,32 +119,25 @@ def find_possible_placements(
         word: The word to place.
         words_to_place_set: Set of words that are yet to be placed.
         placed_letter_coords: Dictionary mapping letters to their coordinates on the grid.
+        open_anchors: The state's open anchor index. When given, placements are read from
+            the index with find_indexed_placements instead of checking every placed letter.
 
     Returns:
         A list of PlacementDetail objects representing valid placements for the word.
 
     """
+    if open_anchors is not None:
+        return find_indexed_placements(grid, word, words_to_place_set, open_anchors)
+
     possible_placements: list[PlacementDetail] = []
     for idx, letter_in_word in enumerate(word):
-        if letter_in_word not in placed_letter_coords:
-            continue
-        for intersect_coord in placed_letter_coords[letter_in_word]:
-            intersect_row, intersect_col = intersect_coord
-            intersection_info: dict = {
-                "row": intersect_row,
-                "col": intersect_col,
-                "idx": idx,
-            }
-            # Check VERTICAL placement
-            if is_valid_placement(grid, word, words_to_place_set, intersection_info, "V"):
-                possible_placements.append(
-                    PlacementDetail(word=word, coord=intersect_coord, idx=idx, orientation="V"),
-                )
-            # Check HORIZONTAL placement
-            if is_valid_placement(grid, word, words_to_place_set, intersection_info, "H"):
-                possible_placements.append(
-                    PlacementDetail(word=word, coord=intersect_coord, idx=idx, orientation="H"),
-                )
+        for intersect_coord in placed_letter_coords.get(letter_in_word, []):
+            intersection_info: dict = {"row": intersect_coord[0], "col": intersect_coord[1], "idx": idx}
+            possible_placements.extend(
+                PlacementDetail(word=word, coord=intersect_coord, idx=idx, orientation=orientation)
+                for orientation in ("V", "H")
+                if is_valid_placement(grid, word, words_to_place_set, intersection_info, orientation)
+            )
     return possible_placements
 
 
@@ -82,12 +172,14 @@ def categorize_placement(
 def select_random_placement(
     priority_placements: list[PlacementDetail],
     other_placements: list[PlacementDetail],
+    rng: random.Random | None = None,
 ) -> PlacementDetail | None:
     """Select a random placement, prioritizing the priority list.
 
     Args:
         priority_placements: List of priority PlacementDetail objects.
         other_placements: List of other PlacementDetail objects.
+        rng: Random number generator to use. Defaults to the random module.
 
     Returns:
         A randomly selected PlacementDetail from the priority list if available,
@@ -95,9 +187,9 @@ def select_random_placement(
 
     """
     if priority_placements:
-        return random.choice(priority_placements)
+        return (rng or random).choice(priority_placements)
     elif other_placements:
-        return random.choice(other_placements)
+        return (rng or random).choice(other_placements)
     return None
 
 
@@ -152,6 +244,71 @@ def apply_placement(
 
     """
     coords_to_place = calculate_straight_word_placement_coords(chosen_placement)
+    if state.open_anchors is not None:
+        new_cells = [(row, col) for row, col in coords_to_place if get_cell(state.grid, row, col) is None]
     update_placed_letter_coords(state, chosen_placement.word, coords_to_place)
     update_placed_word_coords(chosen_placement, coords_to_place, state)
     place_letters_on_grid(state.grid, chosen_placement.word, coords_to_place)
+    if state.open_anchors is not None:
+        update_open_anchors(state, new_cells)
+
+
+def apply_placement_with_undo(
+    state: BoardGenerationState,
+    chosen_placement: PlacementDetail,
+) -> PlacementUndo:
+    """Apply a chosen placement and record what it changed.
+
+    Args:
+        state: The current BoardGenerationState to update.
+        chosen_placement: The PlacementDetail of the word to place.
+
+    Returns:
+        A PlacementUndo that undo_placement can use to restore the previous state.
+
+    """
+    coords_to_place = calculate_straight_word_placement_coords(chosen_placement)
+    new_cells: list[tuple[int, int]] = []
+    new_letters: list[str] = []
+    for i, (row, col) in enumerate(coords_to_place):
+        if get_cell(state.grid, row, col) is None:
+            new_cells.append((row, col))
+            new_letters.append(chosen_placement.word[i])
+
+    used_middle_word_coord = None
+    if (
+        chosen_placement.coord in state.middle_word_coords
+        and chosen_placement.coord not in state.used_middle_word_coords
+    ):
+        used_middle_word_coord = chosen_placement.coord
+
+    apply_placement(state, chosen_placement)
+    return PlacementUndo(
+        word=chosen_placement.word,
+        new_cells=new_cells,
+        new_letters=new_letters,
+        used_middle_word_coord=used_middle_word_coord,
+    )
+
+
+def undo_placement(state: BoardGenerationState, undo: PlacementUndo) -> None:
+    """Restore the state to how it was before the recorded placement.
+
+    Placements must be undone in the reverse order they were applied.
+
+    Args:
+        state: The current BoardGenerationState to update.
+        undo: The record returned by apply_placement_with_undo.
+
+    """
+    for (row, col), letter in zip(reversed(undo.new_cells), reversed(undo.new_letters), strict=True):
+        remove_open_anchor(state, (row, col), letter)
+        state.grid[row][col] = None
+        letter_coords = state.placed_letter_coords[letter]
+        letter_coords.remove((row, col))
+        if not letter_coords:
+            del state.placed_letter_coords[letter]
+    del state.placed_words_coords[undo.word]
+    if undo.used_middle_word_coord is not None:
+        state.used_middle_word_coords.discard(undo.used_middle_word_coord)
+    update_open_anchors(state, undo.new_cells)
@@ -1,3 +1,7 @@
+from .board_state import AnchorRun
+from .flat_grid import FlatGrid
+
+
 def is_within_bounds(r: int, c: int, height: int, width: int) -> bool:
     """Check if the coordinate (r, c) is within the grid boundaries.
 
@@ -157,7 +161,7 @@ def check_for_all_letters(
 
 
 def is_valid_placement(
-    grid: list[list[str | None]],
+    grid: list[list[str | None]] | FlatGrid,
     word: str,
     words_to_place_set: set[str],
     intersection_info: dict,
@@ -165,8 +169,10 @@ def is_valid_placement(
 ) -> bool:
     """Check if placing the word at the specified intersection and orientation is valid.
 
+    A FlatGrid runs the same checks on slices of its buffer with FlatGrid.is_valid_placement.
+
     Args:
-        grid (list[list[str | None]]): 2D list representing the grid.
+        grid (list[list[str | None]] | FlatGrid): 2D grid, as nested lists or a FlatGrid.
         word (str): The word to place.
         words_to_place_set (set[str]): Set of all words that could be on the board.
         intersection_info (dict): Dict with keys 'row', 'col', 'idx' for intersection details.
@@ -176,6 +182,9 @@ def is_valid_placement(
         bool: True if the placement is valid, False otherwise.
 
     """
+    if isinstance(grid, FlatGrid):
+        return grid.is_valid_placement(word, intersection_info, orientation)
+
     height = len(grid)
     width = len(grid[0]) if height > 0 else 0
     word_len = len(word)
@@ -202,3 +211,36 @@ def is_valid_placement(
         return False
 
     return check_for_all_letters(grid, word, words_to_place_set, (start_row, start_col), (dr, dc))
+
+
+def check_anchor_run(anchor_run: AnchorRun, word: str, idx: int) -> bool | None:
+    """Decide whether a word may cross an anchor using only the open anchor index, where possible.
+
+    A word that fits in the free runs around the anchor is valid. A word that would touch the grid edge
+    or a cell that cannot take a letter is not. A word that runs into another placed letter needs the
+    full is_valid_placement check, unless that letter already does not match.
+
+    Args:
+        anchor_run (AnchorRun): The room around the anchor in the placement's orientation.
+        word (str): The word to place.
+        idx (int): Index in 'word' of the letter on the anchor.
+
+    Returns:
+        bool | None: True if the placement is valid, False if it is not, None if the full check is needed.
+
+    """
+    if len(word) < 2:
+        return False
+
+    needs_full_check = False
+    sides = (
+        (idx, anchor_run.before, anchor_run.before_blocker, idx - anchor_run.before - 2),
+        (len(word) - 1 - idx, anchor_run.after, anchor_run.after_blocker, idx + anchor_run.after + 2),
+    )
+    for letters_needed, free_cells, blocker, blocker_idx in sides:
+        if letters_needed <= free_cells:
+            continue
+        if blocker is None or letters_needed < free_cells + 2 or word[blocker_idx].lower() != blocker.lower():
+            return False
+        needs_full_check = True
+    return None if needs_full_check else True
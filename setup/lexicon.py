@@ -0,0 +1,403 @@
+import hashlib
+import itertools
+import os
+import pickle  # noqa: S403
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from data.settings_details import HEART_POINTS_SETTINGS, NO_HEART_POINTS_SETTINGS, DifficultyData
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent  # Holds worderly.py, whatever directory the game runs from
+LEXICON_CACHE_DIR = PROJECT_DIR / ".lexicon_cache"
+LEXICON_CACHE_VERSION = 3
+
+
+@dataclass
+class Lexicon:
+    """Holds a cleaned lexicon along with the lookup structures built from it.
+
+    A Lexicon is meant to be built once per process and shared by every setup
+    attempt and round, so that none of them touch the lexicon file again.
+
+    Attributes:
+        words (list[str]): The cleaned, lowercase words, without duplicates.
+        word_set (set[str]): The same words, for membership checks.
+        length_buckets (dict[int, list[str]]): Mapping of word lengths to the words of that length.
+        signature_index (dict[str, list[str]]): Mapping of letter signatures to the words that share them.
+        word_pools (dict[tuple[int, int], tuple[set[str], list[str]]]): Word pools already built by
+            get_word_pools, keyed by (max_word_length, min_subword_length).
+        subword_counts (dict[tuple[int, int], dict[str, int]]): Number of subwords of every middle word
+            candidate, keyed by (max_word_length, min_subword_length).
+        eligibility_tables (dict[tuple[int, int, int], list[tuple[str, int]]]): Middle words that have
+            enough subwords for a difficulty, with their subword counts, keyed by
+            (max_word_length, min_subword_length, minimum words on board).
+
+    """
+
+    words: list[str]
+    word_set: set[str] = field(default_factory=set)
+    length_buckets: dict[int, list[str]] = field(default_factory=dict)
+    signature_index: dict[str, list[str]] = field(default_factory=dict)
+    word_pools: dict[tuple[int, int], tuple[set[str], list[str]]] = field(
+        default_factory=dict,
+        repr=False,
+        compare=False,
+    )
+    subword_counts: dict[tuple[int, int], dict[str, int]] = field(
+        default_factory=dict,
+        repr=False,
+        compare=False,
+    )
+    eligibility_tables: dict[tuple[int, int, int], list[tuple[str, int]]] = field(
+        default_factory=dict,
+        repr=False,
+        compare=False,
+    )
+
+    def get_word_pools(self, max_word_length: int, min_subword_length: int) -> tuple[set[str], list[str]]:
+        """Return the subword pool and the middle word candidates for the given word lengths.
+
+        The pools are built from the length buckets on first use and reused afterwards.
+
+        Args:
+            max_word_length (int): Length of the middle word, and maximum length of its subwords.
+            min_subword_length (int): Minimum length of the subwords.
+
+        Returns:
+            tuple[set[str], list[str]]: The words with a length between min_subword_length and
+                max_word_length, and the words of exactly max_word_length.
+
+        """
+        pool_key = (max_word_length, min_subword_length)
+        if pool_key not in self.word_pools:
+            subword_pool = {
+                word
+                for length in range(min_subword_length, max_word_length + 1)
+                for word in self.length_buckets.get(length, [])
+            }
+            middle_word_candidates = list(self.length_buckets.get(max_word_length, []))
+            self.word_pools[pool_key] = (subword_pool, middle_word_candidates)
+        return self.word_pools[pool_key]
+
+    def get_subword_counts(self, max_word_length: int, min_subword_length: int) -> dict[str, int]:
+        """Return the number of subwords of every middle word candidate of the given length.
+
+        Args:
+            max_word_length (int): Length of the middle word candidates.
+            min_subword_length (int): Minimum length of the subwords.
+
+        Returns:
+            dict[str, int]: Mapping of each candidate to its number of subwords (excluding itself).
+
+        """
+        counts_key = (max_word_length, min_subword_length)
+        if counts_key not in self.subword_counts:
+            self.subword_counts[counts_key] = {
+                word: sum(
+                    len(self.signature_index.get(signature, []))
+                    for signature in get_sub_signatures(word, min_subword_length)
+                )
+                - 1
+                for word in self.length_buckets.get(max_word_length, [])
+            }
+        return self.subword_counts[counts_key]
+
+    def get_eligible_middle_words(self, difficulty_conf: DifficultyData) -> list[tuple[str, int]]:
+        """Return every middle word that has enough subwords for a difficulty.
+
+        Tables for the built-in difficulties are precomputed when the lexicon is compiled
+        and stored in the lexicon cache. Other settings are computed on first use.
+
+        Args:
+            difficulty_conf (DifficultyData): The difficulty settings.
+
+        Returns:
+            list[tuple[str, int]]: The qualifying middle words and their subword counts.
+
+        """
+        max_len = difficulty_conf.max_word_length
+        min_sub_len = difficulty_conf.min_subword_length
+        min_words_needed = difficulty_conf.words_on_board_needed.minimum
+        table_key = (max_len, min_sub_len, min_words_needed)
+        if table_key not in self.eligibility_tables:
+            self.eligibility_tables[table_key] = [
+                (word, count)
+                for word, count in self.get_subword_counts(max_len, min_sub_len).items()
+                if count >= min_words_needed - 1
+            ]
+        return self.eligibility_tables[table_key]
+
+
+def read_word_file(word_path: str) -> list[str]:
+    """Read a lexicon file and return a list of cleaned, lowercase words.
+
+    Args:
+        word_path (str): The path to the word file.
+
+    Returns:
+        list[str]: A list of words from the file, cleaned and lowercased.
+
+    """
+    try:
+        with open(word_path, encoding="utf-8") as file:
+            return [word.strip().lower() for word in file if word.strip()]
+    except FileNotFoundError:
+        print(f"Error: File {word_path} not found.")
+        return []
+    except OSError as e:
+        print(f"Error reading file {word_path}: {e}")
+        return []
+
+
+def get_letter_signature(word: str) -> str:
+    """Return the sorted-letter signature of a word.
+
+    Two words share a signature exactly when they are anagrams of each other.
+
+    Args:
+        word (str): The word to compute the signature for.
+
+    Returns:
+        str: The letters of the word in sorted order.
+
+    """
+    return "".join(sorted(word))
+
+
+def build_signature_index(words: Iterable[str]) -> dict[str, list[str]]:
+    """Group words by their sorted-letter signature.
+
+    Args:
+        words (Iterable[str]): The words to index.
+
+    Returns:
+        dict[str, list[str]]: Mapping of each signature to the words that share it.
+
+    """
+    signature_index: dict[str, list[str]] = {}
+    for word in words:
+        signature_index.setdefault(get_letter_signature(word), []).append(word)
+    return signature_index
+
+
+def get_sub_signatures(word: str, min_length: int) -> set[str]:
+    """Return the signatures of every sub-multiset of a word's letters.
+
+    Since combinations of a sorted sequence are themselves sorted, every
+    combination is already a valid signature. A word of length n has at most
+    2^n of them, no matter how many permutations its letters have.
+
+    Args:
+        word (str): The word whose letters are used.
+        min_length (int): Minimum length of the sub-multisets to include.
+
+    Returns:
+        set[str]: The distinct signatures of length min_length up to len(word).
+
+    """
+    letters = get_letter_signature(word)
+    sub_signatures: set[str] = set()
+    for length in range(min_length, len(letters) + 1):
+        sub_signatures.update("".join(combo) for combo in itertools.combinations(letters, length))
+    return sub_signatures
+
+
+def build_length_buckets(words: Iterable[str]) -> dict[int, list[str]]:
+    """Group words by their length.
+
+    Args:
+        words (Iterable[str]): The words to group.
+
+    Returns:
+        dict[int, list[str]]: Mapping of each word length to the words of that length.
+
+    """
+    length_buckets: dict[int, list[str]] = {}
+    for word in words:
+        length_buckets.setdefault(len(word), []).append(word)
+    return length_buckets
+
+
+def compile_lexicon(words: Iterable[str]) -> Lexicon:
+    """Build a Lexicon, with its length buckets and signature index, from a list of words.
+
+    Args:
+        words (Iterable[str]): The cleaned words of the lexicon.
+
+    Returns:
+        Lexicon: The compiled lexicon.
+
+    """
+    unique_words = list(dict.fromkeys(words))
+    return Lexicon(
+        words=unique_words,
+        word_set=set(unique_words),
+        length_buckets=build_length_buckets(unique_words),
+        signature_index=build_signature_index(unique_words),
+    )
+
+
+def precompute_eligibility_tables(lexicon: Lexicon) -> None:
+    """Build the middle word eligibility tables for every built-in difficulty.
+
+    Args:
+        lexicon (Lexicon): The compiled lexicon to fill in.
+
+    """
+    for difficulty_conf in [*HEART_POINTS_SETTINGS.values(), NO_HEART_POINTS_SETTINGS]:
+        lexicon.get_eligible_middle_words(difficulty_conf)
+
+
+def get_lexicon_cache_key(lexicon_path: str) -> tuple[str, int, int] | None:
+    """Return the key identifying the current contents of a lexicon file.
+
+    Args:
+        lexicon_path (str): The path to the lexicon file.
+
+    Returns:
+        tuple[str, int, int] | None: The resolved path, size and modification time (ns) of the file,
+            or None if the file cannot be accessed.
+
+    """
+    try:
+        resolved_path = Path(lexicon_path).resolve()
+        file_stat = resolved_path.stat()
+    except OSError:
+        return None
+    return str(resolved_path), file_stat.st_size, file_stat.st_mtime_ns
+
+
+def get_lexicon_cache_path(lexicon_path: str, cache_dir: Path = LEXICON_CACHE_DIR) -> Path:
+    """Return the path of the cache file for a lexicon file.
+
+    Args:
+        lexicon_path (str): The path to the lexicon file.
+        cache_dir (Path): The directory holding the cache files.
+
+    Returns:
+        Path: The cache file path, unique to the resolved lexicon path.
+
+    """
+    resolved_path = Path(lexicon_path).resolve()
+    path_digest = hashlib.sha256(str(resolved_path).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{resolved_path.stem}-{path_digest}.pickle"
+
+
+def load_cached_lexicon(lexicon_path: str, cache_dir: Path = LEXICON_CACHE_DIR) -> Lexicon | None:
+    """Load a compiled lexicon from the cache, if it is still up to date.
+
+    The cache is ignored when the lexicon file's size or modification time differs
+    from the one stored with it, or when it was written by a different cache version.
+
+    Args:
+        lexicon_path (str): The path to the lexicon file.
+        cache_dir (Path): The directory holding the cache files.
+
+    Returns:
+        Lexicon | None: The cached lexicon, or None if there is no valid cache.
+
+    """
+    cache_key = get_lexicon_cache_key(lexicon_path)
+    cache_path = get_lexicon_cache_path(lexicon_path, cache_dir)
+    if cache_key is None or not cache_path.exists():
+        return None
+    try:
+        with cache_path.open("rb") as f:
+            cached = pickle.load(f)  # noqa: S301
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+        return None
+
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("version") != LEXICON_CACHE_VERSION or cached.get("key") != cache_key:
+        return None
+    lexicon = cached.get("lexicon")
+    return lexicon if isinstance(lexicon, Lexicon) else None
+
+
+def save_cached_lexicon(lexicon_path: str, lexicon: Lexicon, cache_dir: Path = LEXICON_CACHE_DIR) -> bool:
+    """Write a compiled lexicon to the cache.
+
+    The file is written to a temporary path first and then moved into place,
+    so an interrupted write never leaves a partial cache behind.
+
+    Args:
+        lexicon_path (str): The path to the lexicon file.
+        lexicon (Lexicon): The compiled lexicon to store.
+        cache_dir (Path): The directory holding the cache files.
+
+    Returns:
+        bool: True if the cache was written, False otherwise.
+
+    """
+    cache_key = get_lexicon_cache_key(lexicon_path)
+    if cache_key is None:
+        return False
+    cache_path = get_lexicon_cache_path(lexicon_path, cache_dir)
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("wb") as f:
+            pickle.dump(
+                {"version": LEXICON_CACHE_VERSION, "key": cache_key, "lexicon": lexicon},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        temp_path.replace(cache_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def load_lexicon(lexicon_path: str, cache_dir: Path = LEXICON_CACHE_DIR) -> Lexicon | None:
+    """Load a compiled lexicon, reading and compiling the lexicon file only on a cache miss.
+
+    Args:
+        lexicon_path (str): The path to the lexicon file.
+        cache_dir (Path): The directory holding the cache files.
+
+    Returns:
+        Lexicon | None: The compiled lexicon, or None if the file is missing or empty.
+
+    """
+    cached_lexicon = load_cached_lexicon(lexicon_path, cache_dir)
+    if cached_lexicon is not None:
+        return cached_lexicon
+
+    words = read_word_file(lexicon_path)
+    if not words:
+        return None
+
+    lexicon = compile_lexicon(words)
+    precompute_eligibility_tables(lexicon)
+    save_cached_lexicon(lexicon_path, lexicon, cache_dir)
+    return lexicon
+
+
+def main() -> None:
+    """Prebuild the lexicon cache for every lexicon file given on the command line."""
+    if len(sys.argv) < 2:
+        print("Usage: python -m setup.lexicon <lexicon_file> [<lexicon_file> ...]", file=sys.stderr)
+        sys.exit(1)
+
+    for lexicon_path in sys.argv[1:]:
+        words = read_word_file(lexicon_path)
+        if not words:
+            print(f"Skipping {lexicon_path}: file is missing or empty.", file=sys.stderr)
+            continue
+        lexicon = compile_lexicon(words)
+        precompute_eligibility_tables(lexicon)
+        if save_cached_lexicon(lexicon_path, lexicon):
+            print(f"Cached {len(lexicon.words)} words from {lexicon_path}.")
+            for difficulty_name, difficulty_conf in HEART_POINTS_SETTINGS.items():
+                eligible_count = len(lexicon.get_eligible_middle_words(difficulty_conf))
+                print(f"  {difficulty_name}: {eligible_count} eligible middle words")
+        else:
+            print(f"Could not write the cache for {lexicon_path}.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from getkey import getkey, keys
+from typing import TYPE_CHECKING
 
 from data.settings_details import HEART_POINTS_SETTINGS, NO_HEART_POINTS_SETTINGS, DifficultyData
 from data.wizards_details import WIZARDS_DATA, WizardData
@@ -21,9 +21,36 @@ from .menu_constants import (
     MENU3_OPTIONS,
 )
 
+if TYPE_CHECKING:
+    from getkey.keynames import Keys
+
 MAX_NAME_LENGTH = 10
 
 
+def getkey() -> str:
+    """Wait for a keypress, importing getkey the first time a menu needs one.
+
+    Returns:
+        str: The key that was pressed.
+
+    """
+    from getkey import getkey as read_key  # noqa: PLC0415
+
+    return read_key()
+
+
+def get_keys() -> "Keys":
+    """Return getkey's key names for the current platform, importing getkey on first use.
+
+    Returns:
+        Keys: The keys object, with UP, DOWN, LEFT, RIGHT and ENTER among its names.
+
+    """
+    from getkey import keys  # noqa: PLC0415
+
+    return keys
+
+
 def select_from_menu(
     options: list[str],
     title: str = "+.+.+.+ Menu +.+.+.+",
@@ -42,6 +69,7 @@ def select_from_menu(
 
     """
     current_index = 0
+    keys = get_keys()
     while True:
         clear_screen()
         if show_main_title:
@@ -81,6 +109,7 @@ def select_character_menu(settings: DifficultyData | None) -> WizardData:
     """
     current_index = 0
     num_wizards = len(WIZARDS_DATA)
+    keys = get_keys()
 
     while True:
         try:
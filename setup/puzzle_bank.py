@@ -0,0 +1,534 @@
+import argparse
+import hashlib
+import math
+import os
+import random
+import struct
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from data.settings_details import HEART_POINTS_SETTINGS, DifficultyData
+from gameplay.word_placement import WordPlacement
+from utils.file_lock import file_lock
+
+from .grid_generator.board_state import create_empty_grid, place_letters_on_grid
+from .lexicon import PROJECT_DIR, Lexicon, get_lexicon_cache_key, load_lexicon
+from .puzzle_factory import Puzzle
+from .seeded_puzzles import (
+    SEED_BITS,
+    add_batch_arguments,
+    build_seeded_puzzle,
+    get_worker_lexicon,
+    init_lexicon_worker,
+)
+from .word_selector import describe_unsupported_settings
+
+PUZZLE_BANK_DIR = PROJECT_DIR / ".puzzle_bank"
+BANK_DATA_SUFFIX = ".bank"
+BANK_INDEX_SUFFIX = ".idx"
+BANK_CURSOR_SUFFIX = ".cursor"
+DEFAULT_BANK_COUNT = 100  # Puzzles added per difficulty by one run of the bank command
+BANK_CHUNK_SIZE = 4  # Seeds handed to a worker process at a time
+
+RECORD_HEADER = struct.Struct("<QH")  # seed, number of placements
+PLACEMENT_HEADER = struct.Struct("<BBcB")  # start row, start col, orientation, word length in bytes
+MAX_BANK_GRID_SIZE = 255  # Rows and columns are stored in one byte each
+INDEX_ENTRY = struct.Struct("<QI")  # record offset in the data file, record length
+CURSOR_STATE = struct.Struct("<QII")  # seed of the draw order, puzzles in the shuffled order, puzzles drawn
+
+
+@dataclass
+class BankedPuzzle:
+    """A puzzle as stored in the bank: just enough to rebuild its grid.
+
+    Attributes:
+        seed (int): The seed the puzzle was generated from.
+        middle_word (str): The diagonal middle word.
+        placements (list[tuple[str, tuple[int, int], str]]): Every word on the board, middle word first,
+            as (word, (start_row, start_col), orientation), where orientation is "H", "V" or "D".
+
+    """
+
+    seed: int
+    middle_word: str
+    placements: list[tuple[str, tuple[int, int], str]]
+
+
+def get_bank_name(difficulty_conf: DifficultyData) -> str:
+    """Return the name of the bank holding puzzles for a difficulty.
+
+    Only the settings that shape the board are part of the name, so difficulties that
+    differ only in their heart point mode share a bank.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings.
+
+    Returns:
+        str: The bank name.
+
+    """
+    grid = difficulty_conf.grid
+    words_needed = difficulty_conf.words_on_board_needed
+    return (
+        f"{grid.height}x{grid.width}-words{words_needed.minimum}-{words_needed.maximum}"
+        f"-len{difficulty_conf.max_word_length}-sub{difficulty_conf.min_subword_length}-{difficulty_conf.board_engine}"
+    )
+
+
+def describe_unbankable_settings(difficulty_conf: DifficultyData) -> str | None:
+    """Explain why puzzles for a difficulty cannot be stored in a bank, if they cannot.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings.
+
+    Returns:
+        str | None: A description of the problem, or None if the puzzles fit in a bank record.
+
+    """
+    grid = difficulty_conf.grid
+    if grid.height > MAX_BANK_GRID_SIZE or grid.width > MAX_BANK_GRID_SIZE:
+        return (
+            f"The {grid.height}x{grid.width} grid is larger than the bank can store "
+            f"({MAX_BANK_GRID_SIZE} rows and columns at most)."
+        )
+    return None
+
+
+def get_bank_dir(lexicon_path: str, root_dir: Path = PUZZLE_BANK_DIR) -> Path | None:
+    """Return the directory of the banks built from a lexicon file.
+
+    The directory is named after the lexicon's cache key, its path, size and modification time,
+    so editing the lexicon starts new banks instead of serving puzzles with words it no longer has.
+    Only the file's metadata is read, not its contents.
+
+    Args:
+        lexicon_path (str): The path to the lexicon file.
+        root_dir (Path): The directory holding the banks of every lexicon.
+
+    Returns:
+        Path | None: The bank directory, or None if the lexicon file cannot be accessed.
+
+    """
+    cache_key = get_lexicon_cache_key(lexicon_path)
+    if cache_key is None:
+        return None
+    key_digest = hashlib.sha256(repr(cache_key).encode("utf-8")).hexdigest()[:16]
+    return root_dir / f"{Path(lexicon_path).stem}-{key_digest}"
+
+
+def get_placements(
+    middle_word: str,
+    words_to_find: dict[str, WordPlacement],
+) -> list[tuple[str, tuple[int, int], str]]:
+    """Reduce a puzzle's word placements to (word, start, orientation) tuples, middle word first.
+
+    Args:
+        middle_word (str): The diagonal middle word.
+        words_to_find (dict[str, WordPlacement]): Words on the board and their placements.
+
+    Returns:
+        list[tuple[str, tuple[int, int], str]]: The placements.
+
+    """
+    placements: list[tuple[str, tuple[int, int], str]] = []
+    for word in sorted(words_to_find, key=lambda word: word != middle_word):
+        placement = words_to_find[word]
+        if not isinstance(placement, WordPlacement):
+            placement = WordPlacement.from_coords(placement)
+        placements.append((word, (placement.start_row, placement.start_col), placement.orientation))
+    return placements
+
+
+def encode_banked_puzzle(banked_puzzle: BankedPuzzle) -> bytes:
+    """Pack a banked puzzle into its compact binary record.
+
+    Args:
+        banked_puzzle (BankedPuzzle): The puzzle to pack.
+
+    Returns:
+        bytes: The record.
+
+    """
+    parts = [RECORD_HEADER.pack(banked_puzzle.seed, len(banked_puzzle.placements))]
+    for word, (row, col), orientation in banked_puzzle.placements:
+        word_bytes = word.encode("utf-8")
+        parts.extend((PLACEMENT_HEADER.pack(row, col, orientation.encode("ascii"), len(word_bytes)), word_bytes))
+    return b"".join(parts)
+
+
+def decode_banked_puzzle(record: bytes) -> BankedPuzzle:
+    """Unpack a binary record written by encode_banked_puzzle.
+
+    Args:
+        record (bytes): The record.
+
+    Returns:
+        BankedPuzzle: The stored puzzle. Its middle word is the first placement.
+
+    """
+    seed, placement_count = RECORD_HEADER.unpack_from(record)
+    offset = RECORD_HEADER.size
+    placements: list[tuple[str, tuple[int, int], str]] = []
+    for _ in range(placement_count):
+        row, col, orientation, word_length = PLACEMENT_HEADER.unpack_from(record, offset)
+        offset += PLACEMENT_HEADER.size
+        word = record[offset : offset + word_length].decode("utf-8")
+        offset += word_length
+        placements.append((word, (row, col), orientation.decode("ascii")))
+    middle_word = placements[0][0] if placements else ""
+    return BankedPuzzle(seed=seed, middle_word=middle_word, placements=placements)
+
+
+def get_draw_position(order_seed: int, shuffled_count: int, drawn: int) -> int:
+    """Return the position of the next puzzle in a shuffled draw order.
+
+    The order is the affine permutation (stride * drawn + offset) % shuffled_count, with a stride
+    coprime to shuffled_count, so every position comes up once and no draw walks the whole order.
+
+    Args:
+        order_seed (int): The seed of the draw order.
+        shuffled_count (int): The number of puzzles the draw order shuffles.
+        drawn (int): The number of puzzles drawn so far, less than shuffled_count.
+
+    Returns:
+        int: The position of the puzzle in the bank.
+
+    """
+    order_rng = random.Random(order_seed)
+    offset = order_rng.randrange(shuffled_count)
+    stride = order_rng.randrange(1, shuffled_count + 1)
+    while math.gcd(stride, shuffled_count) != 1:
+        stride = order_rng.randrange(1, shuffled_count + 1)
+    return (stride * drawn + offset) % shuffled_count
+
+
+def rebuild_puzzle(banked_puzzle: BankedPuzzle, height: int, width: int) -> Puzzle:
+    """Rebuild the playable puzzle, grid included, from a banked puzzle.
+
+    Args:
+        banked_puzzle (BankedPuzzle): The stored puzzle.
+        height (int): The number of rows in the grid.
+        width (int): The number of columns in the grid.
+
+    Returns:
+        Puzzle: The puzzle, with the middle word capitalized on the grid as generate_board does.
+
+    """
+    final_grid = create_empty_grid(height, width)
+    words_to_find: dict[str, WordPlacement] = {}
+    for word, (start_row, start_col), orientation in banked_puzzle.placements:
+        placement = WordPlacement(start_row, start_col, orientation, len(word))
+        words_to_find[word] = placement
+        place_letters_on_grid(final_grid, word, placement.coords)
+    middle_word = banked_puzzle.middle_word
+    if middle_word in words_to_find:
+        place_letters_on_grid(final_grid, middle_word.upper(), words_to_find[middle_word].coords)
+    return Puzzle(middle_word=middle_word, words_to_find=words_to_find, final_grid=final_grid)
+
+
+class PuzzleBank:
+    """An append-only store of pre-generated puzzles for one difficulty.
+
+    Records are appended to a data file, and the offset and length of each record are
+    appended to a fixed-width index file. Any puzzle can then be read with two seeks,
+    without scanning the data file. A record is only counted once its index entry is
+    complete, so an interrupted append is ignored.
+
+    Puzzles are drawn once each, in a shuffled order. A cursor file keeps the seed of
+    that order and how many puzzles were drawn, so the bank drains across sessions.
+
+    Attributes:
+        difficulty_conf (DifficultyData): The difficulty the puzzles were generated for.
+        data_path (Path): The file holding the records.
+        index_path (Path): The file holding the record offsets.
+        cursor_path (Path): The file holding the draw order and the number of puzzles drawn.
+
+    """
+
+    def __init__(self, bank_dir: Path, difficulty_conf: DifficultyData) -> None:
+        self.difficulty_conf = difficulty_conf
+        bank_name = get_bank_name(difficulty_conf)
+        self.data_path = bank_dir / f"{bank_name}{BANK_DATA_SUFFIX}"
+        self.index_path = bank_dir / f"{bank_name}{BANK_INDEX_SUFFIX}"
+        self.cursor_path = bank_dir / f"{bank_name}{BANK_CURSOR_SUFFIX}"
+
+    def __len__(self) -> int:
+        """Return the number of puzzles in the bank.
+
+        Returns:
+            int: The number of complete index entries.
+
+        """
+        try:
+            return self.index_path.stat().st_size // INDEX_ENTRY.size
+        except OSError:
+            return 0
+
+    def extend(self, banked_puzzles: Iterable[BankedPuzzle]) -> int:
+        """Append puzzles to the bank.
+
+        Each record is written to the data file before its index entry, under the data file's lock,
+        so bank commands filling the same bank at once do not interleave their records. The lock is
+        taken per record rather than for the whole call, since the puzzles are usually generated
+        while they are appended.
+
+        Args:
+            banked_puzzles (Iterable[BankedPuzzle]): The puzzles to append.
+
+        Returns:
+            int: The number of puzzles appended.
+
+        """
+        self.data_path.parent.mkdir(parents=True, exist_ok=True)
+        appended = 0
+        with self.data_path.open("ab") as data_file, self.index_path.open("ab") as index_file:
+            for banked_puzzle in banked_puzzles:
+                record = encode_banked_puzzle(banked_puzzle)
+                with file_lock(self.data_path):
+                    # Drop a torn index entry left by an interrupted append
+                    index_file.truncate(len(self) * INDEX_ENTRY.size)
+                    offset = data_file.seek(0, os.SEEK_END)  # Other processes may have appended since
+                    data_file.write(record)
+                    data_file.flush()
+                    index_file.write(INDEX_ENTRY.pack(offset, len(record)))
+                    index_file.flush()
+                appended += 1
+        return appended
+
+    def read(self, position: int) -> BankedPuzzle:
+        """Read one puzzle by its position in the bank.
+
+        Args:
+            position (int): The position of the puzzle, from 0 to len(bank) - 1.
+
+        Returns:
+            BankedPuzzle: The stored puzzle.
+
+        Raises:
+            IndexError: If there is no puzzle at that position.
+
+        """
+        if not 0 <= position < len(self):
+            msg = "puzzle bank position out of range"
+            raise IndexError(msg)
+        with self.index_path.open("rb") as index_file:
+            index_file.seek(position * INDEX_ENTRY.size)
+            offset, length = INDEX_ENTRY.unpack(index_file.read(INDEX_ENTRY.size))
+        with self.data_path.open("rb") as data_file:
+            data_file.seek(offset)
+            return decode_banked_puzzle(data_file.read(length))
+
+    def read_cursor(self) -> tuple[int, int, int] | None:
+        """Read the draw order and the number of puzzles drawn so far.
+
+        Returns:
+            tuple[int, int, int] | None: The seed of the draw order, the number of puzzles it shuffles
+                and the number of puzzles drawn, or None if nothing was drawn yet or the file is unreadable.
+
+        """
+        try:
+            return CURSOR_STATE.unpack(self.cursor_path.read_bytes())
+        except (OSError, struct.error):
+            return None
+
+    def _write_cursor(self, order_seed: int, shuffled_count: int, drawn: int) -> None:
+        """Save the draw order and the number of puzzles drawn, replacing the cursor file in one step.
+
+        Args:
+            order_seed (int): The seed of the draw order.
+            shuffled_count (int): The number of puzzles the draw order shuffles.
+            drawn (int): The number of puzzles drawn.
+
+        """
+        temp_path = self.cursor_path.with_name(f"{self.cursor_path.name}.tmp")
+        temp_path.write_bytes(CURSOR_STATE.pack(order_seed, shuffled_count, drawn))
+        temp_path.replace(self.cursor_path)
+
+    def remaining(self) -> int:
+        """Return the number of puzzles not drawn yet.
+
+        Returns:
+            int: The puzzles left to draw, 0 once the bank is drained.
+
+        """
+        cursor = self.read_cursor()
+        drawn = cursor[2] if cursor is not None else 0
+        return max(len(self) - drawn, 0)
+
+    def _advance_cursor(self, rng: random.Random | None = None) -> tuple[int, int, int] | None:
+        """Record one more puzzle as drawn, holding the cursor's file lock so no other game draws it too.
+
+        Args:
+            rng (random.Random | None): Random number generator seeding a new draw order. Defaults to the random module.
+
+        Returns:
+            tuple[int, int, int] | None: The cursor before the draw, or None if the bank is drained.
+
+        """
+        with file_lock(self.cursor_path):
+            puzzle_count = len(self)
+            cursor = self.read_cursor()
+            if cursor is None:
+                cursor = ((rng or random).getrandbits(SEED_BITS), puzzle_count, 0)
+            order_seed, shuffled_count, drawn = cursor
+            if drawn >= puzzle_count:
+                return None
+            self._write_cursor(order_seed, shuffled_count, drawn + 1)
+            return cursor
+
+    def draw(self, rng: random.Random | None = None) -> Puzzle | None:
+        """Load the next puzzle of the shuffled draw order, and record that it was drawn.
+
+        The first draw shuffles the puzzles in the bank with a seed from rng. Puzzles appended
+        after that are drawn once the shuffled ones run out, in the order they were appended.
+        The cursor moves on before the record is read, so a damaged record is skipped next time.
+
+        Args:
+            rng (random.Random | None): Random number generator to use. Defaults to the random module.
+
+        Returns:
+            Puzzle | None: The puzzle, or None if the bank is drained or the record cannot be read.
+
+        """
+        if len(self) == 0:
+            return None
+        try:
+            cursor = self._advance_cursor(rng)
+        except OSError:
+            return None
+        if cursor is None:
+            return None
+        order_seed, shuffled_count, drawn = cursor
+        position = get_draw_position(order_seed, shuffled_count, drawn) if drawn < shuffled_count else drawn
+        grid = self.difficulty_conf.grid
+        try:
+            banked_puzzle = self.read(position)
+            return rebuild_puzzle(banked_puzzle, grid.height, grid.width)
+        except (OSError, IndexError, KeyError, struct.error, UnicodeDecodeError):
+            return None
+
+
+def generate_banked_puzzle(
+    difficulty_conf: DifficultyData,
+    seed: int,
+    lexicon: Lexicon | None = None,
+) -> BankedPuzzle | None:
+    """Generate one puzzle for the bank from a seed, which alone reproduces the puzzle.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings for the puzzle.
+        seed (int): The seed of the random number generator.
+        lexicon (Lexicon | None): The compiled lexicon. Defaults to the one loaded by the worker process.
+
+    Returns:
+        BankedPuzzle | None: The puzzle, or None if every attempt failed.
+
+    """
+    lexicon = get_worker_lexicon(lexicon)
+    if lexicon is None:
+        return None
+    puzzle = build_seeded_puzzle(difficulty_conf, lexicon, random.Random(seed))
+    if puzzle is None:
+        return None
+    return BankedPuzzle(
+        seed=seed,
+        middle_word=puzzle.middle_word,
+        placements=get_placements(puzzle.middle_word, puzzle.words_to_find),
+    )
+
+
+def fill_bank(  # noqa: PLR0913, PLR0917
+    puzzle_bank: PuzzleBank,
+    lexicon_path: str,
+    lexicon: Lexicon,
+    count: int,
+    workers: int,
+    seeds: list[int] | None = None,
+) -> int:
+    """Generate puzzles and append them to a bank, across a process pool when there are several workers.
+
+    Args:
+        puzzle_bank (PuzzleBank): The bank to fill.
+        lexicon_path (str): The path to the lexicon file, loaded by each worker process.
+        lexicon (Lexicon): The compiled lexicon, used when generating in this process.
+        count (int): The number of seeds to generate puzzles from.
+        workers (int): The number of worker processes.
+        seeds (list[int] | None): The seeds to use. Defaults to count random seeds.
+
+    Returns:
+        int: The number of puzzles appended. Seeds whose attempts all failed are skipped.
+
+    """
+    if seeds is None:
+        seeds = [random.getrandbits(SEED_BITS) for _ in range(count)]
+
+    if workers <= 1:
+        generate = partial(generate_banked_puzzle, puzzle_bank.difficulty_conf, lexicon=lexicon)
+        return puzzle_bank.extend(puzzle for puzzle in map(generate, seeds) if puzzle is not None)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_lexicon_worker,
+        initargs=(lexicon_path,),
+    ) as executor:
+        generated = executor.map(
+            partial(generate_banked_puzzle, puzzle_bank.difficulty_conf),
+            seeds,
+            chunksize=BANK_CHUNK_SIZE,
+        )
+        return puzzle_bank.extend(puzzle for puzzle in generated if puzzle is not None)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the bank command's arguments.
+
+    Args:
+        argv (list[str] | None): The arguments, or None to read them from sys.argv.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python worderly.py bank",
+        description="Generate puzzles ahead of time and append them to the puzzle bank of each difficulty.",
+    )
+    parser.add_argument("lexicon", help="Lexicon file to generate from.")
+    parser.add_argument("--count", type=int, default=DEFAULT_BANK_COUNT, help="Puzzles to add per difficulty.")
+    add_batch_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Fill the puzzle banks of the chosen difficulties.
+
+    Args:
+        argv (list[str] | None): The command-line arguments, or None to read them from sys.argv.
+
+    """
+    args = parse_args(argv)
+    lexicon = load_lexicon(args.lexicon)
+    bank_dir = get_bank_dir(args.lexicon)
+    if lexicon is None or bank_dir is None:
+        print(f"Lexicon file {args.lexicon} is missing or empty.", file=sys.stderr)
+        sys.exit(1)
+
+    seeds = None if args.seed is None else [args.seed + i for i in range(args.count)]
+    for difficulty_name in args.difficulty or HEART_POINTS_SETTINGS:
+        difficulty_conf = HEART_POINTS_SETTINGS[difficulty_name]
+        unsupported_reason = describe_unbankable_settings(difficulty_conf)
+        unsupported_reason = unsupported_reason or describe_unsupported_settings(difficulty_conf, lexicon)
+        if unsupported_reason:
+            print(f"Skipping {difficulty_name}: {unsupported_reason}", file=sys.stderr)
+            continue
+        puzzle_bank = PuzzleBank(bank_dir, difficulty_conf)
+        appended = fill_bank(puzzle_bank, args.lexicon, lexicon, args.count, args.workers, seeds)
+        print(f"{difficulty_name}: added {appended} of {args.count} puzzles ({len(puzzle_bank)} in bank).")
+
+
+if __name__ == "__main__":
+    main()
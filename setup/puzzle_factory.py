@@ -0,0 +1,193 @@
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from data.settings_details import DifficultyData
+from gameplay.word_placement import WordPlacement
+
+from .grid_generator.main_generator import generate_board_with_reason
+from .lexicon import Lexicon
+from .word_selector import select_word_list
+
+DEFAULT_PUZZLE_QUEUE_SIZE = 2  # Number of ready puzzles kept ahead of the player
+MAX_CONSECUTIVE_FAILURES = 25  # Attempts in a row before the worker gives up
+PUZZLE_POLL_INTERVAL = 0.1  # Seconds between checks of the queue and the stop flag
+
+
+@dataclass
+class Puzzle:
+    """A fully generated puzzle, ready to be played.
+
+    Attributes:
+        middle_word (str): The diagonal middle word.
+        words_to_find (dict[str, WordPlacement]): Words on the board and their placements.
+        final_grid (list[list[str | None]]): The solution grid.
+
+    """
+
+    middle_word: str
+    words_to_find: dict[str, WordPlacement]
+    final_grid: list[list[str | None]]
+
+
+def build_puzzle_with_reason(
+    difficulty_conf: DifficultyData,
+    lexicon: Lexicon,
+    rng: random.Random | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> tuple[Puzzle | None, str | None]:
+    """Make a single silent attempt at generating a word list and a board, and say why it failed.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings for the puzzle.
+        lexicon (Lexicon): The compiled lexicon.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+        should_stop (Callable[[], bool] | None): Polled during board generation; the attempt is
+            abandoned as soon as it returns True.
+
+    Returns:
+        tuple[Puzzle | None, str | None]: The generated puzzle and None, or None and the reason this attempt failed.
+
+    """
+    middle_word, words_to_place = select_word_list(difficulty_conf, lexicon, rng=rng)
+    if middle_word is None or words_to_place is None:
+        return None, "No word list could be selected."
+
+    final_grid, words_to_find, reason = generate_board_with_reason(
+        difficulty_conf,
+        middle_word,
+        words_to_place,
+        rng=rng,
+        should_stop=should_stop,
+    )
+    if final_grid is None or words_to_find is None:
+        return None, reason or "The board could not be generated."
+    return Puzzle(middle_word=middle_word, words_to_find=words_to_find, final_grid=final_grid), None
+
+
+def build_puzzle(
+    difficulty_conf: DifficultyData,
+    lexicon: Lexicon,
+    rng: random.Random | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> Puzzle | None:
+    """Make a single silent attempt at generating a word list and a board.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings for the puzzle.
+        lexicon (Lexicon): The compiled lexicon.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+        should_stop (Callable[[], bool] | None): Polled during board generation; the attempt is
+            abandoned as soon as it returns True.
+
+    Returns:
+        Puzzle | None: The generated puzzle, or None if this attempt failed.
+
+    """
+    puzzle, _ = build_puzzle_with_reason(difficulty_conf, lexicon, rng=rng, should_stop=should_stop)
+    return puzzle
+
+
+class PuzzleFactory:
+    """Pre-generates puzzles for one difficulty on a background thread.
+
+    The worker keeps up to queue_size puzzles ready, so the next round can start
+    by popping one instead of waiting on board generation. It stops on its own
+    after MAX_CONSECUTIVE_FAILURES failed attempts in a row. It draws from its own
+    random.Random, so it never shares the random module's state with the main thread.
+    """
+
+    def __init__(
+        self,
+        difficulty_conf: DifficultyData,
+        lexicon: Lexicon,
+        queue_size: int = DEFAULT_PUZZLE_QUEUE_SIZE,
+    ) -> None:
+        self.difficulty_conf = difficulty_conf
+        self.lexicon = lexicon
+        self._ready_puzzles: queue.Queue[Puzzle] = queue.Queue(maxsize=max(1, queue_size))
+        self._stop_event = threading.Event()
+        self._rng = random.Random()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """bool: Whether the background worker is still generating puzzles."""
+        return self._worker is not None and self._worker.is_alive()
+
+    @property
+    def ready_count(self) -> int:
+        """int: The number of puzzles currently ready to be popped."""
+        return self._ready_puzzles.qsize()
+
+    def start(self) -> None:
+        """Start the background worker, if it is not already running."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._run, name="puzzle-factory", daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Ask the background worker to stop and wait for it to finish.
+
+        The worker abandons the board it is building at its next placement, so this does not wait for a whole board.
+
+        Args:
+            timeout (float | None): Maximum number of seconds to wait, or None to wait until it stops.
+
+        """
+        self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+    def get_puzzle(self, timeout: float = 0) -> Puzzle | None:
+        """Pop a ready puzzle.
+
+        If none is ready but the worker is still running, waits up to timeout
+        seconds for it to finish the puzzle it is building.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait for a puzzle.
+
+        Returns:
+            Puzzle | None: A ready puzzle, or None if none became available in time.
+
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._ready_puzzles.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.is_running:
+                    return None
+                try:
+                    return self._ready_puzzles.get(timeout=min(remaining, PUZZLE_POLL_INTERVAL))
+                except queue.Empty:
+                    continue
+
+    def _run(self) -> None:
+        """Generate puzzles until stopped, blocking while the queue is full."""
+        consecutive_failures = 0
+        while not self._stop_event.is_set() and consecutive_failures < MAX_CONSECUTIVE_FAILURES:
+            puzzle = build_puzzle(
+                self.difficulty_conf,
+                self.lexicon,
+                rng=self._rng,
+                should_stop=self._stop_event.is_set,
+            )
+            if puzzle is None:
+                consecutive_failures += 1
+                continue
+            consecutive_failures = 0
+
+            while not self._stop_event.is_set():
+                try:
+                    self._ready_puzzles.put(puzzle, timeout=PUZZLE_POLL_INTERVAL)
+                    break
+                except queue.Full:
+                    continue
@@ -0,0 +1,115 @@
+import argparse
+import os
+import random
+from collections.abc import Iterator
+
+from data.settings_details import HEART_POINTS_SETTINGS, DifficultyData
+
+from .lexicon import Lexicon, load_lexicon
+from .puzzle_factory import Puzzle, build_puzzle_with_reason
+
+MAX_ATTEMPTS_PER_PUZZLE = 25  # Word list and board attempts made for one seed before it is skipped
+SEED_BITS = 64  # Width of the random seeds drawn for puzzles
+
+_worker_lexicon: Lexicon | None = None
+
+
+def init_lexicon_worker(lexicon_path: str) -> None:
+    """Load the lexicon once in each worker process of a puzzle generation pool.
+
+    Args:
+        lexicon_path (str): The path to the lexicon file.
+
+    """
+    global _worker_lexicon  # noqa: PLW0603
+    _worker_lexicon = load_lexicon(lexicon_path)
+
+
+def get_worker_lexicon(lexicon: Lexicon | None = None) -> Lexicon | None:
+    """Return the given lexicon, or the one loaded by init_lexicon_worker in this process.
+
+    Args:
+        lexicon (Lexicon | None): The compiled lexicon, if the caller has one.
+
+    Returns:
+        Lexicon | None: The lexicon to generate from, or None if there is none.
+
+    """
+    return lexicon or _worker_lexicon
+
+
+def iter_puzzle_attempts(
+    difficulty_conf: DifficultyData,
+    lexicon: Lexicon,
+    rng: random.Random,
+) -> Iterator[tuple[Puzzle | None, str | None]]:
+    """Attempt a puzzle until one succeeds or MAX_ATTEMPTS_PER_PUZZLE attempts were made.
+
+    Every attempt draws from the same random number generator, so a seeded rng alone reproduces the puzzle.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings for the puzzle.
+        lexicon (Lexicon): The compiled lexicon.
+        rng (random.Random): Random number generator shared by the attempts.
+
+    Yields:
+        tuple[Puzzle | None, str | None]: Each attempt's puzzle and failure reason, as build_puzzle_with_reason
+            returns them. The last one yielded is the first success, if any.
+
+    """
+    for _ in range(MAX_ATTEMPTS_PER_PUZZLE):
+        puzzle, reason = build_puzzle_with_reason(difficulty_conf, lexicon, rng=rng)
+        yield puzzle, reason
+        if puzzle is not None:
+            return
+
+
+def build_seeded_puzzle(difficulty_conf: DifficultyData, lexicon: Lexicon, rng: random.Random) -> Puzzle | None:
+    """Generate a puzzle, retrying with the same random number generator.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings for the puzzle.
+        lexicon (Lexicon): The compiled lexicon.
+        rng (random.Random): Random number generator shared by the attempts.
+
+    Returns:
+        Puzzle | None: The puzzle, or None if every attempt failed.
+
+    """
+    for puzzle, _ in iter_puzzle_attempts(difficulty_conf, lexicon, rng):
+        if puzzle is not None:
+            return puzzle
+    return None
+
+
+def add_seed_argument(parser: argparse.ArgumentParser, default: int | None = None) -> None:
+    """Add the --seed option of the commands that generate seeded puzzles.
+
+    Args:
+        parser (argparse.ArgumentParser): The command's parser.
+        default (int | None): The seed used when the option is left out.
+
+    """
+    parser.add_argument("--seed", type=int, default=default, help="Seed of the first puzzle, for reproducible runs.")
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --difficulty, --workers and --seed options of the commands that generate puzzles in bulk.
+
+    Args:
+        parser (argparse.ArgumentParser): The command's parser.
+
+    """
+    parser.add_argument(
+        "--difficulty",
+        action="append",
+        choices=list(HEART_POINTS_SETTINGS),
+        help="Difficulty to run. Can be repeated. Defaults to every difficulty.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes. Defaults to one per CPU core.",
+    )
+    add_seed_argument(parser)
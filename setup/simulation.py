@@ -0,0 +1,266 @@
+import argparse
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import partial
+
+from data.settings_details import HEART_POINTS_SETTINGS, DifficultyData
+from data.wizards_details import WIZARDS_DATA
+from gameplay.bot_simulation import BOT_PLAYER_NAME, WizardTally, play_every_wizard
+from gameplay.bots import BOT_STRATEGIES
+from gameplay.gameplay import GameConfig
+
+from .lexicon import Lexicon, load_lexicon
+from .seeded_puzzles import (
+    SEED_BITS,
+    add_batch_arguments,
+    build_seeded_puzzle,
+    get_worker_lexicon,
+    init_lexicon_worker,
+)
+from .word_selector import describe_unsupported_settings, get_valid_word_subwords
+
+DEFAULT_PUZZLES = 20  # Puzzles generated per difficulty
+DEFAULT_GAMES_PER_WIZARD = 20  # Games each wizard plays on every puzzle
+DEFAULT_BOT = "powerup"
+
+
+def get_candidate_words(difficulty_conf: DifficultyData, lexicon: Lexicon, middle_word: str) -> list[str]:
+    """List the lexicon words a player could guess from the letters of a middle word.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings of the puzzle.
+        lexicon (Lexicon): The compiled lexicon.
+        middle_word (str): The middle word of the puzzle.
+
+    Returns:
+        list[str]: The middle word and every valid subword of it, which include all the words on the board.
+
+    """
+    subword_pool, _ = lexicon.get_word_pools(difficulty_conf.max_word_length, difficulty_conf.min_subword_length)
+    subwords = get_valid_word_subwords(
+        middle_word,
+        subword_pool,
+        difficulty_conf.min_subword_length,
+        signature_index=lexicon.signature_index,
+    )
+    return [middle_word, *subwords]
+
+
+def simulate_puzzle(
+    difficulty_conf: DifficultyData,
+    bot_name: str,
+    games_per_wizard: int,
+    seed: int,
+    lexicon: Lexicon | None = None,
+) -> dict[str, WizardTally] | None:
+    """Generate one puzzle from a seed and let every wizard play it several times with a bot.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings of the puzzle.
+        bot_name (str): The name of the bot in BOT_STRATEGIES.
+        games_per_wizard (int): Games each wizard plays on the puzzle.
+        seed (int): The seed of the puzzle and of the games played on it.
+        lexicon (Lexicon | None): The compiled lexicon. Defaults to the one loaded by the worker process.
+
+    Returns:
+        dict[str, WizardTally] | None: The tally of each wizard by name, or None if no puzzle could be generated.
+
+    """
+    lexicon = get_worker_lexicon(lexicon)
+    if lexicon is None:
+        return None
+    rng = random.Random(seed)
+    puzzle = build_seeded_puzzle(difficulty_conf, lexicon, rng)
+    if puzzle is None:
+        return None
+
+    game_config = GameConfig(
+        difficulty_conf=difficulty_conf,
+        final_grid=puzzle.final_grid,
+        words_to_find=puzzle.words_to_find,
+        middle_word=puzzle.middle_word,
+        player_name=BOT_PLAYER_NAME,
+        selected_wizard=WIZARDS_DATA[0],
+    )
+    candidate_words = get_candidate_words(difficulty_conf, lexicon, puzzle.middle_word)
+    return play_every_wizard(game_config, BOT_STRATEGIES[bot_name], candidate_words, games_per_wizard, rng=rng)
+
+
+def run_simulation(  # noqa: PLR0913, PLR0917
+    difficulty_conf: DifficultyData,
+    lexicon_path: str,
+    lexicon: Lexicon,
+    bot_name: str,
+    games_per_wizard: int,
+    seeds: list[int],
+    workers: int,
+) -> tuple[dict[str, WizardTally], int]:
+    """Simulate games on one puzzle per seed, across a process pool when there are several workers.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings of the puzzles.
+        lexicon_path (str): The path to the lexicon file, loaded by each worker process.
+        lexicon (Lexicon): The compiled lexicon, used when simulating in this process.
+        bot_name (str): The name of the bot in BOT_STRATEGIES.
+        games_per_wizard (int): Games each wizard plays on every puzzle.
+        seeds (list[int]): The seed of each puzzle.
+        workers (int): The number of worker processes.
+
+    Returns:
+        tuple[dict[str, WizardTally], int]: The tally of each wizard over all puzzles, in WIZARDS_DATA order,
+            and the number of puzzles played. Seeds whose attempts all failed are skipped.
+
+    """
+    simulate = partial(simulate_puzzle, difficulty_conf, bot_name, games_per_wizard)
+    totals = {wizard.name: WizardTally() for wizard in WIZARDS_DATA}
+    puzzles_played = 0
+
+    if workers <= 1:
+        results = map(partial(simulate, lexicon=lexicon), seeds)
+        for puzzle_tallies in results:
+            puzzles_played += _add_tallies(totals, puzzle_tallies)
+        return totals, puzzles_played
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_lexicon_worker,
+        initargs=(lexicon_path,),
+    ) as executor:
+        for puzzle_tallies in executor.map(simulate, seeds):
+            puzzles_played += _add_tallies(totals, puzzle_tallies)
+    return totals, puzzles_played
+
+
+def _add_tallies(totals: dict[str, WizardTally], puzzle_tallies: dict[str, WizardTally] | None) -> int:
+    """Add the tallies of one puzzle to the totals.
+
+    Args:
+        totals (dict[str, WizardTally]): The totals of each wizard, updated in place.
+        puzzle_tallies (dict[str, WizardTally] | None): The tallies of the puzzle, or None if it was skipped.
+
+    Returns:
+        int: 1 if the puzzle was played, 0 if it was skipped.
+
+    """
+    if puzzle_tallies is None:
+        return 0
+    for wizard_name, tally in puzzle_tallies.items():
+        totals[wizard_name].merge(tally)
+    return 1
+
+
+def format_win_rate_table(results: dict[str, dict[str, WizardTally]]) -> str:
+    """Format the simulated win rates as a plain text table.
+
+    Args:
+        results (dict[str, dict[str, WizardTally]]): The tally of each wizard, by difficulty.
+
+    Returns:
+        str: One header line and one line per difficulty and wizard.
+
+    """
+    header = f"{'Difficulty':<24}{'Wizard':<16}{'Games':>8}{'Win %':>8}{'Turns':>8}{'Points':>8}{'Powerups':>10}"
+    lines = [header]
+    for difficulty_name, tallies in results.items():
+        for wizard_name, tally in tallies.items():
+            games = tally.games or 1
+            lines.append(
+                f"{difficulty_name:<24}{wizard_name:<16}{tally.games:>8}{tally.win_rate:>8.1%}"
+                f"{tally.turns / games:>8.1f}{tally.points / games:>8.1f}{tally.powerups_used / games:>10.2f}",
+            )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the simulate command's arguments.
+
+    Args:
+        argv (list[str] | None): The arguments, or None to read them from sys.argv.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python worderly.py simulate",
+        description="Play games with a bot, without a terminal, and report the win rate of every wizard.",
+    )
+    parser.add_argument("lexicon", help="Lexicon file to generate puzzles from.")
+    parser.add_argument("--bot", choices=sorted(BOT_STRATEGIES), default=DEFAULT_BOT, help="Bot that plays the games.")
+    parser.add_argument("--puzzles", type=int, default=DEFAULT_PUZZLES, help="Puzzles to generate per difficulty.")
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=DEFAULT_GAMES_PER_WIZARD,
+        help="Games each wizard plays on every puzzle.",
+    )
+    add_batch_arguments(parser)
+    parser.add_argument("--output", default=None, help="JSON file to write the tallies to.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Simulate bot games on the chosen difficulties and print the win rate of every wizard.
+
+    Args:
+        argv (list[str] | None): The command-line arguments, or None to read them from sys.argv.
+
+    """
+    args = parse_args(argv)
+    lexicon = load_lexicon(args.lexicon)
+    if lexicon is None:
+        print(f"Lexicon file {args.lexicon} is missing or empty.", file=sys.stderr)
+        sys.exit(1)
+
+    base_seed = args.seed if args.seed is not None else random.getrandbits(SEED_BITS)
+    seeds = [base_seed + i for i in range(args.puzzles)]
+    results: dict[str, dict[str, WizardTally]] = {}
+    total_games = 0
+    started_at = time.perf_counter()
+    for difficulty_name in args.difficulty or HEART_POINTS_SETTINGS:
+        difficulty_conf = HEART_POINTS_SETTINGS[difficulty_name]
+        unsupported_reason = describe_unsupported_settings(difficulty_conf, lexicon)
+        if unsupported_reason:
+            print(f"Skipping {difficulty_name}: {unsupported_reason}", file=sys.stderr)
+            continue
+        tallies, puzzles_played = run_simulation(
+            difficulty_conf,
+            args.lexicon,
+            lexicon,
+            args.bot,
+            args.games,
+            seeds,
+            args.workers,
+        )
+        if puzzles_played < len(seeds):
+            print(f"{difficulty_name}: {len(seeds) - puzzles_played} puzzles could not be generated.", file=sys.stderr)
+        results[difficulty_name] = tallies
+        total_games += sum(tally.games for tally in tallies.values())
+    elapsed = time.perf_counter() - started_at
+
+    print(format_win_rate_table(results))
+    print(f"{total_games} games with the {args.bot} bot in {elapsed:.1f}s ({total_games / elapsed:.0f} games/s).")
+
+    if args.output:
+        summary = {
+            "lexicon": args.lexicon,
+            "bot": args.bot,
+            "base_seed": base_seed,
+            "puzzles": args.puzzles,
+            "games_per_wizard": args.games,
+            "results": {
+                difficulty_name: {wizard_name: asdict(tally) for wizard_name, tally in tallies.items()}
+                for difficulty_name, tallies in results.items()
+            },
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=4)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
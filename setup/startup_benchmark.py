@@ -0,0 +1,213 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+from dataclasses import dataclass, field
+from operator import itemgetter
+from pathlib import Path
+
+DEFAULT_SCRIPT_PATH = "worderly.py"
+DEFAULT_RUNS = 10  # Interpreter starts measured; the median of each number is reported
+DEFAULT_TOP = 10  # Slowest top-level imports listed in the report
+DEFERRED_MODULES = ("rich", "getkey")  # Only imported once a menu or Rich frame needs them
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportTiming:
+    """One line of `python -X importtime` output.
+
+    Attributes:
+        module (str): The imported module.
+        self_us (int): Time spent importing the module itself, in microseconds.
+        cumulative_us (int): Time including the modules it imported, in microseconds.
+        depth (int): Nesting level, 0 for modules imported directly by the script.
+
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupReport:
+    """Startup measurements of a script over several interpreter starts.
+
+    Attributes:
+        script (str): The script that was started.
+        runs (int): Number of interpreter starts measured.
+        import_ms (float): Median total import time, in milliseconds.
+        wall_ms (float): Median time from starting the interpreter to its exit, in milliseconds.
+        deferred_loaded (dict[str, bool]): Whether each deferred module was imported at startup.
+        slowest_imports (list[tuple[str, float]]): Top-level imports by median cumulative time, in milliseconds.
+
+    """
+
+    script: str
+    runs: int
+    import_ms: float
+    wall_ms: float
+    deferred_loaded: dict[str, bool] = field(default_factory=dict)
+    slowest_imports: list[tuple[str, float]] = field(default_factory=list)
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse the timings written to stderr by `python -X importtime`.
+
+    Args:
+        output (str): The captured stderr. Lines that are not import timings are ignored.
+
+    Returns:
+        list[ImportTiming]: The timings, in the order the imports finished.
+
+    """
+    timings = []
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def measure_startup(script: str, env: dict[str, str] | None = None) -> tuple[list[ImportTiming], float]:
+    """Start the script once under `python -X importtime` and time it.
+
+    The script is started without arguments, so the game exits right after its imports
+    with a usage message.
+
+    Args:
+        script (str): Path of the script to start.
+        env (dict[str, str] | None): Environment of the interpreter, or None to inherit this one.
+
+    Returns:
+        tuple[list[ImportTiming], float]: The import timings and the wall time in seconds.
+
+    """
+    started_at = time.perf_counter()
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", script],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=Path(script).resolve().parent,
+        check=False,
+        stdin=subprocess.DEVNULL,
+    )
+    return parse_importtime(result.stderr), time.perf_counter() - started_at
+
+
+def run_startup_benchmark(
+    script: str,
+    runs: int = DEFAULT_RUNS,
+    top: int = DEFAULT_TOP,
+    env: dict[str, str] | None = None,
+) -> StartupReport:
+    """Measure the script's startup over several interpreter starts.
+
+    Args:
+        script (str): Path of the script to start.
+        runs (int): Number of interpreter starts to measure.
+        top (int): Number of slowest top-level imports to report.
+        env (dict[str, str] | None): Environment of the interpreter, or None to inherit this one.
+
+    Returns:
+        StartupReport: The median timings and the deferred modules that were imported.
+
+    """
+    import_totals = []
+    wall_times = []
+    top_level: dict[str, list[int]] = {}
+    loaded_modules: set[str] = set()
+    for _ in range(runs):
+        timings, wall_seconds = measure_startup(script, env)
+        import_totals.append(sum(timing.self_us for timing in timings))
+        wall_times.append(wall_seconds)
+        loaded_modules.update(timing.module for timing in timings)
+        for timing in timings:
+            if timing.depth == 0:
+                top_level.setdefault(timing.module, []).append(timing.cumulative_us)
+
+    slowest_imports = sorted(
+        ((module, statistics.median(times) / 1000) for module, times in top_level.items()),
+        key=itemgetter(1),
+        reverse=True,
+    )[:top]
+    return StartupReport(
+        script=script,
+        runs=runs,
+        import_ms=statistics.median(import_totals) / 1000 if import_totals else 0.0,
+        wall_ms=statistics.median(wall_times) * 1000 if wall_times else 0.0,
+        deferred_loaded={module: module in loaded_modules for module in DEFERRED_MODULES},
+        slowest_imports=slowest_imports,
+    )
+
+
+def format_startup_report(report: StartupReport) -> str:
+    """Format a startup report as plain text.
+
+    Args:
+        report (StartupReport): The report to show.
+
+    Returns:
+        str: The median timings, the deferred modules and the slowest top-level imports.
+
+    """
+    lines = [
+        f"{report.script}: median of {report.runs} starts",
+        f"{'Imports':<44}{report.import_ms:>10.1f} ms",
+        f"{'Interpreter start to exit':<44}{report.wall_ms:>10.1f} ms",
+    ]
+    lines.extend(
+        f"{module + ' imported':<44}{'yes' if loaded else 'no':>10}"
+        for module, loaded in report.deferred_loaded.items()
+    )
+    lines.append("Slowest top-level imports:")
+    lines.extend(f"  {module:<42}{cumulative_ms:>10.1f} ms" for module, cumulative_ms in report.slowest_imports)
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the startup benchmark's command-line arguments.
+
+    Args:
+        argv (list[str] | None): The arguments, or None to read them from sys.argv.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m setup.startup_benchmark",
+        description="Measure the import time of the game with python -X importtime.",
+    )
+    parser.add_argument("script", nargs="?", default=DEFAULT_SCRIPT_PATH, help="Script to start.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Interpreter starts to measure.")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Slowest top-level imports to list.")
+    parser.add_argument("--headless", action="store_true", help="Start the game with WORDERLY_DISPLAY=headless.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the startup benchmark and print its report.
+
+    Args:
+        argv (list[str] | None): The command-line arguments, or None to read them from sys.argv.
+
+    """
+    args = parse_args(argv)
+    if not Path(args.script).is_file():
+        print(f"Script {args.script} not found.", file=sys.stderr)
+        sys.exit(1)
+
+    env = {**os.environ, "WORDERLY_DISPLAY": "headless"} if args.headless else None
+    print(format_startup_report(run_startup_benchmark(args.script, runs=args.runs, top=args.top, env=env)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,10 @@
-import itertools
 import random
 
 from data.settings_details import DifficultyData
 from display.display import print_message
 from display.display_utils import clear_screen
 
-
-def read_word_file(word_path: str) -> list[str]:
-    """Read a lexicon file and return a list of cleaned, lowercase words.
-
-    Args:
-        word_path (str): The path to the word file.
-
-    Returns:
-        list[str]: A list of words from the file, cleaned and lowercased.
-
-    """
-    try:
-        with open(word_path, encoding="utf-8") as file:
-            return [word.strip().lower() for word in file if word.strip()]
-    except FileNotFoundError:
-        print(f"Error: File {word_path} not found.")
-        return []
-    except OSError as e:
-        print(f"Error reading file {word_path}: {e}")
-        return []
+from .lexicon import Lexicon, build_signature_index, get_sub_signatures
 
 
 def filter_exact_length_words(words: list[str], exact_length: int) -> list[str]:
@@ -55,32 +35,47 @@ def filter_words_up_to_max_length(words: list[str], max_length: int) -> set[str]
     return {word for word in words if len(word) <= max_length}
 
 
-def get_valid_word_subwords(word: str, valid_words_set: set[str], min_length: int) -> list[str]:
+def get_valid_word_subwords(
+    word: str,
+    valid_words_set: set[str],
+    min_length: int,
+    signature_index: dict[str, list[str]] | None = None,
+) -> list[str]:
     """Find all valid subwords/anagrams of a word from a set, with minimum length.
 
+    Subwords are looked up by letter signature, so the cost depends on the number of
+    letter combinations of the word rather than the number of its permutations.
+
     Args:
         word (str): The word to find subwords for.
         valid_words_set (set[str]): Set of valid words to check against.
         min_length (int): Minimum length for subwords.
+        signature_index (dict[str, list[str]] | None): Precomputed signature index of the
+            valid words. Built from valid_words_set if not provided.
 
     Returns:
         list[str]: List of valid subwords (excluding the original word).
 
     """
-    valid_subwords: set[str] = set()
-    for length in range(min_length, len(word) + 1):
-        for p in itertools.permutations(word, length):
-            subword = "".join(p)
-            if subword in valid_words_set and subword != word:
-                valid_subwords.add(subword)
-    return list(valid_subwords)
+    if signature_index is None:
+        signature_index = build_signature_index(valid_words_set)
+
+    valid_subwords: list[str] = []
+    # Sorted, so that the subword order does not depend on string hashing
+    for signature in sorted(get_sub_signatures(word, min_length)):
+        valid_subwords.extend(
+            subword for subword in signature_index.get(signature, []) if subword != word and subword in valid_words_set
+        )
+    return valid_subwords
 
 
-def find_valid_word_with_subwords(
+def find_valid_word_with_subwords(  # noqa: PLR0913, PLR0917
     exact_max_length_words: list[str],
     min_subword_length: int,
     min_subwords_needed: int,
     valid_subword_set: set[str],
+    signature_index: dict[str, list[str]] | None = None,
+    rng: random.Random | None = None,
 ) -> tuple[str | None, list[str] | None]:
     """Find a word of a specific length with enough valid subwords.
 
@@ -89,32 +84,73 @@ def find_valid_word_with_subwords(
         min_subword_length (int): Minimum length for subwords.
         min_subwords_needed (int): Minimum number of subwords required (including the word itself).
         valid_subword_set (set[str]): Set of valid words for subword checking.
+        signature_index (dict[str, list[str]] | None): Precomputed signature index of the
+            valid words. Built once from valid_subword_set if not provided.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
 
     Returns:
         tuple[str | None, list[str] | None]: The chosen word and its subwords, or (None, None) if not found.
 
     """
     actual_subwords_needed = min_subwords_needed - 1
+    if signature_index is None:
+        signature_index = build_signature_index(valid_subword_set)
 
     for chosen_word in exact_max_length_words:
-        subwords = get_valid_word_subwords(chosen_word, valid_subword_set, min_subword_length)
+        subwords = get_valid_word_subwords(
+            chosen_word,
+            valid_subword_set,
+            min_subword_length,
+            signature_index=signature_index,
+        )
         if len(subwords) >= actual_subwords_needed:
-            random.shuffle(subwords)
+            (rng or random).shuffle(subwords)
             return chosen_word, subwords
 
     print("Cannot create word list with given settings")
     return None, None
 
 
-def generate_word_list(difficulty_conf: DifficultyData, lexicon_path: str) -> tuple[str | None, list[str] | None]:
-    """Generate a middle word and a list of subwords for the game board.
+def describe_unsupported_settings(difficulty_conf: DifficultyData, lexicon: Lexicon) -> str | None:
+    """Explain why the lexicon cannot produce a word list for the given settings, if it cannot.
 
-    Reads the lexicon, filters words based on settings, finds a suitable
-    middle word with enough subwords, and returns them.
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings for the game.
+        lexicon (Lexicon): The compiled lexicon.
+
+    Returns:
+        str | None: A description of the problem, or None if at least one middle word qualifies.
+
+    """
+    max_len = difficulty_conf.max_word_length
+    min_sub_len = difficulty_conf.min_subword_length
+    min_subwords_needed = difficulty_conf.words_on_board_needed.minimum - 1
+
+    if not lexicon.length_buckets.get(max_len):
+        return f"The lexicon has no {max_len}-letter words to use as the middle word."
+    if not lexicon.get_eligible_middle_words(difficulty_conf):
+        return (
+            f"No {max_len}-letter word in the lexicon has at least {min_subwords_needed} "
+            f"subwords of {min_sub_len} or more letters."
+        )
+    return None
+
+
+def select_word_list(
+    difficulty_conf: DifficultyData,
+    lexicon: Lexicon,
+    rng: random.Random | None = None,
+) -> tuple[str | None, list[str] | None]:
+    """Pick a middle word and its shuffled subwords without displaying anything.
+
+    Draws a random middle word from the lexicon's eligibility table for the settings,
+    so every draw is known to have enough subwords. Safe to call from a background thread.
+    The same seeded rng and lexicon always give the same word list.
 
     Args:
         difficulty_conf (DifficultyData): The difficulty settings for the game.
-        lexicon_path (str): Path to the word list file.
+        lexicon (Lexicon): The compiled lexicon, loaded once per process.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
 
     Returns:
         tuple[str | None, list[str] | None]: The chosen middle word and a list of subwords, or (None, None) if failed.
@@ -124,6 +160,41 @@ def generate_word_list(difficulty_conf: DifficultyData, lexicon_path: str) -> tu
     min_sub_len = difficulty_conf.min_subword_length
     min_words_needed = difficulty_conf.words_on_board_needed.minimum
 
+    eligible_middle_words = lexicon.get_eligible_middle_words(difficulty_conf)
+    if not eligible_middle_words:
+        return None, None
+
+    valid_subword_pool, _ = lexicon.get_word_pools(max_len, min_sub_len)
+    chosen_middle_word, _ = (rng or random).choice(eligible_middle_words)
+
+    return find_valid_word_with_subwords(
+        [chosen_middle_word],
+        min_sub_len,
+        min_words_needed,
+        valid_subword_pool,
+        signature_index=lexicon.signature_index,
+        rng=rng,
+    )
+
+
+def generate_word_list(
+    difficulty_conf: DifficultyData,
+    lexicon: Lexicon,
+    rng: random.Random | None = None,
+) -> tuple[str | None, list[str] | None]:
+    """Generate a middle word and a list of subwords for the game board.
+
+    Shows the board-building message, then picks the words with select_word_list.
+
+    Args:
+        difficulty_conf (DifficultyData): The difficulty settings for the game.
+        lexicon (Lexicon): The compiled lexicon, loaded once per process.
+        rng (random.Random | None): Random number generator to use. Defaults to the random module.
+
+    Returns:
+        tuple[str | None, list[str] | None]: The chosen middle word and a list of subwords, or (None, None) if failed.
+
+    """
     clear_screen()
     print_message(
         difficulty_conf,
@@ -132,25 +203,9 @@ def generate_word_list(difficulty_conf: DifficultyData, lexicon_path: str) -> tu
         border_style="magenta",
     )
 
-    all_words = read_word_file(lexicon_path)
-    if not all_words:
-        return None, None
-
-    valid_subword_pool = filter_words_up_to_max_length(all_words, max_len)
-    if not valid_subword_pool:
-        return None, None
-
-    potential_middle_words = filter_exact_length_words(list(valid_subword_pool), max_len)
-    if not potential_middle_words:
+    unsupported_reason = describe_unsupported_settings(difficulty_conf, lexicon)
+    if unsupported_reason:
+        print(f"Cannot create word list with given settings: {unsupported_reason}")
         return None, None
 
-    random.shuffle(potential_middle_words)
-
-    middle_word, list_of_words_to_place = find_valid_word_with_subwords(
-        potential_middle_words,
-        min_sub_len,
-        min_words_needed,
-        valid_subword_pool,
-    )
-
-    return middle_word, list_of_words_to_place
+    return select_word_list(difficulty_conf, lexicon, rng=rng)
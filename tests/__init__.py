@@ -7,4 +7,5 @@ Modules:
     gameplay: Tests for the main gameplay loop, state handler, and powerup logic.
     leaderboard: Tests for leaderboard and streak management.
     setup: Tests for setup logic, grid generation, menus, and word selection.
+    utils: Tests for the helpers shared by the other packages.
 """
@@ -4,7 +4,9 @@ This package contains unit tests for the core gameplay logic, state management,
 powerup handling, and gameplay constants.
 
 Modules:
+    test_bots: Tests for the solver bots and headless games.
     test_gameplay: Tests for the main gameplay loop and related utilities.
     test_game_state_handler: Tests for functions and classes managing game state and statistics.
     test_powerup_handler: Tests for logic handling powerups and their effects.
+    test_word_placement: Tests for the compact word placement record.
 """
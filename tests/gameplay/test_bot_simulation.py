@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from data.settings_details import HEART_POINTS_SETTINGS
+from data.wizards_details import WIZARDS_DATA
+from gameplay import bot_simulation, bots
+from gameplay.bot_simulation import WizardTally
+from gameplay.bots import BotGameResult
+from gameplay.gameplay import GameConfig
+from gameplay.word_placement import WordPlacement
+
+# ************************************************
+# Fixtures
+# ************************************************
+
+
+@pytest.fixture
+def sample_game_config() -> GameConfig:
+    """Create a small two-word puzzle, "cat" across and "car" down.
+
+    Returns:
+        GameConfig: The sample game configuration, played by the first wizard.
+
+    """
+    return GameConfig(
+        difficulty_conf=HEART_POINTS_SETTINGS["Simple Scroll"],
+        final_grid=[["c", "a", "t"], ["a", None, None], ["r", None, None]],
+        words_to_find={"cat": WordPlacement(0, 0, "H", 3), "car": WordPlacement(0, 0, "V", 3)},
+        middle_word="cat",
+        player_name=bot_simulation.BOT_PLAYER_NAME,
+        selected_wizard=WIZARDS_DATA[0],
+    )
+
+
+# ************************************************
+# Tests
+# ************************************************
+
+
+def test_wizard_tally_counts_and_merges() -> None:
+    """Add up games and merge the tallies of several puzzles."""
+    tally = WizardTally()
+    tally.add_game(BotGameResult(status="win", turns=5, points=20, powerups_used=1, lives_left=3))
+    tally.add_game(BotGameResult(status="loss", turns=7, points=10, powerups_used=0, lives_left=0))
+    other = WizardTally(games=2, wins=2, turns=4, points=30, powerups_used=2)
+
+    tally.merge(other)
+
+    assert tally == WizardTally(games=4, wins=3, turns=16, points=60, powerups_used=3)
+    assert tally.win_rate == pytest.approx(0.75)
+    assert WizardTally().win_rate == pytest.approx(0.0)
+
+
+def test_play_every_wizard_perfect_bot(sample_game_config: GameConfig) -> None:
+    """Play the puzzle with every wizard, and win every game with the perfect bot."""
+    tallies = bot_simulation.play_every_wizard(sample_game_config, bots.perfect_bot, [], 3, rng=random.Random(0))
+
+    assert list(tallies) == [wizard.name for wizard in WIZARDS_DATA]
+    assert all(tally.games == tally.wins == 3 for tally in tallies.values())
+    assert sample_game_config.selected_wizard is WIZARDS_DATA[0]
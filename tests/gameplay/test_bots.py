@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+from data.settings_details import HEART_POINTS_SETTINGS
+from data.wizards_details import WIZARDS_DATA, WizardData
+from gameplay import bots, game_constants
+from gameplay.bots import BotTurn
+from gameplay.game_state_handler import initialize_game_state
+from gameplay.gameplay import GameConfig
+from gameplay.word_placement import WordPlacement
+
+WIZARDS_BY_COLOR = {wizard.color: wizard for wizard in WIZARDS_DATA}
+
+# ************************************************
+# Fixtures
+# ************************************************
+
+
+def make_game_config(wizard: WizardData) -> GameConfig:
+    """Create a small two-word puzzle played by a wizard.
+
+    Args:
+        wizard (WizardData): The wizard playing the puzzle.
+
+    Returns:
+        GameConfig: "cat" across and "car" down, sharing their first letter.
+
+    """
+    return GameConfig(
+        difficulty_conf=HEART_POINTS_SETTINGS["Simple Scroll"],
+        final_grid=[["c", "a", "t"], ["a", None, None], ["r", None, None]],
+        words_to_find={"cat": WordPlacement(0, 0, "H", 3), "car": WordPlacement(0, 0, "V", 3)},
+        middle_word="cat",
+        player_name="Bot",
+        selected_wizard=wizard,
+    )
+
+
+@pytest.fixture
+def sample_game_config() -> GameConfig:
+    """Create the small puzzle played by the wizard without a powerup.
+
+    Returns:
+        GameConfig: The sample game configuration.
+
+    """
+    return make_game_config(WIZARDS_BY_COLOR["bright_white"])
+
+
+# ************************************************
+# Tests
+# ************************************************
+
+
+def test_draw_word_draws_each_word_once_per_pass(sample_game_config: GameConfig) -> None:
+    """Draw every word once before drawing any word again."""
+    game_st = initialize_game_state(sample_game_config.final_grid, "cat", sample_game_config.selected_wizard, "Bot")
+    turn = BotTurn(game_config=sample_game_config, game_st=game_st, board_words=[], candidate_words=[])
+    words = ["act", "arc", "cat", "car"]
+    rng = random.Random(0)
+
+    first_pass = [bots.draw_word(turn, words, rng) for _ in words]
+    game_st.correctly_guessed_words.add("arc")
+    second_pass = [bots.draw_word(turn, words, rng) for _ in range(3)]
+
+    assert sorted(first_pass) == sorted(words)
+    assert sorted(second_pass) == ["act", "car", "cat"]
+
+
+def test_perfect_bot_wins(sample_game_config: GameConfig) -> None:
+    """Win with one guess per word, or fewer when a guess completes another word."""
+    result = bots.play_bot_game(sample_game_config, bots.perfect_bot, [], random.Random(1))
+
+    assert result.status == "win"
+    assert result.turns == 2
+    assert result.lives_left == sample_game_config.selected_wizard.starting_lives
+    assert result.points == 5
+
+
+def test_random_bot_loses_on_wrong_words(sample_game_config: GameConfig) -> None:
+    """Lose one life per wrong guess, guessing the same words again once all were tried."""
+    result = bots.play_bot_game(sample_game_config, bots.random_lexicon_bot, ["act", "arc"], random.Random(2))
+
+    assert result.status == "loss"
+    assert result.turns == sample_game_config.selected_wizard.starting_lives
+    assert result.lives_left == 0
+
+
+@pytest.mark.parametrize(
+    ("color", "lives_left", "shield_turns", "expected"),
+    [
+        ("bright_white", 5, 0, False),  # No powerup
+        ("red", 4, 0, True),  # Reveals are spent at once
+        ("green", 4, 0, True),
+        ("magenta", 4, 0, True),  # Shield when none is up
+        ("magenta", 4, 1, False),
+        ("blue", 3, 0, False),  # Healing only on low lives
+        ("blue", 2, 0, True),
+    ],
+)
+def test_should_use_powerup(color: str, lives_left: int, shield_turns: int, *, expected: bool) -> None:
+    """Spend a power point only when the wizard's powerup is worth it."""
+    game_config = make_game_config(WIZARDS_BY_COLOR[color])
+    game_st = initialize_game_state(game_config.final_grid, "cat", game_config.selected_wizard, "Bot")
+    game_st.statistics.power_points = 1
+    game_st.statistics.lives_left = lives_left
+    game_st.statistics.shield_turns = shield_turns
+    turn = BotTurn(game_config=game_config, game_st=game_st, board_words=["cat", "car"], candidate_words=["cat"])
+
+    assert bots.should_use_powerup(turn) is expected
+    assert (bots.powerup_bot(turn, random.Random(0)) == game_constants.POWERUP_COMMAND) is expected
+
+
+def test_refused_powerup_counts_as_wrong_guess(sample_game_config: GameConfig) -> None:
+    """Treat a powerup command without power points as a wrong guess, so the game always ends."""
+    result = bots.play_bot_game(
+        sample_game_config,
+        lambda _turn, _rng: game_constants.POWERUP_COMMAND,
+        [],
+        random.Random(3),
+    )
+
+    assert result.status == "loss"
+    assert result.powerups_used == 0
+    assert result.turns == sample_game_config.selected_wizard.starting_lives
+
+
+def test_red_wizard_powerup_reveals_a_word() -> None:
+    """Play the red wizard's word reveal through use_powerup once it has a power point."""
+    game_config = make_game_config(WIZARDS_BY_COLOR["red"])
+    guesses = iter(["cat", game_constants.POWERUP_COMMAND])
+
+    def cat_then_powerup(turn: BotTurn, _rng: random.Random) -> str:
+        turn.game_st.statistics.power_points = 1
+        return next(guesses)
+
+    result = bots.play_bot_game(game_config, cat_then_powerup, [], random.Random(4))
+
+    assert result.status == "win"
+    assert result.powerups_used == 1
+    assert result.turns == 2
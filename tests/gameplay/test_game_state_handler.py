@@ -1,8 +1,10 @@
+import random
 from unittest.mock import patch
 
 import pytest
 
 from gameplay import game_constants, game_state_handler
+from gameplay.word_placement import WordPlacement
 
 
 @pytest.fixture
@@ -86,6 +88,9 @@ def sample_initial_game_state(
             self.correctly_guessed_words = set()
             self.hidden_letter_coords = set(all_coords)
             self.found_letter_coords = set()
+            self.words_by_cell = {}
+            self.hidden_cell_counts = {}
+            self.uncovered_words = {}
             self.next_message = game_constants.WELCOME_MSG
             self.next_message_color = sample_wizard_data.color
 
@@ -114,6 +119,15 @@ def test_shuffle_letters_statistic(
     assert result == "W O R D"
 
 
+def test_shuffle_letters_statistic_seeded() -> None:
+    """Shuffle the letters the same way for the same seed."""
+    first = game_state_handler.shuffle_letters_statistic("STREAK", rng=random.Random(4))
+    second = game_state_handler.shuffle_letters_statistic("STREAK", rng=random.Random(4))
+
+    assert first == second
+    assert sorted(first.split()) == sorted("STREAK")
+
+
 def test_create_hidden_grid(
     sample_final_grid: list[list[str | None]],
 ) -> None:
@@ -263,7 +277,7 @@ def test_initialize_game_state(
     )
 
     mock_create_hidden.assert_called_once_with(sample_final_grid)
-    mock_shuffle_letters.assert_called_once_with(middle_word)
+    mock_shuffle_letters.assert_called_once_with(middle_word, rng=None)
     mock_get_coords.assert_called_once_with(sample_final_grid)
 
     assert game_state.player_name == player_name
@@ -544,7 +558,10 @@ def test_check_for_completed_words(
     """
 
     class DummyGameState:
-        pass
+        def __init__(self) -> None:
+            self.words_by_cell = {}
+            self.hidden_cell_counts = {}
+            self.uncovered_words = {}
 
     game_state = DummyGameState()
     game_state.correctly_guessed_words = {"HAT"}
@@ -567,6 +584,60 @@ def test_check_for_completed_words(
     assert set(newly_found_all) == {"HI", "HAT", "AT"}
 
 
+def test_process_guess_with_word_placements(sample_final_grid: list[list[str | None]]) -> None:
+    """Test guessing and implicit completion on compact word placements from the generator.
+
+    Assert that the guessed word's letters are revealed and a word covered by them is completed.
+
+    """
+    words_to_find = {
+        "HAT": WordPlacement(0, 1, "V", 3),
+        "AT": WordPlacement(1, 1, "V", 2),
+        "HI": WordPlacement(0, 1, "H", 2),
+    }
+    game_state = game_state_handler.GameStateData(
+        player_name=None,
+        statistics=game_state_handler.GameStatisticsData(lives_left=3),
+        hidden_grid=game_state_handler.create_hidden_grid(sample_final_grid),
+        next_message="",
+        next_message_color="",
+        hidden_letter_coords=game_state_handler.get_all_letter_coords(sample_final_grid),
+    )
+
+    game_state_handler.process_guess("HAT", game_state, words_to_find, sample_final_grid, "red")
+
+    assert game_state.correctly_guessed_words == {"HAT", "AT"}
+    assert game_state.hidden_letter_coords == {(0, 2)}
+    assert [game_state.hidden_grid[row][1] for row in range(3)] == ["H", "A", "T"]
+    assert game_state.statistics.points == 3
+
+
+def test_word_index_follows_reveals(
+    sample_final_grid: list[list[str | None]],
+    sample_words_to_find: dict[str, list[tuple[int, int]]],
+    sample_initial_game_state: object,
+) -> None:
+    """Test that reveals only update the hidden counts of the words crossing the revealed cells.
+
+    Assert that a word is reported once, when its last hidden cell is revealed.
+
+    """
+    game_state = sample_initial_game_state
+    assert game_state_handler.check_for_completed_words(game_state, sample_words_to_find) == []
+    assert game_state.words_by_cell[0, 1] == ["HI", "HAT"]
+    assert game_state.hidden_cell_counts == {"HI": 2, "HAT": 3, "AT": 2}
+
+    game_state_handler.apply_coordinate_reveal(game_state, sample_final_grid, [(1, 1), (2, 1)])
+    assert game_state.hidden_cell_counts == {"HI": 2, "HAT": 1, "AT": 0}
+    assert game_state_handler.check_for_completed_words(game_state, sample_words_to_find) == ["AT"]
+
+    game_state.correctly_guessed_words.add("AT")
+    game_state_handler.apply_coordinate_reveal(game_state, sample_final_grid, [(1, 1), (0, 1)])
+    assert game_state.hidden_cell_counts == {"HI": 1, "HAT": 0, "AT": 0}
+    assert game_state_handler.check_for_completed_words(game_state, sample_words_to_find) == ["HAT"]
+    assert game_state_handler.check_for_completed_words(game_state, sample_words_to_find) == []
+
+
 def test_check_game_over(
     sample_words_to_find: dict[str, list[tuple[int, int]]],
 ) -> None:
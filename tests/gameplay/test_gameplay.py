@@ -3,8 +3,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from display import frame_renderer
 from gameplay import game_constants, gameplay
 from gameplay.game_state_handler import GameStateData, GameStatisticsData
+from leaderboard.streak_handler import StreakEntry, StreakStanding
 
 # ************************************************
 # Fixtures
@@ -146,6 +148,8 @@ class DummyGameConfig:
         self.final_grid = final_grid
         self.words_to_find = words_to_find
         self.middle_word = middle_word
+        self.streak_count = 0
+        self.streak_points = 0
         self.player_name = player_name
 
 
@@ -161,12 +165,15 @@ PATCH_PRINT_LB = "gameplay.gameplay.print_streak_leaderboard"
 PATCH_GET_INPUT = "gameplay.gameplay.get_input"
 PATCH_GET_GUESS = "gameplay.gameplay.get_guess"
 PATCH_CLEAR_SCREEN = "gameplay.gameplay.clear_screen"
+PATCH_FRAME_CLEAR_SCREEN = "display.frame_renderer.clear_screen"
+PATCH_SUPPORTS_ANSI = "display.frame_renderer.supports_ansi"
 PATCH_INIT_STATE = "gameplay.gameplay.initialize_game_state"
 PATCH_PROC_GUESS = "gameplay.gameplay.process_guess"
 PATCH_CHECK_GO = "gameplay.gameplay.check_game_over"
 PATCH_UPDATE_PP = "gameplay.gameplay.update_power_points"
 PATCH_USE_PU = "gameplay.gameplay.use_powerup"
 PATCH_LOAD_LB = "gameplay.gameplay.load_streaks"
+PATCH_GET_STANDING = "gameplay.gameplay.get_streak_standing"
 PATCH_UPDATE_DISPLAY = "gameplay.gameplay.update_display"
 PATCH_UPDATE_GO_DISPLAY = "gameplay.gameplay.update_game_over_display"
 PATCH_UPDATE_END_DISPLAY = "gameplay.gameplay.end_game"
@@ -176,7 +183,7 @@ PATCH_UPDATE_END_DISPLAY = "gameplay.gameplay.end_game"
 # ************************************************
 
 
-@patch(PATCH_CLEAR_SCREEN)
+@patch(PATCH_FRAME_CLEAR_SCREEN)
 @patch(PATCH_PRINT_GRID)
 @patch(PATCH_PRINT_STATS)
 @patch(PATCH_PRINT_MSG)
@@ -202,8 +209,46 @@ def test_update_display(  # noqa: PLR0913, PLR0917
     mock_print_msg.assert_called_once()
 
 
+@patch(PATCH_SUPPORTS_ANSI, return_value=True)
+@patch(PATCH_FRAME_CLEAR_SCREEN)
+@patch(PATCH_PRINT_GRID, side_effect=lambda *_args, **_kwargs: print("A . B\nC . D"))
+@patch(PATCH_PRINT_STATS, side_effect=lambda *_args, **_kwargs: print("Points: 0"))
+@patch(PATCH_PRINT_MSG, side_effect=lambda _settings, message, **_kwargs: print(message))
+def test_update_display_redraws_changed_lines(  # noqa: PLR0913, PLR0917
+    mock_print_msg: MagicMock,
+    mock_print_stats: MagicMock,
+    mock_print_grid: MagicMock,
+    mock_clear: MagicMock,
+    mock_supports_ansi: MagicMock,
+    sample_settings: object,
+    sample_game_state: GameStateData,
+    sample_wizard: object,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that on an ANSI terminal, later turns only rewrite the lines that changed."""
+    game_config = DummyGameConfig(
+        difficulty_conf=sample_settings,
+        selected_wizard=sample_wizard,
+        final_grid=[["A"]],
+    )
+    frame_renderer.FRAME_RENDERER.reset()
+
+    sample_game_state.next_message = "Welcome!"
+    gameplay.update_display(game_config, sample_game_state)
+    first_frame = capsys.readouterr().out
+    sample_game_state.next_message = "Correct!"
+    gameplay.update_display(game_config, sample_game_state)
+    second_frame = capsys.readouterr().out
+
+    mock_clear.assert_not_called()
+    assert first_frame.startswith("\x1b[2J\x1b[H")
+    assert "A . B\nC . D\nPoints: 0\nWelcome!" in first_frame
+    assert second_frame == "\x1b[4;1HCorrect!\x1b[K\x1b[5;1H\x1b[J"
+
+
 @patch(PATCH_GET_INPUT)
 @patch(PATCH_CLEAR_SCREEN)
+@patch(PATCH_GET_STANDING, return_value=StreakStanding.from_counts(0, 0, None))
 @patch(PATCH_LOAD_LB)
 @patch(PATCH_PRINT_LB)
 @patch(PATCH_PRINT_MSG)
@@ -211,6 +256,7 @@ def test_update_end_game_display(  # noqa: PLR0913, PLR0917
     mock_print_msg: MagicMock,
     mock_print_lb: MagicMock,
     mock_load_lb: MagicMock,
+    mock_get_standing: MagicMock,
     mock_clear: MagicMock,
     mock_get_input: MagicMock,
     sample_settings: object,
@@ -226,11 +272,79 @@ def test_update_end_game_display(  # noqa: PLR0913, PLR0917
     mock_leaderboard_data = [{"name": "WINNAHHH", "score": 100}]
     mock_load_lb.return_value = mock_leaderboard_data
 
-    gameplay.end_game(game_config, final_score)
+    gameplay.end_game(game_config, final_score, "win")
 
     mock_clear.assert_called_once()
     mock_load_lb.assert_called_once()
     mock_print_lb.assert_called_once_with(sample_settings, mock_leaderboard_data)
+    mock_get_standing.assert_called_once_with("WINNAHHH", 1, final_score)
+
+
+@patch(PATCH_GET_INPUT)
+@patch(PATCH_CLEAR_SCREEN)
+@patch(PATCH_LOAD_LB, return_value=[])
+@patch(PATCH_PRINT_LB)
+@patch(PATCH_PRINT_MSG)
+def test_end_game_shows_player_rank(  # noqa: PLR0913, PLR0917
+    mock_print_msg: MagicMock,
+    mock_print_lb: MagicMock,
+    mock_load_lb: MagicMock,
+    mock_clear: MagicMock,
+    mock_get_input: MagicMock,
+    sample_settings: object,
+) -> None:
+    """Test that the streak that just ended is ranked on a loss, before it is recorded, with the player's best."""
+    best = StreakEntry("WINNAHHH", 2, 10)
+    standing = StreakStanding.from_counts(22, 16, best)
+    game_config = DummyGameConfig(
+        difficulty_conf=sample_settings,
+        selected_wizard=None,
+        final_grid=[["A"]],
+        player_name="WINNAHHH",
+    )
+    game_config.streak_count = 3
+    game_config.streak_points = 5
+
+    with patch(PATCH_GET_STANDING, return_value=standing) as mock_get_standing:
+        gameplay.end_game(game_config, 100, "loss")
+
+    mock_get_standing.assert_called_once_with("WINNAHHH", 3, 5)
+    rank_message = mock_print_msg.call_args_list[-1].args[1]
+    assert rank_message == "\n".join(
+        [
+            game_constants.PLAYER_RANK_MSG.format("WINNAHHH", 3, 5, 17, 23, 100 * 6 / 22),
+            game_constants.PERSONAL_BEST_MSG.format(2, 10),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    ("game_over_status", "expected"),
+    [("win", (4, 150)), ("loss", (3, 50))],
+)
+def test_get_session_streak(sample_settings: object, game_over_status: str, expected: tuple[int, int]) -> None:
+    """Test that a win extends the session streak and a loss leaves it as it stood before the game."""
+    game_config = DummyGameConfig(difficulty_conf=sample_settings, selected_wizard=None)
+    game_config.streak_count = 3
+    game_config.streak_points = 50
+
+    assert gameplay.get_session_streak(game_config, game_over_status, 100) == expected
+
+
+def test_describe_player_rank_first_streak() -> None:
+    """Test that a first-time player's streak is ranked, and that nothing is described without a streak or a name."""
+    empty_standing = StreakStanding.from_counts(0, 0, None)
+
+    assert gameplay.describe_player_rank("Angelo", 1, 40, empty_standing) == game_constants.PLAYER_RANK_MSG.format(
+        "Angelo",
+        1,
+        40,
+        1,
+        1,
+        100.0,
+    )
+    assert gameplay.describe_player_rank("Angelo", 0, 0, empty_standing) is None
+    assert gameplay.describe_player_rank(None, 1, 40, empty_standing) is None
 
 
 # ************************************************
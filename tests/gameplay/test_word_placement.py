@@ -0,0 +1,70 @@
+import pickle  # noqa: S403
+
+import pytest
+
+from gameplay.word_placement import WordPlacement
+
+
+@pytest.mark.parametrize(
+    ("coords", "orientation"),
+    [
+        ([(2, 3), (2, 4), (2, 5)], "H"),
+        ([(2, 3), (3, 3), (4, 3)], "V"),
+        ([(2, 3), (4, 5), (6, 7)], "D"),
+        ([(2, 3)], "H"),
+    ],
+)
+def test_from_coords_round_trip(coords: list[tuple[int, int]], orientation: str) -> None:
+    """Test that a placement built from coordinates yields the same coordinates."""
+    placement = WordPlacement.from_coords(coords)
+
+    assert placement.orientation == orientation
+    assert len(placement) == len(coords)
+    assert placement.coords == coords
+    assert list(placement) == coords
+
+
+def test_contains_checks_only_letter_cells() -> None:
+    """Test membership without listing the coordinates, including the cells a diagonal skips."""
+    diagonal = WordPlacement(1, 1, "D", 3)
+    vertical = WordPlacement(0, 4, "V", 2)
+
+    assert (3, 3) in diagonal
+    assert (5, 5) in diagonal
+    assert (2, 2) not in diagonal
+    assert (7, 7) not in diagonal
+    assert (-1, -1) not in diagonal
+    assert (1, 4) in vertical
+    assert (2, 4) not in vertical
+    assert (1, 5) not in vertical
+    assert "not a coord" not in vertical
+
+
+def test_getitem() -> None:
+    """Test indexing single letters, from either end."""
+    placement = WordPlacement(4, 2, "H", 3)
+
+    assert placement[0] == (4, 2)
+    assert placement[-1] == (4, 4)
+    with pytest.raises(IndexError):
+        placement[3]
+
+
+def test_equality() -> None:
+    """Test that a placement equals the same placement and its coordinate list."""
+    placement = WordPlacement(0, 0, "V", 2)
+
+    assert placement == WordPlacement(0, 0, "V", 2)
+    assert placement != WordPlacement(0, 0, "H", 2)
+    assert placement == [(0, 0), (1, 0)]
+    assert {"at": placement} == {"at": [(0, 0), (1, 0)]}
+
+
+def test_pickles_smaller_than_coordinate_lists() -> None:
+    """Test that placements survive pickling and take less space than the coordinates they replace."""
+    words_to_find = {f"word{i}": WordPlacement(i % 15, i % 25, "H" if i % 2 else "V", 6) for i in range(50)}
+
+    pickled = pickle.dumps(words_to_find)
+
+    assert pickle.loads(pickled) == words_to_find  # noqa: S301
+    assert len(pickled) < len(pickle.dumps({word: placement.coords for word, placement in words_to_find.items()}))
@@ -3,5 +3,7 @@
 This package contains unit tests for leaderboard logic and streak handling.
 
 Modules:
+    test_streak_database: Tests for the SQLite leaderboard backend and its migration from JSON.
     test_streak_handler: Tests for functions and classes managing streaks and leaderboard statistics.
+    test_streak_journal: Tests for the streak journals, their compaction and their recovery after a crash.
 """
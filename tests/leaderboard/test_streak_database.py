@@ -0,0 +1,226 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from leaderboard import streak_database, streak_handler, streak_journal
+from leaderboard.streak_journal import StreakEntry
+
+# ************************************************
+# Fixtures
+# ************************************************
+
+
+@pytest.fixture
+def streak_file_path(tmp_path: Path) -> Path:
+    """Create the path of a JSON leaderboard in a temporary directory.
+
+    Args:
+        tmp_path (Path): Temporary directory provided by pytest.
+
+    Returns:
+        Path: The snapshot path, next to which the database is created.
+
+    """
+    return tmp_path / "winning_streaks.json"
+
+
+@pytest.fixture
+def sqlite_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Select the SQLite backend for the streak_handler functions.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest's monkeypatch fixture.
+
+    """
+    monkeypatch.setenv(streak_handler.LEADERBOARD_BACKEND_ENV_VAR, streak_handler.SQLITE_BACKEND)
+
+
+# ************************************************
+# Tests
+# ************************************************
+
+
+def test_migrates_json_leaderboard_once(streak_file_path: Path) -> None:
+    """Test that the snapshot and journal are copied into a new database, and only the first time."""
+    streak_file_path.write_text(json.dumps([{"player_name": "Joel", "streak_count": 5, "total_points_in_streak": 100}]))
+    streak_journal.append_to_journal(streak_journal.get_journal_path(streak_file_path), StreakEntry("Angelo", 7, 50))
+
+    with streak_database.open_database(streak_file_path) as conn:
+        assert streak_database.count_streaks(conn) == 2
+        assert not streak_database.migrate_from_json(conn, streak_file_path)
+    with streak_database.open_database(streak_file_path) as conn:
+        assert streak_database.count_streaks(conn) == 2
+    assert streak_file_path.exists()
+
+
+def test_migrates_every_recorded_streak(streak_file_path: Path) -> None:
+    """Test that streaks dropped from the JSON snapshot are migrated from its history, with the players' bests."""
+    streak_count = streak_handler.MAX_STREAK_ENTRIES + 5
+    for count in range(streak_count):
+        streak_handler.add_streak_entry(StreakEntry("Joel", streak_count - count, 0), streak_file_path)
+    streak_handler.add_streak_entry(StreakEntry("Angelo", 1, 10), streak_file_path)
+    streak_handler.compact_streaks(streak_file_path)
+    assert "Angelo" not in [entry.player_name for entry in streak_journal.read_snapshot(streak_file_path)]
+
+    with streak_database.open_database(streak_file_path) as conn:
+        assert streak_database.count_streaks(conn) == streak_count + 1
+        assert streak_database.player_best(conn, "Angelo") == StreakEntry("Angelo", 1, 10)
+        assert streak_database.player_best(conn, "Joel") == StreakEntry("Joel", streak_count, 0)
+
+
+def test_migrates_streaks_lost_from_history(streak_file_path: Path) -> None:
+    """Test that journaled streaks a crash dropped from the history are migrated too, once each."""
+    for count in range(3):
+        streak_handler.add_streak_entry(StreakEntry("Joel", count, 0), streak_file_path)
+    history_path = streak_journal.get_history_path(streak_file_path)
+    history_lines = history_path.read_bytes().splitlines(keepends=True)
+    history_path.write_bytes(b"".join(history_lines[:-1]))
+
+    with streak_database.open_database(streak_file_path) as conn:
+        assert streak_database.count_streaks(conn) == 3
+
+
+def test_open_database_reuses_connection(streak_file_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the connection, schema and migration check are set up once, then reused by every query."""
+    with streak_database.open_database(streak_file_path) as conn:
+        streak_database.insert_streak(conn, StreakEntry("Joel", 5, 100))
+    monkeypatch.setattr(streak_database, "migrate_from_json", lambda *_args: pytest.fail("migrated again"))
+
+    with streak_database.open_database(streak_file_path) as reused:
+        assert reused is conn
+        assert streak_database.count_streaks(reused) == 1
+    streak_database.close_databases()
+    assert not streak_database.DATABASE_CONNECTIONS
+
+
+def test_open_database_drops_failed_connection(streak_file_path: Path) -> None:
+    """Test that a connection is closed and forgotten after an sqlite3 error, so the next use reopens it."""
+    with pytest.raises(streak_database.sqlite3.Error), streak_database.open_database(streak_file_path) as conn:
+        conn.execute("SELECT * FROM missing")
+
+    with streak_database.open_database(streak_file_path) as reopened:
+        assert reopened is not conn
+
+
+def test_queries_keep_every_streak(streak_file_path: Path) -> None:
+    """Test the top, per-player best and rank queries over more streaks than the JSON leaderboard keeps."""
+    with streak_database.open_database(streak_file_path) as conn:
+        for count in range(15):
+            streak_database.insert_streak(conn, StreakEntry(f"Player{count}", count, 10 * count))
+        streak_database.insert_streak(conn, StreakEntry("Player3", 9, 1))
+
+        assert streak_database.count_streaks(conn) == 16
+        assert [e.streak_count for e in streak_database.top_streaks(conn, 3)] == [14, 13, 12]
+        assert streak_database.player_best(conn, "Player3") == StreakEntry("Player3", 9, 1)
+        assert streak_database.player_best(conn, "Nobody") is None
+        assert streak_database.streak_rank(conn, 14, 140) == 1
+        assert streak_database.streak_rank(conn, 9, 50) == 7  # Behind 14 to 10 wins and 9 wins with 90 points
+        assert streak_database.streak_rank(conn, 0, 0) == 16
+
+
+def test_equal_streaks_keep_their_order(streak_file_path: Path) -> None:
+    """Test that equal streaks are listed in the order they were recorded, as in the JSON leaderboard."""
+    with streak_database.open_database(streak_file_path) as conn:
+        for name in ("First", "Second", "Third"):
+            streak_database.insert_streak(conn, StreakEntry(name, 2, 20))
+
+        assert [e.player_name for e in streak_database.top_streaks(conn, 3)] == ["First", "Second", "Third"]
+
+
+@pytest.mark.parametrize(
+    ("query", "params", "index"),
+    [
+        (
+            f"SELECT * FROM streaks ORDER BY {streak_database.BEST_FIRST} LIMIT 10",  # noqa: S608
+            (),
+            "streaks_by_rank",
+        ),
+        (
+            f"SELECT * FROM streaks WHERE player_name = ? ORDER BY {streak_database.BEST_FIRST} LIMIT 1",  # noqa: S608
+            ("Joel",),
+            "streaks_by_player",
+        ),
+        (
+            "SELECT COUNT(*) FROM streaks WHERE (streak_count, total_points_in_streak) > (?, ?)",
+            (3, 10),
+            "streaks_by_rank",
+        ),
+    ],
+)
+def test_queries_use_indexes(streak_file_path: Path, query: str, params: tuple, index: str) -> None:
+    """Test that the leaderboard queries are answered from an index, without sorting the whole table."""
+    with streak_database.open_database(streak_file_path) as conn:
+        plan = " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.usefixtures("sqlite_backend")
+def test_streak_handler_uses_sqlite_backend(streak_file_path: Path) -> None:
+    """Test that the streak_handler functions read and write the database when the SQLite backend is selected."""
+    streak_file_path.write_text(json.dumps([{"player_name": "Joel", "streak_count": 5, "total_points_in_streak": 100}]))
+
+    streak_handler.compact_streaks(streak_file_path)
+    for count in range(12):
+        streak_handler.add_streak_entry(StreakEntry("Angelo", count, 0), streak_file_path)
+
+    streaks = streak_handler.load_streaks(streak_file_path)
+    assert len(streaks) == streak_handler.MAX_STREAK_ENTRIES
+    assert streaks[0] == StreakEntry("Angelo", 11, 0)
+    assert StreakEntry("Joel", 5, 100) in streaks
+    assert not streak_journal.get_journal_path(streak_file_path).exists()
+    with streak_database.open_database(streak_file_path) as conn:
+        assert streak_database.count_streaks(conn) == 13
+
+
+def test_json_backend_is_the_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only WORDERLY_LEADERBOARD=sqlite selects the SQLite backend."""
+    monkeypatch.delenv(streak_handler.LEADERBOARD_BACKEND_ENV_VAR, raising=False)
+    assert streak_handler.get_leaderboard_backend() == streak_handler.JSON_BACKEND
+
+    monkeypatch.setenv(streak_handler.LEADERBOARD_BACKEND_ENV_VAR, " SQLite ")
+    assert streak_handler.get_leaderboard_backend() == streak_handler.SQLITE_BACKEND
+
+
+@pytest.mark.usefixtures("sqlite_backend")
+def test_unreadable_database(streak_file_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that a corrupt database is reported when saving and reads as an empty leaderboard."""
+    streak_handler.get_database_path(streak_file_path).write_bytes(b"not a database")
+
+    streak_handler.add_streak_entry(StreakEntry("Joel", 5, 100), streak_file_path)
+
+    assert "Could not save streak" in capsys.readouterr().out
+    assert streak_handler.load_streaks(streak_file_path) == []
+
+
+@pytest.mark.usefixtures("sqlite_backend")
+def test_streak_standing_uses_indexed_queries(streak_file_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a streak's standing is read from the database's queries, without loading every streak."""
+    for count in range(15):
+        streak_handler.add_streak_entry(StreakEntry("Joel", count, 0), streak_file_path)
+    streak_handler.add_streak_entry(StreakEntry("Angelo", 20, 0), streak_file_path)
+    monkeypatch.setattr(streak_handler, "load_streak_ranking", lambda _path: pytest.fail("loaded every streak"))
+
+    standing = streak_handler.get_streak_standing("Joel", 14, 0, streak_file_path)
+
+    assert standing == streak_handler.StreakStanding(
+        rank=2,
+        streak_total=17,
+        percentile=pytest.approx(100 * 15 / 16),
+        personal_best=StreakEntry("Joel", 14, 0),
+    )
+
+
+@pytest.mark.usefixtures("sqlite_backend")
+def test_streak_standing_of_unreadable_database(streak_file_path: Path) -> None:
+    """Test that a corrupt database gives the standing of an empty leaderboard."""
+    streak_handler.get_database_path(streak_file_path).write_bytes(b"not a database")
+
+    assert streak_handler.get_streak_standing("Joel", 5, 100, streak_file_path) == streak_handler.StreakStanding(
+        rank=1,
+        streak_total=1,
+        percentile=100.0,
+        personal_best=None,
+    )
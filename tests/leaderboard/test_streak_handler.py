@@ -1,9 +1,12 @@
 import json
+import multiprocessing
+from multiprocessing.synchronize import Barrier
 from pathlib import Path
 
 import pytest
 
-from leaderboard import streak_handler
+from leaderboard import streak_handler, streak_journal
+from utils import file_lock
 
 # ************************************************
 # Fixtures
@@ -120,40 +123,6 @@ def test_load_streaks_io_error(monkeypatch: pytest.MonkeyPatch, tmp_path: Path)
     assert result == []
 
 
-# ************************************************
-# Tests for: save_streaks_to_file
-# ************************************************
-
-
-def testsave_streaks_to_file(tmp_path: Path, sample_streak_entries: list[streak_handler.StreakEntry]) -> None:
-    """Test saving streaks to file."""
-    file_path = tmp_path / "save.json"
-    streak_handler.save_streaks_to_file(file_path, sample_streak_entries)
-
-    # File should exist and contain valid JSON
-    assert file_path.exists()
-    with open(file_path, encoding="utf-8") as f:
-        data = json.load(f)
-        assert isinstance(data, list)
-        assert any(d["player_name"] == "Joel" for d in data)
-
-
-def testsave_streaks_to_file_io_error(
-    monkeypatch: pytest.MonkeyPatch,
-    sample_streak_entries: list[streak_handler.StreakEntry],
-    tmp_path: Path,
-) -> None:
-    """Test IOError during saving streaks to file."""
-
-    def _raise_ioerror(*_args: object, **_kwargs: object) -> None:
-        raise OSError
-
-    monkeypatch.setattr("pathlib.Path.open", lambda *_a, **_k: _raise_ioerror())
-    file_path = tmp_path / "ioerror_save.json"
-    # Should not raise
-    streak_handler.save_streaks_to_file(file_path, sample_streak_entries)
-
-
 # ************************************************
 # Tests for: add_streak_entry
 # ************************************************
@@ -172,22 +141,38 @@ def test_add_streak_entry_limit(
     tmp_path: Path,
     sample_streak_entries: list[streak_handler.StreakEntry],
 ) -> None:
-    """Test that add_streak_entry enforces max_entries limit and sorts."""
+    """Test that the best max_entries streaks are loaded after an add, sorted."""
     file_path = tmp_path / "limit.json"
 
     # Save initial entries
-    streak_handler.save_streaks_to_file(file_path, sample_streak_entries)
+    streak_journal.save_streaks_to_file(file_path, sample_streak_entries)
 
     # Add a new entry with high streak/points
     new_entry = streak_handler.StreakEntry("Top", 10, 999)
     streak_handler.add_streak_entry(new_entry, file_path, max_entries=3)
-    loaded = streak_handler.load_streaks(file_path)
+    loaded = streak_handler.load_streaks(file_path, max_entries=3)
 
     # Should only keep 3, and "Top" should be first
     assert len(loaded) == 3
     assert loaded[0].player_name == "Top"
 
 
+def test_add_streak_entry_limit_applies_at_compaction(
+    tmp_path: Path,
+    sample_streak_entries: list[streak_handler.StreakEntry],
+) -> None:
+    """Test that add_streak_entry keeps every streak until compaction caps the snapshot to max_entries."""
+    file_path = tmp_path / "limit.json"
+    streak_journal.save_streaks_to_file(file_path, sample_streak_entries)
+
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Top", 10, 999), file_path, max_entries=3)
+
+    assert len(streak_handler.load_streaks(file_path)) == 4
+    streak_handler.compact_streaks(file_path, max_entries=3)
+    assert [e.player_name for e in streak_journal.read_snapshot(file_path)] == ["Top", "Baldapan", "Joel"]
+    assert len(streak_handler.load_streaks(file_path)) == 3
+
+
 def test_add_streak_entry_sorting(tmp_path: Path) -> None:
     """Test that add_streak_entry sorts by streak_count then total_points_in_streak."""
     file_path = tmp_path / "sort.json"
@@ -204,3 +189,328 @@ def test_add_streak_entry_sorting(tmp_path: Path) -> None:
     assert loaded[0].player_name == "C"
     assert loaded[1].player_name == "B"
     assert loaded[2].player_name == "A"
+
+
+# ************************************************
+# Tests for: journal and compaction
+# ************************************************
+
+
+def test_add_streak_entry_appends_to_journal(streak_file_path: Path) -> None:
+    """Test that adding a streak appends one line to the journal without rewriting the snapshot."""
+    streak_journal.save_streaks_to_file(streak_file_path, [streak_handler.StreakEntry("Joel", 5, 100)])
+    snapshot_before = streak_file_path.read_bytes()
+
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Top", 9, 300), streak_file_path)
+
+    journal_path = streak_journal.get_journal_path(streak_file_path)
+    assert streak_file_path.read_bytes() == snapshot_before
+    assert journal_path.read_text(encoding="utf-8").count("\n") == 1
+    assert [e.player_name for e in streak_handler.load_streaks(streak_file_path)] == ["Top", "Joel"]
+
+
+def test_journal_skips_torn_line(streak_file_path: Path) -> None:
+    """Test that a line torn by a crash is skipped, and the next entry still starts its own line."""
+    journal_path = streak_journal.get_journal_path(streak_file_path)
+    journal_path.write_text('{"player_name": "Torn", "streak_co', encoding="utf-8")
+
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Joel", 5, 100), streak_file_path)
+
+    assert [e.player_name for e in streak_handler.load_streaks(streak_file_path)] == ["Joel"]
+
+
+def test_compact_streaks_merges_journal(
+    streak_file_path: Path,
+    sample_streak_entries: list[streak_handler.StreakEntry],
+) -> None:
+    """Test that compaction keeps the best entries in the snapshot and removes the journal."""
+    streak_journal.save_streaks_to_file(streak_file_path, sample_streak_entries)
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Top", 10, 999), streak_file_path)
+
+    streak_handler.compact_streaks(streak_file_path, max_entries=3)
+
+    assert not streak_journal.get_journal_path(streak_file_path).exists()
+    assert not streak_journal.get_compacting_path(streak_file_path).exists()
+    assert [e.player_name for e in streak_journal.read_snapshot(streak_file_path)] == ["Top", "Baldapan", "Joel"]
+
+
+def test_add_streak_entry_compacts_large_journal(monkeypatch: pytest.MonkeyPatch, streak_file_path: Path) -> None:
+    """Test that the journal is merged into the snapshot once it grows past the compaction size."""
+    monkeypatch.setattr(streak_handler, "JOURNAL_COMPACTION_BYTES", 1)
+
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Joel", 5, 100), streak_file_path)
+
+    assert not streak_journal.get_journal_path(streak_file_path).exists()
+    assert [e.player_name for e in streak_journal.read_snapshot(streak_file_path)] == ["Joel"]
+
+
+STRESS_PROCESSES = 8
+STRESS_ENTRIES_PER_PROCESS = 25
+
+
+def _add_stress_entries(filepath: Path, process_id: int, barrier: Barrier) -> None:
+    """Add STRESS_ENTRIES_PER_PROCESS entries from one process of the stress test.
+
+    Args:
+        filepath (Path): The snapshot file.
+        process_id (int): The number of the process, used in the player names.
+        barrier (Barrier): Released once every process is ready, so they all write at once.
+
+    """
+    streak_handler.JOURNAL_COMPACTION_BYTES = 300  # Compact every few entries, while other processes append
+    barrier.wait()
+    for i in range(STRESS_ENTRIES_PER_PROCESS):
+        entry = streak_handler.StreakEntry(f"P{process_id}-{i}", i, process_id)
+        streak_handler.add_streak_entry(entry, filepath, max_entries=1000)
+
+
+def test_readers_share_lock(monkeypatch: pytest.MonkeyPatch, streak_file_path: Path) -> None:
+    """Test that loading streaks shares the lock with other readers, while writers still wait for them."""
+    monkeypatch.setattr(file_lock, "LOCK_TIMEOUT_SECONDS", 0.05)
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Joel", 5, 100), streak_file_path)
+    streak_handler.clear_streak_cache()
+
+    with streak_handler.leaderboard_lock(streak_file_path, shared=True):
+        assert [e.player_name for e in streak_handler.load_streaks(streak_file_path)] == ["Joel"]
+        with pytest.raises(TimeoutError), streak_handler.leaderboard_lock(streak_file_path):
+            pass
+
+
+def test_add_streak_entry_lock_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+    streak_file_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that a streak is reported as not saved when the lock stays busy through every attempt."""
+    monkeypatch.setattr(file_lock, "LOCK_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(file_lock, "_try_lock", lambda _lock_file, **_kwargs: False)
+
+    assert not streak_handler.add_streak_entry(streak_handler.StreakEntry("Joel", 5, 100), streak_file_path)
+
+    assert "Could not save streak" in capsys.readouterr().out
+    assert not streak_journal.get_journal_path(streak_file_path).exists()
+
+
+def test_add_streak_entry_waits_for_busy_lock(monkeypatch: pytest.MonkeyPatch, streak_file_path: Path) -> None:
+    """Test that a streak is still saved, once, when the lock only frees up after a timed out attempt."""
+    attempts = iter([False] * (streak_handler.SAVE_ATTEMPTS - 1))
+    monkeypatch.setattr(file_lock, "LOCK_TIMEOUT_SECONDS", 0.0)
+    monkeypatch.setattr(file_lock, "_try_lock", lambda _lock_file, **_kwargs: next(attempts, True))
+    monkeypatch.setattr(file_lock, "_unlock", lambda _lock_file: None)
+
+    assert streak_handler.add_streak_entry(streak_handler.StreakEntry("Joel", 5, 100), streak_file_path)
+
+    assert streak_journal.read_journal(streak_journal.get_journal_path(streak_file_path)) == [
+        streak_handler.StreakEntry("Joel", 5, 100),
+    ]
+
+
+def test_concurrent_add_streak_entry_loses_nothing(streak_file_path: Path) -> None:
+    """Test that many processes adding and compacting streaks at once lose no entry."""
+    barrier = multiprocessing.Barrier(STRESS_PROCESSES)
+    processes = [
+        multiprocessing.Process(target=_add_stress_entries, args=(streak_file_path, process_id, barrier))
+        for process_id in range(STRESS_PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+
+    assert all(process.exitcode == 0 for process in processes)
+    names = [entry.player_name for entry in streak_handler.load_streaks(streak_file_path, max_entries=1000)]
+    expected = {f"P{p}-{i}" for p in range(STRESS_PROCESSES) for i in range(STRESS_ENTRIES_PER_PROCESS)}
+    assert sorted(names) == sorted(expected)
+
+
+def test_load_streaks_uses_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    streak_file_path: Path,
+    sample_streak_dicts: list[dict],
+) -> None:
+    """Test that an unchanged leaderboard is served from memory, without reading its files."""
+    streak_file_path.write_text(json.dumps(sample_streak_dicts))
+    first = streak_handler.load_streaks(streak_file_path)
+    monkeypatch.setattr(streak_handler, "read_all_streaks", lambda _filepath: pytest.fail("read from disk"))
+
+    assert streak_handler.load_streaks(streak_file_path) == first
+    assert streak_handler.load_streaks(streak_file_path, max_entries=1) == first[:1]
+
+
+def test_load_streaks_reloads_changed_file(streak_file_path: Path, sample_streak_dicts: list[dict]) -> None:
+    """Test that the cache is dropped once another process rewrites the snapshot."""
+    streak_file_path.write_text(json.dumps(sample_streak_dicts))
+    streak_handler.load_streaks(streak_file_path)
+
+    other_snapshot = streak_file_path.with_name("other.json")
+    other_snapshot.write_text(json.dumps(sample_streak_dicts[:1]))
+    other_snapshot.replace(streak_file_path)
+
+    assert [e.player_name for e in streak_handler.load_streaks(streak_file_path)] == ["Joel"]
+
+
+def test_add_streak_entry_updates_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    streak_file_path: Path,
+    sample_streak_dicts: list[dict],
+) -> None:
+    """Test that this process's writes update the cache in place, in the order a reload would give."""
+    streak_file_path.write_text(json.dumps(sample_streak_dicts))
+    streak_journal.get_history_path(streak_file_path).touch()  # Started already, so adding reads nothing
+    streak_handler.load_streaks(streak_file_path)
+    monkeypatch.setattr(streak_handler, "read_all_streaks", lambda _filepath: pytest.fail("read from disk"))
+
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Tie", 5, 100), streak_file_path)
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Best", 9, 10), streak_file_path)
+
+    names = [e.player_name for e in streak_handler.load_streaks(streak_file_path)]
+    assert names == ["Best", "Baldapan", "Joel", "Tie", "Angelo"]
+    monkeypatch.undo()
+    streak_handler.clear_streak_cache()
+    assert [e.player_name for e in streak_handler.load_streaks(streak_file_path)] == names
+
+
+def test_compaction_updates_cache(monkeypatch: pytest.MonkeyPatch, streak_file_path: Path) -> None:
+    """Test that the cache matches the compacted snapshot, without reading it again."""
+    monkeypatch.setattr(streak_handler, "JOURNAL_COMPACTION_BYTES", 1)
+    streak_handler.load_streaks(streak_file_path)
+
+    for count in range(5):
+        streak_handler.add_streak_entry(streak_handler.StreakEntry("Joel", count, 0), streak_file_path, max_entries=3)
+
+    cached = streak_handler.STREAK_CACHE[streak_file_path]
+    assert cached.signature == streak_handler.get_leaderboard_signature(streak_file_path)
+    assert [e.streak_count for e in cached.streaks] == [4, 3, 2]
+
+
+def test_streak_ranking_queries() -> None:
+    """Test ranks, percentiles and personal bests, including ties and streaks that were never recorded."""
+    ranking = streak_handler.build_streak_ranking(
+        [
+            streak_handler.StreakEntry("Joel", 5, 100),
+            streak_handler.StreakEntry("Angelo", 3, 50),
+            streak_handler.StreakEntry("Joel", 7, 10),
+            streak_handler.StreakEntry("Angelo", 3, 50),
+        ],
+    )
+
+    assert len(ranking) == 4
+    assert ranking.rank(7, 10) == 1
+    assert ranking.rank(3, 50) == 3  # Equal streaks share a rank
+    assert ranking.rank(6, 0) == 2
+    assert ranking.rank(0, 0) == 5
+    assert ranking.percentile(7, 10) == pytest.approx(100.0)
+    assert ranking.percentile(3, 50) == pytest.approx(50.0)
+    assert ranking.percentile(0, 0) == pytest.approx(0.0)
+    assert ranking.personal_best("Joel") == streak_handler.StreakEntry("Joel", 7, 10)
+    assert ranking.personal_best("Baldapan") is None
+    assert streak_handler.StreakRanking().percentile(1, 1) == pytest.approx(100.0)
+
+
+def test_streak_ranking_add_matches_build() -> None:
+    """Test that adding streaks one by one gives the same ranking as building it at once."""
+    streaks = [streak_handler.StreakEntry(f"P{i % 7}", (i * 37) % 50, (i * 11) % 13) for i in range(100_000)]
+
+    ranking = streak_handler.build_streak_ranking(streaks[:-100])
+    for entry in streaks[-100:]:
+        ranking.add(entry)
+
+    assert ranking == streak_handler.build_streak_ranking(streaks)
+    better = sum((e.streak_count, e.total_points_in_streak) > (25, 6) for e in streaks)
+    assert ranking.rank(25, 6) == better + 1
+
+
+def test_history_keeps_every_streak(monkeypatch: pytest.MonkeyPatch, streak_file_path: Path) -> None:
+    """Test that the history keeps streaks dropped from the compacted snapshot, and starts from the old leaderboard."""
+    monkeypatch.setattr(streak_handler, "JOURNAL_COMPACTION_BYTES", 1)
+    streak_journal.save_streaks_to_file(streak_file_path, [streak_handler.StreakEntry("Old", 9, 0)])
+
+    for count in range(5):
+        streak_handler.add_streak_entry(streak_handler.StreakEntry("Joel", count, 0), streak_file_path, max_entries=2)
+
+    history = streak_journal.read_journal(streak_journal.get_history_path(streak_file_path))
+    assert [e.streak_count for e in history] == [9, 0, 1, 2, 3, 4]
+    assert len(streak_handler.load_streaks(streak_file_path)) == 2
+    ranking = streak_handler.load_streak_ranking(streak_file_path)
+    assert len(ranking) == 6
+    assert ranking.rank(0, 0) == 6
+
+
+@pytest.mark.parametrize("lost_bytes", [0, 10, 60, 200])
+def test_compaction_restores_history(streak_file_path: Path, lost_bytes: int) -> None:
+    """Test that compaction appends the journaled streaks a crash dropped from the unsynced history, once each."""
+    for count in range(4):
+        streak_handler.add_streak_entry(streak_handler.StreakEntry("Joel", count, 0), streak_file_path)
+    history_path = streak_journal.get_history_path(streak_file_path)
+    history = history_path.read_bytes()
+    history_path.write_bytes(history[: len(history) - lost_bytes])
+
+    streak_handler.compact_streaks(streak_file_path)
+
+    assert [e.streak_count for e in streak_journal.read_journal(history_path)] == [0, 1, 2, 3]
+    assert len(streak_handler.load_streak_ranking(streak_file_path)) == 4
+
+
+def test_compaction_restores_repeated_streak(streak_file_path: Path) -> None:
+    """Test that lost streaks equal to the history's last one are restored, since lines are matched by number."""
+    entry = streak_handler.StreakEntry("Joel", 3, 60)
+    streak_handler.add_streak_entry(entry, streak_file_path)
+    streak_handler.compact_streaks(streak_file_path)
+    for _ in range(2):
+        streak_handler.add_streak_entry(entry, streak_file_path)
+    history_path = streak_journal.get_history_path(streak_file_path)
+    history_lines = history_path.read_bytes().splitlines(keepends=True)
+    history_path.write_bytes(b"".join(history_lines[:-2]))
+
+    streak_handler.compact_streaks(streak_file_path)
+
+    assert streak_journal.read_journal(history_path) == [entry] * 3
+    assert [journaled.seq for journaled in streak_journal.read_journaled_streaks(history_path)] == [0, 1, 2]
+
+
+def test_load_streak_ranking_is_cached_and_updated(
+    monkeypatch: pytest.MonkeyPatch,
+    streak_file_path: Path,
+) -> None:
+    """Test that the ranking is read once, updated in place by this process, and reloaded after other writes."""
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Joel", 5, 100), streak_file_path)
+    ranking = streak_handler.load_streak_ranking(streak_file_path)
+    monkeypatch.setattr(streak_handler, "read_journal", lambda _path: pytest.fail("read from disk"))
+
+    streak_handler.add_streak_entry(streak_handler.StreakEntry("Angelo", 7, 0), streak_file_path)
+
+    assert streak_handler.load_streak_ranking(streak_file_path) is ranking
+    assert ranking.rank(5, 100) == 2
+    monkeypatch.undo()
+    streak_journal.append_to_journal(
+        streak_journal.get_history_path(streak_file_path),
+        streak_handler.StreakEntry("Other", 9, 0),
+    )
+    assert streak_handler.load_streak_ranking(streak_file_path).rank(5, 100) == 3
+
+
+def test_get_streak_standing(streak_file_path: Path) -> None:
+    """Test the standing of a streak not recorded yet, counted among the recorded ones with the player's best."""
+    for entry in (
+        streak_handler.StreakEntry("Joel", 5, 100),
+        streak_handler.StreakEntry("Angelo", 3, 50),
+        streak_handler.StreakEntry("Joel", 7, 10),
+    ):
+        streak_handler.add_streak_entry(entry, streak_file_path)
+
+    standing = streak_handler.get_streak_standing("Joel", 5, 100, streak_file_path)
+
+    assert standing == streak_handler.StreakStanding(
+        rank=2,
+        streak_total=4,
+        percentile=pytest.approx(100 * 2 / 3),
+        personal_best=streak_handler.StreakEntry("Joel", 7, 10),
+    )
+    assert streak_handler.get_streak_standing("Baldapan", 1, 0, streak_file_path).personal_best is None
+    empty_file_path = streak_file_path.with_name("empty.json")
+    assert streak_handler.get_streak_standing("Joel", 1, 0, empty_file_path) == streak_handler.StreakStanding(
+        rank=1,
+        streak_total=1,
+        percentile=100.0,
+        personal_best=None,
+    )
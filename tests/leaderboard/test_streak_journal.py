@@ -0,0 +1,202 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from leaderboard import streak_journal
+from leaderboard.streak_journal import StreakEntry
+
+# ************************************************
+# Fixtures
+# ************************************************
+
+
+@pytest.fixture
+def sample_streak_entries() -> list[StreakEntry]:
+    """Create sample list of StreakEntry objects.
+
+    Returns:
+        list[StreakEntry]: List of sample streak entries.
+
+    """
+    return [
+        StreakEntry(player_name="Joel", streak_count=5, total_points_in_streak=100),
+        StreakEntry(player_name="Angelo", streak_count=3, total_points_in_streak=50),
+        StreakEntry(player_name="Baldapan", streak_count=7, total_points_in_streak=150),
+    ]
+
+
+@pytest.fixture
+def streak_file_path(tmp_path: Path) -> Path:
+    """Provide temporary file path for streaks.
+
+    Returns:
+        Path: Temporary file path for streaks.
+
+    """
+    return tmp_path / "winning_streaks.json"
+
+
+# ************************************************
+# Tests for: save_streaks_to_file
+# ************************************************
+
+
+def testsave_streaks_to_file(tmp_path: Path, sample_streak_entries: list[StreakEntry]) -> None:
+    """Test saving streaks to file."""
+    file_path = tmp_path / "save.json"
+    streak_journal.save_streaks_to_file(file_path, sample_streak_entries)
+
+    # File should exist and contain valid JSON
+    assert file_path.exists()
+    with open(file_path, encoding="utf-8") as f:
+        data = json.load(f)
+        assert isinstance(data, list)
+        assert any(d["player_name"] == "Joel" for d in data)
+
+
+def testsave_streaks_to_file_io_error(
+    monkeypatch: pytest.MonkeyPatch,
+    sample_streak_entries: list[StreakEntry],
+    tmp_path: Path,
+) -> None:
+    """Test IOError during saving streaks to file."""
+
+    def _raise_ioerror(*_args: object, **_kwargs: object) -> None:
+        raise OSError
+
+    monkeypatch.setattr("pathlib.Path.open", lambda *_a, **_k: _raise_ioerror())
+    file_path = tmp_path / "ioerror_save.json"
+    # Should not raise
+    streak_journal.save_streaks_to_file(file_path, sample_streak_entries)
+
+
+# ************************************************
+# Tests for: append_to_journal and sequence numbers
+# ************************************************
+
+
+def test_append_to_journal_repairs_torn_line(streak_file_path: Path) -> None:
+    """Test that a line appended after a torn one starts its own line, and the torn line is skipped."""
+    journal_path = streak_journal.get_journal_path(streak_file_path)
+    journal_path.write_text('{"player_name": "Torn", "streak_co', encoding="utf-8")
+
+    assert streak_journal.append_to_journal(journal_path, StreakEntry("Joel", 5, 100), seq=0)
+
+    assert streak_journal.read_journaled_streaks(journal_path) == [
+        streak_journal.JournaledStreak(StreakEntry("Joel", 5, 100), 0),
+    ]
+
+
+def test_next_sequence_number_reads_every_journal(streak_file_path: Path) -> None:
+    """Test that the next sequence number follows the last one in the journals and history."""
+    assert streak_journal.next_sequence_number(streak_file_path) == 0
+
+    entry = StreakEntry("Joel", 1, 0)
+    streak_journal.append_to_journal(streak_journal.get_history_path(streak_file_path), entry, seq=4)
+    streak_journal.append_to_journal(streak_journal.get_compacting_path(streak_file_path), entry, seq=6)
+    streak_journal.append_to_journal(streak_journal.get_journal_path(streak_file_path), entry)
+
+    assert streak_journal.next_sequence_number(streak_file_path) == 7
+
+
+# ************************************************
+# Tests for: compact_journal and crash recovery
+# ************************************************
+
+
+def test_compact_journal_keeps_best_streaks(
+    streak_file_path: Path,
+    sample_streak_entries: list[StreakEntry],
+) -> None:
+    """Test that compaction keeps the best max_entries streaks in the snapshot and removes the journal."""
+    streak_journal.save_streaks_to_file(streak_file_path, sample_streak_entries)
+    streak_journal.append_to_journal(streak_journal.get_journal_path(streak_file_path), StreakEntry("Top", 10, 999))
+
+    streaks = streak_journal.compact_journal(streak_file_path, max_entries=3)
+
+    assert streaks == streak_journal.read_snapshot(streak_file_path)
+    assert [e.player_name for e in streaks] == ["Top", "Baldapan", "Joel"]
+    assert not streak_journal.get_journal_path(streak_file_path).exists()
+    assert not streak_journal.get_compacting_path(streak_file_path).exists()
+
+
+def test_compact_journal_without_journal(streak_file_path: Path) -> None:
+    """Test that there is nothing to compact without a journal."""
+    streak_journal.save_streaks_to_file(streak_file_path, [StreakEntry("Joel", 5, 100)])
+
+    assert streak_journal.compact_journal(streak_file_path, max_entries=3) is None
+
+
+def test_compact_journal_finishes_interrupted_compaction(streak_file_path: Path) -> None:
+    """Test that a journal left by a crash before the snapshot was saved is merged once."""
+    compacting_path = streak_journal.get_compacting_path(streak_file_path)
+    streak_journal.save_streaks_to_file(streak_file_path, [StreakEntry("Joel", 5, 100)])
+    streak_journal.append_to_journal(compacting_path, StreakEntry("Lost", 6, 120))
+
+    assert len(streak_journal.read_all_streaks(streak_file_path)) == 2
+    streak_journal.compact_journal(streak_file_path, max_entries=10)
+
+    assert not compacting_path.exists()
+    assert [e.player_name for e in streak_journal.read_all_streaks(streak_file_path)] == ["Lost", "Joel"]
+
+
+def test_compact_journal_skips_saved_compaction(streak_file_path: Path) -> None:
+    """Test that a journal left by a crash after the merged snapshot replaced the old one is not merged twice."""
+    compacted_path = streak_journal.get_compacted_path(streak_file_path)
+    streak_journal.append_to_journal(compacted_path, StreakEntry("Joel", 5, 100))
+    streak_journal.save_streaks_to_file(streak_file_path, [StreakEntry("Joel", 5, 100)])
+
+    assert len(streak_journal.read_all_streaks(streak_file_path)) == 1
+    streak_journal.compact_journal(streak_file_path, max_entries=10)
+
+    assert not compacted_path.exists()
+    assert len(streak_journal.read_all_streaks(streak_file_path)) == 1
+
+
+def test_compact_journal_finishes_merged_compaction(streak_file_path: Path) -> None:
+    """Test that a merged snapshot left by a crash before it replaced the old one is put in place, not merged again."""
+    compacted_path = streak_journal.get_compacted_path(streak_file_path)
+    temp_path = streak_journal.get_temp_path(streak_file_path)
+    streak_journal.save_streaks_to_file(streak_file_path, [StreakEntry("Joel", 5, 100)])
+    streak_journal.append_to_journal(compacted_path, StreakEntry("Lost", 6, 120))
+    merged_entries = [StreakEntry("Lost", 6, 120), StreakEntry("Joel", 5, 100)]
+    temp_path.write_text(json.dumps([asdict(entry) for entry in merged_entries]), encoding="utf-8")
+
+    streaks = streak_journal.sort_streaks(streak_journal.read_all_streaks(streak_file_path))
+    assert [e.player_name for e in streaks] == ["Lost", "Joel"]
+    streak_journal.compact_journal(streak_file_path, max_entries=10)
+
+    assert not compacted_path.exists()
+    assert not temp_path.exists()
+    assert [e.player_name for e in streak_journal.read_snapshot(streak_file_path)] == ["Lost", "Joel"]
+
+
+# ************************************************
+# Tests for: start_history and catch_up_history
+# ************************************************
+
+
+def test_start_history_copies_leaderboard(streak_file_path: Path) -> None:
+    """Test that a new history starts with the snapshot's streaks, then the journaled ones with their numbers."""
+    streak_journal.save_streaks_to_file(streak_file_path, [StreakEntry("Old", 9, 0)])
+    streak_journal.append_to_journal(streak_journal.get_journal_path(streak_file_path), StreakEntry("New", 1, 0), seq=0)
+
+    streak_journal.start_history(streak_file_path)
+
+    history = streak_journal.read_journaled_streaks(streak_journal.get_history_path(streak_file_path))
+    assert [(journaled.entry.player_name, journaled.seq) for journaled in history] == [("Old", None), ("New", 0)]
+
+
+def test_catch_up_history_appends_missing_numbers(streak_file_path: Path) -> None:
+    """Test that only the pending streaks whose numbers are missing from the history are appended."""
+    history_path = streak_journal.get_history_path(streak_file_path)
+    entry = StreakEntry("Joel", 3, 60)
+    streak_journal.append_to_journal(history_path, entry, seq=0)
+    pending = [streak_journal.JournaledStreak(entry, seq) for seq in range(3)]
+
+    streak_journal.catch_up_history(streak_file_path, pending)
+    streak_journal.catch_up_history(streak_file_path, pending)
+
+    assert [journaled.seq for journaled in streak_journal.read_journaled_streaks(history_path)] == [0, 1, 2]
@@ -4,6 +4,12 @@ This package contains unit tests for the setup logic, including grid generation,
 menu utilities, and word selection.
 
 Modules:
+    test_benchmark: Tests for the generator benchmark harness.
+    test_lexicon: Tests for lexicon reading, indexing and caching.
     test_menus: Tests for menu-related utilities.
+    test_puzzle_bank: Tests for the puzzle bank store and command.
+    test_puzzle_factory: Tests for background puzzle pre-generation.
+    test_simulation: Tests for the batch bot simulation and its command.
+    test_startup_benchmark: Tests for the startup benchmark and the deferred imports.
     test_word_selector: Tests for word selection logic.
 """
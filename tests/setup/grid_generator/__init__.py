@@ -4,8 +4,11 @@ This package contains unit tests for the grid generation logic, board state mana
 placement logic, placement rules, and word selection.
 
 Modules:
+    test_backtracking_generator: Tests for the backtracking board generator engine.
     test_board_state: Tests for board state and grid utilities.
+    test_flat_grid: Tests for the flat grid backend.
     test_main_generator: Tests for main board setup functions.
+    test_parallel_generator: Tests for parallel board generation.
     test_placement_logic: Tests for placement finding and selection logic.
     test_placement_rules: Tests for grid validation and placement rules.
     test_word_selector: Tests for word selection logic.
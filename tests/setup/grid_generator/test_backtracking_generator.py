@@ -0,0 +1,169 @@
+# ************************************************
+# Tests for: Backtracking Board Generator
+# ************************************************
+import random
+from dataclasses import replace
+
+import pytest
+
+from data.settings_details import DifficultyData, GridConfigData, WordsNeededData
+from gameplay.word_placement import WordPlacement
+from setup.grid_generator import backtracking_generator, main_generator
+from setup.grid_generator.board_state import BoardGenerationState
+
+STREAK_SUBWORDS = ["rat", "stare", "rate", "stark", "ear", "rest", "steak", "take", "tears", "skate", "treks"]
+
+
+@pytest.fixture
+def backtracking_settings() -> DifficultyData:
+    """Create settings that select the backtracking engine.
+
+    Returns:
+        DifficultyData: A sample settings object for testing.
+
+    """
+    return DifficultyData(
+        grid=GridConfigData(height=15, width=25),
+        words_on_board_needed=WordsNeededData(minimum=6, maximum=10),
+        max_word_length=6,
+        min_subword_length=3,
+        board_engine="backtracking",
+    )
+
+
+def make_middle_word_state(middle_word: str, settings: DifficultyData) -> BoardGenerationState:
+    """Create a board state with the middle word already placed.
+
+    Args:
+        middle_word (str): The diagonal middle word.
+        settings (DifficultyData): The settings giving the grid size.
+
+    Returns:
+        BoardGenerationState: The prepared board state.
+
+    """
+    state = main_generator.initialize_board_state(settings.grid.height, settings.grid.width)
+    assert main_generator.place_middle_word(state, middle_word)
+    return state
+
+
+def test_place_words_backtracking_success(backtracking_settings: DifficultyData) -> None:
+    """Cross every middle word letter and reach the minimum word count."""
+    random.seed(3)
+    state = make_middle_word_state("streak", backtracking_settings)
+
+    reason = backtracking_generator.place_words_backtracking(state, STREAK_SUBWORDS, backtracking_settings)
+
+    assert reason is None
+    assert state.used_middle_word_coords == state.middle_word_coords
+    minimum = backtracking_settings.words_on_board_needed.minimum
+    maximum = backtracking_settings.words_on_board_needed.maximum
+    assert minimum <= len(state.placed_words_coords) <= maximum
+
+
+def test_place_words_backtracking_reports_uncrossable_middle_word(backtracking_settings: DifficultyData) -> None:
+    """Report why the board fails when no sub-word can cross a middle word letter."""
+    state = make_middle_word_state("streak", backtracking_settings)
+
+    reason = backtracking_generator.place_words_backtracking(state, ["rat", "ear"], backtracking_settings)
+
+    assert reason == "No arrangement of the sub-words crosses every letter of the middle word."
+    assert list(state.placed_words_coords) == ["streak"]
+
+
+def test_place_words_backtracking_reports_too_few_words(backtracking_settings: DifficultyData) -> None:
+    """Report how many words were placed when the minimum word count is out of reach."""
+    random.seed(3)
+    demanding_settings = DifficultyData(
+        grid=backtracking_settings.grid,
+        words_on_board_needed=WordsNeededData(minimum=40, maximum=50),
+        max_word_length=6,
+        min_subword_length=3,
+        board_engine="backtracking",
+    )
+    state = make_middle_word_state("streak", demanding_settings)
+
+    reason = backtracking_generator.place_words_backtracking(state, STREAK_SUBWORDS, demanding_settings)
+
+    assert reason is not None
+    assert "of the 40 words needed" in reason
+
+
+def test_order_most_constrained(backtracking_settings: DifficultyData) -> None:
+    """Put words with fewer placements first and unplaceable words last."""
+    state = make_middle_word_state("streak", backtracking_settings)
+    all_words = {"streak", "rat", "take", "zzz"}
+
+    ordered_words = backtracking_generator.order_most_constrained(state, ["zzz", "take", "rat"], all_words)
+
+    assert ordered_words[-1] == "zzz"
+    assert set(ordered_words) == {"zzz", "take", "rat"}
+
+
+def test_generate_board_selects_engine(backtracking_settings: DifficultyData) -> None:
+    """Generate a board with the engine named by the difficulty, and reject unknown engines."""
+    random.seed(3)
+    final_grid, placed_words_coords, reason = main_generator.generate_board_with_reason(
+        backtracking_settings,
+        "streak",
+        STREAK_SUBWORDS,
+    )
+
+    assert reason is None
+    assert final_grid is not None
+    assert placed_words_coords is not None
+    assert "streak" in placed_words_coords
+
+    unknown_settings = DifficultyData(
+        grid=backtracking_settings.grid,
+        words_on_board_needed=backtracking_settings.words_on_board_needed,
+        max_word_length=6,
+        min_subword_length=3,
+        board_engine="quantum",
+    )
+    with pytest.raises(ValueError, match="Unknown board engine"):
+        main_generator.generate_board(unknown_settings, "streak", STREAK_SUBWORDS)
+
+
+@pytest.mark.parametrize("board_engine", ["greedy", "backtracking"])
+def test_generate_board_seeded(backtracking_settings: DifficultyData, board_engine: str) -> None:
+    """Generate the same board for the same seed, whatever the global random state."""
+    settings = replace(backtracking_settings, board_engine=board_engine)
+
+    random.seed(1)
+    first = main_generator.generate_board(settings, "streak", STREAK_SUBWORDS, rng=random.Random(8))
+    random.seed(2)
+    second = main_generator.generate_board(settings, "streak", STREAK_SUBWORDS, rng=random.Random(8))
+
+    assert first == second
+    final_grid, words_to_find = first
+    assert final_grid is not None
+    assert words_to_find is not None
+    assert words_to_find["streak"].orientation == "D"
+    for word, placement in words_to_find.items():
+        assert isinstance(placement, WordPlacement)
+        assert "".join(final_grid[row][col] for row, col in placement).lower() == word
+
+
+@pytest.mark.parametrize("board_engine", ["greedy", "backtracking"])
+def test_generate_board_stops_when_asked(backtracking_settings: DifficultyData, board_engine: str) -> None:
+    """Give up between placements once should_stop returns True, without returning a partial board."""
+    settings = replace(backtracking_settings, board_engine=board_engine)
+    checks: list[None] = []
+
+    def should_stop() -> bool:
+        checks.append(None)
+        return True
+
+    final_grid, placed_words_coords, reason = main_generator.generate_board_with_reason(
+        settings,
+        "streak",
+        STREAK_SUBWORDS,
+        rng=random.Random(8),
+        should_stop=should_stop,
+    )
+
+    assert final_grid is None
+    assert placed_words_coords is None
+    assert reason == "Stopped before the board was finished."
+    assert checks
@@ -83,3 +83,53 @@ def sample_state_data() -> dict[str, object]:
         },
         "used_middle_word_coords": {(1, 1), (3, 3)},  # Occupied by xE and We
     }
+
+
+def test_compute_anchor_run(sample_grid_5x5: list[list[str | None]]) -> None:
+    """Measure the free room around a placed letter in each orientation."""
+    grid = sample_grid_5x5
+
+    # "E" at (1, 2) vertically: one free cell above, three below
+    assert board_state.compute_anchor_run(grid, (1, 2), "V") == board_state.AnchorRun(before=1, after=3)
+
+    # "E" at (1, 2) horizontally: boxed in by "T" and "S", so only words running through them fit
+    assert board_state.compute_anchor_run(grid, (1, 2), "H") == board_state.AnchorRun(
+        before=-1,
+        after=-1,
+        before_blocker="T",
+        after_blocker="S",
+    )
+
+    # A lone letter in the corner of an empty grid cannot be crossed going up or left
+    corner_grid = board_state.create_empty_grid(3, 3)
+    corner_grid[0][0] = "A"
+    assert board_state.compute_anchor_run(corner_grid, (0, 0), "V") == board_state.AnchorRun(before=0, after=2)
+    single_cell_grid = [["A"]]
+    assert board_state.compute_anchor_run(single_cell_grid, (0, 0), "H") is None
+
+
+def test_update_open_anchors_matches_full_rebuild() -> None:
+    """Keep the incremental index equal to one rebuilt from scratch as cells are filled and emptied."""
+
+    def rebuild(grid: list[list[str | None]]) -> dict:
+        state = board_state.BoardGenerationState(grid=grid, open_anchors={})
+        filled = [(r, c) for r, row in enumerate(grid) for c, cell in enumerate(row) if cell is not None]
+        board_state.update_open_anchors(state, filled)
+        return {key: anchors for key, anchors in state.open_anchors.items() if anchors}
+
+    state = board_state.initialize_board_state(7, 7)
+    cat_coords = [(3, 1), (3, 2), (3, 3)]
+    board_state.place_letters_on_grid(state.grid, "cat", cat_coords)
+    board_state.update_open_anchors(state, cat_coords)
+    assert {key: anchors for key, anchors in state.open_anchors.items() if anchors} == rebuild(state.grid)
+
+    tan_coords = [(4, 3), (5, 3)]
+    board_state.place_letters_on_grid(state.grid, "an", tan_coords)
+    board_state.update_open_anchors(state, tan_coords)
+    assert {key: anchors for key, anchors in state.open_anchors.items() if anchors} == rebuild(state.grid)
+
+    for (row, col), letter in zip(tan_coords, "an", strict=True):
+        board_state.remove_open_anchor(state, (row, col), letter)
+        state.grid[row][col] = None
+    board_state.update_open_anchors(state, tan_coords)
+    assert {key: anchors for key, anchors in state.open_anchors.items() if anchors} == rebuild(state.grid)
@@ -0,0 +1,99 @@
+# ************************************************
+# Tests for: Flat Grid Backend
+# ************************************************
+import pytest
+
+from setup.grid_generator.board_state import compute_anchor_run, create_empty_grid, initialize_board_state
+from setup.grid_generator.flat_grid import FlatGrid, fits_in_flat_grid
+from setup.grid_generator.placement_rules import is_valid_placement
+
+
+@pytest.fixture
+def sample_grid() -> list[list[str | None]]:
+    """Create a small nested grid with a horizontal and a vertical word.
+
+    Returns:
+        list[list[str | None]]: A 5x5 grid containing 'cat' across and 'art' down.
+
+    """
+    grid = create_empty_grid(5, 5)
+    for col, letter in enumerate("cat"):
+        grid[1][col + 1] = letter
+    for row, letter in enumerate("rt"):
+        grid[row + 2][2] = letter
+    return grid
+
+
+def test_fits_in_flat_grid() -> None:
+    """Accept Latin-1 words and reject letters that do not fit in a byte."""
+    assert fits_in_flat_grid(["streak", "café"])
+    assert not fits_in_flat_grid(["streak", "ćma"])
+
+
+def test_round_trip(sample_grid: list[list[str | None]]) -> None:
+    """Convert a nested grid to a flat grid and back without changes."""
+    flat_grid = FlatGrid.from_nested(sample_grid)
+
+    assert flat_grid.to_nested() == sample_grid
+    assert flat_grid == sample_grid
+    assert (len(flat_grid), len(flat_grid[0])) == (5, 5)
+
+
+def test_row_view_reads_and_writes(sample_grid: list[list[str | None]]) -> None:
+    """Read and write cells through grid[row][col], as with nested lists."""
+    flat_grid = FlatGrid.from_nested(sample_grid)
+
+    assert flat_grid[1][2] == "a"
+    assert flat_grid[0][0] is None
+    flat_grid[0][0] = "z"
+    assert flat_grid.get(0, 0) == "z"
+    flat_grid[0][0] = None
+    assert flat_grid == sample_grid
+    with pytest.raises(IndexError):
+        flat_grid[5]
+
+
+def test_place_word_skips_out_of_bounds() -> None:
+    """Write the letters inside the grid and skip coordinates outside it."""
+    flat_grid = FlatGrid(2, 2)
+
+    flat_grid.place_word("abc", [(0, 0), (0, 1), (0, 2)])
+
+    assert flat_grid.to_nested() == [["a", "b"], [None, None]]
+
+
+def test_is_valid_placement_matches_nested_rules(sample_grid: list[list[str | None]]) -> None:
+    """Give the same answer as the nested-list rules for every anchor, index and orientation."""
+    flat_grid = FlatGrid.from_nested(sample_grid)
+    words = ["tar", "at", "rat", "cart", "tact", "cat", "art"]
+    words_set = set(words)
+
+    for word in words:
+        for row in range(5):
+            for col in range(5):
+                for idx in range(len(word)):
+                    for orientation in ("V", "H"):
+                        info = {"row": row, "col": col, "idx": idx}
+                        expected = is_valid_placement(sample_grid, word, words_set, info, orientation)
+                        assert is_valid_placement(flat_grid, word, words_set, info, orientation) == expected
+
+
+def test_anchor_runs_match_nested_grid(sample_grid: list[list[str | None]]) -> None:
+    """Compute the same anchor runs on a flat grid as on the nested grid."""
+    flat_grid = FlatGrid.from_nested(sample_grid)
+
+    for row in range(5):
+        for col in range(5):
+            if sample_grid[row][col] is None:
+                continue
+            for orientation in ("V", "H"):
+                expected = compute_anchor_run(sample_grid, (row, col), orientation)
+                assert compute_anchor_run(flat_grid, (row, col), orientation) == expected
+
+
+def test_initialize_board_state_flat_grid() -> None:
+    """Store the grid as a FlatGrid when requested."""
+    state = initialize_board_state(3, 4, use_flat_grid=True)
+
+    assert isinstance(state.grid, FlatGrid)
+    assert state.grid == create_empty_grid(3, 4)
@@ -0,0 +1,142 @@
+# ************************************************
+# Tests for: Parallel Board Generation
+# ************************************************
+from unittest.mock import patch
+
+import pytest
+
+from data.settings_details import DifficultyData, GridConfigData, WordsNeededData
+from setup.grid_generator import parallel_generator
+
+SAMPLE_GRID = [["S"]]
+SAMPLE_COORDS = {"streak": [(0, 0)]}
+
+
+@pytest.fixture
+def small_settings() -> DifficultyData:
+    """Create settings small enough for a real board to be generated quickly.
+
+    Returns:
+        DifficultyData: A sample settings object for testing.
+
+    """
+    return DifficultyData(
+        grid=GridConfigData(height=15, width=25),
+        words_on_board_needed=WordsNeededData(minimum=2, maximum=10),
+        max_word_length=6,
+        min_subword_length=3,
+    )
+
+
+@pytest.mark.parametrize(
+    ("configured", "expected"),
+    [("", 1), ("4", 4), ("0", 1), ("-2", 1), ("many", 1)],
+)
+def test_get_board_worker_count(monkeypatch: pytest.MonkeyPatch, configured: str, expected: int) -> None:
+    """Read the worker count from the environment, falling back to sequential generation."""
+    monkeypatch.setenv(parallel_generator.BOARD_WORKERS_ENV_VAR, configured)
+    assert parallel_generator.get_board_worker_count() == expected
+
+
+@patch("setup.grid_generator.parallel_generator.os.cpu_count", return_value=6)
+def test_get_board_worker_count_auto(mock_cpu_count: object, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use one worker per core when the worker count is 'auto'."""
+    monkeypatch.setenv(parallel_generator.BOARD_WORKERS_ENV_VAR, "auto")
+    assert parallel_generator.get_board_worker_count() == 6
+
+
+@patch("setup.grid_generator.parallel_generator.random.Random")
+@patch("setup.grid_generator.parallel_generator.generate_board")
+def test_generate_board_with_seed(
+    mock_gen_board: object,
+    mock_random: object,
+    small_settings: DifficultyData,
+) -> None:
+    """Run the attempt with its own random number generator seeded from the attempt's seed."""
+    mock_gen_board.return_value = (SAMPLE_GRID, SAMPLE_COORDS)
+
+    result = parallel_generator.generate_board_with_seed(small_settings, "streak", ["rat"], 42)
+
+    assert result == (SAMPLE_GRID, SAMPLE_COORDS)
+    mock_random.assert_called_once_with(42)
+    mock_gen_board.assert_called_once_with(small_settings, "streak", ["rat"], rng=mock_random.return_value)
+
+
+@patch("setup.grid_generator.parallel_generator.ProcessPoolExecutor")
+@patch("setup.grid_generator.parallel_generator.generate_board")
+def test_generate_board_parallel_single_worker_runs_in_process(
+    mock_gen_board: object,
+    mock_executor: object,
+    small_settings: DifficultyData,
+) -> None:
+    """Run the attempts one after another, stopping at the first success, when only one worker is set."""
+    mock_gen_board.side_effect = [(None, None), (SAMPLE_GRID, SAMPLE_COORDS), (None, None)]
+
+    result = parallel_generator.generate_board_parallel(small_settings, "streak", ["rat"], attempts=3, max_workers=1)
+
+    assert result == (SAMPLE_GRID, SAMPLE_COORDS)
+    assert mock_gen_board.call_count == 2
+    mock_executor.assert_not_called()
+
+
+@patch("setup.grid_generator.parallel_generator.ProcessPoolExecutor")
+def test_board_worker_pool_does_not_fork(mock_executor: object) -> None:
+    """Start the workers without forking, since the game may run the pool next to other threads."""
+    parallel_generator.BoardWorkerPool(max_workers=2)
+
+    start_method = mock_executor.call_args.kwargs["mp_context"].get_start_method()
+    assert start_method in {"forkserver", "spawn"}
+
+
+@patch("setup.grid_generator.parallel_generator.generate_board", return_value=(None, None))
+def test_generate_board_parallel_all_attempts_fail(mock_gen_board: object, small_settings: DifficultyData) -> None:
+    """Return (None, None) when no attempt produces a valid board."""
+    result = parallel_generator.generate_board_parallel(small_settings, "streak", ["rat"], attempts=3, max_workers=1)
+
+    assert result == (None, None)
+    assert mock_gen_board.call_count == 3
+
+
+@patch("setup.grid_generator.parallel_generator.generate_board", return_value=(SAMPLE_GRID, SAMPLE_COORDS))
+def test_generate_pooled_attempt_stops_once_round_is_over(
+    mock_gen_board: object,
+    monkeypatch: pytest.MonkeyPatch,
+    small_settings: DifficultyData,
+) -> None:
+    """Give the attempt a stop check that turns True once the pool's round id moves on."""
+    active_round = parallel_generator.multiprocessing.Value("q", 3, lock=False)
+    monkeypatch.setattr(parallel_generator, "_worker_active_round", active_round)
+
+    parallel_generator.generate_pooled_attempt(small_settings, "streak", ["rat"], 42, 3)
+
+    should_stop = mock_gen_board.call_args.kwargs["should_stop"]
+    assert not should_stop()
+    active_round.value = parallel_generator.NO_ACTIVE_ROUND
+    assert should_stop()
+
+
+def test_generate_board_parallel_process_pool(small_settings: DifficultyData) -> None:
+    """Generate real boards across worker processes, reusing the session's pool for every word list."""
+    words_to_place = ["rat", "stare", "rate", "stark", "ear", "rest", "steak", "take", "tears"]
+
+    try:
+        for _ in range(2):
+            final_grid, placed_words_coords = parallel_generator.generate_board_parallel(
+                small_settings,
+                "streak",
+                words_to_place,
+                attempts=4,
+                max_workers=2,
+            )
+
+            assert final_grid is not None
+            assert placed_words_coords is not None
+            assert "streak" in placed_words_coords
+            assert len(placed_words_coords) >= small_settings.words_on_board_needed.minimum
+        pool = parallel_generator.BOARD_WORKER_POOLS[2]
+        assert pool.round_count == 2
+        assert pool.active_round.value == parallel_generator.NO_ACTIVE_ROUND
+    finally:
+        parallel_generator.shutdown_board_worker_pools()
+
+    assert not parallel_generator.BOARD_WORKER_POOLS
@@ -168,3 +168,55 @@ def test_apply_placement(
         state,
     )
     mock_place_letters.assert_called_once_with(state.grid, "APPLY", calculated_coords)
+
+
+def test_apply_placement_with_undo_round_trip() -> None:
+    """Undo a placement and restore the grid and tracking state exactly."""
+    grid: list[list[str | None]] = [[None] * 5 for _ in range(5)]
+    state: BoardGenerationState = BoardGenerationState(grid=grid)
+    placement_logic.apply_placement(state, PlacementDetail("cat", (2, 0), 0, "H"))
+    state.middle_word_coords = {(2, 1)}
+
+    before_grid = [row[:] for row in state.grid]
+    before_words = {word: list(coords) for word, coords in state.placed_words_coords.items()}
+    before_letters = {letter: list(coords) for letter, coords in state.placed_letter_coords.items()}
+
+    undo = placement_logic.apply_placement_with_undo(state, PlacementDetail("bad", (2, 1), 1, "V"))
+
+    assert undo.new_cells == [(1, 1), (3, 1)]
+    assert undo.new_letters == ["b", "d"]
+    assert undo.used_middle_word_coord == (2, 1)
+    assert state.used_middle_word_coords == {(2, 1)}
+    assert state.grid[1][1] == "b"
+
+    placement_logic.undo_placement(state, undo)
+
+    assert state.grid == before_grid
+    assert state.placed_words_coords == before_words
+    assert state.placed_letter_coords == before_letters
+    assert state.used_middle_word_coords == set()
+
+
+def test_find_indexed_placements_matches_full_check() -> None:
+    """Find the same placements from the open anchor index as from walking the grid."""
+    state: BoardGenerationState = BoardGenerationState(grid=[[None] * 9 for _ in range(9)], open_anchors={})
+    words_on_board = {"streak", "rat", "stare", "tears", "rest", "take", "ear"}
+    placement_logic.apply_placement(state, PlacementDetail("streak", (4, 1), 0, "H"))
+    placement_logic.apply_placement(state, PlacementDetail("rat", (4, 3), 0, "V"))
+    placement_logic.apply_placement(state, PlacementDetail("take", (6, 3), 0, "H"))
+
+    for word in ("stare", "tears", "rest", "ear"):
+        full_check = placement_logic.find_possible_placements(
+            state.grid,
+            word,
+            words_on_board,
+            state.placed_letter_coords,
+        )
+        indexed = placement_logic.find_possible_placements(
+            state.grid,
+            word,
+            words_on_board,
+            state.placed_letter_coords,
+            open_anchors=state.open_anchors,
+        )
+        assert sorted(map(repr, indexed)) == sorted(map(repr, full_check))
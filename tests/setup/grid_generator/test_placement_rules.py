@@ -511,3 +511,18 @@ def test_calculate_middle_word_placement_coords() -> None:
         "PNEUMONOULTRAMICROSCOPICSILICOVOLCANOCONIOSIS",
     )
     assert coords is None
+
+
+def test_check_anchor_run() -> None:
+    """Decide placements from the free runs around an anchor, deferring to the full check when needed."""
+    open_run = board_state.AnchorRun(before=2, after=2)
+    assert placement_rules.check_anchor_run(open_run, "cat", 1) is True
+    assert placement_rules.check_anchor_run(open_run, "catalog", 1) is False  # Runs past the free cells
+
+    blocked_run = board_state.AnchorRun(before=-1, after=3, before_blocker="r")
+    assert placement_rules.check_anchor_run(blocked_run, "rate", 1) is None  # Runs through the matching "r"
+    assert placement_rules.check_anchor_run(blocked_run, "bate", 1) is False  # "b" does not match the "r"
+    assert placement_rules.check_anchor_run(blocked_run, "ate", 0) is False  # Would touch the "r"
+    gap_run = board_state.AnchorRun(before=0, after=3, before_blocker="r")
+    assert placement_rules.check_anchor_run(gap_run, "ate", 0) is True  # Leaves a gap before the "r"
+    assert placement_rules.check_anchor_run(open_run, "a", 0) is False  # No new letter would be placed
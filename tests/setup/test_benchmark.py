@@ -0,0 +1,148 @@
+# ************************************************
+# Tests for: Generator Benchmark
+# ************************************************
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from data.settings_details import DifficultyData, GridConfigData, WordsNeededData
+from setup import benchmark
+from setup.benchmark import PresetReport, PuzzleRun
+from setup.lexicon import compile_lexicon
+
+SAMPLE_GRID = [["S"]]
+SAMPLE_COORDS = {"streak": [(0, 0)]}
+
+
+@pytest.fixture
+def sample_settings() -> DifficultyData:
+    """Create a sample DifficultyData object for tests.
+
+    Returns:
+        DifficultyData: A sample settings object for testing.
+
+    """
+    return DifficultyData(
+        grid=GridConfigData(height=15, width=25),
+        words_on_board_needed=WordsNeededData(minimum=2, maximum=10),
+        max_word_length=6,
+        min_subword_length=3,
+        heart_point_mode=True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("pct", "expected"),
+    [(50, 3.0), (95, 5.0), (99, 5.0), (0, 1.0)],
+)
+def test_percentile(pct: float, expected: float) -> None:
+    """Return the nearest-rank percentile."""
+    assert benchmark.percentile([5.0, 1.0, 4.0, 2.0, 3.0], pct) == expected
+
+
+def test_percentile_empty() -> None:
+    """Return zero when there are no values."""
+    assert benchmark.percentile([], 50) == pytest.approx(0.0)
+
+
+def test_normalize_failure_reason() -> None:
+    """Group failure reasons that only differ in their numbers and quoted words."""
+    assert benchmark.normalize_failure_reason("Placed 3 of the 12 words needed.") == "Placed N of the N words needed."
+    assert benchmark.normalize_failure_reason("The middle word 'streak' does not fit on a 5x5 grid.") == (
+        "The middle word '...' does not fit on a NxN grid."
+    )
+
+
+@patch("setup.puzzle_factory.generate_board_with_reason")
+@patch("setup.puzzle_factory.select_word_list")
+@patch("setup.benchmark.random.Random")
+def test_run_puzzle_retries_until_success(
+    mock_random: object,
+    mock_select: object,
+    mock_gen_board: object,
+    sample_settings: DifficultyData,
+) -> None:
+    """Count every attempt and record why the failed ones failed."""
+    mock_select.side_effect = [(None, None), ("streak", ["rat"]), ("streak", ["rat"])]
+    mock_gen_board.side_effect = [(None, None, "Placed 1 of the 2 words needed."), (SAMPLE_GRID, SAMPLE_COORDS, None)]
+
+    puzzle_run = benchmark.run_puzzle(sample_settings, compile_lexicon([]), seed=7)
+
+    mock_random.assert_called_once_with(7)
+    assert mock_select.call_args.kwargs["rng"] is mock_random.return_value
+    assert puzzle_run.succeeded
+    assert puzzle_run.attempts == 3
+    assert puzzle_run.failure_reasons == ["No word list could be selected.", "Placed 1 of the 2 words needed."]
+
+
+@patch("setup.puzzle_factory.generate_board_with_reason", return_value=(None, None, "Placed 1 of the 2 words needed."))
+@patch("setup.puzzle_factory.select_word_list", return_value=("streak", ["rat"]))
+def test_run_puzzle_gives_up(mock_select: object, mock_gen_board: object, sample_settings: DifficultyData) -> None:
+    """Fail the puzzle after MAX_ATTEMPTS_PER_PUZZLE attempts."""
+    puzzle_run = benchmark.run_puzzle(sample_settings, compile_lexicon([]), seed=0)
+
+    assert not puzzle_run.succeeded
+    assert puzzle_run.attempts == benchmark.MAX_ATTEMPTS_PER_PUZZLE
+    assert mock_gen_board.call_count == benchmark.MAX_ATTEMPTS_PER_PUZZLE
+
+
+@patch("setup.benchmark.measure_peak_memory", return_value=2048)
+@patch("setup.benchmark.run_puzzle")
+def test_benchmark_preset_summarizes_runs(
+    mock_run_puzzle: object,
+    mock_peak_memory: object,
+    sample_settings: DifficultyData,
+) -> None:
+    """Summarize latency, attempts per success, failure rate and failure reasons."""
+    mock_run_puzzle.side_effect = [
+        PuzzleRun(seed=3, latency_seconds=0.010, attempts=1, succeeded=True),
+        PuzzleRun(seed=4, latency_seconds=0.030, attempts=3, succeeded=True, failure_reasons=["Placed 1 of 2.", "x"]),
+        PuzzleRun(seed=5, latency_seconds=0.020, attempts=2, succeeded=False, failure_reasons=["Placed 0 of 2."] * 2),
+    ]
+
+    report = benchmark.benchmark_preset("Sample", sample_settings, compile_lexicon([]), runs=3, base_seed=3)
+
+    assert [call.args[2] for call in mock_run_puzzle.call_args_list] == [3, 4, 5]
+    assert report.successes == 2
+    assert report.failure_rate == pytest.approx(0.3333)
+    assert report.attempts_per_success == pytest.approx(3.0)
+    assert report.latency_ms["p50"] == pytest.approx(20.0)
+    assert report.latency_ms["p99"] == pytest.approx(30.0)
+    assert report.peak_memory_kib == pytest.approx(2.0)
+    assert report.failure_reasons == {"Placed N of N.": 3, "x": 1}
+
+
+@patch("setup.benchmark.run_benchmark")
+@patch("setup.benchmark.load_lexicon")
+def test_main_writes_json(mock_load: object, mock_run_benchmark: object, tmp_path: Path) -> None:
+    """Write the reports and the benchmark parameters to the output file."""
+    mock_load.return_value = compile_lexicon([])
+    mock_run_benchmark.return_value = [
+        PresetReport(
+            difficulty="Sample",
+            board_engine="greedy",
+            runs=2,
+            successes=2,
+            failure_rate=0.0,
+            attempts_per_success=1.0,
+            latency_ms={"p50": 1.0, "p95": 2.0, "p99": 2.0, "mean": 1.5},
+            peak_memory_kib=10.0,
+        ),
+    ]
+    output_path = tmp_path / "results.json"
+
+    benchmark.main(["words.txt", "--runs", "2", "--seed", "9", "--output", str(output_path)])
+
+    mock_run_benchmark.assert_called_once_with(mock_load.return_value, runs=2, base_seed=9, board_engine=None)
+    results = json.loads(output_path.read_text(encoding="utf-8"))
+    assert results["base_seed"] == 9
+    assert results["presets"][0]["difficulty"] == "Sample"
+
+
+@patch("setup.benchmark.load_lexicon", return_value=None)
+def test_main_missing_lexicon(mock_load: object) -> None:
+    """Exit with an error when the lexicon cannot be loaded."""
+    with pytest.raises(SystemExit):
+        benchmark.main(["missing.txt"])
@@ -0,0 +1,226 @@
+# ************************************************
+# Tests for: Lexicon
+# ************************************************
+import itertools
+from pathlib import Path
+from unittest.mock import mock_open, patch
+
+import pytest
+
+from data.settings_details import (
+    HEART_POINTS_SETTINGS,
+    NO_HEART_POINTS_SETTINGS,
+    DifficultyData,
+    GridConfigData,
+    WordsNeededData,
+)
+from setup import lexicon
+
+
+@pytest.fixture
+def lexicon_file(tmp_path: Path) -> Path:
+    """Create a small lexicon file on disk.
+
+    Returns:
+        Path: Path to the lexicon file.
+
+    """
+    file_path = tmp_path / "lexicon.txt"
+    file_path.write_text("Stare\ntears\n\nrat\ntar\nstreak\ntears\n", encoding="utf-8")
+    return file_path
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    """Provide a temporary directory for lexicon cache files.
+
+    Returns:
+        Path: Temporary cache directory.
+
+    """
+    return tmp_path / "cache"
+
+
+def test_get_letter_signature() -> None:
+    """Anagrams share a signature while other words do not."""
+    assert lexicon.get_letter_signature("stare") == "aerst"
+    assert lexicon.get_letter_signature("tears") == lexicon.get_letter_signature("rates")
+    assert lexicon.get_letter_signature("stark") != lexicon.get_letter_signature("stare")
+
+
+def test_build_signature_index() -> None:
+    """Group words under their shared signature."""
+    index = lexicon.build_signature_index(["stare", "tears", "rat", "tar", "art", "dog"])
+    assert sorted(index["aerst"]) == ["stare", "tears"]
+    assert sorted(index["art"]) == ["art", "rat", "tar"]
+    assert index["dgo"] == ["dog"]
+    assert len(index) == 3
+
+
+def test_get_sub_signatures_matches_permutations() -> None:
+    """Cover exactly the signatures reachable through permutations of the word."""
+    word = "letter"
+    min_length = 3
+
+    expected = {
+        lexicon.get_letter_signature("".join(p))
+        for length in range(min_length, len(word) + 1)
+        for p in itertools.permutations(word, length)
+    }
+
+    assert lexicon.get_sub_signatures(word, min_length) == expected
+
+
+def test_get_sub_signatures_min_length_too_long() -> None:
+    """Return no signatures when the minimum length exceeds the word length."""
+    assert lexicon.get_sub_signatures("cat", 4) == set()
+
+
+def test_read_word_file_not_found() -> None:
+    """Test that read_word_file returns [] and prints error when file is missing."""
+    with (
+        patch("setup.lexicon.open", side_effect=FileNotFoundError) as mock_open_func,
+        patch("builtins.print") as mock_print,
+    ):
+        result = lexicon.read_word_file("non_existent_file.txt")
+        assert result == []
+        mock_open_func.assert_called_once_with("non_existent_file.txt", encoding="utf-8")
+        mock_print.assert_called_once()
+        assert "Error: File non_existent_file.txt not found." in mock_print.call_args[0][0]
+
+
+def test_read_word_file_io_error() -> None:
+    """Test that read_word_file returns [] and prints error on IOError."""
+    with (
+        patch("setup.lexicon.open", side_effect=OSError("Permission denied")) as mock_open_func,
+        patch("builtins.print") as mock_print,
+    ):
+        result = lexicon.read_word_file("some_file.txt")
+        assert result == []
+        mock_open_func.assert_called_once_with("some_file.txt", encoding="utf-8")
+        mock_print.assert_called_once()
+        assert "Error reading file some_file.txt: Permission denied" in mock_print.call_args[0][0]
+
+
+def test_read_word_file_empty() -> None:
+    """Test that read_word_file returns [] for an empty file."""
+    with patch("builtins.open", mock_open(read_data="")) as mock_file:
+        result = lexicon.read_word_file("empty.txt")
+        assert result == []
+        mock_file.assert_called_once_with("empty.txt", encoding="utf-8")
+
+
+def test_read_word_file_valid() -> None:
+    """Test that read_word_file cleans and processes valid file content."""
+    file_content = " Apple \nbanana\n\nCherry\n   \ndate "
+    expected_result = ["apple", "banana", "cherry", "date"]
+    with patch("builtins.open", mock_open(read_data=file_content)) as mock_file:
+        result = lexicon.read_word_file("valid.txt")
+        assert result == expected_result
+        mock_file.assert_called_once_with("valid.txt", encoding="utf-8")
+
+
+def test_compile_lexicon() -> None:
+    """Remove duplicates and build the length buckets and signature index."""
+    compiled = lexicon.compile_lexicon(["stare", "tears", "rat", "stare", "streak"])
+    assert compiled.words == ["stare", "tears", "rat", "streak"]
+    assert compiled.length_buckets == {5: ["stare", "tears"], 3: ["rat"], 6: ["streak"]}
+    assert compiled.signature_index["aerst"] == ["stare", "tears"]
+
+
+def test_get_word_pools() -> None:
+    """Build the subword pool and middle word candidates once per setting."""
+    compiled = lexicon.compile_lexicon(["at", "rat", "stare", "tears", "streak", "streaks"])
+
+    subword_pool, middle_words = compiled.get_word_pools(6, 3)
+    assert subword_pool == {"rat", "stare", "tears", "streak"}
+    assert middle_words == ["streak"]
+    assert compiled.get_word_pools(6, 3)[0] is subword_pool
+
+    assert compiled.get_word_pools(5, 2) == ({"at", "rat", "stare", "tears"}, ["stare", "tears"])
+
+
+def test_get_eligible_middle_words() -> None:
+    """List only the middle words with enough subwords, along with their counts."""
+    compiled = lexicon.compile_lexicon(["rat", "tar", "art", "star", "tars", "rats", "arts", "dogs", "god"])
+    settings = DifficultyData(
+        grid=GridConfigData(height=10, width=10),
+        words_on_board_needed=WordsNeededData(minimum=6, maximum=10),
+        max_word_length=4,
+        min_subword_length=3,
+    )
+
+    eligible = compiled.get_eligible_middle_words(settings)
+
+    assert sorted(eligible) == [("arts", 6), ("rats", 6), ("star", 6), ("tars", 6)]
+    assert compiled.get_subword_counts(4, 3)["dogs"] == 1
+    assert compiled.get_eligible_middle_words(settings) is eligible
+
+
+def test_load_lexicon_precomputes_eligibility(lexicon_file: Path, cache_dir: Path) -> None:
+    """Store the eligibility tables of every built-in difficulty in the cache."""
+    lexicon.load_lexicon(str(lexicon_file), cache_dir)
+    cached = lexicon.load_cached_lexicon(str(lexicon_file), cache_dir)
+    assert cached is not None
+
+    for difficulty_conf in [*HEART_POINTS_SETTINGS.values(), NO_HEART_POINTS_SETTINGS]:
+        table_key = (
+            difficulty_conf.max_word_length,
+            difficulty_conf.min_subword_length,
+            difficulty_conf.words_on_board_needed.minimum,
+        )
+        assert table_key in cached.eligibility_tables
+
+
+def test_load_lexicon_builds_cache(lexicon_file: Path, cache_dir: Path) -> None:
+    """Compile the lexicon on a cold start and write it to the cache."""
+    compiled = lexicon.load_lexicon(str(lexicon_file), cache_dir)
+    assert compiled is not None
+    assert compiled.words == ["stare", "tears", "rat", "tar", "streak"]
+    assert lexicon.get_lexicon_cache_path(str(lexicon_file), cache_dir).exists()
+
+
+def test_load_lexicon_uses_cache(lexicon_file: Path, cache_dir: Path) -> None:
+    """Skip reading the lexicon file on a warm start."""
+    cold = lexicon.load_lexicon(str(lexicon_file), cache_dir)
+    with patch("setup.lexicon.read_word_file") as mock_read:
+        warm = lexicon.load_lexicon(str(lexicon_file), cache_dir)
+        mock_read.assert_not_called()
+    assert warm == cold
+
+
+def test_load_lexicon_invalidates_cache(lexicon_file: Path, cache_dir: Path) -> None:
+    """Rebuild the cache when the lexicon file changes."""
+    lexicon.load_lexicon(str(lexicon_file), cache_dir)
+    lexicon_file.write_text("wizard\nlizard\n", encoding="utf-8")
+
+    reloaded = lexicon.load_lexicon(str(lexicon_file), cache_dir)
+    assert reloaded is not None
+    assert reloaded.words == ["wizard", "lizard"]
+
+
+def test_lexicon_cache_dir_is_in_project(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Keep the default cache next to worderly.py, not in the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+    cache_path = lexicon.get_lexicon_cache_path("corncob-lowercase.txt")
+
+    assert (lexicon.PROJECT_DIR / "worderly.py").is_file()
+    assert cache_path.parent == lexicon.PROJECT_DIR / ".lexicon_cache"
+
+
+def test_load_lexicon_ignores_corrupt_cache(lexicon_file: Path, cache_dir: Path) -> None:
+    """Fall back to reading the lexicon file when the cache cannot be unpickled."""
+    cache_path = lexicon.get_lexicon_cache_path(str(lexicon_file), cache_dir)
+    cache_dir.mkdir()
+    cache_path.write_bytes(b"not a pickle")
+
+    compiled = lexicon.load_lexicon(str(lexicon_file), cache_dir)
+    assert compiled is not None
+    assert "streak" in compiled.words
+
+
+def test_load_lexicon_missing_file(tmp_path: Path, cache_dir: Path) -> None:
+    """Return None when the lexicon file does not exist."""
+    with patch("builtins.print"):
+        assert lexicon.load_lexicon(str(tmp_path / "missing.txt"), cache_dir) is None
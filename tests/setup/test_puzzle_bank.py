@@ -0,0 +1,320 @@
+# ************************************************
+# Tests for: Puzzle Bank
+# ************************************************
+import multiprocessing
+import random
+from dataclasses import replace
+from multiprocessing.synchronize import Barrier
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from data.settings_details import DifficultyData, GridConfigData, WordsNeededData
+from setup import puzzle_bank, seeded_puzzles
+from setup.lexicon import compile_lexicon
+from setup.puzzle_bank import BankedPuzzle, PuzzleBank
+from setup.puzzle_factory import Puzzle
+
+SAMPLE_WORDS = ["streak", "stare", "tears", "rates", "taker", "skate", "steak", "rake", "take", "star", "rat", "tea"]
+
+
+@pytest.fixture
+def sample_settings() -> DifficultyData:
+    """Create a sample DifficultyData object for tests.
+
+    Returns:
+        DifficultyData: A sample settings object for testing.
+
+    """
+    return DifficultyData(
+        grid=GridConfigData(height=15, width=25),
+        words_on_board_needed=WordsNeededData(minimum=4, maximum=10),
+        max_word_length=6,
+        min_subword_length=3,
+        heart_point_mode=True,
+    )
+
+
+@pytest.fixture
+def sample_banked_puzzle() -> BankedPuzzle:
+    """Create a sample banked puzzle with one word of each orientation.
+
+    Returns:
+        BankedPuzzle: A sample banked puzzle for testing.
+
+    """
+    return BankedPuzzle(
+        seed=2**63 + 5,
+        middle_word="streak",
+        placements=[("streak", (2, 7), "D"), ("stare", (2, 7), "H"), ("rat", (4, 11), "V")],
+    )
+
+
+def test_encode_decode_round_trip(sample_banked_puzzle: BankedPuzzle) -> None:
+    """Decode exactly the puzzle that was encoded."""
+    record = puzzle_bank.encode_banked_puzzle(sample_banked_puzzle)
+
+    assert puzzle_bank.decode_banked_puzzle(record) == sample_banked_puzzle
+
+
+def test_get_placements_puts_middle_word_first() -> None:
+    """Reduce word coordinates to start and orientation, middle word first."""
+    words_to_find = {
+        "rat": [(4, 11), (5, 11), (6, 11)],
+        "streak": [(2, 7), (4, 9), (6, 11), (8, 13), (10, 15), (12, 17)],
+        "tar": [(6, 10), (6, 11), (6, 12)],
+    }
+
+    placements = puzzle_bank.get_placements("streak", words_to_find)
+
+    assert placements == [("streak", (2, 7), "D"), ("rat", (4, 11), "V"), ("tar", (6, 10), "H")]
+
+
+def test_get_bank_name_ignores_heart_point_mode(sample_settings: DifficultyData) -> None:
+    """Share a bank between difficulties that only differ in their heart point mode."""
+    no_hp_settings = DifficultyData(
+        grid=sample_settings.grid,
+        words_on_board_needed=sample_settings.words_on_board_needed,
+        max_word_length=sample_settings.max_word_length,
+        min_subword_length=sample_settings.min_subword_length,
+        heart_point_mode=False,
+    )
+
+    assert puzzle_bank.get_bank_name(sample_settings) == puzzle_bank.get_bank_name(no_hp_settings)
+
+
+def test_get_bank_dir_follows_lexicon_file(tmp_path: Path) -> None:
+    """Name the bank directory after the lexicon's cache key, and fail on a missing file."""
+    lexicon_path = tmp_path / "words.txt"
+    lexicon_path.write_text("streak\nrat\n", encoding="utf-8")
+    first_dir = puzzle_bank.get_bank_dir(str(lexicon_path), tmp_path)
+    lexicon_path.write_text("streak\nrat\nstare\n", encoding="utf-8")
+
+    assert first_dir is not None
+    assert first_dir.name.startswith("words-")
+    assert puzzle_bank.get_bank_dir(str(lexicon_path), tmp_path) != first_dir
+    assert puzzle_bank.get_bank_dir(str(tmp_path / "missing.txt"), tmp_path) is None
+
+
+def test_bank_append_and_read(
+    tmp_path: Path,
+    sample_settings: DifficultyData,
+    sample_banked_puzzle: BankedPuzzle,
+) -> None:
+    """Read back any appended puzzle by position, across separate appends."""
+    bank = PuzzleBank(tmp_path, sample_settings)
+    second_puzzle = BankedPuzzle(seed=1, middle_word="skater", placements=[("skater", (2, 7), "D")])
+
+    assert len(bank) == 0
+    assert bank.extend([sample_banked_puzzle]) == 1
+    assert bank.extend([second_puzzle]) == 1
+
+    assert len(bank) == 2
+    assert bank.read(1) == second_puzzle
+    assert bank.read(0) == sample_banked_puzzle
+    with pytest.raises(IndexError):
+        bank.read(2)
+
+
+def test_bank_ignores_torn_index_entry(
+    tmp_path: Path,
+    sample_settings: DifficultyData,
+    sample_banked_puzzle: BankedPuzzle,
+) -> None:
+    """Skip an incomplete index entry, and overwrite it on the next append."""
+    bank = PuzzleBank(tmp_path, sample_settings)
+    bank.extend([sample_banked_puzzle])
+    with bank.index_path.open("ab") as index_file:
+        index_file.write(b"\x01\x02\x03")
+
+    assert len(bank) == 1
+    bank.extend([sample_banked_puzzle])
+    assert len(bank) == 2
+    assert bank.read(1) == sample_banked_puzzle
+
+
+CONCURRENT_WRITERS = 2
+PUZZLES_PER_WRITER = 50
+
+
+def _extend_concurrently(bank_dir: Path, settings: DifficultyData, writer_id: int, barrier: Barrier) -> None:
+    """Append PUZZLES_PER_WRITER puzzles from one process of the concurrent append test.
+
+    Args:
+        bank_dir (Path): The bank directory.
+        settings (DifficultyData): The difficulty of the bank.
+        writer_id (int): The number of the process, used in the seeds.
+        barrier (Barrier): Released once every process is ready, so they all write at once.
+
+    """
+    bank = PuzzleBank(bank_dir, settings)
+    barrier.wait()
+    for i in range(PUZZLES_PER_WRITER):
+        seed = writer_id * PUZZLES_PER_WRITER + i
+        bank.extend([BankedPuzzle(seed=seed, middle_word="streak", placements=[("streak", (2, 7), "D")] * (i % 5))])
+
+
+def test_bank_concurrent_extend_keeps_every_record(tmp_path: Path, sample_settings: DifficultyData) -> None:
+    """Keep every record readable when two processes append to the same bank at once."""
+    barrier = multiprocessing.Barrier(CONCURRENT_WRITERS)
+    processes = [
+        multiprocessing.Process(target=_extend_concurrently, args=(tmp_path, sample_settings, writer_id, barrier))
+        for writer_id in range(CONCURRENT_WRITERS)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+
+    assert all(process.exitcode == 0 for process in processes)
+    bank = PuzzleBank(tmp_path, sample_settings)
+    assert len(bank) == CONCURRENT_WRITERS * PUZZLES_PER_WRITER
+    banked_puzzles = [bank.read(position) for position in range(len(bank))]
+    assert sorted(banked_puzzle.seed for banked_puzzle in banked_puzzles) == list(range(len(bank)))
+    for banked_puzzle in banked_puzzles:  # Records of different lengths, so a stale offset misreads them
+        assert len(banked_puzzle.placements) == banked_puzzle.seed % PUZZLES_PER_WRITER % 5
+
+
+def test_draw_empty_bank(tmp_path: Path, sample_settings: DifficultyData) -> None:
+    """Return None when the bank has no puzzles."""
+    assert PuzzleBank(tmp_path, sample_settings).draw() is None
+
+
+def test_draw_drains_bank_across_sessions(tmp_path: Path, sample_settings: DifficultyData) -> None:
+    """Draw every puzzle once, in a shuffled order kept by the cursor file, then report the bank drained."""
+    middle_words = ["rat", "tar", "art", "tea", "eat"]
+    bank = PuzzleBank(tmp_path, sample_settings)
+    bank.extend(
+        BankedPuzzle(seed=seed, middle_word=word, placements=[(word, (5, 10), "D")])
+        for seed, word in enumerate(middle_words)
+    )
+
+    drawn = [bank.draw(random.Random(0)) for _ in range(2)]
+    reopened_bank = PuzzleBank(tmp_path, sample_settings)
+    assert reopened_bank.remaining() == 3
+    drawn += [reopened_bank.draw() for _ in range(3)]
+
+    assert sorted(puzzle.middle_word for puzzle in drawn) == sorted(middle_words)
+    assert reopened_bank.remaining() == 0
+    assert reopened_bank.draw() is None
+
+    reopened_bank.extend([BankedPuzzle(seed=9, middle_word="ate", placements=[("ate", (5, 10), "D")])])
+    assert reopened_bank.remaining() == 1
+    assert reopened_bank.draw().middle_word == "ate"
+    assert reopened_bank.draw() is None
+
+
+def test_draw_position_visits_every_puzzle_once() -> None:
+    """Map the draws onto every position exactly once, for any bank size and seed."""
+    for shuffled_count in (1, 2, 6, 97, 100):
+        for order_seed in range(5):
+            positions = [
+                puzzle_bank.get_draw_position(order_seed, shuffled_count, drawn) for drawn in range(shuffled_count)
+            ]
+            assert sorted(positions) == list(range(shuffled_count))
+
+
+def test_draw_waits_for_cursor_lock(tmp_path: Path, sample_settings: DifficultyData) -> None:
+    """Draw nothing, and leave the cursor alone, while another game holds the cursor's lock."""
+    bank = PuzzleBank(tmp_path, sample_settings)
+    bank.extend([BankedPuzzle(seed=0, middle_word="rat", placements=[("rat", (5, 10), "D")])])
+
+    with patch("setup.puzzle_bank.file_lock", side_effect=TimeoutError) as mock_lock:
+        assert bank.draw() is None
+    mock_lock.assert_called_once_with(bank.cursor_path)
+    assert bank.remaining() == 1
+
+
+def test_draw_rebuilds_generated_puzzle(tmp_path: Path, sample_settings: DifficultyData) -> None:
+    """Rebuild the exact grid and coordinates of a generated puzzle from its banked form."""
+    lexicon = compile_lexicon(SAMPLE_WORDS)
+    banked_puzzle = puzzle_bank.generate_banked_puzzle(sample_settings, seed=3, lexicon=lexicon)
+    assert banked_puzzle is not None
+    bank = PuzzleBank(tmp_path, sample_settings)
+    bank.extend([banked_puzzle])
+
+    puzzle = bank.draw(random.Random(0))
+
+    regenerated = seeded_puzzles.build_seeded_puzzle(sample_settings, lexicon, random.Random(3))
+    assert isinstance(puzzle, Puzzle)
+    assert regenerated is not None
+    assert puzzle == regenerated
+
+
+@patch("setup.seeded_puzzles.build_puzzle_with_reason", return_value=(None, "No word list could be selected."))
+def test_generate_banked_puzzle_gives_up(mock_build: object, sample_settings: DifficultyData) -> None:
+    """Skip a seed after MAX_ATTEMPTS_PER_PUZZLE failed attempts."""
+    lexicon = compile_lexicon(SAMPLE_WORDS)
+
+    assert puzzle_bank.generate_banked_puzzle(sample_settings, seed=0, lexicon=lexicon) is None
+    assert mock_build.call_count == seeded_puzzles.MAX_ATTEMPTS_PER_PUZZLE
+
+
+def test_fill_bank_sequential(tmp_path: Path, sample_settings: DifficultyData) -> None:
+    """Append one puzzle per seed that could be generated."""
+    lexicon = compile_lexicon(SAMPLE_WORDS)
+    bank = PuzzleBank(tmp_path, sample_settings)
+
+    appended = puzzle_bank.fill_bank(bank, "unused.txt", lexicon, count=3, workers=1, seeds=[1, 2, 3])
+
+    assert appended == len(bank) == 3
+    assert [bank.read(i).seed for i in range(3)] == [1, 2, 3]
+
+
+@patch("setup.puzzle_bank.fill_bank", return_value=2)
+@patch("setup.puzzle_bank.load_lexicon")
+def test_main_fills_chosen_difficulty(mock_load: object, mock_fill: object, tmp_path: Path) -> None:
+    """Fill only the chosen difficulty, with consecutive seeds when a seed is given."""
+    lexicon_path = tmp_path / "words.txt"
+    lexicon_path.write_text("streak\n", encoding="utf-8")
+    mock_load.return_value = compile_lexicon(SAMPLE_WORDS)
+
+    with patch("setup.puzzle_bank.describe_unsupported_settings", return_value=None):
+        puzzle_bank.main([str(lexicon_path), "--difficulty", "Spellbook", "--count", "2", "--seed", "7"])
+
+    mock_fill.assert_called_once()
+    bank, _, _, count, _, seeds = mock_fill.call_args.args
+    assert bank.difficulty_conf == puzzle_bank.HEART_POINTS_SETTINGS["Spellbook"]
+    assert count == 2
+    assert seeds == [7, 8]
+
+
+def test_describe_unbankable_settings(sample_settings: DifficultyData) -> None:
+    """Refuse grids whose rows or columns do not fit in a placement's one-byte fields."""
+    assert puzzle_bank.describe_unbankable_settings(sample_settings) is None
+
+    wide_settings = replace(sample_settings, grid=GridConfigData(height=15, width=puzzle_bank.MAX_BANK_GRID_SIZE + 1))
+
+    assert "larger than the bank can store" in puzzle_bank.describe_unbankable_settings(wide_settings)
+
+
+@patch("setup.puzzle_bank.fill_bank")
+@patch("setup.puzzle_bank.load_lexicon")
+def test_main_skips_unbankable_difficulty(
+    mock_load: object,
+    mock_fill: object,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Skip a difficulty whose grid is too large for the bank, before generating any puzzle."""
+    lexicon_path = tmp_path / "words.txt"
+    lexicon_path.write_text("streak\n", encoding="utf-8")
+    mock_load.return_value = compile_lexicon(SAMPLE_WORDS)
+    wide_settings = replace(
+        puzzle_bank.HEART_POINTS_SETTINGS["Spellbook"],
+        grid=GridConfigData(height=puzzle_bank.MAX_BANK_GRID_SIZE + 1, width=25),
+    )
+
+    with patch.dict(puzzle_bank.HEART_POINTS_SETTINGS, {"Spellbook": wide_settings}):
+        puzzle_bank.main([str(lexicon_path), "--difficulty", "Spellbook"])
+
+    mock_fill.assert_not_called()
+    assert "Skipping Spellbook" in capsys.readouterr().err
+
+
+@patch("setup.puzzle_bank.load_lexicon", return_value=None)
+def test_main_missing_lexicon(mock_load: object) -> None:
+    """Exit with an error when the lexicon cannot be loaded."""
+    with pytest.raises(SystemExit):
+        puzzle_bank.main(["missing.txt"])
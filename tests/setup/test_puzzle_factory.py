@@ -0,0 +1,232 @@
+# ************************************************
+# Tests for: Puzzle Factory
+# ************************************************
+import os
+import subprocess  # noqa: S404
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from data.settings_details import DifficultyData, GridConfigData, WordsNeededData
+from setup import puzzle_factory
+from setup.lexicon import compile_lexicon
+from setup.puzzle_factory import Puzzle, PuzzleFactory
+
+SAMPLE_GRID = [["s", "t"], ["r", "a"]]
+SAMPLE_WORDS_TO_FIND = {"streak": [(0, 0)], "rat": [(1, 0)]}
+
+
+@pytest.fixture
+def sample_settings() -> DifficultyData:
+    """Create a sample DifficultyData object for tests.
+
+    Returns:
+        DifficultyData: A sample settings object for testing.
+
+    """
+    return DifficultyData(
+        grid=GridConfigData(height=10, width=10),
+        words_on_board_needed=WordsNeededData(minimum=3, maximum=50),
+        max_word_length=6,
+        min_subword_length=3,
+        heart_point_mode=True,
+    )
+
+
+@pytest.fixture
+def sample_puzzle() -> Puzzle:
+    """Create a sample generated puzzle.
+
+    Returns:
+        Puzzle: A sample puzzle for testing.
+
+    """
+    return Puzzle(middle_word="streak", words_to_find=SAMPLE_WORDS_TO_FIND, final_grid=SAMPLE_GRID)
+
+
+@patch("setup.puzzle_factory.generate_board_with_reason")
+@patch("setup.puzzle_factory.select_word_list")
+def test_build_puzzle_success(
+    mock_select: object,
+    mock_gen_board: object,
+    sample_settings: DifficultyData,
+) -> None:
+    """Build a puzzle from a selected word list and a generated board."""
+    mock_select.return_value = ("streak", ["rat", "stare"])
+    mock_gen_board.return_value = (SAMPLE_GRID, SAMPLE_WORDS_TO_FIND, None)
+    lexicon = compile_lexicon(["streak", "rat", "stare"])
+
+    puzzle = puzzle_factory.build_puzzle(sample_settings, lexicon)
+
+    assert puzzle == Puzzle("streak", SAMPLE_WORDS_TO_FIND, SAMPLE_GRID)
+    mock_gen_board.assert_called_once_with(
+        sample_settings,
+        "streak",
+        ["rat", "stare"],
+        rng=None,
+        should_stop=None,
+    )
+
+
+@patch("setup.puzzle_factory.generate_board_with_reason")
+@patch("setup.puzzle_factory.select_word_list")
+def test_build_puzzle_failures(
+    mock_select: object,
+    mock_gen_board: object,
+    sample_settings: DifficultyData,
+) -> None:
+    """Return None, and say why, when either the word list or the board cannot be generated."""
+    lexicon = compile_lexicon(["streak", "rat", "stare"])
+
+    mock_select.return_value = (None, None)
+    assert puzzle_factory.build_puzzle(sample_settings, lexicon) is None
+    assert puzzle_factory.build_puzzle_with_reason(sample_settings, lexicon) == (
+        None,
+        "No word list could be selected.",
+    )
+    mock_gen_board.assert_not_called()
+
+    mock_select.return_value = ("streak", ["rat", "stare"])
+    mock_gen_board.return_value = (None, None, "Placed 1 of the 2 words needed.")
+    assert puzzle_factory.build_puzzle(sample_settings, lexicon) is None
+    assert puzzle_factory.build_puzzle_with_reason(sample_settings, lexicon) == (
+        None,
+        "Placed 1 of the 2 words needed.",
+    )
+
+
+SEEDED_PUZZLE_SCRIPT = """
+import random
+from data.settings_details import DifficultyData, GridConfigData, WordsNeededData
+from setup.lexicon import compile_lexicon
+from setup.puzzle_factory import build_puzzle
+
+words = "streak rat stare arks rate stark ear rest steak east sat take era sear takes erst seat tar est skate"
+settings = DifficultyData(
+    grid=GridConfigData(height=15, width=25),
+    words_on_board_needed=WordsNeededData(minimum=4, maximum=10),
+    max_word_length=6,
+    min_subword_length=3,
+)
+print(build_puzzle(settings, compile_lexicon(words.split()), rng=random.Random(5)))
+"""
+
+
+def test_build_puzzle_seeded_across_processes() -> None:
+    """Build the same puzzle from the same seed in processes with different string hashing."""
+    outputs = []
+    for hash_seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", SEEDED_PUZZLE_SCRIPT],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        outputs.append(result.stdout)
+
+    assert outputs[0].startswith("Puzzle(")
+    assert outputs[0] == outputs[1]
+
+
+@patch("setup.puzzle_factory.build_puzzle")
+def test_factory_fills_queue_in_background(
+    mock_build: object,
+    sample_settings: DifficultyData,
+    sample_puzzle: Puzzle,
+) -> None:
+    """Keep the queue filled with puzzles until the factory is stopped."""
+    mock_build.return_value = sample_puzzle
+    factory = PuzzleFactory(sample_settings, compile_lexicon(["streak"]), queue_size=2)
+
+    factory.start()
+    try:
+        assert factory.get_puzzle(timeout=2) is sample_puzzle
+        assert factory.get_puzzle(timeout=2) is sample_puzzle
+        assert factory.is_running
+    finally:
+        factory.stop(timeout=2)
+
+    assert not factory.is_running
+
+
+@patch("setup.puzzle_factory.build_puzzle")
+def test_factory_start_is_idempotent(
+    mock_build: object,
+    sample_settings: DifficultyData,
+    sample_puzzle: Puzzle,
+) -> None:
+    """Starting an already running factory does not spawn a second worker."""
+    mock_build.return_value = sample_puzzle
+    factory = PuzzleFactory(sample_settings, compile_lexicon(["streak"]), queue_size=1)
+
+    factory.start()
+    try:
+        first_worker = factory._worker  # noqa: SLF001
+        factory.start()
+        assert factory._worker is first_worker  # noqa: SLF001
+    finally:
+        factory.stop(timeout=2)
+
+
+@patch("setup.puzzle_factory.generate_board_with_reason")
+@patch("setup.puzzle_factory.select_word_list")
+def test_factory_stop_interrupts_board_generation(
+    mock_select: object,
+    mock_gen_board: object,
+    sample_settings: DifficultyData,
+) -> None:
+    """Abandon the board being built when stopped, using the factory's own random generator."""
+    mock_select.return_value = ("streak", ["rat", "stare"])
+    board_started = threading.Event()
+
+    def generate_until_stopped(*args: object, rng: object, should_stop: object) -> tuple[None, None, str]:
+        """Block like a slow board until the stop callback fires.
+
+        Returns:
+            tuple[None, None, str]: The result of an abandoned board.
+
+        """
+        board_started.set()
+        while not should_stop():
+            time.sleep(0.01)
+        return None, None, "Stopped before the board was finished."
+
+    mock_gen_board.side_effect = generate_until_stopped
+    factory = PuzzleFactory(sample_settings, compile_lexicon(["streak"]))
+
+    factory.start()
+    assert board_started.wait(timeout=2)
+    factory.stop(timeout=2)
+
+    assert not factory.is_running
+    assert mock_gen_board.call_args.kwargs["rng"] is factory._rng  # noqa: SLF001
+    assert mock_select.call_args.kwargs["rng"] is factory._rng  # noqa: SLF001
+
+
+@patch("setup.puzzle_factory.build_puzzle", return_value=None)
+def test_factory_gives_up_after_consecutive_failures(
+    mock_build: object,
+    sample_settings: DifficultyData,
+) -> None:
+    """Stop the worker after too many failed attempts in a row, without waiting on get_puzzle."""
+    factory = PuzzleFactory(sample_settings, compile_lexicon(["streak"]))
+
+    factory.start()
+    factory._worker.join(timeout=2)  # noqa: SLF001
+
+    assert not factory.is_running
+    assert mock_build.call_count == puzzle_factory.MAX_CONSECUTIVE_FAILURES
+    assert factory.get_puzzle(timeout=5) is None
+
+
+def test_get_puzzle_without_worker_returns_immediately(sample_settings: DifficultyData) -> None:
+    """Return None right away when nothing is ready and no worker is running."""
+    factory = PuzzleFactory(sample_settings, compile_lexicon(["streak"]))
+
+    assert factory.get_puzzle(timeout=5) is None
+    assert factory.ready_count == 0
@@ -0,0 +1,91 @@
+# ************************************************
+# Tests for: Seeded Puzzle Generation
+# ************************************************
+import argparse
+import random
+from unittest.mock import patch
+
+import pytest
+
+from data.settings_details import DifficultyData, GridConfigData, WordsNeededData
+from setup import seeded_puzzles
+from setup.lexicon import compile_lexicon
+from setup.puzzle_factory import Puzzle
+
+SAMPLE_WORDS = ["streak", "stare", "tears", "rates", "taker", "skate", "steak", "rake", "take", "star", "rat", "tea"]
+SAMPLE_PUZZLE = Puzzle(middle_word="streak", words_to_find={}, final_grid=[["s"]])
+
+
+@pytest.fixture
+def sample_settings() -> DifficultyData:
+    """Create a sample DifficultyData object for tests.
+
+    Returns:
+        DifficultyData: A sample settings object for testing.
+
+    """
+    return DifficultyData(
+        grid=GridConfigData(height=15, width=25),
+        words_on_board_needed=WordsNeededData(minimum=4, maximum=10),
+        max_word_length=6,
+        min_subword_length=3,
+    )
+
+
+@patch("setup.seeded_puzzles.build_puzzle_with_reason")
+def test_iter_puzzle_attempts_stops_at_success(mock_build: object, sample_settings: DifficultyData) -> None:
+    """Yield each failed attempt with its reason, then the first puzzle, and nothing after it."""
+    mock_build.side_effect = [(None, "No word list could be selected."), (SAMPLE_PUZZLE, None), (SAMPLE_PUZZLE, None)]
+    rng = random.Random(0)
+
+    attempts = list(seeded_puzzles.iter_puzzle_attempts(sample_settings, compile_lexicon([]), rng))
+
+    assert attempts == [(None, "No word list could be selected."), (SAMPLE_PUZZLE, None)]
+    assert all(call.kwargs["rng"] is rng for call in mock_build.call_args_list)
+
+
+@patch("setup.seeded_puzzles.build_puzzle_with_reason", return_value=(None, "No word list could be selected."))
+def test_build_seeded_puzzle_gives_up(mock_build: object, sample_settings: DifficultyData) -> None:
+    """Return None after MAX_ATTEMPTS_PER_PUZZLE failed attempts."""
+    assert seeded_puzzles.build_seeded_puzzle(sample_settings, compile_lexicon([]), random.Random(0)) is None
+    assert mock_build.call_count == seeded_puzzles.MAX_ATTEMPTS_PER_PUZZLE
+
+
+def test_build_seeded_puzzle_is_reproducible(sample_settings: DifficultyData) -> None:
+    """Build the same puzzle from the same seed."""
+    lexicon = compile_lexicon(SAMPLE_WORDS)
+
+    first = seeded_puzzles.build_seeded_puzzle(sample_settings, lexicon, random.Random(5))
+    second = seeded_puzzles.build_seeded_puzzle(sample_settings, lexicon, random.Random(5))
+
+    assert first is not None
+    assert first == second
+
+
+@patch("setup.seeded_puzzles.load_lexicon")
+def test_worker_lexicon(mock_load: object) -> None:
+    """Prefer the caller's lexicon, and fall back to the one loaded by the worker initializer."""
+    caller_lexicon = compile_lexicon(["rat"])
+    mock_load.return_value = compile_lexicon(SAMPLE_WORDS)
+
+    with patch("setup.seeded_puzzles._worker_lexicon", None):
+        assert seeded_puzzles.get_worker_lexicon() is None
+        seeded_puzzles.init_lexicon_worker("words.txt")
+        assert seeded_puzzles.get_worker_lexicon() is mock_load.return_value
+        assert seeded_puzzles.get_worker_lexicon(caller_lexicon) is caller_lexicon
+
+    mock_load.assert_called_once_with("words.txt")
+
+
+def test_add_batch_arguments() -> None:
+    """Parse the shared difficulty, worker and seed options."""
+    parser = argparse.ArgumentParser()
+    seeded_puzzles.add_batch_arguments(parser)
+
+    args = parser.parse_args(["--difficulty", "Spellbook", "--workers", "2", "--seed", "7"])
+    defaults = parser.parse_args([])
+
+    assert (args.difficulty, args.workers, args.seed) == (["Spellbook"], 2, 7)
+    assert defaults.difficulty is None
+    assert defaults.seed is None
+    assert defaults.workers >= 1
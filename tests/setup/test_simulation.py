@@ -0,0 +1,123 @@
+# ************************************************
+# Tests for: Bot Simulation
+# ************************************************
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from data.settings_details import DifficultyData, GridConfigData, WordsNeededData
+from data.wizards_details import WIZARDS_DATA
+from gameplay.bot_simulation import WizardTally
+from setup import seeded_puzzles, simulation
+from setup.lexicon import compile_lexicon
+
+SAMPLE_WORDS = ["streak", "stare", "tears", "rates", "taker", "skate", "steak", "rake", "take", "star", "rat", "tea"]
+
+
+@pytest.fixture
+def sample_settings() -> DifficultyData:
+    """Create a sample DifficultyData object for tests.
+
+    Returns:
+        DifficultyData: A sample settings object for testing.
+
+    """
+    return DifficultyData(
+        grid=GridConfigData(height=15, width=25),
+        words_on_board_needed=WordsNeededData(minimum=4, maximum=10),
+        max_word_length=6,
+        min_subword_length=3,
+        heart_point_mode=True,
+    )
+
+
+def test_get_candidate_words_cover_the_board(sample_settings: DifficultyData) -> None:
+    """List the middle word and all its subwords, including every word on the board."""
+    lexicon = compile_lexicon(SAMPLE_WORDS)
+
+    candidates = simulation.get_candidate_words(sample_settings, lexicon, "streak")
+
+    assert candidates[0] == "streak"
+    assert set(candidates) == set(SAMPLE_WORDS)
+
+
+def test_simulate_puzzle_perfect_bot_always_wins(sample_settings: DifficultyData) -> None:
+    """Play every wizard on the seeded puzzle, and win every game with the perfect bot."""
+    lexicon = compile_lexicon(SAMPLE_WORDS)
+
+    tallies = simulation.simulate_puzzle(sample_settings, "perfect", 3, seed=5, lexicon=lexicon)
+
+    assert tallies is not None
+    assert list(tallies) == [wizard.name for wizard in WIZARDS_DATA]
+    assert all(tally.games == tally.wins == 3 for tally in tallies.values())
+
+
+def test_simulate_puzzle_is_reproducible(sample_settings: DifficultyData) -> None:
+    """Give the same tallies for the same seed."""
+    lexicon = compile_lexicon(SAMPLE_WORDS)
+
+    first = simulation.simulate_puzzle(sample_settings, "powerup", 4, seed=9, lexicon=lexicon)
+    second = simulation.simulate_puzzle(sample_settings, "powerup", 4, seed=9, lexicon=lexicon)
+
+    assert first == second
+
+
+@patch("setup.seeded_puzzles.build_puzzle_with_reason", return_value=(None, "No word list could be selected."))
+def test_simulate_puzzle_gives_up(mock_build: object, sample_settings: DifficultyData) -> None:
+    """Skip a seed after MAX_ATTEMPTS_PER_PUZZLE failed attempts."""
+    lexicon = compile_lexicon(SAMPLE_WORDS)
+
+    assert simulation.simulate_puzzle(sample_settings, "perfect", 1, seed=0, lexicon=lexicon) is None
+    assert mock_build.call_count == seeded_puzzles.MAX_ATTEMPTS_PER_PUZZLE
+
+
+def test_run_simulation_sequential(sample_settings: DifficultyData) -> None:
+    """Add up the games of every puzzle, for every wizard."""
+    lexicon = compile_lexicon(SAMPLE_WORDS)
+
+    totals, puzzles_played = simulation.run_simulation(
+        sample_settings,
+        "unused.txt",
+        lexicon,
+        "random",
+        games_per_wizard=2,
+        seeds=[1, 2, 3],
+        workers=1,
+    )
+
+    assert puzzles_played == 3
+    assert all(tally.games == 6 for tally in totals.values())
+
+
+@patch("setup.simulation.run_simulation")
+@patch("setup.simulation.load_lexicon")
+def test_main_reports_win_rates(
+    mock_load: object,
+    mock_run: object,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Print a win rate per wizard and write the tallies to the output file."""
+    mock_load.return_value = compile_lexicon(SAMPLE_WORDS)
+    mock_run.return_value = ({"Oldspella": WizardTally(games=4, wins=1, turns=40, points=80)}, 2)
+    output_path = tmp_path / "simulation.json"
+
+    with patch("setup.simulation.describe_unsupported_settings", return_value=None):
+        simulation.main(
+            ["words.txt", "--difficulty", "Spellbook", "--puzzles", "2", "--seed", "7", "--output", str(output_path)],
+        )
+
+    seeds = mock_run.call_args.args[5]
+    assert seeds == [7, 8]
+    assert "25.0%" in capsys.readouterr().out
+    results = json.loads(output_path.read_text(encoding="utf-8"))
+    assert results["results"]["Spellbook"]["Oldspella"]["wins"] == 1
+
+
+@patch("setup.simulation.load_lexicon", return_value=None)
+def test_main_missing_lexicon(mock_load: object) -> None:
+    """Exit with an error when the lexicon cannot be loaded."""
+    with pytest.raises(SystemExit):
+        simulation.main(["missing.txt"])
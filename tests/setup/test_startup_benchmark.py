@@ -0,0 +1,52 @@
+# ************************************************
+# Tests for: Startup Benchmark
+# ************************************************
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from setup import startup_benchmark
+from setup.startup_benchmark import ImportTiming
+
+SAMPLE_IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | site
+import time:        50 |         50 |     rich.text
+import time:       200 |        250 |   rich
+not an import line
+import time:      1000 |       1250 | gameplay.gameplay
+"""
+WORDERLY_SCRIPT = Path(__file__).resolve().parents[2] / "worderly.py"
+
+
+def test_parse_importtime() -> None:
+    """Read the module, times and nesting of each import line, skipping other lines."""
+    timings = startup_benchmark.parse_importtime(SAMPLE_IMPORTTIME)
+
+    assert [timing.module for timing in timings] == ["_io", "site", "rich.text", "rich", "gameplay.gameplay"]
+    assert timings[2] == ImportTiming("rich.text", 50, 50, 2)
+    assert timings[4] == ImportTiming("gameplay.gameplay", 1000, 1250, 0)
+
+
+@patch("setup.startup_benchmark.measure_startup")
+def test_run_startup_benchmark_reports_medians(mock_measure: object) -> None:
+    """Report the median import and wall times, the deferred modules and the slowest top-level imports."""
+    timings = startup_benchmark.parse_importtime(SAMPLE_IMPORTTIME)
+    mock_measure.side_effect = [(timings, 0.5), (timings[:2], 0.1), (timings, 0.3)]
+
+    report = startup_benchmark.run_startup_benchmark("worderly.py", runs=3, top=1)
+
+    assert report.import_ms == pytest.approx(1.67)
+    assert report.wall_ms == pytest.approx(300.0)
+    assert report.deferred_loaded == {"rich": True, "getkey": False}
+    assert report.slowest_imports == [("gameplay.gameplay", 1.25)]
+
+
+def test_game_startup_defers_rich_and_getkey() -> None:
+    """Start the game without importing Rich or getkey."""
+    timings, _ = startup_benchmark.measure_startup(str(WORDERLY_SCRIPT))
+
+    loaded_modules = {timing.module for timing in timings}
+    assert "gameplay.gameplay" in loaded_modules
+    assert not loaded_modules & set(startup_benchmark.DEFERRED_MODULES)
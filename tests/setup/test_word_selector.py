@@ -2,12 +2,15 @@
 # Tests for: Word Selector
 # ************************************************
 import itertools
-from unittest.mock import mock_open, patch
+import operator
+import random
+from unittest.mock import patch
 
 import pytest
 
 from data.settings_details import DifficultyData, GridConfigData, WordsNeededData
 from setup import word_selector
+from setup.lexicon import build_signature_index, compile_lexicon
 
 
 @pytest.fixture
@@ -53,50 +56,6 @@ def streak_word_set() -> set[str]:
     return set(words_streak.lower().split())
 
 
-def test_read_word_file_not_found() -> None:
-    """Test that read_word_file returns [] and prints error when file is missing."""
-    with (
-        patch("setup.word_selector.open", side_effect=FileNotFoundError) as mock_open_func,
-        patch("builtins.print") as mock_print,
-    ):
-        result = word_selector.read_word_file("non_existent_file.txt")
-        assert result == []
-        mock_open_func.assert_called_once_with("non_existent_file.txt", encoding="utf-8")
-        mock_print.assert_called_once()
-        assert "Error: File non_existent_file.txt not found." in mock_print.call_args[0][0]
-
-
-def test_read_word_file_io_error() -> None:
-    """Test that read_word_file returns [] and prints error on IOError."""
-    with (
-        patch("setup.word_selector.open", side_effect=OSError("Permission denied")) as mock_open_func,
-        patch("builtins.print") as mock_print,
-    ):
-        result = word_selector.read_word_file("some_file.txt")
-        assert result == []
-        mock_open_func.assert_called_once_with("some_file.txt", encoding="utf-8")
-        mock_print.assert_called_once()
-        assert "Error reading file some_file.txt: Permission denied" in mock_print.call_args[0][0]
-
-
-def test_read_word_file_empty() -> None:
-    """Test that read_word_file returns [] for an empty file."""
-    with patch("builtins.open", mock_open(read_data="")) as mock_file:
-        result = word_selector.read_word_file("empty.txt")
-        assert result == []
-        mock_file.assert_called_once_with("empty.txt", encoding="utf-8")
-
-
-def test_read_word_file_valid() -> None:
-    """Test that read_word_file cleans and processes valid file content."""
-    file_content = " Apple \nbanana\n\nCherry\n   \ndate "
-    expected_result = ["apple", "banana", "cherry", "date"]
-    with patch("builtins.open", mock_open(read_data=file_content)) as mock_file:
-        result = word_selector.read_word_file("valid.txt")
-        assert result == expected_result
-        mock_file.assert_called_once_with("valid.txt", encoding="utf-8")
-
-
 def test_filter_exact_length_words(simple_word_list: list[str]) -> None:
     """Filter words to find only those of an exact length."""
     words = simple_word_list
@@ -157,6 +116,25 @@ def test_get_valid_word_subwords_none_found(
     assert actual_subwords == []
 
 
+def test_get_valid_word_subwords_with_signature_index(
+    streak_word_set: set[str],
+) -> None:
+    """Find the same subwords when a precomputed signature index is given."""
+    word_to_check = "streak"
+    signature_index = build_signature_index(streak_word_set)
+
+    without_index = word_selector.get_valid_word_subwords(word_to_check, streak_word_set, 3)
+    with_index = word_selector.get_valid_word_subwords(
+        word_to_check,
+        streak_word_set,
+        3,
+        signature_index=signature_index,
+    )
+
+    assert sorted(with_index) == sorted(without_index)
+    assert len(with_index) == len(set(with_index))
+
+
 @patch("setup.word_selector.get_valid_word_subwords")
 @patch("setup.word_selector.random.shuffle")
 def test_find_valid_word_with_subwords_success(
@@ -175,6 +153,7 @@ def test_find_valid_word_with_subwords_success(
         word: str,
         valid_set: set[str],
         min_len: int,
+        signature_index: dict[str, list[str]] | None = None,
     ) -> list[str]:
         if word == "streak":
             return [
@@ -235,40 +214,37 @@ def test_find_valid_word_with_subwords_fail(
     mock_shuffle.assert_not_called()
 
 
-@patch("setup.word_selector.read_word_file")
 @patch("setup.word_selector.find_valid_word_with_subwords")
 @patch("setup.word_selector.clear_screen")
 @patch("setup.word_selector.print_message")
-@patch("setup.word_selector.random.shuffle")
+@patch("setup.word_selector.random.choice")
 def test_generate_word_list_success(  # noqa: PLR0913, PLR0917
-    mock_rnd_shuffle_exact: object,
+    mock_rnd_choice: object,
     mock_print: object,
     mock_clear: object,
     mock_find: object,
-    mock_read: object,
     sample_settings: DifficultyData,
     streak_word_set: set[str],
 ) -> None:
     """Test that generate_word_list successfully finds words."""
     settings: DifficultyData = sample_settings
-    lexicon_path: str = "dummy_lexicon.txt"
+    lexicon = compile_lexicon(list(streak_word_set))
 
-    mock_read.return_value = list(streak_word_set)
     expected_middle: str = "streak"
     expected_subs: list[str] = ["rat", "stare", "rate", "stark", "ear"]
+    mock_rnd_choice.side_effect = operator.itemgetter(0)
     mock_find.return_value = (expected_middle, expected_subs)
 
-    actual_middle, actual_subs = word_selector.generate_word_list(settings, lexicon_path)
+    actual_middle, actual_subs = word_selector.generate_word_list(settings, lexicon)
 
     assert actual_middle == expected_middle
     assert actual_subs == expected_subs
 
     mock_clear.assert_called_once()
     mock_print.assert_called_once()
-    mock_read.assert_called_once_with(lexicon_path)
     mock_find.assert_called_once()
 
-    args_find, _ = mock_find.call_args
+    args_find, kwargs_find = mock_find.call_args
     assert args_find[0] == ["streak"]
     assert args_find[1] == settings.min_subword_length
     assert args_find[2] == settings.words_on_board_needed.minimum
@@ -277,58 +253,85 @@ def test_generate_word_list_success(  # noqa: PLR0913, PLR0917
         settings.max_word_length,
     )
     assert args_find[3] == expected_valid_set
+    assert kwargs_find["signature_index"] is lexicon.signature_index
 
-    mock_rnd_shuffle_exact.assert_called_once_with(["streak"])
+    mock_rnd_choice.assert_called_once_with(lexicon.get_eligible_middle_words(settings))
 
 
-@patch("setup.word_selector.read_word_file")
 @patch("setup.word_selector.clear_screen")
 @patch("setup.word_selector.print_message")
-def test_generate_word_list_read_fail(
+def test_generate_word_list_no_candidates(
     mock_print: object,
     mock_clear: object,
-    mock_read: object,
     sample_settings: DifficultyData,
 ) -> None:
-    """Test that generate_word_list returns None when reading the lexicon fails."""
+    """Test that generate_word_list returns None when the lexicon has no word of the needed length."""
     settings: DifficultyData = sample_settings
-    lexicon_path: str = "dummy_lexicon.txt"
-    mock_read.return_value = []
+    lexicon = compile_lexicon(["cat", "dog", "bird"])
 
-    actual_middle, actual_subs = word_selector.generate_word_list(settings, lexicon_path)
+    with patch("builtins.print") as mock_builtin_print:
+        actual_middle, actual_subs = word_selector.generate_word_list(settings, lexicon)
 
     assert actual_middle is None
     assert actual_subs is None
     mock_clear.assert_called_once()
     mock_print.assert_called_once()
+    assert "no 6-letter words" in mock_builtin_print.call_args[0][0]
 
 
-@patch("setup.word_selector.read_word_file")
 @patch("setup.word_selector.find_valid_word_with_subwords")
 @patch("setup.word_selector.clear_screen")
 @patch("setup.word_selector.print_message")
-@patch("setup.word_selector.random.shuffle")
+@patch("setup.word_selector.random.choice")
 def test_generate_word_list_find_fail(  # noqa: PLR0913, PLR0917
-    mock_rnd_shuffle: object,
+    mock_rnd_choice: object,
     mock_print: object,
     mock_clear: object,
     mock_find: object,
-    mock_read: object,
     sample_settings: DifficultyData,
     streak_word_set: set[str],
 ) -> None:
     """Test that generate_word_list returns None when finding a suitable middle word fails."""
     settings: DifficultyData = sample_settings
-    lexicon_path: str = "dummy_lexicon.txt"
-    mock_read.return_value = list(streak_word_set)
+    lexicon = compile_lexicon(list(streak_word_set))
+    mock_rnd_choice.return_value = ("streak", 24)
     mock_find.return_value = (None, None)
 
-    actual_middle, actual_subs = word_selector.generate_word_list(settings, lexicon_path)
+    actual_middle, actual_subs = word_selector.generate_word_list(settings, lexicon)
 
     assert actual_middle is None
     assert actual_subs is None
     mock_clear.assert_called_once()
     mock_print.assert_called_once()
-    mock_read.assert_called_once()
     mock_find.assert_called_once()
-    mock_rnd_shuffle.assert_called_once()
+    mock_rnd_choice.assert_called_once()
+
+
+def test_describe_unsupported_settings(
+    sample_settings: DifficultyData,
+    streak_word_set: set[str],
+) -> None:
+    """Describe why a lexicon cannot satisfy the settings, or return None when it can."""
+    lexicon = compile_lexicon(list(streak_word_set))
+    assert word_selector.describe_unsupported_settings(sample_settings, lexicon) is None
+
+    demanding_settings = DifficultyData(
+        grid=sample_settings.grid,
+        words_on_board_needed=WordsNeededData(minimum=100, maximum=150),
+        max_word_length=6,
+        min_subword_length=3,
+    )
+    reason = word_selector.describe_unsupported_settings(demanding_settings, lexicon)
+    assert reason is not None
+    assert "at least 99 subwords" in reason
+
+
+def test_select_word_list_seeded(sample_settings: DifficultyData, streak_word_set: set[str]) -> None:
+    """Pick the same middle word and subword order for the same seed."""
+    lexicon = compile_lexicon(sorted(streak_word_set))
+
+    first = word_selector.select_word_list(sample_settings, lexicon, rng=random.Random(11))
+    second = word_selector.select_word_list(sample_settings, lexicon, rng=random.Random(11))
+
+    assert first[0] == "streak"
+    assert first == second
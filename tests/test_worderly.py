@@ -1,9 +1,14 @@
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 # Import the module to be tested
 import worderly
+from data.settings_details import HEART_POINTS_SETTINGS
+from setup.lexicon import compile_lexicon
+from setup.puzzle_bank import BankedPuzzle, PuzzleBank
+from setup.puzzle_factory import Puzzle, PuzzleFactory
 
 
 @pytest.fixture
@@ -22,17 +27,19 @@ def sample_settings() -> dict:
 # ************************************************
 
 
-PATCH_READ_WORD_FILE = "worderly.read_word_file"
+PATCH_LOAD_LEXICON = "worderly.load_lexicon"
 PATCH_GEN_WORD_LIST = "worderly.generate_word_list"
 PATCH_GEN_BOARD = "worderly.generate_board"
+PATCH_GEN_BOARD_PARALLEL = "worderly.generate_board_parallel"
 PATCH_RUN_HP_MENU = "worderly.run_heart_points_menu"
 PATCH_RUN_MAIN_MENU = "worderly.run_main_menu"  # Added
 PATCH_RUN_SETUP = "worderly.run_setup"
+PATCH_DESCRIBE_UNSUPPORTED = "worderly.describe_unsupported_settings"
 PATCH_INIT_PLAYER = "worderly.initialize_player_info"
 PATCH_RUN_GAME = "worderly.run_game"
 PATCH_CLEAR_SCREEN = "worderly.clear_screen"
 PATCH_PRINT = "builtins.print"  # For print calls within worderly.py
-PATCH_GET_LEXICON = "worderly.get_lexicon_file"  # For testing main
+PATCH_GET_LEXICON = "worderly.get_lexicon"  # For testing main
 
 # ************************************************
 # Tests For: Getting lexicon file
@@ -41,12 +48,12 @@ PATCH_GET_LEXICON = "worderly.get_lexicon_file"  # For testing main
 
 @patch("sys.argv", ["worderly.py"])  # Simulate no command-line argument
 @patch(PATCH_PRINT)
-def test_get_lexicon_file_no_arg(mock_print: object) -> None:
-    """Test get_lexicon_file when no filename argument is provided.
+def test_get_lexicon_no_arg(mock_print: object) -> None:
+    """Test get_lexicon when no filename argument is provided.
 
     Ensure function returns None and prints error messages.
     """
-    result = worderly.get_lexicon_file()
+    result = worderly.get_lexicon()
     assert result is None
     # Check that error messages were printed (to stderr, implicitly checked by print mock)
     assert mock_print.call_count == 2
@@ -55,17 +62,17 @@ def test_get_lexicon_file_no_arg(mock_print: object) -> None:
 
 @patch("sys.argv", ["worderly.py", "my_lexicon.txt"])
 @patch(
-    PATCH_READ_WORD_FILE,
-    return_value=[],
-)  # Simulate read returning empty list (failure)
+    PATCH_LOAD_LEXICON,
+    return_value=None,
+)  # Simulate load returning None (failure)
 @patch(PATCH_PRINT)
-def test_get_lexicon_file_read_fail(mock_print: object, mock_read: object) -> None:
-    """Test get_lexicon_file when read_word_file fails.
+def test_get_lexicon_read_fail(mock_print: object, mock_read: object) -> None:
+    """Test get_lexicon when load_lexicon fails.
 
     Ensure function returns None and prints error messages.
     """
     lexicon_path = "my_lexicon.txt"
-    result = worderly.get_lexicon_file()
+    result = worderly.get_lexicon()
     assert result is None
     mock_read.assert_called_once_with(lexicon_path)
     # Check that error messages were printed
@@ -74,19 +81,18 @@ def test_get_lexicon_file_read_fail(mock_print: object, mock_read: object) -> No
 
 
 @patch("sys.argv", ["worderly.py", "my_lexicon.txt"])
-@patch(
-    PATCH_READ_WORD_FILE,
-    return_value=["word1", "word2"],
-)  # Simulate successful read
+@patch(PATCH_LOAD_LEXICON)
 @patch(PATCH_PRINT)
-def test_get_lexicon_file_success(mock_print: object, mock_read: object) -> None:
-    """Test get_lexicon_file successful execution.
+def test_get_lexicon_success(mock_print: object, mock_read: object) -> None:
+    """Test get_lexicon successful execution.
 
-    Ensure function returns the lexicon path and does not print errors.
+    Ensure function returns the loaded lexicon and does not print errors.
     """
     lexicon_path = "my_lexicon.txt"
-    result = worderly.get_lexicon_file()
-    assert result == lexicon_path
+    loaded_lexicon = compile_lexicon(["word1", "word2"])
+    mock_read.return_value = loaded_lexicon
+    result = worderly.get_lexicon()
+    assert result is loaded_lexicon
     mock_read.assert_called_once_with(lexicon_path)
     mock_print.assert_not_called()  # No errors printed
 
@@ -95,7 +101,7 @@ def test_get_lexicon_file_success(mock_print: object, mock_read: object) -> None
 @patch(PATCH_GET_LEXICON, return_value=None)  # Simulate lexicon failure
 @patch(PATCH_RUN_HP_MENU)
 def test_main_exits_if_no_lexicon(mock_run_menu: object, mock_get_lex: object) -> None:
-    """Test that main returns if get_lexicon_file returns None.
+    """Test that main returns if get_lexicon returns None.
 
     Ensure main does not proceed to run_heart_points_menu.
     """
@@ -103,3 +109,196 @@ def test_main_exits_if_no_lexicon(mock_run_menu: object, mock_get_lex: object) -
 
     mock_get_lex.assert_called_once()
     mock_run_menu.assert_not_called()  # Should return before menu
+
+
+@patch("worderly.run_bank_command")
+@patch(PATCH_GET_LEXICON)
+def test_main_runs_bank_command(mock_get_lex: object, mock_bank_command: object) -> None:
+    """Test that "worderly.py bank ..." runs the puzzle bank command instead of the game."""
+    with patch("sys.argv", ["worderly.py", "bank", "words.txt", "--count", "5"]):
+        worderly.main()
+
+    mock_bank_command.assert_called_once_with(["words.txt", "--count", "5"])
+    mock_get_lex.assert_not_called()
+
+
+@patch("worderly.add_streak_entry", return_value=False)
+def test_save_streak_reports_unsaved_streak(mock_add: object, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that a streak the leaderboard could not save is reported instead of passed over."""
+    with patch.object(worderly, "CURRENT_SESSION_STREAK", worderly.SessionStreakState("Joel", 2, 40)):
+        assert not worderly._save_streak()  # noqa: SLF001
+
+    mock_add.assert_called_once_with(worderly.StreakEntry("Joel", 2, 40))
+    assert "Could not save the streak for Joel" in capsys.readouterr().out
+
+
+@patch("worderly.compact_streaks")
+@patch("worderly.get_bank_dir", return_value=None)
+@patch(PATCH_GET_LEXICON)
+@patch(PATCH_RUN_HP_MENU, return_value=None)
+@patch("worderly._run_game_session")
+def test_main_compacts_leaderboard_at_startup(
+    mock_session: object,
+    mock_run_menu: object,
+    mock_get_lex: object,
+    mock_get_bank_dir: object,
+    mock_compact: object,
+) -> None:
+    """Test that main merges the leaderboard journal before showing the menus."""
+    with patch("sys.argv", ["worderly.py", "words.txt"]):
+        worderly.main()
+
+    mock_compact.assert_called_once_with()
+    mock_session.assert_called_once()
+
+
+@patch("worderly.run_simulate_command")
+@patch(PATCH_GET_LEXICON)
+def test_main_runs_simulate_command(mock_get_lex: object, mock_simulate_command: object) -> None:
+    """Test that "worderly.py simulate ..." runs the bot simulation instead of the game."""
+    with patch("sys.argv", ["worderly.py", "simulate", "words.txt", "--bot", "perfect"]):
+        worderly.main()
+
+    mock_simulate_command.assert_called_once_with(["words.txt", "--bot", "perfect"])
+    mock_get_lex.assert_not_called()
+
+
+# ************************************************
+# Tests For: Running setup
+# ************************************************
+
+
+@patch(PATCH_LOAD_LEXICON)
+@patch(PATCH_GEN_BOARD)
+@patch(PATCH_GEN_WORD_LIST)
+@patch(PATCH_DESCRIBE_UNSUPPORTED, return_value=None)
+def test_run_setup_reuses_lexicon(
+    mock_describe: object,
+    mock_gen_words: object,
+    mock_gen_board: object,
+    mock_load: object,
+) -> None:
+    """Test that run_setup passes the same lexicon to every retry without reloading it."""
+    shared_lexicon = compile_lexicon(["streak", "stare", "rat"])
+    mock_gen_words.side_effect = [(None, None), ("streak", ["stare", "rat"])]
+    mock_gen_board.side_effect = [(None, None), ([["s"]], {"streak": [(0, 0)]})]
+
+    result = worderly.run_setup(HEART_POINTS_SETTINGS["Simple Scroll"], shared_lexicon)
+
+    assert result == ("streak", {"streak": [(0, 0)]}, [["s"]])
+    assert mock_gen_words.call_count == 2
+    for call in mock_gen_words.call_args_list:
+        assert call.args[1] is shared_lexicon
+    mock_load.assert_not_called()
+
+
+@patch(PATCH_GEN_WORD_LIST)
+def test_run_setup_fails_fast_when_unsupported(mock_gen_words: object) -> None:
+    """Test that run_setup gives up without retrying when the lexicon cannot satisfy the settings."""
+    small_lexicon = compile_lexicon(["streak", "stare", "rat"])
+
+    result = worderly.run_setup(HEART_POINTS_SETTINGS["Simple Scroll"], small_lexicon)
+
+    assert result is None
+    mock_gen_words.assert_not_called()
+
+
+@patch(PATCH_GEN_WORD_LIST)
+@patch(PATCH_DESCRIBE_UNSUPPORTED, return_value=None)
+def test_run_setup_uses_pregenerated_puzzle(mock_describe: object, mock_gen_words: object) -> None:
+    """Test that run_setup takes a ready puzzle from the factory instead of generating one live."""
+    settings = HEART_POINTS_SETTINGS["Simple Scroll"]
+    factory = PuzzleFactory(settings, compile_lexicon(["streak", "stare", "rat"]))
+    puzzle = Puzzle("streak", {"streak": [(0, 0)]}, [["s"]])
+
+    with patch.object(factory, "get_puzzle", return_value=puzzle) as mock_get_puzzle:
+        result = worderly.run_setup(settings, factory.lexicon, factory)
+
+    assert result == ("streak", {"streak": [(0, 0)]}, [["s"]])
+    mock_get_puzzle.assert_called_once_with(timeout=worderly.PUZZLE_WAIT_TIMEOUT)
+    mock_gen_words.assert_not_called()
+
+
+@patch(PATCH_GEN_BOARD)
+@patch(PATCH_GEN_WORD_LIST)
+@patch(PATCH_DESCRIBE_UNSUPPORTED, return_value=None)
+def test_run_setup_falls_back_when_factory_empty(
+    mock_describe: object,
+    mock_gen_words: object,
+    mock_gen_board: object,
+) -> None:
+    """Test that run_setup generates live when the factory has no puzzle ready."""
+    settings = HEART_POINTS_SETTINGS["Simple Scroll"]
+    factory = PuzzleFactory(settings, compile_lexicon(["streak", "stare", "rat"]))
+    mock_gen_words.return_value = ("streak", ["stare", "rat"])
+    mock_gen_board.return_value = ([["s"]], {"streak": [(0, 0)]})
+
+    result = worderly.run_setup(settings, factory.lexicon, factory)
+
+    assert result == ("streak", {"streak": [(0, 0)]}, [["s"]])
+    mock_gen_words.assert_called_once()
+
+
+@patch(PATCH_GEN_BOARD)
+@patch(PATCH_GEN_BOARD_PARALLEL)
+@patch(PATCH_GEN_WORD_LIST)
+@patch(PATCH_DESCRIBE_UNSUPPORTED, return_value=None)
+def test_run_setup_parallel_board_workers(
+    mock_describe: object,
+    mock_gen_words: object,
+    mock_gen_parallel: object,
+    mock_gen_board: object,
+) -> None:
+    """Test that run_setup hands the board attempts to the process pool when several workers are set."""
+    settings = HEART_POINTS_SETTINGS["The Great Bibliotheca"]
+    lexicon = compile_lexicon(["streak", "stare", "rat"])
+    mock_gen_words.side_effect = [("streak", ["stare"]), ("streak", ["stare", "rat"])]
+    mock_gen_parallel.side_effect = [(None, None), ([["s"]], {"streak": [(0, 0)]})]
+
+    result = worderly.run_setup(settings, lexicon, board_workers=8)
+
+    assert result == ("streak", {"streak": [(0, 0)]}, [["s"]])
+    assert mock_gen_parallel.call_count == 2
+    assert mock_gen_parallel.call_args.kwargs == {"attempts": 8, "max_workers": 8}
+    mock_gen_board.assert_not_called()
+
+
+@patch(PATCH_GEN_WORD_LIST)
+@patch(PATCH_DESCRIBE_UNSUPPORTED, return_value=None)
+def test_run_setup_draws_from_puzzle_bank(mock_describe: object, mock_gen_words: object, tmp_path: Path) -> None:
+    """Test that run_setup takes a banked puzzle before the factory or live generation."""
+    settings = HEART_POINTS_SETTINGS["Simple Scroll"]
+    bank = PuzzleBank(tmp_path, settings)
+    bank.extend([BankedPuzzle(seed=1, middle_word="rat", placements=[("rat", (5, 10), "D")])])
+    factory = PuzzleFactory(settings, compile_lexicon(["streak", "stare", "rat"]))
+
+    with patch.object(factory, "get_puzzle") as mock_get_puzzle:
+        result = worderly.run_setup(settings, factory.lexicon, factory, puzzle_bank=bank)
+
+    assert result is not None
+    middle_word, words_to_find, final_grid = result
+    assert middle_word == "rat"
+    assert words_to_find == {"rat": [(5, 10), (7, 12), (9, 14)]}
+    assert [final_grid[row][col] for row, col in words_to_find["rat"]] == ["R", "A", "T"]
+    mock_get_puzzle.assert_not_called()
+    mock_gen_words.assert_not_called()
+
+
+@patch(PATCH_GEN_BOARD)
+@patch(PATCH_GEN_WORD_LIST)
+@patch(PATCH_DESCRIBE_UNSUPPORTED, return_value=None)
+def test_run_setup_falls_back_when_bank_empty(
+    mock_describe: object,
+    mock_gen_words: object,
+    mock_gen_board: object,
+    tmp_path: Path,
+) -> None:
+    """Test that run_setup generates live when the puzzle bank is empty."""
+    settings = HEART_POINTS_SETTINGS["Simple Scroll"]
+    mock_gen_words.return_value = ("streak", ["stare", "rat"])
+    mock_gen_board.return_value = ([["s"]], {"streak": [(0, 0)]})
+
+    result = worderly.run_setup(settings, compile_lexicon(["streak"]), puzzle_bank=PuzzleBank(tmp_path, settings))
+
+    assert result == ("streak", {"streak": [(0, 0)]}, [["s"]])
+    mock_gen_words.assert_called_once()
@@ -0,0 +1,7 @@
+"""Test package for utils module in Worderly.
+
+This package contains unit tests for the helpers shared by the other packages.
+
+Modules:
+    test_file_lock: Tests for the cross-process file lock and retries with backoff.
+"""
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from utils import file_lock
+
+
+# ************************************************
+# Tests for: File Lock
+# ************************************************
+def test_get_lock_path(tmp_path: Path) -> None:
+    """Test that the lock file sits next to the file it guards."""
+    assert file_lock.get_lock_path(tmp_path / "bank.cursor") == tmp_path / "bank.cursor.lock"
+
+
+def test_lock_times_out(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that waiting for a lock held elsewhere gives up with a TimeoutError."""
+    monkeypatch.setattr(file_lock, "LOCK_TIMEOUT_SECONDS", 0.05)
+    monkeypatch.setattr(file_lock, "_try_lock", lambda _lock_file, **_kwargs: False)
+
+    with pytest.raises(TimeoutError, match="Timed out waiting for the lock"), file_lock.file_lock(tmp_path / "f"):
+        pass
+
+
+def test_shared_locks_exclude_writers(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that shared holders can stack, while an exclusive lock waits for them."""
+    monkeypatch.setattr(file_lock, "LOCK_TIMEOUT_SECONDS", 0.05)
+    guarded = tmp_path / "f"
+
+    with (
+        file_lock.file_lock(guarded, shared=True),
+        file_lock.file_lock(guarded, shared=True),
+        pytest.raises(TimeoutError),
+        file_lock.file_lock(guarded),
+    ):
+        pass
+    with file_lock.file_lock(guarded):
+        pass
+
+
+def test_retry_with_backoff() -> None:
+    """Test that an operation is retried until it succeeds, and given up after the timeout."""
+    results = iter([False, False, True])
+
+    assert file_lock.retry_with_backoff(lambda: next(results), timeout=1.0)
+    assert not file_lock.retry_with_backoff(lambda: False, timeout=0.01)
@@ -0,0 +1,7 @@
+"""Utilities package for Worderly.
+
+This package contains helpers shared by the other packages, with no game logic of their own.
+
+Modules:
+    file_lock: Cross-process file locks and retries with backoff.
+"""
@@ -0,0 +1,116 @@
+import random
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl, the lock falls back to msvcrt
+    fcntl = None
+    import msvcrt
+
+LOCK_SUFFIX = ".lock"  # Shared by processes reading the guarded file, held alone by those writing it
+LOCK_TIMEOUT_SECONDS = 10.0
+INITIAL_BACKOFF_SECONDS = 0.002
+MAX_BACKOFF_SECONDS = 0.1
+
+
+def get_lock_path(filepath: Path) -> Path:
+    """Return the path of the lock file guarding a file.
+
+    Args:
+        filepath (Path): The guarded file.
+
+    Returns:
+        Path: The lock file, next to the guarded file.
+
+    """
+    return filepath.with_name(filepath.name + LOCK_SUFFIX)
+
+
+def retry_with_backoff(attempt: Callable[[], bool], timeout: float) -> bool:
+    """Call an operation until it succeeds or the timeout runs out.
+
+    The sleep doubles after each failure, with jitter so that waiting processes do not retry in lockstep.
+
+    Args:
+        attempt (Callable[[], bool]): The operation, returning True once it succeeded.
+        timeout (float): Seconds to keep retrying for.
+
+    Returns:
+        bool: True if the operation succeeded, False if it timed out.
+
+    """
+    deadline = time.monotonic() + timeout
+    backoff = INITIAL_BACKOFF_SECONDS
+    while not attempt():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(backoff * random.uniform(0.5, 1.5))
+        backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+    return True
+
+
+def _try_lock(lock_file: IO[bytes], *, shared: bool = False) -> bool:
+    """Take the lock on an open lock file without waiting.
+
+    Args:
+        lock_file (IO[bytes]): The open lock file.
+        shared (bool): Whether to take a shared lock instead of an exclusive one.
+
+    Returns:
+        bool: True if the lock was taken, False if it is held elsewhere.
+
+    """
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+        else:  # msvcrt has no shared lock, readers take it exclusively
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(lock_file: IO[bytes]) -> None:
+    """Release the lock taken by _try_lock.
+
+    Args:
+        lock_file (IO[bytes]): The open lock file.
+
+    """
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(filepath: Path, *, shared: bool = False) -> Generator[None]:
+    """Hold the lock guarding a file, which readers passing shared=True can hold together.
+
+    Args:
+        filepath (Path): The guarded file. The lock is taken on a separate file next to it.
+        shared (bool): Whether to take a shared lock instead of an exclusive one.
+
+    Yields:
+        None: While the lock is held.
+
+    Raises:
+        TimeoutError: If the lock is still held elsewhere after LOCK_TIMEOUT_SECONDS.
+
+    """
+    lock_path = get_lock_path(filepath)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a+b") as lock_file:
+        if not retry_with_backoff(lambda: _try_lock(lock_file, shared=shared), LOCK_TIMEOUT_SECONDS):
+            msg = f"Timed out waiting for the lock {lock_path}."
+            raise TimeoutError(msg)
+        try:
+            yield
+        finally:
+            _unlock(lock_file)
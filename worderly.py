@@ -3,19 +3,30 @@
 # ****************
 import sys
 from dataclasses import dataclass
+from pathlib import Path
 
 from data.settings_details import NO_HEART_POINTS_SETTINGS, DifficultyData
 from display.display_utils import clear_screen
 from gameplay.gameplay import GameConfig, run_game
-from leaderboard.streak_handler import StreakEntry, add_streak_entry
+from leaderboard.streak_handler import StreakEntry, add_streak_entry, compact_streaks
 from setup.grid_generator.main_generator import generate_board
+from setup.grid_generator.parallel_generator import (
+    generate_board_parallel,
+    get_board_worker_count,
+    shutdown_board_worker_pools,
+)
+from setup.lexicon import Lexicon, load_lexicon
 from setup.menu_constants import EXIT_GAME_MARKER
 from setup.menus import (
     initialize_player_info,
     run_heart_points_menu,
     run_main_menu,
 )
-from setup.word_selector import generate_word_list, read_word_file
+from setup.puzzle_bank import PuzzleBank, get_bank_dir
+from setup.puzzle_bank import main as run_bank_command
+from setup.puzzle_factory import PuzzleFactory
+from setup.simulation import main as run_simulate_command
+from setup.word_selector import describe_unsupported_settings, generate_word_list
 
 
 @dataclass
@@ -46,13 +57,18 @@ class SessionStreakState:
 CURRENT_SESSION_STREAK = SessionStreakState()
 MAX_SETUP_RETRIES = 5  # Maximum number of attempts to generate words and board
 MAX_GRID_SETUP_RETRIES = 5  # Maximum number of attempts to generate board
+PUZZLE_WAIT_TIMEOUT = 5.0  # Seconds to wait on a puzzle the background factory is still building
+BANK_COMMAND = "bank"  # First argument that runs the puzzle bank command instead of the game
+SIMULATE_COMMAND = "simulate"  # First argument that runs headless bot games instead of the game
+
 
+def get_lexicon() -> Lexicon | None:
+    """Load the lexicon given in the command-line arguments.
 
-def get_lexicon_file() -> str | None:
-    """Retrieve and validate the lexicon file path from command-line arguments.
+    The lexicon is loaded once here and then shared by every setup attempt and round.
 
     Returns:
-        str | None: The path to the lexicon file if valid, otherwise None.
+        Lexicon | None: The compiled lexicon if the file is valid, otherwise None.
 
     """
     if len(sys.argv) < 2:
@@ -61,62 +77,137 @@ def get_lexicon_file() -> str | None:
         return None
 
     lexicon_file_path = sys.argv[1]
-    if not read_word_file(lexicon_file_path):
+    lexicon = load_lexicon(lexicon_file_path)
+    if lexicon is None:
         print("Lexicon file reading failed, or file is empty!", file=sys.stderr)
         print("Please recheck your file.", file=sys.stderr)
         return None
     else:
-        return lexicon_file_path
+        return lexicon
+
+
+def _generate_board_for_word_list(
+    difficulty_config: DifficultyData,
+    middle_word: str,
+    words_to_place: list[str],
+    board_workers: int,
+) -> tuple[list | None, dict | None]:
+    """Try to build a board for one word list, sequentially or across a process pool.
+
+    Args:
+        difficulty_config (DifficultyData): The difficulty settings for the game.
+        middle_word (str): The diagonal middle word.
+        words_to_place (list[str]): The subwords to place around the middle word.
+        board_workers (int): Number of board generation processes.
+
+    Returns:
+        tuple[list | None, dict | None]: (final_grid, words_to_find) on success, (None, None) on failure.
+
+    """
+    if board_workers > 1:
+        return generate_board_parallel(
+            difficulty_config,
+            middle_word,
+            words_to_place,
+            attempts=max(MAX_GRID_SETUP_RETRIES, board_workers),
+            max_workers=board_workers,
+        )
+
+    grid_setup_attempts = 0
+    while grid_setup_attempts < MAX_GRID_SETUP_RETRIES:
+        grid_setup_attempts += 1
+        final_grid, words_to_find = generate_board(
+            difficulty_config,
+            middle_word,
+            words_to_place,
+        )
+        if final_grid is None:
+            continue
+        return final_grid, words_to_find
+    return None, None
 
 
 def run_setup(
     difficulty_config: DifficultyData,
-    lexicon_file_path: str,
+    lexicon: Lexicon,
+    puzzle_factory: PuzzleFactory | None = None,
+    board_workers: int | None = None,
+    puzzle_bank: PuzzleBank | None = None,
 ) -> tuple[str, dict, list] | None:
     """Attempt to generate a valid word list and game board.
 
+    A puzzle is drawn from the puzzle bank until it is drained, then taken from the factory
+    when one is ready. Otherwise the word list and board are generated live. With more than one board worker, the
+    board attempts for each word list run in parallel and the first valid board wins.
+
     Args:
         difficulty_config (DifficultyData): The difficulty settings for the game.
-        lexicon_file_path (str): The path to the lexicon file.
+        lexicon (Lexicon): The compiled lexicon, shared across retries and rounds.
+        puzzle_factory (PuzzleFactory | None): Background generator for this difficulty, if any.
+        board_workers (int | None): Number of board generation processes. Defaults to get_board_worker_count().
+        puzzle_bank (PuzzleBank | None): Bank of pre-generated puzzles for this difficulty, if any.
 
     Returns:
         tuple[str, dict, list] | None: (middle_word, words_to_find, final_grid) on success, None on failure.
 
     """
+    if describe_unsupported_settings(difficulty_config, lexicon):
+        return None
+
+    if puzzle_bank is not None and puzzle_bank.difficulty_conf == difficulty_config:
+        puzzle = puzzle_bank.draw()
+        if puzzle is not None:
+            return puzzle.middle_word, puzzle.words_to_find, puzzle.final_grid
+
+    if puzzle_factory is not None and puzzle_factory.difficulty_conf == difficulty_config:
+        puzzle = puzzle_factory.get_puzzle(timeout=PUZZLE_WAIT_TIMEOUT)
+        if puzzle is not None:
+            return puzzle.middle_word, puzzle.words_to_find, puzzle.final_grid
+
+    if board_workers is None:
+        board_workers = get_board_worker_count()
+
     setup_attempts = 0
     while setup_attempts < MAX_SETUP_RETRIES:
         setup_attempts += 1
-        grid_setup_attempts = 0
 
-        middle_word, words_to_place = generate_word_list(difficulty_config, lexicon_file_path)
+        middle_word, words_to_place = generate_word_list(difficulty_config, lexicon)
         if middle_word is None:
             continue
 
-        while grid_setup_attempts < MAX_GRID_SETUP_RETRIES:
-            grid_setup_attempts += 1
-            final_grid, words_to_find = generate_board(
-                difficulty_config,
-                middle_word,
-                words_to_place,
-            )
-            if final_grid is None:
-                continue
-            return middle_word, words_to_find, final_grid
+        final_grid, words_to_find = _generate_board_for_word_list(
+            difficulty_config,
+            middle_word,
+            words_to_place,
+            board_workers,
+        )
+        if final_grid is None:
+            continue
+        return middle_word, words_to_find, final_grid
     return None
 
 
-def _handle_fatal_setup_error() -> None:
+def _handle_fatal_setup_error(reason: str | None = None) -> None:
     """Handle a fatal setup error by printing an error message and saving the active streak.
 
-    This function is called when the game setup fails after the maximum allowed retries.
-    It informs the user of possible causes and saves the current streak if one exists.
+    This function is called when the game setup fails after the maximum allowed retries,
+    or right away when the lexicon cannot satisfy the settings at all.
+    It informs the user of the cause and saves the current streak if one exists.
+
+    Args:
+        reason (str | None): The known cause of the failure, if any.
+
     """
     clear_screen()
     print("\n" + "=" * 50)
-    print(f"FATAL ERROR: Failed to set up game after {MAX_SETUP_RETRIES} attempts.")
-    print("This could be due to:")
-    print("  - Very restrictive grid settings (Grid size, number of words needed, word lengths).")
-    print("  - Lexicon file lacks suitable words (Must have enough subwords to satisfy grid creation).")
+    if reason:
+        print("FATAL ERROR: Failed to set up game.")
+        print(f"  - {reason}")
+    else:
+        print(f"FATAL ERROR: Failed to set up game after {MAX_SETUP_RETRIES} attempts.")
+        print("This could be due to:")
+        print("  - Very restrictive grid settings (Grid size, number of words needed, word lengths).")
+        print("  - Lexicon file lacks suitable words (Must have enough subwords to satisfy grid creation).")
     print("Please check your settings, lexicon file, or try again.")
     print("Exiting program.")
     print("=" * 50 + "\n")
@@ -126,15 +217,21 @@ def _handle_fatal_setup_error() -> None:
             CURRENT_SESSION_STREAK.count,
             CURRENT_SESSION_STREAK.points_total,
         )
-        add_streak_entry(entry)
-        print(f"Saved active streak for {CURRENT_SESSION_STREAK.player_name} due to setup error.")
+        if add_streak_entry(entry):
+            print(f"Saved active streak for {CURRENT_SESSION_STREAK.player_name} due to setup error.")
+        else:
+            print(f"Could not save the active streak for {CURRENT_SESSION_STREAK.player_name}.")
 
 
-def _save_streak() -> None:
+def _save_streak() -> bool:
     """Save the current streak if it exists and the player name is set.
 
     This function creates a StreakEntry and adds it to the leaderboard if the current
     session streak has a nonzero count and a valid player name.
+
+    Returns:
+        bool: False if there was a streak to save and it could not be saved, True otherwise.
+
     """
     if CURRENT_SESSION_STREAK.count > 0 and CURRENT_SESSION_STREAK.player_name:
         entry = StreakEntry(
@@ -142,7 +239,10 @@ def _save_streak() -> None:
             CURRENT_SESSION_STREAK.count,
             CURRENT_SESSION_STREAK.points_total,
         )
-        add_streak_entry(entry)
+        if not add_streak_entry(entry):
+            print(f"Could not save the streak for {CURRENT_SESSION_STREAK.player_name}.")
+            return False
+    return True
 
 
 def _update_player_name(player_name_from_init: str | None) -> None:
@@ -162,96 +262,176 @@ def _update_player_name(player_name_from_init: str | None) -> None:
         CURRENT_SESSION_STREAK.reset_streak_counters()
 
 
+def _get_puzzle_factory(
+    puzzle_factory: PuzzleFactory | None,
+    difficulty_config: DifficultyData,
+    lexicon: Lexicon,
+    puzzle_bank: PuzzleBank | None = None,
+) -> PuzzleFactory | None:
+    """Return a running puzzle factory for the difficulty, replacing one built for another difficulty.
+
+    No factory is needed when the round draws from a puzzle bank, so the previous one is stopped.
+
+    Args:
+        puzzle_factory (PuzzleFactory | None): The factory used in the previous round, if any.
+        difficulty_config (DifficultyData): The difficulty settings for this round.
+        lexicon (Lexicon): The compiled lexicon.
+        puzzle_bank (PuzzleBank | None): The non-empty puzzle bank for this round, if any.
+
+    Returns:
+        PuzzleFactory | None: A started factory for difficulty_config, or None when drawing from the bank.
+
+    """
+    if puzzle_bank is not None:
+        if puzzle_factory is not None:
+            puzzle_factory.stop()
+        return None
+    if puzzle_factory is None or puzzle_factory.difficulty_conf != difficulty_config:
+        if puzzle_factory is not None:
+            puzzle_factory.stop()
+        puzzle_factory = PuzzleFactory(difficulty_config, lexicon)
+    puzzle_factory.start()
+    return puzzle_factory
+
+
+def _get_puzzle_bank(puzzle_bank_dir: Path | None, difficulty_config: DifficultyData) -> PuzzleBank | None:
+    """Return the puzzle bank for the difficulty, if it still holds puzzles that were not drawn.
+
+    Args:
+        puzzle_bank_dir (Path | None): The directory of the lexicon's puzzle banks, if known.
+        difficulty_config (DifficultyData): The difficulty settings for this round.
+
+    Returns:
+        PuzzleBank | None: The bank, or None if there is no bank or it is drained, so the round generates live.
+
+    """
+    if puzzle_bank_dir is None:
+        return None
+    puzzle_bank = PuzzleBank(puzzle_bank_dir, difficulty_config)
+    return puzzle_bank if puzzle_bank.remaining() > 0 else None
+
+
 def _run_game_session(
-    lexicon_file_p: str,
+    lexicon: Lexicon,
     initial_difficulty_config_for_nhp: DifficultyData | None,
     *,
     is_hp_mode_session: bool,
+    puzzle_bank_dir: Path | None = None,
 ) -> None:
     """Run the game session loop for either HP or NHP mode, using the global streak state.
 
     This function manages the main game loop, handling player info, setup, and game execution.
-    It updates the session streak state based on game outcomes.
+    It updates the session streak state based on game outcomes. Puzzles for the chosen
+    difficulty are drawn from the puzzle bank, or generated in the background while the player
+    enters their details and plays when the bank is empty.
 
     Args:
-        lexicon_file_p (str): The path to the lexicon file.
+        lexicon (Lexicon): The compiled lexicon, shared across rounds.
         initial_difficulty_config_for_nhp (DifficultyData | None): The difficulty config for NHP mode.
         is_hp_mode_session (bool): Whether the session is in HP mode.
+        puzzle_bank_dir (Path | None): The directory of the lexicon's puzzle banks, if any.
 
     """
-    while True:
-        # Select difficulty config for this round
-        if is_hp_mode_session:
-            menu_result = run_main_menu()
-            if menu_result == EXIT_GAME_MARKER:
-                _save_streak()
-                print("\nThanks for your bravery, Wizard! Exiting Worderly Place.")
-                return
-            difficulty_config_this_round = menu_result
-        else:
-            if initial_difficulty_config_for_nhp is None:
-                print("Error: NHP settings missing.")
-                return
-            difficulty_config_this_round = initial_difficulty_config_for_nhp
+    puzzle_factory: PuzzleFactory | None = None
+    try:
+        while True:
+            # Select difficulty config for this round
+            if is_hp_mode_session:
+                menu_result = run_main_menu()
+                if menu_result == EXIT_GAME_MARKER:
+                    _save_streak()
+                    print("\nThanks for your bravery, Wizard! Exiting Worderly Place.")
+                    return
+                difficulty_config_this_round = menu_result
+            else:
+                if initial_difficulty_config_for_nhp is None:
+                    print("Error: NHP settings missing.")
+                    return
+                difficulty_config_this_round = initial_difficulty_config_for_nhp
+
+            # Determine player name to pass to init
+            name_to_pass_to_init: str | None = (
+                CURRENT_SESSION_STREAK.player_name
+                if (CURRENT_SESSION_STREAK.count > 0 and CURRENT_SESSION_STREAK.player_name)
+                else None
+            )
 
-        # Determine player name to pass to init
-        name_to_pass_to_init: str | None = (
-            CURRENT_SESSION_STREAK.player_name
-            if (CURRENT_SESSION_STREAK.count > 0 and CURRENT_SESSION_STREAK.player_name)
-            else None
-        )
+            puzzle_bank = _get_puzzle_bank(puzzle_bank_dir, difficulty_config_this_round)
+            puzzle_factory = _get_puzzle_factory(puzzle_factory, difficulty_config_this_round, lexicon, puzzle_bank)
 
-        player_name_from_init, selected_wizard = initialize_player_info(
-            difficulty_config_this_round,
-            name_to_pass_to_init,
-        )
+            player_name_from_init, selected_wizard = initialize_player_info(
+                difficulty_config_this_round,
+                name_to_pass_to_init,
+            )
 
-        _update_player_name(player_name_from_init)
+            _update_player_name(player_name_from_init)
 
-        setup_result = run_setup(difficulty_config_this_round, lexicon_file_p)
-        if not setup_result:
-            _handle_fatal_setup_error()
-            return
+            setup_result = run_setup(difficulty_config_this_round, lexicon, puzzle_factory, puzzle_bank=puzzle_bank)
+            if not setup_result:
+                _handle_fatal_setup_error(describe_unsupported_settings(difficulty_config_this_round, lexicon))
+                return
 
-        middle_word, words_to_find, final_grid = setup_result
+            middle_word, words_to_find, final_grid = setup_result
+
+            game_ctx = GameConfig(
+                difficulty_conf=difficulty_config_this_round,
+                final_grid=final_grid,
+                words_to_find=words_to_find,
+                middle_word=middle_word,
+                player_name=CURRENT_SESSION_STREAK.player_name,
+                selected_wizard=selected_wizard,
+                streak_count=CURRENT_SESSION_STREAK.count,
+                streak_points=CURRENT_SESSION_STREAK.points_total,
+            )
+            game_outcome, points_this_game = run_game(game_ctx)
 
-        game_ctx = GameConfig(
-            difficulty_conf=difficulty_config_this_round,
-            final_grid=final_grid,
-            words_to_find=words_to_find,
-            middle_word=middle_word,
-            player_name=CURRENT_SESSION_STREAK.player_name,
-            selected_wizard=selected_wizard,
-        )
-        game_outcome, points_this_game = run_game(game_ctx)
+            if CURRENT_SESSION_STREAK.player_name:
+                if game_outcome == "win":
+                    CURRENT_SESSION_STREAK.count += 1
+                    CURRENT_SESSION_STREAK.points_total += points_this_game
+                elif game_outcome == "loss":
+                    _save_streak()
+                    CURRENT_SESSION_STREAK.reset_streak_counters()
 
-        if CURRENT_SESSION_STREAK.player_name:
-            if game_outcome == "win":
-                CURRENT_SESSION_STREAK.count += 1
-                CURRENT_SESSION_STREAK.points_total += points_this_game
-            elif game_outcome == "loss":
-                _save_streak()
-                CURRENT_SESSION_STREAK.reset_streak_counters()
+    finally:
+        if puzzle_factory is not None:
+            puzzle_factory.stop()
+        shutdown_board_worker_pools()
 
 
 def main() -> None:
     """Run the Worderly game.
 
     This function initializes the game, handles mode selection, and starts the main game session.
-    It also resets the session streak state at the start.
+    It also resets the session streak state at the start. "worderly.py bank ..." runs the
+    puzzle bank command instead, and "worderly.py simulate ..." the bot simulation.
     """
-    lexicon_file_p: str | None = get_lexicon_file()
-    if not lexicon_file_p:
+    if len(sys.argv) > 1 and sys.argv[1] == BANK_COMMAND:
+        run_bank_command(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == SIMULATE_COMMAND:
+        run_simulate_command(sys.argv[2:])
+        return
+
+    lexicon: Lexicon | None = get_lexicon()
+    if lexicon is None:
         return
+    puzzle_bank_dir = get_bank_dir(sys.argv[1])
+    compact_streaks()  # Merge the streaks journaled by earlier sessions into the leaderboard snapshot
 
     initial_mode_choice: DifficultyData | None = run_heart_points_menu()
 
     CURRENT_SESSION_STREAK.full_reset()
 
     if initial_mode_choice is None:
-        _run_game_session(lexicon_file_p, None, is_hp_mode_session=True)
+        _run_game_session(lexicon, None, is_hp_mode_session=True, puzzle_bank_dir=puzzle_bank_dir)
     elif not initial_mode_choice.heart_point_mode:
-        _run_game_session(lexicon_file_p, NO_HEART_POINTS_SETTINGS, is_hp_mode_session=False)
+        _run_game_session(
+            lexicon,
+            NO_HEART_POINTS_SETTINGS,
+            is_hp_mode_session=False,
+            puzzle_bank_dir=puzzle_bank_dir,
+        )
     else:
         print("Exiting due to an unexpected initial mode selection outcome.")
 
@@ -263,11 +443,11 @@ if __name__ == "__main__":
         clear_screen()
         if CURRENT_SESSION_STREAK.count > 0 and CURRENT_SESSION_STREAK.player_name:
             print("\nInterrupt detected. Saving current streak...")
-            _save_streak()
-            print(
-                f"Streak for {CURRENT_SESSION_STREAK.player_name} saved: "
-                f"{CURRENT_SESSION_STREAK.count} wins, {CURRENT_SESSION_STREAK.points_total} pts.",
-            )
+            if _save_streak():
+                print(
+                    f"Streak for {CURRENT_SESSION_STREAK.player_name} saved: "
+                    f"{CURRENT_SESSION_STREAK.count} wins, {CURRENT_SESSION_STREAK.points_total} pts.",
+                )
         else:
             print("\nInterrupt detected. No active streak to save or player name not set.")
 